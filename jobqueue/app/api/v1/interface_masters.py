@@ -22,6 +22,7 @@
     InterfaceValidationError,
     InterfaceValidator,
 )
+from app.services.task_version_manager import TaskVersionManager
 
 router = APIRouter()
 
@@ -87,8 +88,7 @@ async def list_interface_masters(
     # Build query conditions
     conditions = []
     if is_active is not None:
-        # SQLite stores bool as int
-        conditions.append(InterfaceMaster.is_active == (1 if is_active else 0))
+        conditions.append(InterfaceMaster.is_active.is_(is_active))
 
     # Build base query
     query = select(InterfaceMaster)
@@ -178,6 +178,7 @@ async def update_interface_master(
         interface.is_active = interface_data.is_active
 
     await db.commit()
+    TaskVersionManager.invalidate_master()
     await db.refresh(interface)
 
     return InterfaceMasterResponse(
@@ -201,6 +202,7 @@ async def delete_interface_master(
     interface.is_active = False
 
     await db.commit()
+    TaskVersionManager.invalidate_master()
     await db.refresh(interface)
 
     return InterfaceMasterResponse(
@@ -250,6 +252,7 @@ async def associate_interface_to_task_master(
 
     db.add(association)
     await db.commit()
+    TaskVersionManager.invalidate_master(master_id)
     await db.refresh(association)
 
     return InterfaceAssociationResponse.model_validate(association)
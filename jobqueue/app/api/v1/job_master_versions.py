@@ -27,7 +27,7 @@ async def list_versions(
 ) -> JobMasterVersionList:
     """Get version history for a job master."""
     # Check if master exists
-    master = await db.get(JobMaster, master_id)
+    master = await VersionManager.get_master_snapshot(db, master_id)
     if not master:
         raise HTTPException(status_code=404, detail="Job master not found")
 
@@ -71,7 +71,7 @@ async def get_version(
 ) -> JobMasterVersionResponse:
     """Get specific version details of a job master."""
     # Check if master exists
-    master = await db.get(JobMaster, master_id)
+    master = await VersionManager.get_master_snapshot(db, master_id)
     if not master:
         raise HTTPException(status_code=404, detail="Job master not found")
 
@@ -96,7 +96,7 @@ async def create_from_version(
 ) -> CreateFromVersionResponse:
     """Create a new job master from a specific version."""
     # Check if master exists
-    master = await db.get(JobMaster, master_id)
+    master = await VersionManager.get_master_snapshot(db, master_id)
     if not master:
         raise HTTPException(status_code=404, detail="Job master not found")
 
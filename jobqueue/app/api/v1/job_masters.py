@@ -3,8 +3,9 @@
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import and_, case, desc, func, or_, select
+from sqlalchemy import Text, and_, case, cast, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 from ulid import new as ulid_new
 
 from app.core.database import get_db
@@ -87,16 +88,12 @@ async def list_job_masters(
 ) -> JobMasterList:
     """List job masters with filtering and pagination."""
     # Build query conditions
-    conditions = []
+    conditions: list[ColumnElement[bool]] = []
     if is_active is not None:
-        # SQLite stores bool as int
-        conditions.append(JobMaster.is_active == (1 if is_active else 0))
+        conditions.append(JobMaster.is_active.is_(is_active))
     if tags:
         # Filter masters that have any of the specified tags
-        tag_conditions = [
-            JobMaster.tags.op("JSON_EXTRACT")("$[*]").op("LIKE")(f"%{tag}%")
-            for tag in tags
-        ]
+        tag_conditions = [cast(JobMaster.tags, Text).like(f"%{tag}%") for tag in tags]
         conditions.append(or_(*tag_conditions))
 
     # Build base query
@@ -200,6 +197,7 @@ async def update_job_master(
         master.updated_by = master_data.updated_by
 
     await db.commit()
+    VersionManager.invalidate_master(master.id)
     await db.refresh(master)
 
     return JobMasterUpdateResponse(
@@ -225,6 +223,7 @@ async def delete_job_master(
     master.is_active = False
 
     await db.commit()
+    VersionManager.invalidate_master(master.id)
     await db.refresh(master)
 
     return JobMasterResponse(
@@ -462,6 +461,7 @@ async def publish_workflow_version(
     master.current_version += 1
 
     await db.commit()
+    VersionManager.invalidate_master(master.id)
     await db.refresh(master)
 
     return JobMasterUpdateResponse(
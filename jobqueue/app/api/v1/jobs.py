@@ -5,20 +5,21 @@
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import and_, desc, func, or_, select
+from pydantic import ValidationError
+from sqlalchemy import Text, and_, cast, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from ulid import new as ulid_new
 
 from app.core.database import get_db
 from app.core.merge import merge_dict_deep, merge_dict_shallow, merge_tags
 from app.models.job import Job, JobStatus
-from app.models.job_master import JobMaster
 from app.models.result import JobResult, JobResultHistory
 from app.models.task import Task, TaskStatus
-from app.models.task_master import TaskMaster
-from app.models.task_master_interface import TaskMasterInterface
 from app.schemas.job import (
+    JobBatchFromMaster,
+    JobBatchItem,
+    JobBatchItemResult,
+    JobBatchResponse,
     JobCreate,
     JobCreateFromMaster,
     JobDetail,
@@ -30,11 +31,15 @@
     JobResultHistoryList,
     JobResultResponse,
 )
+from app.services.async_task_manager import AsyncTaskManager
 from app.services.interface_validator import (
     InterfaceValidationError,
     InterfaceValidator,
 )
 from app.services.job_interface_validator import JobInterfaceValidator
+from app.services.result_blob_store import ResultBlobStore
+from app.services.task_version_manager import TaskVersionManager
+from app.services.version_manager import VersionManager
 
 router = APIRouter()
 
@@ -75,8 +80,10 @@ async def create_job(
     # Create tasks if provided
     if job_data.tasks:
         for task_data in job_data.tasks:
-            # Get task master
-            task_master = await db.get(TaskMaster, task_data.master_id)
+            # Get task master (cached snapshot incl. required interface schemas)
+            task_master = await TaskVersionManager.get_master_snapshot(
+                db, task_data.master_id
+            )
             if not task_master:
                 raise HTTPException(
                     status_code=404,
@@ -89,29 +96,21 @@ async def create_job(
                     detail=f"Task master {task_data.master_id} is inactive",
                 )
 
-            # Validate input data against interface schemas
-            # Get task master interfaces with eager loading of interface_master
-            interface_associations = await db.scalars(
-                select(TaskMasterInterface)
-                .where(TaskMasterInterface.task_master_id == task_master.id)
-                .options(selectinload(TaskMasterInterface.interface_master))
-            )
-            for assoc in interface_associations.all():
-                if assoc.required and assoc.interface_master.input_schema:
-                    # Validate even if input_data is empty (required fields should be checked)
-                    input_data_to_validate = (
-                        task_data.input_data if task_data.input_data is not None else {}
+            # Validate input data against required interface schemas
+            for input_schema in task_master.required_input_schemas:
+                # Validate even if input_data is empty (required fields should be checked)
+                input_data_to_validate = (
+                    task_data.input_data if task_data.input_data is not None else {}
+                )
+                try:
+                    InterfaceValidator.validate_input(
+                        input_data_to_validate, input_schema
                     )
-                    try:
-                        InterfaceValidator.validate_input(
-                            input_data_to_validate,
-                            assoc.interface_master.input_schema,
-                        )
-                    except InterfaceValidationError as e:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"Task {task_data.sequence} input validation failed: {'; '.join(e.errors)}",
-                        ) from e
+                except InterfaceValidationError as e:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Task {task_data.sequence} input validation failed: {'; '.join(e.errors)}",
+                    ) from e
 
             # Generate ULID for task ID
             task_id = f"t_{ulid_new()}"
@@ -207,9 +206,32 @@ async def get_job_result(
     )
 
 
-@router.get("/jobs/{job_id}/result/history", response_model=JobResultHistoryList)
+# Fields selectable via `fields=` on the result history endpoint
+HISTORY_FIELDS = {
+    "response_status",
+    "response_headers",
+    "response_body",
+    "error",
+    "duration_ms",
+    "executed_at",
+}
+
+
+@router.get(
+    "/jobs/{job_id}/result/history",
+    response_model=JobResultHistoryList,
+    response_model_exclude_unset=True,
+)
 async def get_job_result_history(
     job_id: str,
+    fields: str | None = Query(
+        None,
+        description=(
+            "Comma-separated fields to include in each entry "
+            "(id, job_id and attempt are always included). "
+            "Omit response_headers/response_body to skip loading payloads."
+        ),
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> JobResultHistoryList:
     """Get job result history (all execution attempts)."""
@@ -217,20 +239,58 @@ async def get_job_result_history(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
+    if fields is None:
+        selected = set(HISTORY_FIELDS)
+    else:
+        selected = {f.strip() for f in fields.split(",") if f.strip()}
+        unknown = selected - HISTORY_FIELDS - {"id", "job_id", "attempt"}
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown history fields: {', '.join(sorted(unknown))}",
+            )
+        selected &= HISTORY_FIELDS
+
+    # Select only the requested columns; payloads are referenced by hash
+    columns: list[Any] = [JobResultHistory.id, JobResultHistory.attempt]
+    for field in sorted(selected):
+        if field == "response_headers":
+            columns.append(JobResultHistory.response_headers_hash)
+        elif field == "response_body":
+            columns.append(JobResultHistory.response_body_hash)
+        else:
+            columns.append(getattr(JobResultHistory, field))
+
     # Get all history entries ordered by attempt DESC (newest first)
     history_query = (
-        select(JobResultHistory)
+        select(*columns)
         .where(JobResultHistory.job_id == job_id)
         .order_by(desc(JobResultHistory.attempt))
     )
-    history_result = await db.scalars(history_query)
-    history_entries = history_result.all()
-
-    return JobResultHistoryList(
-        job_id=job_id,
-        total=len(history_entries),
-        items=[JobResultHistoryItem.model_validate(entry) for entry in history_entries],
-    )
+    rows = (await db.execute(history_query)).mappings().all()
+
+    # Load referenced payloads in one query (deduplicated by hash)
+    blob_hashes: set[str | None] = set()
+    for row in rows:
+        if "response_headers" in selected:
+            blob_hashes.add(row["response_headers_hash"])
+        if "response_body" in selected:
+            blob_hashes.add(row["response_body_hash"])
+    payloads = await ResultBlobStore.load_many(db, blob_hashes)
+
+    items = []
+    for row in rows:
+        values: dict[str, Any] = {"job_id": job_id}
+        for key, value in row.items():
+            if key == "response_headers_hash":
+                values["response_headers"] = payloads.get(value) if value else None
+            elif key == "response_body_hash":
+                values["response_body"] = payloads.get(value) if value else None
+            else:
+                values[key] = value
+        items.append(JobResultHistoryItem(**values))
+
+    return JobResultHistoryList(job_id=job_id, total=len(items), items=items)
 
 
 @router.post("/jobs/{job_id}/cancel", response_model=JobResponse)
@@ -249,6 +309,9 @@ async def cancel_job(
             detail=f"Cannot cancel job with status: {job.status}",
         )
 
+    # Stop polling and invalidate the callback token of a waiting task
+    await AsyncTaskManager.cancel_waiting(db, job.id)
+
     job.status = JobStatus.CANCELED
     job.finished_at = datetime.now(UTC)
 
@@ -285,8 +348,12 @@ async def retry_job(
             job_id=job_id,
             attempt=current_result.attempt,
             response_status=current_result.response_status,
-            response_headers=current_result.response_headers,
-            response_body=current_result.response_body,
+            response_headers_hash=await ResultBlobStore.store(
+                db, current_result.response_headers
+            ),
+            response_body_hash=await ResultBlobStore.store(
+                db, current_result.response_body
+            ),
             error=current_result.error,
             duration_ms=current_result.duration_ms,
             executed_at=current_result.updated_at or current_result.created_at,
@@ -309,17 +376,16 @@ async def retry_job(
     return JobResponse(job_id=job.id, status=job.status)
 
 
-@router.post(
-    "/jobs/from-master/{master_id}", response_model=JobResponse, status_code=201
-)
-async def create_job_from_master(
-    master_id: str,
-    job_data: JobCreateFromMaster,
-    db: AsyncSession = Depends(get_db),
-) -> JobResponse:
-    """Create a job from a master template."""
-    # Get master
-    master = await db.get(JobMaster, master_id)
+async def _add_job_from_master(
+    db: AsyncSession, master_id: str, job_data: JobCreateFromMaster
+) -> Job:
+    """Validate a from-master submission and add the job and its tasks to the session.
+
+    All checks run before anything is added, so a rejected submission leaves
+    the session untouched. The caller commits.
+    """
+    # Get master (cached snapshot; no master-table read in steady state)
+    master = await VersionManager.get_master_snapshot(db, master_id)
     if not master:
         raise HTTPException(status_code=404, detail="Job master not found")
 
@@ -327,6 +393,41 @@ async def create_job_from_master(
     if not master.is_active:
         raise HTTPException(status_code=400, detail="Job master is inactive")
 
+    # Resolve and validate tasks before adding anything
+    task_masters = []
+    for task_data in job_data.tasks or []:
+        # Get task master (cached snapshot incl. required interface schemas)
+        task_master = await TaskVersionManager.get_master_snapshot(
+            db, task_data.master_id
+        )
+        if not task_master:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Task master {task_data.master_id} not found",
+            )
+
+        if not task_master.is_active:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Task master {task_data.master_id} is inactive",
+            )
+
+        # Validate input data against required interface schemas
+        for input_schema in task_master.required_input_schemas:
+            # Validate even if input_data is empty (required fields should be checked)
+            input_data_to_validate = (
+                task_data.input_data if task_data.input_data is not None else {}
+            )
+            try:
+                InterfaceValidator.validate_input(input_data_to_validate, input_schema)
+            except InterfaceValidationError as e:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Task {task_data.sequence} input validation failed: {'; '.join(e.errors)}",
+                ) from e
+
+        task_masters.append((task_data, task_master))
+
     # Merge parameters
     merged_headers = merge_dict_shallow(master.headers, job_data.headers)
     merged_params = merge_dict_shallow(master.params, job_data.params)
@@ -369,96 +470,134 @@ async def create_job_from_master(
     await db.flush()
 
     # Create tasks if provided
-    if job_data.tasks:
-        for task_data in job_data.tasks:
-            # Get task master
-            task_master = await db.get(TaskMaster, task_data.master_id)
-            if not task_master:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Task master {task_data.master_id} not found",
-                )
+    for task_data, task_master in task_masters:
+        # Generate ULID for task ID
+        task_id = f"t_{ulid_new()}"
 
-            if not task_master.is_active:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Task master {task_data.master_id} is inactive",
-                )
+        # Create task instance
+        task = Task(
+            id=task_id,
+            job_id=job_id,
+            master_id=task_master.id,
+            master_version=task_master.current_version,
+            order=task_data.sequence,
+            status=TaskStatus.QUEUED,
+            input_data=task_data.input_data,
+            attempt=0,
+        )
 
-            # Validate input data against interface schemas
-            # Get task master interfaces with eager loading of interface_master
-            interface_associations = await db.scalars(
-                select(TaskMasterInterface)
-                .where(TaskMasterInterface.task_master_id == task_master.id)
-                .options(selectinload(TaskMasterInterface.interface_master))
-            )
-            for assoc in interface_associations.all():
-                if assoc.required and assoc.interface_master.input_schema:
-                    # Validate even if input_data is empty (required fields should be checked)
-                    input_data_to_validate = (
-                        task_data.input_data if task_data.input_data is not None else {}
-                    )
-                    try:
-                        InterfaceValidator.validate_input(
-                            input_data_to_validate,
-                            assoc.interface_master.input_schema,
-                        )
-                    except InterfaceValidationError as e:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"Task {task_data.sequence} input validation failed: {'; '.join(e.errors)}",
-                        ) from e
+        db.add(task)
+
+    return job
+
+
+async def _tag_interface_validation(db: AsyncSession, job: Job) -> None:
+    """Validate task interfaces of a committed job and record the result as a tag."""
+    validation_result = await JobInterfaceValidator.validate_job_interfaces(db, job.id)
+
+    # Format validation result as tag
+    validation_tag = {
+        "type": "interface_validation",
+        "validated_at": datetime.now(UTC).isoformat(),
+        "is_valid": validation_result.is_valid,
+        "error_count": len(validation_result.errors),
+        "warning_count": len(validation_result.warnings),
+        "errors": validation_result.errors[:5],  # Store first 5 errors
+        "warnings": validation_result.warnings[:5],  # Store first 5 warnings
+    }
+
+    # Add validation tag to Job.tags
+    if job.tags is None:
+        job.tags = []
+    job.tags.append(validation_tag)  # type: ignore[arg-type]
+
+    # Log validation result (warning only, Job creation continues)
+    if not validation_result.is_valid:
+        logger = logging.getLogger(__name__)
+        logger.warning(
+            f"Job {job.id} created with interface validation warnings: "
+            f"{validation_result.errors}"
+        )
 
-            # Generate ULID for task ID
-            task_id = f"t_{ulid_new()}"
 
-            # Create task instance
-            task = Task(
-                id=task_id,
-                job_id=job_id,
-                master_id=task_master.id,
-                master_version=task_master.current_version,
-                order=task_data.sequence,
-                status=TaskStatus.QUEUED,
-                input_data=task_data.input_data,
-                attempt=0,
-            )
+@router.post(
+    "/jobs/from-master/batch", response_model=JobBatchResponse, status_code=201
+)
+async def create_jobs_from_master_batch(
+    batch: JobBatchFromMaster,
+    db: AsyncSession = Depends(get_db),
+) -> JobBatchResponse:
+    """Create many jobs from master templates in one transaction.
 
-            db.add(task)
+    Invalid or rejected items are reported in their result without failing
+    the rest of the batch.
+    """
+    results: list[JobBatchItemResult] = []
+    created: list[tuple[JobBatchItem, Job]] = []
+    for raw_item in batch.jobs:
+        try:
+            item = JobBatchItem.model_validate(raw_item)
+        except ValidationError as e:
+            master_id = raw_item.get("master_id")
+            results.append(
+                JobBatchItemResult(
+                    master_id=master_id if isinstance(master_id, str) else "",
+                    status_code=422,
+                    error="; ".join(
+                        f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}"
+                        for err in e.errors()
+                    ),
+                )
+            )
+            continue
+        try:
+            job = await _add_job_from_master(db, item.master_id, item)
+        except HTTPException as e:
+            results.append(
+                JobBatchItemResult(
+                    master_id=item.master_id,
+                    status_code=e.status_code,
+                    error=str(e.detail),
+                )
+            )
+            continue
+        created.append((item, job))
+        results.append(
+            JobBatchItemResult(master_id=item.master_id, status_code=201, job_id=job.id)
+        )
 
     await db.commit()
-    await db.refresh(job)
 
     # Interface validation (Phase 2.2)
-    if job_data.validate_interfaces and job_data.tasks:
-        validation_result = await JobInterfaceValidator.validate_job_interfaces(
-            db, job.id
-        )
+    validated = [
+        job for item, job in created if item.validate_interfaces and item.tasks
+    ]
+    for job in validated:
+        await db.refresh(job)
+        await _tag_interface_validation(db, job)
+    if validated:
+        await db.commit()
 
-        # Format validation result as tag
-        validation_tag = {
-            "type": "interface_validation",
-            "validated_at": datetime.now(UTC).isoformat(),
-            "is_valid": validation_result.is_valid,
-            "error_count": len(validation_result.errors),
-            "warning_count": len(validation_result.warnings),
-            "errors": validation_result.errors[:5],  # Store first 5 errors
-            "warnings": validation_result.warnings[:5],  # Store first 5 warnings
-        }
+    return JobBatchResponse(results=results, created=len(created))
 
-        # Add validation tag to Job.tags
-        if job.tags is None:
-            job.tags = []
-        job.tags.append(validation_tag)  # type: ignore[arg-type]
 
-        # Log validation result (warning only, Job creation continues)
-        if not validation_result.is_valid:
-            logger = logging.getLogger(__name__)
-            logger.warning(
-                f"Job {job.id} created with interface validation warnings: "
-                f"{validation_result.errors}"
-            )
+@router.post(
+    "/jobs/from-master/{master_id}", response_model=JobResponse, status_code=201
+)
+async def create_job_from_master(
+    master_id: str,
+    job_data: JobCreateFromMaster,
+    db: AsyncSession = Depends(get_db),
+) -> JobResponse:
+    """Create a job from a master template."""
+    job = await _add_job_from_master(db, master_id, job_data)
 
+    await db.commit()
+    await db.refresh(job)
+
+    # Interface validation (Phase 2.2)
+    if job_data.validate_interfaces and job_data.tasks:
+        await _tag_interface_validation(db, job)
         await db.commit()
         await db.refresh(job)
 
@@ -480,9 +619,7 @@ async def list_jobs(
         conditions.append(Job.status == status)
     if tags:
         # Filter jobs that have any of the specified tags
-        tag_conditions = [
-            Job.tags.op("JSON_EXTRACT")("$[*]").op("LIKE")(f"%{tag}%") for tag in tags
-        ]
+        tag_conditions = [cast(Job.tags, Text).like(f"%{tag}%") for tag in tags]
         conditions.append(or_(*tag_conditions))
 
     # Build base query
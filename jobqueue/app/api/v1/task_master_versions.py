@@ -27,7 +27,7 @@ async def list_versions(
 ) -> TaskMasterVersionList:
     """Get version history for a task master."""
     # Check if master exists
-    master = await db.get(TaskMaster, master_id)
+    master = await TaskVersionManager.get_master_snapshot(db, master_id)
     if not master:
         raise HTTPException(status_code=404, detail="Task master not found")
 
@@ -71,7 +71,7 @@ async def get_version(
 ) -> TaskMasterVersionResponse:
     """Get specific version details of a task master."""
     # Check if master exists
-    master = await db.get(TaskMaster, master_id)
+    master = await TaskVersionManager.get_master_snapshot(db, master_id)
     if not master:
         raise HTTPException(status_code=404, detail="Task master not found")
 
@@ -96,7 +96,7 @@ async def create_from_version(
 ) -> CreateFromVersionResponse:
     """Create a new task master from a specific version."""
     # Check if master exists
-    master = await db.get(TaskMaster, master_id)
+    master = await TaskVersionManager.get_master_snapshot(db, master_id)
     if not master:
         raise HTTPException(status_code=404, detail="Task master not found")
 
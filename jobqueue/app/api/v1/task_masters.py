@@ -103,8 +103,7 @@ async def list_task_masters(
     # Build query conditions
     conditions = []
     if is_active is not None:
-        # SQLite stores bool as int
-        conditions.append(TaskMaster.is_active == (1 if is_active else 0))
+        conditions.append(TaskMaster.is_active.is_(is_active))
 
     # Build base query
     query = select(TaskMaster)
@@ -235,6 +234,7 @@ async def update_task_master(
         master.updated_by = master_data.updated_by
 
     await db.commit()
+    TaskVersionManager.invalidate_master(master.id)
     await db.refresh(master)
 
     return TaskMasterUpdateResponse(
@@ -260,6 +260,7 @@ async def delete_task_master(
     master.is_active = False
 
     await db.commit()
+    TaskVersionManager.invalidate_master(master.id)
     await db.refresh(master)
 
     return TaskMasterResponse(
@@ -1,6 +1,6 @@
 """Task API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from sqlalchemy import and_, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,12 +8,15 @@
 from app.models.job import Job, JobStatus
 from app.models.task import Task, TaskStatus
 from app.schemas.task import (
+    TaskCallback,
+    TaskCallbackResponse,
     TaskDetail,
     TaskList,
     TaskListAll,
     TaskRetryResponse,
     TaskStats,
 )
+from app.services.async_task_manager import AsyncTaskManager
 
 router = APIRouter()
 
@@ -70,6 +73,7 @@ async def get_task_stats(
     # Count by status
     queued_query = select(func.count(Task.id)).where(Task.status == TaskStatus.QUEUED)
     running_query = select(func.count(Task.id)).where(Task.status == TaskStatus.RUNNING)
+    waiting_query = select(func.count(Task.id)).where(Task.status == TaskStatus.WAITING)
     succeeded_query = select(func.count(Task.id)).where(
         Task.status == TaskStatus.SUCCEEDED
     )
@@ -79,12 +83,14 @@ async def get_task_stats(
     if conditions:
         queued_query = queued_query.where(and_(*conditions))
         running_query = running_query.where(and_(*conditions))
+        waiting_query = waiting_query.where(and_(*conditions))
         succeeded_query = succeeded_query.where(and_(*conditions))
         failed_query = failed_query.where(and_(*conditions))
         skipped_query = skipped_query.where(and_(*conditions))
 
     queued_tasks = await db.scalar(queued_query) or 0
     running_tasks = await db.scalar(running_query) or 0
+    waiting_tasks = await db.scalar(waiting_query) or 0
     succeeded_tasks = await db.scalar(succeeded_query) or 0
     failed_tasks = await db.scalar(failed_query) or 0
     skipped_tasks = await db.scalar(skipped_query) or 0
@@ -107,6 +113,7 @@ async def get_task_stats(
         total_tasks=total_tasks,
         queued_tasks=queued_tasks,
         running_tasks=running_tasks,
+        waiting_tasks=waiting_tasks,
         succeeded_tasks=succeeded_tasks,
         failed_tasks=failed_tasks,
         skipped_tasks=skipped_tasks,
@@ -161,6 +168,10 @@ async def retry_task(
         t.started_at = None
         t.finished_at = None
         t.duration_ms = None
+        t.callback_token = None
+        t.poll_url = None
+        t.next_poll_at = None
+        t.wait_deadline = None
         t.attempt += 1
 
     # Reset job status
@@ -180,6 +191,52 @@ async def retry_task(
     )
 
 
+@router.post("/tasks/{task_id}/callback", response_model=TaskCallbackResponse)
+async def complete_task_callback(
+    task_id: str,
+    callback: TaskCallback,
+    callback_token: str | None = Header(
+        None, alias=AsyncTaskManager.CALLBACK_TOKEN_HEADER
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> TaskCallbackResponse:
+    """Complete a task that was accepted for asynchronous execution (202).
+
+    Called by the upstream service with the token it received in the
+    X-JobQueue-Callback-Token header. A succeeded task re-queues its job so
+    the remaining tasks run; a failed task fails the job.
+    """
+    task = await db.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    if not AsyncTaskManager.verify_token(task, callback_token):
+        raise HTTPException(status_code=403, detail="Invalid callback token")
+
+    completed = await AsyncTaskManager.complete(
+        db,
+        task,
+        succeeded=callback.status == "succeeded",
+        output_data=callback.output_data,
+        error=callback.error,
+    )
+    if not completed:
+        await db.refresh(task)
+        raise HTTPException(
+            status_code=409,
+            detail=f"Task is not awaiting completion. Current status: {task.status}",
+        )
+
+    await db.refresh(task)
+    job = await db.get(Job, task.job_id, populate_existing=True)
+
+    return TaskCallbackResponse(
+        task_id=task.id,
+        status=task.status,
+        job_status=job.status if job else "unknown",
+    )
+
+
 @router.get("/tasks", response_model=TaskListAll)
 async def list_all_tasks(
     status: str | None = Query(None, description="Filter by task status"),
@@ -25,16 +25,39 @@ class Settings(BaseSettings):
     # Database
     database_url: str = Field(default="sqlite+aiosqlite:///./data/jobqueue.db")
 
+    # Connection pools (PostgreSQL only; SQLite uses SQLAlchemy defaults).
+    # Workers get their own pool of `concurrency` connections.
+    db_api_pool_size: int = Field(default=5)  # Connections reserved for the API
+    db_max_overflow: int = Field(default=5)
+    db_pool_timeout: float = Field(default=30.0)
+    db_pool_recycle: int = Field(default=1800)  # Seconds before reconnecting
+    db_statement_cache_size: int = Field(
+        default=100
+    )  # asyncpg prepared statements per connection (0 for pgbouncer)
+
     # Worker
     concurrency: int = Field(
         default=4
     )  # Number of concurrent workers (safe with optimistic locking)
     poll_interval: float = Field(default=0.3)
 
+    # Master snapshot cache (see app/services/snapshot_cache.py)
+    master_cache_size: int = Field(default=1024)  # Entries per cache, 0 disables
+    master_cache_ttl_seconds: float = Field(
+        default=30.0
+    )  # Picks up master changes made by other processes
+
     # HTTP
     default_timeout: int = Field(default=30)
     result_max_bytes: int = Field(default=1048576)
 
+    # Asynchronous task completion (upstream answers 202 Accepted)
+    callback_base_url: str | None = Field(
+        default=None
+    )  # Externally reachable jobqueue URL, e.g. http://jobqueue:8001
+    async_task_timeout_sec: int = Field(default=3600)  # Max wait for completion
+    async_poll_interval: float = Field(default=5.0)  # Seconds between polls
+
     # Logging
     LOG_LEVEL: str = Field(default="INFO")
     LOG_DIR: str = Field(default="./")
@@ -2,12 +2,15 @@
 
 import logging
 from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import event
+from sqlalchemy import DateTime, event
+from sqlalchemy.engine import Dialect
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.types import TypeDecorator
 
 from app.core.config import get_settings
 
@@ -20,21 +23,78 @@ class Base(DeclarativeBase):
     pass
 
 
+class UTCDateTime(TypeDecorator[datetime]):
+    """Timezone-naive UTC timestamp column portable across SQLite and PostgreSQL.
+
+    Aware datetimes (e.g. ``datetime.now(UTC)``) are converted to naive UTC on
+    write. SQLite silently drops the offset; asyncpg rejects aware values for
+    ``TIMESTAMP WITHOUT TIME ZONE`` columns.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: datetime | None, dialect: Dialect
+    ) -> datetime | None:
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(UTC).replace(tzinfo=None)
+        return value
+
+
+def is_sqlite_url(url: str) -> bool:
+    """Return True if the database URL points at SQLite."""
+    return url.startswith("sqlite")
+
+
+def is_postgresql(session: AsyncSession) -> bool:
+    """Return True if the session is bound to a PostgreSQL engine."""
+    return session.bind is not None and session.bind.dialect.name == "postgresql"
+
+
 settings = get_settings()
 
 # Create database directory if it doesn't exist
-if settings.database_url.startswith("sqlite"):
+if is_sqlite_url(settings.database_url):
     db_path = settings.database_url.replace("sqlite+aiosqlite:///", "")
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
+
+def _engine_options(pool_size: int) -> dict[str, Any]:
+    """Build connection pool options for the configured backend.
+
+    SQLite keeps SQLAlchemy's defaults (file locking, not pooling, is the
+    bottleneck there).
+    """
+    if is_sqlite_url(settings.database_url):
+        return {}
+
+    options: dict[str, Any] = {
+        "pool_size": pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
+    if settings.database_url.startswith("postgresql+asyncpg"):
+        # asyncpg prepared statement LRU per connection (0 disables it, which
+        # is required behind pgbouncer in transaction pooling mode)
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.db_statement_cache_size
+        }
+    return options
+
+
+# Engine for API requests
 engine = create_async_engine(
     settings.database_url,
     echo=False,
     future=True,
+    **_engine_options(settings.db_api_pool_size),
 )
 
 # Enable WAL mode for SQLite
-if settings.database_url.startswith("sqlite"):
+if is_sqlite_url(settings.database_url):
 
     def set_sqlite_pragma(dbapi_connection: Any, connection_record: Any) -> None:
         """Set SQLite pragma for WAL mode and foreign keys."""
@@ -45,12 +105,29 @@ def set_sqlite_pragma(dbapi_connection: Any, connection_record: Any) -> None:
 
     event.listen(engine.sync_engine, "connect", set_sqlite_pragma)
 
+    worker_engine = engine
+else:
+    # Workers hold a connection for the whole job execution, so they get a
+    # dedicated pool (one connection per worker) that cannot starve the API.
+    worker_engine = create_async_engine(
+        settings.database_url,
+        echo=False,
+        future=True,
+        **_engine_options(settings.concurrency),
+    )
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+WorkerSessionLocal = async_sessionmaker(
+    worker_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get database session."""
@@ -70,7 +147,11 @@ async def init_db() -> None:
         from app.models.job_master import JobMaster  # noqa: F401
         from app.models.job_master_interface import JobMasterInterface  # noqa: F401
         from app.models.job_master_version import JobMasterVersion  # noqa: F401
-        from app.models.result import JobResult, JobResultHistory  # noqa: F401
+        from app.models.result import (  # noqa: F401
+            JobResult,
+            JobResultHistory,
+            ResultBlob,
+        )
         from app.models.task import Task  # noqa: F401
         from app.models.task_master import TaskMaster  # noqa: F401
         from app.models.task_master_interface import TaskMasterInterface  # noqa: F401
@@ -7,17 +7,20 @@
 from typing import Any
 
 import httpx
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.config import get_settings
-from app.core.database import AsyncSessionLocal
+from app.core.database import WorkerSessionLocal, is_postgresql
 from app.models.job import BackoffStrategy, Job, JobStatus
 from app.models.result import JobResult
 from app.models.task import Task, TaskStatus
 from app.models.task_master import TaskMaster
 from app.models.task_master_interface import TaskMasterInterface
+from app.services.async_task_manager import AsyncTaskManager
 from app.services.interface_validator import (
     InterfaceValidationError,
     InterfaceValidator,
@@ -94,11 +97,16 @@ async def execute_job(self, job: Job) -> None:
     async def _execute_tasks(self, job: Job, tasks: list[Task]) -> None:
         """Execute tasks in order."""
         for task in tasks:
+            if task.status == TaskStatus.SUCCEEDED:
+                # Completed before this (resumed or retried) execution
+                continue
+
             logger.info(f"[TASK] Executing task {task.id} (order={task.order})")
 
-            # Update task status
+            # Update task status (callback token must be committed before sending)
             task.status = TaskStatus.RUNNING
             task.started_at = datetime.now(UTC)
+            callback_headers = AsyncTaskManager.callback_headers(task, self.settings)
             await self.session.commit()
 
             start_time = datetime.now(UTC)
@@ -154,12 +162,33 @@ async def _execute_tasks(self, job: Job, tasks: list[Task]) -> None:
                     response = await client.request(
                         method=task_master.method,
                         url=task_master.url,
-                        headers=task_master.headers or {},
+                        headers={**(task_master.headers or {}), **callback_headers},
                         json=resolved_body,
                         timeout=task_master.timeout_sec,
                     )
                     logger.info(f"[TASK] Response status: {response.status_code}")
 
+                    # 202 Accepted: release the worker until callback/poll completes
+                    if AsyncTaskManager.is_accepted(task, response):
+                        if await AsyncTaskManager.begin_wait(
+                            self.session, task, job, response, self.settings
+                        ):
+                            await self.session.commit()
+                            logger.info(
+                                f"[TASK] Task {task.id} accepted for asynchronous completion"
+                            )
+                            return
+
+                        # Callback arrived before the acknowledgement was handled
+                        await self.session.refresh(task)
+                        if task.status == TaskStatus.SUCCEEDED:
+                            continue
+                        await self._skip_remaining_tasks(tasks, task.order)
+                        job.status = JobStatus.FAILED
+                        job.finished_at = datetime.now(UTC)
+                        await self.session.commit()
+                        return
+
                     # Parse response
                     output_data = None
                     if response.content:
@@ -338,52 +367,26 @@ async def _store_job_result(
         response_body: dict[str, Any] | None = None,
         error: str | None = None,
     ) -> None:
-        """Store or update job result safely using upsert pattern."""
+        """Store or update job result with a native upsert on job_id."""
         duration_ms = int((datetime.now(UTC) - start_time).total_seconds() * 1000)
 
-        # Try to get existing result first
-        result = await self.session.scalar(
-            select(JobResult).where(JobResult.job_id == job_id)
+        values: dict[str, Any] = {
+            "response_status": response_status,
+            "response_headers": response_headers,
+            "response_body": response_body,
+            "error": error,
+            "duration_ms": duration_ms,
+        }
+
+        # INSERT ... ON CONFLICT (job_id) DO UPDATE is atomic on both backends,
+        # so concurrent writers for the same job cannot race.
+        insert = pg_insert if is_postgresql(self.session) else sqlite_insert
+        stmt = insert(JobResult).values(job_id=job_id, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobResult.job_id],
+            set_={**values, "updated_at": datetime.now(UTC)},
         )
-
-        if result:
-            # Update existing result
-            result.response_status = response_status
-            result.response_headers = response_headers
-            result.response_body = response_body
-            result.error = error
-            result.duration_ms = duration_ms
-            result.updated_at = datetime.now(UTC)
-        else:
-            # Create new result
-            try:
-                result = JobResult(
-                    job_id=job_id,
-                    response_status=response_status,
-                    response_headers=response_headers,
-                    response_body=response_body,
-                    error=error,
-                    duration_ms=duration_ms,
-                )
-                self.session.add(result)
-                await self.session.flush()  # Flush to catch constraint violations
-            except Exception as e:
-                # Handle race condition: another process created the result
-                if "UNIQUE constraint failed" in str(e):
-                    await self.session.rollback()
-                    # Retry with update approach
-                    result = await self.session.scalar(
-                        select(JobResult).where(JobResult.job_id == job_id)
-                    )
-                    if result:
-                        result.response_status = response_status
-                        result.response_headers = response_headers
-                        result.response_body = response_body
-                        result.error = error
-                        result.duration_ms = duration_ms
-                        result.updated_at = datetime.now(UTC)
-                else:
-                    raise  # Re-raise if not a constraint violation
+        await self.session.execute(stmt)
 
     async def _schedule_retry(self, job: Job) -> None:
         """Schedule a job retry."""
@@ -420,6 +423,7 @@ def __init__(self) -> None:
         self.settings = get_settings()
         self.running = False
         self.workers: list[asyncio.Task[None]] = []
+        self.async_task_poller: asyncio.Task[None] | None = None
 
     async def start(self) -> None:
         """Start the worker manager."""
@@ -431,9 +435,12 @@ async def start(self) -> None:
             worker = asyncio.create_task(self._worker_loop(f"worker-{i}"))
             self.workers.append(worker)
 
+        # Completes tasks waiting on a poll URL and expires overdue ones
+        self.async_task_poller = asyncio.create_task(self._async_task_loop())
+
         # Wait for all workers to complete
         try:
-            await asyncio.gather(*self.workers)
+            await asyncio.gather(*self.workers, self.async_task_poller)
         except asyncio.CancelledError:
             logger.info("Worker manager cancelled")
         finally:
@@ -447,9 +454,17 @@ async def stop(self) -> None:
         for worker in self.workers:
             worker.cancel()
 
+        if self.async_task_poller:
+            self.async_task_poller.cancel()
+
         # Wait for cancellation
-        await asyncio.gather(*self.workers, return_exceptions=True)
+        await asyncio.gather(
+            *self.workers,
+            *([self.async_task_poller] if self.async_task_poller else []),
+            return_exceptions=True,
+        )
         self.workers.clear()
+        self.async_task_poller = None
 
     async def _worker_loop(self, worker_name: str) -> None:
         """Main worker loop."""
@@ -457,7 +472,7 @@ async def _worker_loop(self, worker_name: str) -> None:
 
         while self.running:
             try:
-                async with AsyncSessionLocal() as session:
+                async with WorkerSessionLocal() as session:
                     # Get next available job
                     logger.debug(f"[WORKER] {worker_name} polling for next job...")
                     job = await self._get_next_job(session)
@@ -487,6 +502,26 @@ async def _worker_loop(self, worker_name: str) -> None:
 
         logger.info(f"Worker {worker_name} stopped")
 
+    async def _async_task_loop(self) -> None:
+        """Poll and expire tasks awaiting asynchronous completion."""
+        logger.info("[ASYNC_TASK] Starting asynchronous task poller")
+
+        async with httpx.AsyncClient() as client:
+            while self.running:
+                try:
+                    async with WorkerSessionLocal() as session:
+                        await AsyncTaskManager.expire_overdue(session)
+                        await AsyncTaskManager.poll_due(session, client, self.settings)
+                    await asyncio.sleep(self.settings.async_poll_interval)
+
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.error(f"Asynchronous task poller error: {e}")
+                    await asyncio.sleep(1)  # Brief pause before retrying
+
+        logger.info("[ASYNC_TASK] Asynchronous task poller stopped")
+
     async def _get_next_job(self, session: AsyncSession) -> Job | None:
         """Get the next job to execute with optimistic locking.
 
@@ -494,20 +529,39 @@ async def _get_next_job(self, session: AsyncSession) -> Job | None:
         multiple concurrent workers, by using an atomic UPDATE operation.
         """
         now = datetime.now(UTC)
+        claimable = and_(
+            Job.status == JobStatus.QUEUED,
+            or_(Job.next_attempt_at.is_(None), Job.next_attempt_at <= now),
+        )
+        # Higher priority first (lower number)
+        ordering = (Job.priority.asc(), Job.created_at.asc())
+
+        if is_postgresql(session):
+            # Claim in a single statement; SKIP LOCKED lets concurrent workers
+            # (across processes and hosts) take different rows without waiting.
+            candidate = (
+                select(Job.id)
+                .where(claimable)
+                .order_by(*ordering)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            result = await session.execute(
+                update(Job)
+                .where(Job.id == candidate)
+                .values(status=JobStatus.RUNNING, started_at=now)
+                .returning(Job)
+            )
+            job = result.scalar_one_or_none()
+            await session.commit()
+            if job:
+                logger.debug(f"[WORKER] Successfully claimed job {job.id}")
+            return job
 
         # Find candidate job ID (not the full job object)
         candidate_id = await session.scalar(
-            select(Job.id)
-            .where(
-                and_(
-                    Job.status == JobStatus.QUEUED,
-                    or_(Job.next_attempt_at.is_(None), Job.next_attempt_at <= now),
-                )
-            )
-            .order_by(
-                Job.priority.asc(), Job.created_at.asc()
-            )  # Higher priority first (lower number)
-            .limit(1)
+            select(Job.id).where(claimable).order_by(*ordering).limit(1)
         )
 
         if not candidate_id:
@@ -515,8 +569,6 @@ async def _get_next_job(self, session: AsyncSession) -> Job | None:
 
         # Try to atomically claim this job by updating its status
         # This will only succeed for one worker if multiple workers try simultaneously
-        from sqlalchemy import update
-
         result = await session.execute(
             update(Job)
             .where(
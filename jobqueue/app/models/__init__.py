@@ -5,7 +5,7 @@
 from app.models.job_master import JobMaster
 from app.models.job_master_interface import JobMasterInterface
 from app.models.job_master_version import JobMasterVersion
-from app.models.result import JobResult, JobResultHistory
+from app.models.result import JobResult, JobResultHistory, ResultBlob
 from app.models.task import Task, TaskStatus
 from app.models.task_master import TaskMaster
 from app.models.task_master_interface import TaskMasterInterface
@@ -21,6 +21,7 @@
     "JobResult",
     "JobResultHistory",
     "JobStatus",
+    "ResultBlob",
     "Task",
     "TaskMaster",
     "TaskMasterInterface",
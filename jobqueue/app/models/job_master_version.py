@@ -3,11 +3,11 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import JSON, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-from app.core.database import Base
+from app.core.database import Base, UTCDateTime
 
 
 class JobMasterVersion(Base):
@@ -36,7 +36,7 @@ class JobMasterVersion(Base):
     tags: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
 
     # Metadata
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(UTCDateTime, server_default=func.now())
     created_by: Mapped[str | None] = mapped_column(String(100), nullable=True)
     change_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
 
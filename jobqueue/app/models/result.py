@@ -3,11 +3,19 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-from app.core.database import Base
+from app.core.database import Base, UTCDateTime
 
 
 class JobResult(Base):
@@ -35,9 +43,9 @@ class JobResult(Base):
     duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(UTCDateTime, server_default=func.now())
     updated_at: Mapped[datetime | None] = mapped_column(
-        DateTime, onupdate=func.now(), nullable=True
+        UTCDateTime, onupdate=func.now(), nullable=True
     )
 
     # Relationship
@@ -55,10 +63,14 @@ class JobResultHistory(Base):
     # Attempt number (1, 2, 3, ...)
     attempt: Mapped[int] = mapped_column(Integer, nullable=False)
 
-    # HTTP response data
+    # HTTP response data (headers/body are stored once in result_blobs)
     response_status: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    response_headers: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
-    response_body: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    response_headers_hash: Mapped[str | None] = mapped_column(
+        String(64), ForeignKey("result_blobs.hash"), nullable=True
+    )
+    response_body_hash: Mapped[str | None] = mapped_column(
+        String(64), ForeignKey("result_blobs.hash"), nullable=True
+    )
 
     # Error information
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -67,7 +79,9 @@ class JobResultHistory(Base):
     duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Execution timestamp
-    executed_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    executed_at: Mapped[datetime] = mapped_column(
+        UTCDateTime, server_default=func.now()
+    )
 
     # Composite unique constraint on (job_id, attempt)
     __table_args__ = (
@@ -76,3 +90,24 @@ class JobResultHistory(Base):
 
     # Relationship
     job = relationship("Job", backref="result_history")
+
+
+class ResultBlob(Base):
+    """Deduplicated, compressed JSON payload referenced by result history rows.
+
+    Rows are content-addressed by the SHA-256 of the canonical JSON encoding,
+    so identical headers/bodies across attempts and jobs are stored once.
+    """
+
+    __tablename__ = "result_blobs"
+
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    # Compression codec of `data` (currently always "zlib")
+    encoding: Mapped[str] = mapped_column(String(16), nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    # Size of the uncompressed JSON payload in bytes
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(UTCDateTime, server_default=func.now())
@@ -2,6 +2,8 @@
 
 from app.schemas.health import HealthResponse
 from app.schemas.job import (
+    JobBatchFromMaster,
+    JobBatchResponse,
     JobCreate,
     JobCreateFromMaster,
     JobDetail,
@@ -19,6 +21,8 @@
 
 __all__ = [
     "HealthResponse",
+    "JobBatchFromMaster",
+    "JobBatchResponse",
     "JobCreate",
     "JobCreateFromMaster",
     "JobDetail",
@@ -172,3 +172,37 @@ class JobCreateFromMaster(BaseModel):
         default=True,
         description="Whether to validate interface compatibility between tasks",
     )
+
+
+class JobBatchItem(JobCreateFromMaster):
+    """One job in a batch submission from master templates."""
+
+    master_id: str = Field(..., description="Job master ID")
+
+
+class JobBatchFromMaster(BaseModel):
+    """Schema for creating many jobs from master templates at once.
+
+    Items are validated one by one as JobBatchItem, so an invalid item is
+    reported in its own result instead of rejecting the whole batch.
+    """
+
+    jobs: list[dict[str, Any]] = Field(
+        ..., min_length=1, max_length=1000, description="Jobs to create"
+    )
+
+
+class JobBatchItemResult(BaseModel):
+    """Outcome of one item in a batch submission."""
+
+    master_id: str
+    status_code: int = Field(..., description="201 if created, else the error code")
+    job_id: str | None = None
+    error: str | None = None
+
+
+class JobBatchResponse(BaseModel):
+    """Schema for batch job creation response (results are in request order)."""
+
+    results: list[JobBatchItemResult]
+    created: int
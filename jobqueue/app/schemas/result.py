@@ -28,7 +28,11 @@ class JobResultResponse(BaseModel):
 
 
 class JobResultHistoryItem(BaseModel):
-    """Schema for a single job result history entry."""
+    """Schema for a single job result history entry.
+
+    Only id, job_id and attempt are guaranteed; other fields may be omitted
+    when the history is requested with a `fields=` projection.
+    """
 
     id: int = Field(..., description="History entry ID")
     job_id: str = Field(..., description="Job identifier")
@@ -42,7 +46,7 @@ class JobResultHistoryItem(BaseModel):
     duration_ms: int | None = Field(
         None, description="Execution duration in milliseconds"
     )
-    executed_at: datetime = Field(..., description="Execution timestamp")
+    executed_at: datetime | None = Field(None, description="Execution timestamp")
 
     model_config = {"from_attributes": True}
 
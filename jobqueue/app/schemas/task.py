@@ -1,7 +1,7 @@
 """Task schemas."""
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -58,6 +58,24 @@ class TaskRetryResponse(BaseModel):
     message: str
 
 
+class TaskCallback(BaseModel):
+    """Asynchronous task completion callback schema."""
+
+    status: Literal["succeeded", "failed"] = Field(
+        ..., description="Final status of the task"
+    )
+    output_data: dict[str, Any] | None = Field(None, description="Task output")
+    error: str | None = Field(None, description="Error message (failed only)")
+
+
+class TaskCallbackResponse(BaseModel):
+    """Asynchronous task completion callback response schema."""
+
+    task_id: str
+    status: str
+    job_status: str
+
+
 class TaskListAll(BaseModel):
     """Task list response schema for all tasks with pagination."""
 
@@ -73,6 +91,7 @@ class TaskStats(BaseModel):
     total_tasks: int
     queued_tasks: int
     running_tasks: int
+    waiting_tasks: int = Field(0, description="Tasks awaiting asynchronous completion")
     succeeded_tasks: int
     failed_tasks: int
     skipped_tasks: int
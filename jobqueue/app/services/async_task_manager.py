@@ -0,0 +1,382 @@
+"""Asynchronous completion of long-running tasks.
+
+Protocol:
+    1. The worker sends each task request with ``X-JobQueue-Callback-URL`` and
+       ``X-JobQueue-Callback-Token`` headers (when ``CALLBACK_BASE_URL`` is set).
+    2. A long-running upstream answers ``202 Accepted``, optionally with a poll
+       URL (``poll_url`` / ``status_url`` in the JSON body, or ``Location``).
+    3. The task becomes WAITING, its job becomes WAITING and the worker slot is
+       released.
+    4. The task completes when the upstream POSTs to the callback URL, or when
+       polling the poll URL returns something other than 202. A succeeded task
+       re-queues its job so the remaining tasks run; a failed task fails it.
+"""
+
+import asyncio
+import hmac
+import json
+import logging
+import secrets
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from urllib.parse import urljoin
+
+import httpx
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.job import Job, JobStatus
+from app.models.task import Task, TaskStatus
+from app.models.task_master_interface import TaskMasterInterface
+from app.services.interface_validator import (
+    InterfaceValidationError,
+    InterfaceValidator,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTaskManager:
+    """Service for tasks that complete asynchronously (202 Accepted)."""
+
+    CALLBACK_URL_HEADER = "X-JobQueue-Callback-URL"
+    CALLBACK_TOKEN_HEADER = "X-JobQueue-Callback-Token"
+
+    # JSON fields of a 202 body that may carry the poll URL
+    POLL_URL_FIELDS = ("poll_url", "status_url")
+
+    # Waiting tasks handled per poll/expiry pass
+    BATCH_SIZE = 50
+
+    @staticmethod
+    def callback_headers(task: Task, settings: Any) -> dict[str, str]:
+        """
+        Issue a callback token for this attempt and return the headers to send.
+
+        Returns an empty dict when no callback base URL is configured.
+        """
+        if not settings.callback_base_url:
+            return {}
+
+        task.callback_token = secrets.token_urlsafe(32)
+        base_url = settings.callback_base_url.rstrip("/")
+        return {
+            AsyncTaskManager.CALLBACK_URL_HEADER: (
+                f"{base_url}/api/v1/tasks/{task.id}/callback"
+            ),
+            AsyncTaskManager.CALLBACK_TOKEN_HEADER: task.callback_token,
+        }
+
+    @staticmethod
+    def get_poll_url(response: httpx.Response) -> str | None:
+        """
+        Extract the poll URL from a 202 response (relative URLs are resolved).
+        """
+        poll_url = None
+        try:
+            body = response.json() if response.content else None
+        except json.JSONDecodeError:
+            body = None
+        if isinstance(body, dict):
+            poll_url = next(
+                (body[f] for f in AsyncTaskManager.POLL_URL_FIELDS if body.get(f)),
+                None,
+            )
+        poll_url = poll_url or response.headers.get("location")
+        if not poll_url:
+            return None
+        return urljoin(str(response.request.url), str(poll_url))
+
+    @staticmethod
+    def is_accepted(task: Task, response: httpx.Response) -> bool:
+        """
+        Whether a response acknowledges the task for asynchronous completion.
+
+        A 202 without a callback token or poll URL keeps the legacy behavior
+        (treated as a synchronous success).
+        """
+        if response.status_code != 202:
+            return False
+        return (
+            task.callback_token is not None
+            or AsyncTaskManager.get_poll_url(response) is not None
+        )
+
+    @staticmethod
+    async def begin_wait(
+        db: AsyncSession,
+        task: Task,
+        job: Job,
+        response: httpx.Response,
+        settings: Any,
+    ) -> bool:
+        """
+        Move a RUNNING task and its job to WAITING (not committed).
+
+        Returns False if the task is no longer RUNNING, i.e. its callback
+        arrived before the acknowledgement was processed.
+        """
+        now = datetime.now(UTC)
+        poll_url = AsyncTaskManager.get_poll_url(response)
+
+        result = await db.execute(
+            update(Task)
+            .where(Task.id == task.id, Task.status == TaskStatus.RUNNING)
+            .values(
+                status=TaskStatus.WAITING,
+                poll_url=poll_url,
+                next_poll_at=(
+                    now + timedelta(seconds=settings.async_poll_interval)
+                    if poll_url
+                    else None
+                ),
+                wait_deadline=now + timedelta(seconds=settings.async_task_timeout_sec),
+            )
+        )
+        if result.rowcount == 0:  # type: ignore[attr-defined]
+            return False
+
+        job.status = JobStatus.WAITING
+        return True
+
+    @staticmethod
+    def verify_token(task: Task, token: str | None) -> bool:
+        """
+        Check a callback token against the one issued for the task.
+        """
+        if not task.callback_token or not token:
+            return False
+        return hmac.compare_digest(task.callback_token, token)
+
+    @staticmethod
+    async def complete(
+        db: AsyncSession,
+        task: Task,
+        succeeded: bool,
+        output_data: Any = None,
+        error: str | None = None,
+    ) -> bool:
+        """
+        Finish an asynchronously running task and resume or fail its job.
+
+        Returns False if the task was already completed elsewhere.
+        """
+        now = datetime.now(UTC)
+
+        if succeeded and output_data:
+            validation_error = await AsyncTaskManager._validate_output(
+                db, task.master_id, output_data
+            )
+            if validation_error:
+                succeeded, error = False, validation_error
+
+        started_at = task.started_at
+        if started_at and started_at.tzinfo is None:
+            started_at = started_at.replace(tzinfo=UTC)  # Stored as naive UTC
+        result = await db.execute(
+            update(Task)
+            .where(
+                Task.id == task.id,
+                Task.status.in_([TaskStatus.RUNNING, TaskStatus.WAITING]),
+            )
+            .values(
+                status=TaskStatus.SUCCEEDED if succeeded else TaskStatus.FAILED,
+                output_data=output_data,
+                error=None if succeeded else error,
+                finished_at=now,
+                duration_ms=(
+                    int((now - started_at).total_seconds() * 1000)
+                    if started_at
+                    else None
+                ),
+                callback_token=None,
+                poll_url=None,
+                next_poll_at=None,
+                wait_deadline=None,
+            )
+        )
+        if result.rowcount == 0:  # type: ignore[attr-defined]
+            # Nothing was written: no rollback, which would expire the tasks
+            # the caller is still iterating over
+            return False
+
+        # A job still RUNNING is owned by a worker that picks the result up
+        # itself; only WAITING jobs are resumed or failed here.
+        if succeeded:
+            await db.execute(
+                update(Job)
+                .where(Job.id == task.job_id, Job.status == JobStatus.WAITING)
+                .values(status=JobStatus.QUEUED, next_attempt_at=now)
+            )
+        else:
+            job_result = await db.execute(
+                update(Job)
+                .where(Job.id == task.job_id, Job.status == JobStatus.WAITING)
+                .values(status=JobStatus.FAILED, finished_at=now)
+            )
+            if job_result.rowcount:  # type: ignore[attr-defined]
+                await db.execute(
+                    update(Task)
+                    .where(
+                        Task.job_id == task.job_id,
+                        Task.order > task.order,
+                        Task.status == TaskStatus.QUEUED,
+                    )
+                    .values(status=TaskStatus.SKIPPED)
+                )
+
+        await db.commit()
+        logger.info(
+            f"[ASYNC_TASK] Task {task.id} completed asynchronously "
+            f"({'succeeded' if succeeded else 'failed'})"
+        )
+        return True
+
+    @staticmethod
+    async def expire_overdue(db: AsyncSession) -> int:
+        """
+        Fail waiting tasks whose completion deadline has passed.
+        """
+        now = datetime.now(UTC)
+        result = await db.scalars(
+            select(Task)
+            .where(Task.status == TaskStatus.WAITING, Task.wait_deadline <= now)
+            .limit(AsyncTaskManager.BATCH_SIZE)
+        )
+        expired = 0
+        for task in result.all():
+            if await AsyncTaskManager.complete(
+                db, task, succeeded=False, error="Asynchronous completion timed out"
+            ):
+                expired += 1
+        return expired
+
+    @staticmethod
+    async def cancel_waiting(db: AsyncSession, job_id: str) -> int:
+        """
+        Stop waiting for the asynchronous tasks of a canceled job (not committed).
+
+        The tasks are failed with their callback token, poll URL and deadline
+        cleared, so polling stops and late callbacks are rejected. Tasks that
+        have not run yet are skipped.
+
+        Returns the number of waiting tasks canceled.
+        """
+        now = datetime.now(UTC)
+        result = await db.execute(
+            update(Task)
+            .where(Task.job_id == job_id, Task.status == TaskStatus.WAITING)
+            .values(
+                status=TaskStatus.FAILED,
+                error="Job canceled",
+                finished_at=now,
+                callback_token=None,
+                poll_url=None,
+                next_poll_at=None,
+                wait_deadline=None,
+            )
+        )
+        canceled: int = result.rowcount  # type: ignore[attr-defined]
+        if canceled:
+            await db.execute(
+                update(Task)
+                .where(Task.job_id == job_id, Task.status == TaskStatus.QUEUED)
+                .values(status=TaskStatus.SKIPPED)
+            )
+        return canceled
+
+    @staticmethod
+    async def poll_due(
+        db: AsyncSession, client: httpx.AsyncClient, settings: Any
+    ) -> int:
+        """
+        Poll the status URLs of waiting tasks that are due.
+
+        Returns the number of tasks completed.
+        """
+        now = datetime.now(UTC)
+        result = await db.scalars(
+            select(Task)
+            .where(
+                Task.status == TaskStatus.WAITING,
+                Task.poll_url.is_not(None),
+                Task.next_poll_at <= now,
+            )
+            .order_by(Task.next_poll_at)
+            .limit(AsyncTaskManager.BATCH_SIZE)
+        )
+        tasks = list(result.all())
+        if not tasks:
+            return 0
+
+        # Requests run concurrently; results are applied sequentially
+        responses = await asyncio.gather(
+            *(
+                client.get(str(task.poll_url), timeout=settings.default_timeout)
+                for task in tasks
+            ),
+            return_exceptions=True,
+        )
+
+        completed = 0
+        next_poll_at = now + timedelta(seconds=settings.async_poll_interval)
+        for task, response in zip(tasks, responses, strict=True):
+            if isinstance(response, BaseException):
+                logger.warning(
+                    f"[ASYNC_TASK] Polling task {task.id} failed: {response}"
+                )
+                task.next_poll_at = next_poll_at
+                continue
+            if response.status_code == 202:
+                task.next_poll_at = next_poll_at
+                continue
+
+            await db.commit()  # Persist poll schedule updates so far
+            if await AsyncTaskManager.complete(
+                db,
+                task,
+                succeeded=response.is_success,
+                output_data=AsyncTaskManager.parse_output(response),
+                error=None
+                if response.is_success
+                else f"HTTP {response.status_code}: {response.text}",
+            ):
+                completed += 1
+
+        await db.commit()
+        return completed
+
+    @staticmethod
+    def parse_output(response: httpx.Response) -> Any:
+        """
+        Parse a response body into task output data (as the worker does).
+        """
+        if not response.content:
+            return None
+        try:
+            return response.json()
+        except json.JSONDecodeError:
+            return {"text": response.text}
+
+    @staticmethod
+    async def _validate_output(
+        db: AsyncSession, master_id: str, output_data: dict[str, Any]
+    ) -> str | None:
+        """
+        Validate output against required interfaces; return an error or None.
+        """
+        interfaces = await db.scalars(
+            select(TaskMasterInterface)
+            .where(TaskMasterInterface.task_master_id == master_id)
+            .options(selectinload(TaskMasterInterface.interface_master))
+        )
+        for assoc in interfaces.all():
+            if assoc.required and assoc.interface_master.output_schema:
+                try:
+                    InterfaceValidator.validate_output(
+                        output_data, assoc.interface_master.output_schema
+                    )
+                except InterfaceValidationError as e:
+                    return f"Output validation failed: {'; '.join(e.errors)}"
+        return None
@@ -0,0 +1,87 @@
+"""Content-addressed storage for result headers/bodies."""
+
+import hashlib
+import json
+import zlib
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import is_postgresql
+from app.models.result import ResultBlob
+
+
+class ResultBlobStore:
+    """Service for storing JSON payloads once in the result_blobs table."""
+
+    ENCODING = "zlib"
+    COMPRESSION_LEVEL = 6
+
+    @staticmethod
+    def encode(payload: Any) -> tuple[str, bytes, int]:
+        """
+        Encode a JSON payload for storage.
+
+        Returns:
+            (sha256 hex digest, compressed bytes, uncompressed size)
+        """
+        raw = json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        return (
+            digest,
+            zlib.compress(raw, ResultBlobStore.COMPRESSION_LEVEL),
+            len(raw),
+        )
+
+    @staticmethod
+    def decode(blob: ResultBlob) -> Any:
+        """
+        Decode a stored blob back into its JSON payload.
+        """
+        if blob.encoding != ResultBlobStore.ENCODING:
+            raise ValueError(f"Unsupported result blob encoding: {blob.encoding}")
+        return json.loads(zlib.decompress(blob.data))
+
+    @staticmethod
+    async def store(db: AsyncSession, payload: Any) -> str | None:
+        """
+        Store a payload (if not already present) and return its hash.
+
+        None payloads are not stored and yield None.
+        """
+        if payload is None:
+            return None
+
+        digest, data, size = ResultBlobStore.encode(payload)
+
+        # INSERT ... ON CONFLICT (hash) DO NOTHING: concurrent writers of the
+        # same payload cannot race between a lookup and the insert.
+        insert = pg_insert if is_postgresql(db) else sqlite_insert
+        await db.execute(
+            insert(ResultBlob)
+            .values(
+                hash=digest,
+                encoding=ResultBlobStore.ENCODING,
+                data=data,
+                size_bytes=size,
+            )
+            .on_conflict_do_nothing(index_elements=[ResultBlob.hash])
+        )
+        return digest
+
+    @staticmethod
+    async def load_many(db: AsyncSession, hashes: set[str | None]) -> dict[str, Any]:
+        """
+        Load and decode several payloads in a single query.
+        """
+        wanted = {h for h in hashes if h}
+        if not wanted:
+            return {}
+
+        blobs = await db.scalars(select(ResultBlob).where(ResultBlob.hash.in_(wanted)))
+        return {blob.hash: ResultBlobStore.decode(blob) for blob in blobs.all()}
@@ -0,0 +1,143 @@
+"""Immutable snapshots of master / master-version rows and their cache."""
+
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from enum import Enum
+from types import MappingProxyType
+from typing import Any
+
+from app.core.database import Base
+
+
+def _canonical(value: Any) -> Any:
+    """Normalize a field value so equal configurations hash identically."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def structural_hash(values: Mapping[str, Any], fields: Iterable[str]) -> str:
+    """
+    Hash the given fields of a configuration.
+
+    Two configurations with the same hash are treated as unchanged, so change
+    detection is a string compare instead of a field-by-field diff.
+    """
+    canonical = {field: _canonical(values.get(field)) for field in sorted(fields)}
+    raw = json.dumps(
+        canonical,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    Read-only copy of a row, detached from any session.
+
+    Column values are available as attributes (so Pydantic ``from_attributes``
+    works); dict/list values are copied on access so callers cannot mutate
+    the cached copy.
+    """
+
+    values: Mapping[str, Any]
+    config_hash: str
+
+    @classmethod
+    def from_row(
+        cls,
+        row: Base,
+        hash_fields: Iterable[str],
+        extra: Mapping[str, Any] | None = None,
+    ) -> "Snapshot":
+        """Build a snapshot from an ORM row's column values."""
+        values = {
+            column.key: copy.deepcopy(getattr(row, column.key))
+            for column in row.__table__.columns
+        }
+        if extra:
+            values.update(copy.deepcopy(dict(extra)))
+        return cls(
+            values=MappingProxyType(values),
+            config_hash=structural_hash(values, hash_fields),
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            value = self.values[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        if isinstance(value, dict | list):
+            return copy.deepcopy(value)
+        return value
+
+
+class SnapshotCache:
+    """
+    Bounded LRU cache of snapshots.
+
+    Entries for immutable rows (master versions) never expire. Entries for
+    mutable rows (current masters) are invalidated by the endpoints that
+    modify them and additionally expire after ``ttl_seconds`` so changes
+    made by another process are eventually picked up.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float | None = None) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Snapshot]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Snapshot | None:
+        """Return a cached snapshot, or None on a miss or expired entry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stored_at, snapshot = entry
+        if (
+            self.ttl_seconds is not None
+            and time.monotonic() - stored_at > self.ttl_seconds
+        ):
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return snapshot
+
+    def put(self, key: Hashable, snapshot: Snapshot) -> None:
+        """Store a snapshot, evicting the least recently used entry if full."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic(), snapshot)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -5,10 +5,14 @@
 
 from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from app.core.config import get_settings
 from app.models.task import Task
 from app.models.task_master import TaskMaster
+from app.models.task_master_interface import TaskMasterInterface
 from app.models.task_master_version import TaskMasterVersion
+from app.services.snapshot_cache import Snapshot, SnapshotCache, structural_hash
 
 
 class TaskVersionManager:
@@ -23,6 +27,14 @@ class TaskVersionManager:
         "timeout_sec",
     }
 
+    # Version rows never change once written; current masters are invalidated
+    # by the endpoints that modify them or their interfaces.
+    _versions = SnapshotCache(max_entries=get_settings().master_cache_size)
+    _masters = SnapshotCache(
+        max_entries=get_settings().master_cache_size,
+        ttl_seconds=get_settings().master_cache_ttl_seconds,
+    )
+
     @staticmethod
     async def should_create_new_version(
         db: AsyncSession,
@@ -35,13 +47,12 @@ async def should_create_new_version(
         Returns:
             (should_version, reason)
         """
-        # Check if any critical fields changed
-        has_critical_change = any(
-            field in update_data and getattr(master, field) != update_data[field]
-            for field in TaskVersionManager.VERSION_CRITICAL_FIELDS
-        )
+        # Compare structural hashes of the current and updated configuration
+        fields = TaskVersionManager.VERSION_CRITICAL_FIELDS
+        current = {field: getattr(master, field) for field in fields}
+        updated = {**current, **{f: update_data[f] for f in fields if f in update_data}}
 
-        if not has_critical_change:
+        if structural_hash(current, fields) == structural_hash(updated, fields):
             return False, "重要フィールドに変更がないため、バージョンアップ不要"
 
         # Check if any tasks exist for this master
@@ -54,8 +65,8 @@ async def should_create_new_version(
 
         changed_fields = [
             field
-            for field in TaskVersionManager.VERSION_CRITICAL_FIELDS
-            if field in update_data and getattr(master, field) != update_data[field]
+            for field in sorted(fields)
+            if structural_hash(current, [field]) != structural_hash(updated, [field])
         ]
 
         return (
@@ -103,11 +114,81 @@ async def save_current_version(
         await db.flush()
         return version_entry
 
+    @staticmethod
+    async def get_master_snapshot(
+        db: AsyncSession,
+        master_id: str,
+    ) -> Snapshot | None:
+        """
+        Get the current configuration of a master, served from cache when possible.
+
+        The snapshot also carries ``required_input_schemas``: the input schemas
+        of the required interfaces associated with the master.
+        """
+        snapshot = TaskVersionManager._masters.get(master_id)
+        if snapshot is None:
+            master = await db.get(TaskMaster, master_id)
+            if not master:
+                return None
+
+            interface_associations = await db.scalars(
+                select(TaskMasterInterface)
+                .where(TaskMasterInterface.task_master_id == master_id)
+                .options(selectinload(TaskMasterInterface.interface_master))
+            )
+            required_input_schemas = [
+                assoc.interface_master.input_schema
+                for assoc in interface_associations.all()
+                if assoc.required and assoc.interface_master.input_schema
+            ]
+
+            snapshot = Snapshot.from_row(
+                master,
+                TaskVersionManager.VERSION_CRITICAL_FIELDS,
+                extra={"required_input_schemas": required_input_schemas},
+            )
+            TaskVersionManager._masters.put(master_id, snapshot)
+        return snapshot
+
+    @staticmethod
+    def invalidate_master(master_id: str | None = None) -> None:
+        """
+        Drop the cached current configuration of a master (or of all masters).
+
+        Call after committing any change to the master row or its interfaces.
+        """
+        if master_id is None:
+            TaskVersionManager._masters.clear()
+        else:
+            TaskVersionManager._masters.invalidate(master_id)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Drop all cached master and version snapshots.
+        """
+        TaskVersionManager._masters.clear()
+        TaskVersionManager._versions.clear()
+
+    @staticmethod
+    def _version_snapshot(version_entry: TaskMasterVersion) -> Snapshot:
+        """
+        Get the cached snapshot of a version row, creating it if needed.
+        """
+        key = (version_entry.master_id, version_entry.version)
+        snapshot = TaskVersionManager._versions.get(key)
+        if snapshot is None:
+            snapshot = Snapshot.from_row(
+                version_entry, TaskVersionManager.VERSION_CRITICAL_FIELDS
+            )
+            TaskVersionManager._versions.put(key, snapshot)
+        return snapshot
+
     @staticmethod
     async def get_version_history(
         db: AsyncSession,
         master_id: str,
-    ) -> list[TaskMasterVersion]:
+    ) -> list[Snapshot]:
         """
         Get all version history for a master.
         """
@@ -116,29 +197,35 @@ async def get_version_history(
             .where(TaskMasterVersion.master_id == master_id)
             .order_by(desc(TaskMasterVersion.version))
         )
-        return list(result.all())
+        return [TaskVersionManager._version_snapshot(entry) for entry in result.all()]
 
     @staticmethod
     async def get_version(
         db: AsyncSession,
         master_id: str,
         version: int,
-    ) -> TaskMasterVersion | None:
+    ) -> Snapshot | None:
         """
         Get a specific version of a master.
         """
+        snapshot = TaskVersionManager._versions.get((master_id, version))
+        if snapshot is not None:
+            return snapshot
+
         result = await db.scalar(
             select(TaskMasterVersion).where(
                 TaskMasterVersion.master_id == master_id,
                 TaskMasterVersion.version == version,
             )
         )
-        return result
+        if result is None:
+            return None
+        return TaskVersionManager._version_snapshot(result)
 
     @staticmethod
     def compare_versions(
-        prev_version: TaskMasterVersion | None,
-        current_version: TaskMasterVersion,
+        prev_version: Snapshot | None,
+        current_version: Snapshot,
     ) -> list[str]:
         """
         Compare two versions and return list of changed fields.
@@ -146,11 +233,12 @@ def compare_versions(
         if prev_version is None:
             return []
 
-        changed_fields = []
-        for field in TaskVersionManager.VERSION_CRITICAL_FIELDS:
-            prev_value = getattr(prev_version, field)
-            curr_value = getattr(current_version, field)
-            if prev_value != curr_value:
-                changed_fields.append(field)
+        # Identical configurations share a hash; only diff when they differ
+        if prev_version.config_hash == current_version.config_hash:
+            return []
 
-        return changed_fields
+        return [
+            field
+            for field in sorted(TaskVersionManager.VERSION_CRITICAL_FIELDS)
+            if prev_version.values[field] != current_version.values[field]
+        ]
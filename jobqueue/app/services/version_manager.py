@@ -6,9 +6,11 @@
 from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.models.job import Job
 from app.models.job_master import JobMaster
 from app.models.job_master_version import JobMasterVersion
+from app.services.snapshot_cache import Snapshot, SnapshotCache, structural_hash
 
 
 class VersionManager:
@@ -28,6 +30,14 @@ class VersionManager:
         "ttl_seconds",
     }
 
+    # Version rows never change once written; current masters are invalidated
+    # by the endpoints that modify them.
+    _versions = SnapshotCache(max_entries=get_settings().master_cache_size)
+    _masters = SnapshotCache(
+        max_entries=get_settings().master_cache_size,
+        ttl_seconds=get_settings().master_cache_ttl_seconds,
+    )
+
     @staticmethod
     async def should_create_new_version(
         db: AsyncSession,
@@ -40,13 +50,12 @@ async def should_create_new_version(
         Returns:
             (should_version, reason)
         """
-        # Check if any critical fields changed
-        has_critical_change = any(
-            field in update_data and getattr(master, field) != update_data[field]
-            for field in VersionManager.VERSION_CRITICAL_FIELDS
-        )
+        # Compare structural hashes of the current and updated configuration
+        fields = VersionManager.VERSION_CRITICAL_FIELDS
+        current = {field: getattr(master, field) for field in fields}
+        updated = {**current, **{f: update_data[f] for f in fields if f in update_data}}
 
-        if not has_critical_change:
+        if structural_hash(current, fields) == structural_hash(updated, fields):
             return False, "重要フィールドに変更がないため、バージョンアップ不要"
 
         # Check if any jobs exist for this master
@@ -59,8 +68,8 @@ async def should_create_new_version(
 
         changed_fields = [
             field
-            for field in VersionManager.VERSION_CRITICAL_FIELDS
-            if field in update_data and getattr(master, field) != update_data[field]
+            for field in sorted(fields)
+            if structural_hash(current, [field]) != structural_hash(updated, [field])
         ]
 
         return (
@@ -77,6 +86,18 @@ async def save_current_version(
         """
         Save current master configuration as a version.
         """
+        # Check if this version already exists (saved when the master was created)
+        existing_version = await db.scalar(
+            select(JobMasterVersion).where(
+                JobMasterVersion.master_id == master.id,
+                JobMasterVersion.version == master.current_version,
+            )
+        )
+
+        if existing_version:
+            # Version already saved, return existing record
+            return existing_version
+
         version_entry = JobMasterVersion(
             master_id=master.id,
             version=master.current_version,
@@ -103,11 +124,59 @@ async def save_current_version(
         await db.flush()
         return version_entry
 
+    @staticmethod
+    async def get_master_snapshot(
+        db: AsyncSession,
+        master_id: str,
+    ) -> Snapshot | None:
+        """
+        Get the current configuration of a master, served from cache when possible.
+        """
+        snapshot = VersionManager._masters.get(master_id)
+        if snapshot is None:
+            master = await db.get(JobMaster, master_id)
+            if not master:
+                return None
+            snapshot = Snapshot.from_row(master, VersionManager.VERSION_CRITICAL_FIELDS)
+            VersionManager._masters.put(master_id, snapshot)
+        return snapshot
+
+    @staticmethod
+    def invalidate_master(master_id: str) -> None:
+        """
+        Drop the cached current configuration of a master.
+
+        Call after committing any change to the master row.
+        """
+        VersionManager._masters.invalidate(master_id)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Drop all cached master and version snapshots.
+        """
+        VersionManager._masters.clear()
+        VersionManager._versions.clear()
+
+    @staticmethod
+    def _version_snapshot(version_entry: JobMasterVersion) -> Snapshot:
+        """
+        Get the cached snapshot of a version row, creating it if needed.
+        """
+        key = (version_entry.master_id, version_entry.version)
+        snapshot = VersionManager._versions.get(key)
+        if snapshot is None:
+            snapshot = Snapshot.from_row(
+                version_entry, VersionManager.VERSION_CRITICAL_FIELDS
+            )
+            VersionManager._versions.put(key, snapshot)
+        return snapshot
+
     @staticmethod
     async def get_version_history(
         db: AsyncSession,
         master_id: str,
-    ) -> list[JobMasterVersion]:
+    ) -> list[Snapshot]:
         """
         Get all version history for a master.
         """
@@ -116,29 +185,35 @@ async def get_version_history(
             .where(JobMasterVersion.master_id == master_id)
             .order_by(desc(JobMasterVersion.version))
         )
-        return list(result.all())
+        return [VersionManager._version_snapshot(entry) for entry in result.all()]
 
     @staticmethod
     async def get_version(
         db: AsyncSession,
         master_id: str,
         version: int,
-    ) -> JobMasterVersion | None:
+    ) -> Snapshot | None:
         """
         Get a specific version of a master.
         """
+        snapshot = VersionManager._versions.get((master_id, version))
+        if snapshot is not None:
+            return snapshot
+
         result = await db.scalar(
             select(JobMasterVersion).where(
                 JobMasterVersion.master_id == master_id,
                 JobMasterVersion.version == version,
             )
         )
-        return result
+        if result is None:
+            return None
+        return VersionManager._version_snapshot(result)
 
     @staticmethod
     def compare_versions(
-        prev_version: JobMasterVersion | None,
-        current_version: JobMasterVersion,
+        prev_version: Snapshot | None,
+        current_version: Snapshot,
     ) -> list[str]:
         """
         Compare two versions and return list of changed fields.
@@ -146,11 +221,12 @@ def compare_versions(
         if prev_version is None:
             return []
 
-        changed_fields = []
-        for field in VersionManager.VERSION_CRITICAL_FIELDS:
-            prev_value = getattr(prev_version, field)
-            curr_value = getattr(current_version, field)
-            if prev_value != curr_value:
-                changed_fields.append(field)
+        # Identical configurations share a hash; only diff when they differ
+        if prev_version.config_hash == current_version.config_hash:
+            return []
 
-        return changed_fields
+        return [
+            field
+            for field in sorted(VersionManager.VERSION_CRITICAL_FIELDS)
+            if prev_version.values[field] != current_version.values[field]
+        ]
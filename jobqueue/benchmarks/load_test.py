@@ -0,0 +1,449 @@
+"""
+End-to-end load test for JobQueue.
+
+Starts JobQueue (uvicorn subprocess) against a fresh database and a mock
+upstream with configurable latency/payload, submits jobs with 0..N tasks and
+measures, for every `concurrency` setting:
+
+- enqueue rate (POST /api/v1/jobs, client side)
+- dequeue latency (job accepted -> worker started_at)
+- end-to-end latency p50/p95/p99 (job accepted -> finished_at)
+- DB size growth and server CPU time per job
+
+Results are written as JSON so runs can be compared for regressions.
+
+Run:
+    uv run python -m benchmarks.load_test --jobs 500 --concurrency 1,4,16 \\
+        --tasks-per-job 0,3 --latency-ms 50 --payload-bytes 4096 \\
+        --output results.json [--baseline previous.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import Base, is_sqlite_url
+from app.models.job import Job, JobStatus
+from benchmarks.mock_upstream import start_mock_server
+from benchmarks.stats import latency_summary
+
+JOBQUEUE_ROOT = Path(__file__).resolve().parent.parent
+TERMINAL_STATUSES = (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELED)
+
+# Metrics where a larger value is better (used for baseline comparison)
+HIGHER_IS_BETTER = {"enqueue_per_sec", "jobs_per_sec"}
+COMPARED_METRICS = (
+    "enqueue_per_sec",
+    "jobs_per_sec",
+    "end_to_end.p95_ms",
+    "dequeue.p95_ms",
+    "cpu_ms_per_job",
+)
+
+
+def free_port() -> int:
+    """Return an unused local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def process_cpu_seconds(pid: int) -> float | None:
+    """Return user+system CPU seconds of a process (Linux /proc only)."""
+    try:
+        fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    ticks = os.sysconf("SC_CLK_TCK")
+    # utime and stime are fields 14 and 15 (1-based) of /proc/<pid>/stat
+    return (int(fields[11]) + int(fields[12])) / ticks
+
+
+def sqlite_size_bytes(url: str) -> int:
+    """Return the on-disk size of a SQLite database including its WAL."""
+    path = Path(url.replace("sqlite+aiosqlite:///", ""))
+    return sum(
+        p.stat().st_size
+        for p in (path, path.with_name(path.name + "-wal"))
+        if p.exists()
+    )
+
+
+async def database_size_bytes(engine: Any, url: str) -> int:
+    """Return the current database size in bytes."""
+    if is_sqlite_url(url):
+        return sqlite_size_bytes(url)
+    async with engine.connect() as conn:
+        size = await conn.scalar(text("SELECT pg_database_size(current_database())"))
+    return int(size or 0)
+
+
+async def reset_database(engine: Any) -> None:
+    """Drop and recreate all JobQueue tables."""
+    import app.models  # noqa: F401  (register all mappers)
+    import app.models.job_master_task  # noqa: F401
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+def start_jobqueue(
+    port: int, database_url: str, concurrency: int, args: argparse.Namespace
+) -> subprocess.Popen[bytes]:
+    """Start JobQueue in a uvicorn subprocess."""
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "CONCURRENCY": str(concurrency),
+        "POLL_INTERVAL": str(args.poll_interval),
+        "LOG_LEVEL": args.log_level,
+        "LOG_DIR": args.workdir,
+    }
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=JOBQUEUE_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def stop_process(proc: subprocess.Popen[bytes]) -> None:
+    """Terminate a subprocess and reap it."""
+    if proc.poll() is None:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+async def wait_until_healthy(client: httpx.AsyncClient, timeout: float = 30) -> None:
+    """Wait for JobQueue's /health endpoint."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("JobQueue did not become healthy")
+
+
+async def create_task_masters(
+    client: httpx.AsyncClient, upstream_url: str, count: int
+) -> list[str]:
+    """Create `count` task masters pointing at the mock upstream."""
+    master_ids = []
+    for i in range(count):
+        response = await client.post(
+            "/api/v1/task-masters",
+            json={
+                "name": f"bench-task-{i}",
+                "method": "POST",
+                "url": f"{upstream_url}/task/{i}",
+                "body_template": {"step": i},
+                "timeout_sec": 60,
+            },
+        )
+        response.raise_for_status()
+        master_ids.append(response.json()["master_id"])
+    return master_ids
+
+
+async def submit_jobs(
+    client: httpx.AsyncClient,
+    upstream_url: str,
+    master_ids: list[str],
+    job_count: int,
+    submit_concurrency: int,
+) -> tuple[dict[str, float], float]:
+    """Submit jobs; return accepted wall-clock time per job id and duration."""
+    accepted: dict[str, float] = {}
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(job_count):
+        queue.put_nowait(i)
+
+    async def submitter() -> None:
+        while not queue.empty():
+            i = queue.get_nowait()
+            payload: dict[str, Any] = {
+                "name": f"bench-{i}",
+                "method": "POST",
+                "url": f"{upstream_url}/job",
+                "body": {"n": i},
+                "validate_interfaces": False,
+            }
+            if master_ids:
+                payload["tasks"] = [
+                    {"master_id": master_id, "sequence": seq}
+                    for seq, master_id in enumerate(master_ids)
+                ]
+            response = await client.post("/api/v1/jobs", json=payload)
+            response.raise_for_status()
+            accepted[response.json()["job_id"]] = time.time()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(submitter() for _ in range(submit_concurrency)))
+    return accepted, time.perf_counter() - start
+
+
+async def wait_for_completion(engine: Any, job_count: int, timeout: float) -> bool:
+    """Poll the database until every job reached a terminal status."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        async with engine.connect() as conn:
+            done = await conn.scalar(
+                select(func.count(Job.id)).where(Job.status.in_(TERMINAL_STATUSES))
+            )
+        if (done or 0) >= job_count:
+            return True
+        await asyncio.sleep(0.2)
+    return False
+
+
+def as_epoch(value: datetime | None) -> float | None:
+    """Convert a naive-UTC database timestamp to epoch seconds."""
+    if value is None:
+        return None
+    return value.replace(tzinfo=UTC).timestamp()
+
+
+async def run_scenario(
+    args: argparse.Namespace,
+    database_url: str,
+    upstream_url: str,
+    concurrency: int,
+    tasks_per_job: int,
+) -> dict[str, Any]:
+    """Run one (concurrency, tasks_per_job) scenario against a fresh database."""
+    engine = create_async_engine(database_url)
+    await reset_database(engine)
+
+    port = free_port()
+    proc = start_jobqueue(port, database_url, concurrency, args)
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}",
+            timeout=60,
+            limits=httpx.Limits(max_connections=args.submit_concurrency),
+        ) as client:
+            await wait_until_healthy(client)
+            master_ids = await create_task_masters(client, upstream_url, tasks_per_job)
+
+            size_before = await database_size_bytes(engine, database_url)
+            cpu_before = process_cpu_seconds(proc.pid)
+            run_start = time.time()
+
+            accepted, submit_seconds = await submit_jobs(
+                client, upstream_url, master_ids, args.jobs, args.submit_concurrency
+            )
+            completed = await wait_for_completion(engine, args.jobs, args.timeout)
+
+            run_seconds = time.time() - run_start
+            cpu_after = process_cpu_seconds(proc.pid)
+            size_after = await database_size_bytes(engine, database_url)
+
+        async with engine.connect() as conn:
+            rows = (
+                await conn.execute(
+                    select(Job.id, Job.status, Job.started_at, Job.finished_at)
+                )
+            ).all()
+    finally:
+        stop_process(proc)
+        await engine.dispose()
+
+    dequeue: list[float] = []
+    end_to_end: list[float] = []
+    statuses: dict[str, int] = {}
+    last_finished = run_start
+    for job_id, status, started_at, finished_at in rows:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+        accepted_at = accepted.get(job_id)
+        started = as_epoch(started_at)
+        finished = as_epoch(finished_at)
+        if accepted_at is not None and started is not None:
+            dequeue.append(max(0.0, started - accepted_at))
+        if accepted_at is not None and finished is not None:
+            end_to_end.append(max(0.0, finished - accepted_at))
+            last_finished = max(last_finished, finished)
+
+    cpu_seconds = (
+        cpu_after - cpu_before
+        if cpu_before is not None and cpu_after is not None
+        else None
+    )
+    return {
+        "backend": database_url.split(":", 1)[0],
+        "concurrency": concurrency,
+        "tasks_per_job": tasks_per_job,
+        "jobs": args.jobs,
+        "completed": completed,
+        "statuses": statuses,
+        "enqueue_per_sec": round(args.jobs / submit_seconds, 1),
+        "jobs_per_sec": round(
+            len(end_to_end) / max(last_finished - run_start, 1e-9), 1
+        ),
+        "run_seconds": round(run_seconds, 2),
+        "dequeue": latency_summary(dequeue),
+        "end_to_end": latency_summary(end_to_end),
+        "db_growth_bytes": size_after - size_before,
+        "db_bytes_per_job": round((size_after - size_before) / args.jobs, 1),
+        "cpu_ms_per_job": (
+            round(cpu_seconds * 1000 / args.jobs, 3)
+            if cpu_seconds is not None
+            else None
+        ),
+    }
+
+
+def metric(result: dict[str, Any], path: str) -> float | None:
+    """Read a dotted metric path from a scenario result."""
+    value: Any = result
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return float(value) if isinstance(value, int | float) else None
+
+
+def compare_with_baseline(
+    results: list[dict[str, Any]], baseline_path: str, tolerance: float
+) -> list[str]:
+    """Return human-readable regressions against a previous results file."""
+    baseline = json.loads(Path(baseline_path).read_text())
+    previous = {
+        (r["backend"], r["concurrency"], r["tasks_per_job"]): r
+        for r in baseline["scenarios"]
+    }
+    regressions = []
+    for result in results:
+        key = (result["backend"], result["concurrency"], result["tasks_per_job"])
+        if key not in previous:
+            continue
+        for name in COMPARED_METRICS:
+            old, new = metric(previous[key], name), metric(result, name)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if name in HIGHER_IS_BETTER else change
+            if worse > tolerance:
+                regressions.append(f"{key}: {name} {old} -> {new} ({change:+.1%})")
+    return regressions
+
+
+async def main() -> int:
+    """Parse arguments and run the scenario matrix."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--concurrency", default="1,4,16")
+    parser.add_argument("--tasks-per-job", default="0,3")
+    parser.add_argument("--submit-concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--payload-bytes", type=int, default=2048)
+    parser.add_argument("--poll-interval", type=float, default=0.3)
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--timeout", type=float, default=600)
+    parser.add_argument(
+        "--database-url",
+        help="Database URL (default: a fresh SQLite file per scenario)",
+    )
+    parser.add_argument("--workdir", default=None)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Previous results JSON to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args()
+
+    args.workdir = args.workdir or tempfile.mkdtemp(prefix="jobqueue-bench-")
+    upstream_port = free_port()
+    upstream_url = f"http://127.0.0.1:{upstream_port}"
+    server, server_task = await start_mock_server(
+        upstream_port, args.latency_ms, args.latency_jitter_ms, args.payload_bytes
+    )
+
+    results = []
+    try:
+        for tasks_per_job in (int(t) for t in args.tasks_per_job.split(",")):
+            for concurrency in (int(c) for c in args.concurrency.split(",")):
+                database_url = args.database_url or (
+                    f"sqlite+aiosqlite:///{args.workdir}/"
+                    f"bench_c{concurrency}_t{tasks_per_job}.db"
+                )
+                result = await run_scenario(
+                    args, database_url, upstream_url, concurrency, tasks_per_job
+                )
+                results.append(result)
+                print(
+                    f"{result['backend']:<20} concurrency={concurrency:<3} "
+                    f"tasks={tasks_per_job:<2} "
+                    f"enqueue={result['enqueue_per_sec']:>7}/s "
+                    f"throughput={result['jobs_per_sec']:>7}/s "
+                    f"e2e p50/p95/p99={result['end_to_end']['p50_ms']}/"
+                    f"{result['end_to_end']['p95_ms']}/"
+                    f"{result['end_to_end']['p99_ms']}ms "
+                    f"cpu/job={result['cpu_ms_per_job']}ms "
+                    f"db/job={result['db_bytes_per_job']}B"
+                )
+    finally:
+        server.should_exit = True
+        await server_task
+
+    report = {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "jobs": args.jobs,
+            "submit_concurrency": args.submit_concurrency,
+            "latency_ms": args.latency_ms,
+            "latency_jitter_ms": args.latency_jitter_ms,
+            "payload_bytes": args.payload_bytes,
+            "poll_interval": args.poll_interval,
+        },
+        "scenarios": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
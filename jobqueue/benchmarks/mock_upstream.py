@@ -0,0 +1,83 @@
+"""
+Mock upstream API used by the load-test benchmarks.
+
+Every request sleeps for a configurable latency and returns a JSON body of a
+configurable size, standing in for expertAgent / graphAiServer endpoints.
+
+Run standalone:
+    uv run python -m benchmarks.mock_upstream --port 8199 --latency-ms 50 \\
+        --payload-bytes 2048
+"""
+
+import argparse
+import asyncio
+import random
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI, Request
+
+
+def create_mock_app(
+    latency_ms: float = 0.0,
+    latency_jitter_ms: float = 0.0,
+    payload_bytes: int = 256,
+) -> FastAPI:
+    """Create the mock upstream application."""
+    app = FastAPI(title="JobQueue Mock Upstream")
+    payload = {"data": "x" * payload_bytes}
+    app.state.requests = 0
+
+    @app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
+    async def handle(path: str, request: Request) -> dict[str, Any]:
+        """Respond after the configured latency."""
+        app.state.requests += 1
+        delay = latency_ms + random.uniform(0, latency_jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        return {"path": path, **payload}
+
+    return app
+
+
+async def start_mock_server(
+    port: int,
+    latency_ms: float = 0.0,
+    latency_jitter_ms: float = 0.0,
+    payload_bytes: int = 256,
+) -> tuple[uvicorn.Server, "asyncio.Task[None]"]:
+    """Start the mock upstream on the running event loop."""
+    config = uvicorn.Config(
+        create_mock_app(latency_ms, latency_jitter_ms, payload_bytes),
+        host="127.0.0.1",
+        port=port,
+        log_level="warning",
+        access_log=False,
+    )
+    server = uvicorn.Server(config)
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    return server, task
+
+
+def main() -> None:
+    """Run the mock upstream standalone."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8199)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--payload-bytes", type=int, default=256)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        create_mock_app(args.latency_ms, args.latency_jitter_ms, args.payload_bytes),
+        host="127.0.0.1",
+        port=args.port,
+        log_level="warning",
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+-- Databases used by the test suite and benchmarks
+CREATE DATABASE jobqueue_test;
+CREATE DATABASE jobqueue_bench;
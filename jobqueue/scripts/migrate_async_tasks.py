@@ -0,0 +1,116 @@
+"""
+Migration script to add asynchronous completion support to tasks.
+
+Changes:
+1. Add callback_token, poll_url, next_poll_at and wait_deadline columns to
+   the tasks table
+2. Create an index on tasks(status, next_poll_at) for the poller
+
+Run: uv run python -m scripts.migrate_async_tasks
+"""
+
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+# Database paths
+BASE_DIR = Path(__file__).parent.parent
+DB_PATH = BASE_DIR / "data" / "jobqueue.db"
+BACKUP_DIR = BASE_DIR / "data" / "backups"
+
+NEW_COLUMNS = {
+    "callback_token": "VARCHAR(64)",
+    "poll_url": "TEXT",
+    "next_poll_at": "DATETIME",
+    "wait_deadline": "DATETIME",
+}
+
+
+def create_backup() -> Path:
+    """Create database backup."""
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = BACKUP_DIR / f"jobqueue.db.backup.{timestamp}"
+    shutil.copy(DB_PATH, backup_path)
+    return backup_path
+
+
+def migrate() -> None:
+    """Execute database migration."""
+    print("=" * 80)
+    print("🚀 Async Task Completion Migration")
+    print("=" * 80)
+    print(f"⏰ Timestamp: {datetime.now().isoformat()}\n")
+
+    # Check if database exists
+    if not DB_PATH.exists():
+        print(f"❌ Database not found: {DB_PATH}")
+        print("   Please ensure JobQueue is initialized first.")
+        return
+
+    # Create backup
+    print("📦 Step 1: Creating database backup...")
+    try:
+        backup_path = create_backup()
+        print(f"   ✅ Backup created: {backup_path}\n")
+    except Exception as e:
+        print(f"   ❌ Backup failed: {e}")
+        return
+
+    # Connect to database
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        # Step 2: Add columns to tasks
+        print("📝 Step 2: Adding columns to tasks table...")
+        cursor.execute("PRAGMA table_info(tasks)")
+        columns = {col[1] for col in cursor.fetchall()}
+
+        for column, column_type in NEW_COLUMNS.items():
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE tasks ADD COLUMN {column} {column_type};")
+                print(f"   ✅ Added column: {column}")
+            else:
+                print(f"   ⏭️  Column already exists: {column}")
+        print()
+
+        # Step 3: Create poller index
+        print("📝 Step 3: Creating index...")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS ix_tasks_status_next_poll
+            ON tasks(status, next_poll_at);
+        """)
+        print("   ✅ Index 'ix_tasks_status_next_poll' created\n")
+
+        # Commit changes
+        conn.commit()
+
+        # Summary
+        print("=" * 80)
+        print("✅ Migration completed successfully!")
+        print("=" * 80)
+        print("\n📊 Summary:")
+        for column in NEW_COLUMNS:
+            print(f"   - tasks.{column}: Added")
+        print(f"\n📦 Backup: {backup_path}")
+        print()
+
+    except Exception as e:
+        conn.rollback()
+        print("\n" + "=" * 80)
+        print("❌ Migration failed!")
+        print("=" * 80)
+        print(f"\nError: {e}")
+        print("\n🔄 Database has been rolled back.")
+        print(f"📦 You can restore from backup: {backup_path}")
+        print()
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,193 @@
+"""
+Migration script to move result history payloads into result_blobs.
+
+Changes:
+1. Create result_blobs table (content-addressed, zlib-compressed JSON)
+2. Add response_headers_hash and response_body_hash columns to result_history
+3. Move existing response_headers/response_body JSON into result_blobs and
+   clear the legacy columns
+
+Run: uv run python -m scripts.migrate_result_blobs
+"""
+
+import hashlib
+import json
+import shutil
+import sqlite3
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+# Database paths
+BASE_DIR = Path(__file__).parent.parent
+DB_PATH = BASE_DIR / "data" / "jobqueue.db"
+BACKUP_DIR = BASE_DIR / "data" / "backups"
+
+# Rows converted per batch
+BATCH_SIZE = 500
+
+
+def create_backup() -> Path:
+    """Create database backup."""
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = BACKUP_DIR / f"jobqueue.db.backup.{timestamp}"
+    shutil.copy(DB_PATH, backup_path)
+    return backup_path
+
+
+def store_blob(cursor: sqlite3.Cursor, raw_json: str | None) -> str | None:
+    """Store a JSON payload in result_blobs and return its hash.
+
+    Must match app.services.result_blob_store.ResultBlobStore.encode.
+    """
+    if raw_json is None:
+        return None
+    payload = json.loads(raw_json)
+    if payload is None:
+        return None
+
+    raw = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+    digest = hashlib.sha256(raw).hexdigest()
+    cursor.execute(
+        """
+        INSERT OR IGNORE INTO result_blobs (hash, encoding, data, size_bytes, created_at)
+        VALUES (?, 'zlib', ?, ?, CURRENT_TIMESTAMP);
+        """,
+        (digest, zlib.compress(raw, 6), len(raw)),
+    )
+    return digest
+
+
+def migrate() -> None:
+    """Execute database migration."""
+    print("=" * 80)
+    print("🚀 Result Blob Migration")
+    print("=" * 80)
+    print(f"⏰ Timestamp: {datetime.now().isoformat()}\n")
+
+    # Check if database exists
+    if not DB_PATH.exists():
+        print(f"❌ Database not found: {DB_PATH}")
+        print("   Please ensure JobQueue is initialized first.")
+        return
+
+    # Create backup
+    print("📦 Step 1: Creating database backup...")
+    try:
+        backup_path = create_backup()
+        print(f"   ✅ Backup created: {backup_path}\n")
+    except Exception as e:
+        print(f"   ❌ Backup failed: {e}")
+        return
+
+    # Connect to database
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        # Step 2: Create result_blobs table
+        print("📝 Step 2: Creating result_blobs table...")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS result_blobs (
+                hash VARCHAR(64) PRIMARY KEY,
+                encoding VARCHAR(16) NOT NULL,
+                data BLOB NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+        """)
+        print("   ✅ Table 'result_blobs' created\n")
+
+        # Step 3: Add hash columns to result_history
+        print("📝 Step 3: Adding columns to result_history table...")
+        cursor.execute("PRAGMA table_info(result_history)")
+        columns = {col[1] for col in cursor.fetchall()}
+
+        for column in ("response_headers_hash", "response_body_hash"):
+            if column not in columns:
+                cursor.execute(f"""
+                    ALTER TABLE result_history ADD COLUMN {column} VARCHAR(64)
+                    REFERENCES result_blobs(hash);
+                """)
+                print(f"   ✅ Added column: {column}")
+            else:
+                print(f"   ⏭️  Column already exists: {column}")
+        print()
+
+        # Step 4: Move legacy payloads into result_blobs
+        print("📝 Step 4: Moving history payloads into result_blobs...")
+        moved = 0
+        if {"response_headers", "response_body"}.issubset(columns):
+            while True:
+                cursor.execute(
+                    """
+                    SELECT id, response_headers, response_body FROM result_history
+                    WHERE response_headers IS NOT NULL OR response_body IS NOT NULL
+                    LIMIT ?;
+                    """,
+                    (BATCH_SIZE,),
+                )
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                for row_id, headers, body in rows:
+                    cursor.execute(
+                        """
+                        UPDATE result_history
+                        SET response_headers_hash = ?, response_body_hash = ?,
+                            response_headers = NULL, response_body = NULL
+                        WHERE id = ?;
+                        """,
+                        (store_blob(cursor, headers), store_blob(cursor, body), row_id),
+                    )
+                moved += len(rows)
+                conn.commit()
+                print(f"   ... {moved} rows converted")
+        print(f"   ✅ Converted {moved} history row(s)\n")
+
+        # Commit changes
+        conn.commit()
+
+        # Step 5: Verify migration
+        print("🔍 Step 5: Verifying migration...")
+        cursor.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM result_blobs"
+        )
+        blob_count, blob_bytes = cursor.fetchone()
+        print(
+            f"   ✅ result_blobs: {blob_count} blob(s), {blob_bytes} bytes uncompressed"
+        )
+
+        # Summary
+        print("=" * 80)
+        print("✅ Migration completed successfully!")
+        print("=" * 80)
+        print("\n📊 Summary:")
+        print("   - result_blobs table: Created")
+        print("   - result_history.response_headers_hash: Added")
+        print("   - result_history.response_body_hash: Added")
+        print(f"   - Converted rows: {moved}")
+        print("\nℹ️  Run VACUUM afterwards to reclaim space from the cleared columns.")
+        print(f"\n📦 Backup: {backup_path}")
+        print()
+
+    except Exception as e:
+        conn.rollback()
+        print("\n" + "=" * 80)
+        print("❌ Migration failed!")
+        print("=" * 80)
+        print(f"\nError: {e}")
+        print("\n🔄 Database has been rolled back.")
+        print(f"📦 You can restore from backup: {backup_path}")
+        print()
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
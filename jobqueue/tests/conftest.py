@@ -13,6 +13,8 @@
 
 from app.core.database import Base, get_db
 from app.main import create_app
+from app.services.task_version_manager import TaskVersionManager
+from app.services.version_manager import VersionManager
 
 
 @pytest.fixture(scope="session")
@@ -23,20 +25,35 @@ def event_loop():
     loop.close()
 
 
+# Run the suite against another backend (e.g. a local PostgreSQL container):
+#   JOBQUEUE_TEST_DATABASE_URL=postgresql+asyncpg://postgres@localhost/jobqueue_test
+TEST_DATABASE_URL = os.environ.get("JOBQUEUE_TEST_DATABASE_URL")
+
+
 @pytest_asyncio.fixture
 async def test_db():
     """Create test database."""
-    # Create temporary database file
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        test_db_path = f.name
+    test_db_path = None
+    if TEST_DATABASE_URL:
+        test_db_url = TEST_DATABASE_URL
+    else:
+        # Create temporary database file
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+            test_db_path = f.name
+        test_db_url = f"sqlite+aiosqlite:///{test_db_path}"
+
+    # Master snapshots must not leak between test databases
+    VersionManager.clear_cache()
+    TaskVersionManager.clear_cache()
 
     # Set test database URL
-    test_db_url = f"sqlite+aiosqlite:///{test_db_path}"
     os.environ["JOBQUEUE_DB_URL"] = test_db_url
 
     # Create engine and tables
     engine = create_async_engine(test_db_url, echo=False)
     async with engine.begin() as conn:
+        if TEST_DATABASE_URL:
+            await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
 
     # Create session factory
@@ -51,8 +68,12 @@ async def get_test_db():
     yield get_test_db
 
     # Cleanup
+    if TEST_DATABASE_URL:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
     await engine.dispose()
-    os.unlink(test_db_path)
+    if test_db_path:
+        os.unlink(test_db_path)
 
 
 @pytest_asyncio.fixture
@@ -318,3 +318,200 @@ async def test_list_jobs_filter_by_status(self, client: AsyncClient):
         assert len(data["jobs"]) == 1
         assert data["jobs"][0]["id"] == job_id1
         assert data["jobs"][0]["status"] == "canceled"
+
+
+class TestJobResultHistoryAPI:
+    """Test job result history storage and projection."""
+
+    async def _fail_job(self, db_session, job_id: str) -> None:
+        """Mark a job as failed with a large response stored as its result."""
+        from sqlalchemy import select
+
+        from app.models.job import Job, JobStatus
+        from app.models.result import JobResult
+
+        job = await db_session.get(Job, job_id)
+        job.status = JobStatus.FAILED
+        result = await db_session.scalar(
+            select(JobResult).where(JobResult.job_id == job_id)
+        )
+        if result is None:
+            result = JobResult(job_id=job_id)
+            db_session.add(result)
+        result.response_status = 500
+        result.response_headers = {"content-type": "application/json"}
+        result.response_body = {"items": ["x" * 100] * 100}
+        result.error = "HTTP 500"
+        result.duration_ms = 12
+        await db_session.commit()
+
+    @pytest.mark.asyncio
+    async def test_retry_history_deduplicates_payloads(
+        self, client: AsyncClient, db_session
+    ):
+        """Retrying twice with identical responses stores each payload once."""
+        from sqlalchemy import func, select
+
+        from app.models.result import ResultBlob
+
+        create_response = await client.post(
+            "/api/v1/jobs", json={"method": "GET", "url": "https://httpbin.org/get"}
+        )
+        job_id = create_response.json()["job_id"]
+
+        for _ in range(2):
+            await self._fail_job(db_session, job_id)
+            response = await client.post(f"/api/v1/jobs/{job_id}/retry")
+            assert response.status_code == 200
+
+        blob_count = await db_session.scalar(select(func.count(ResultBlob.hash)))
+        assert blob_count == 2  # one headers blob + one body blob
+
+        response = await client.get(f"/api/v1/jobs/{job_id}/result/history")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert [item["attempt"] for item in data["items"]] == [2, 1]
+        for item in data["items"]:
+            assert item["response_status"] == 500
+            assert item["response_headers"] == {"content-type": "application/json"}
+            assert item["response_body"] == {"items": ["x" * 100] * 100}
+            assert item["executed_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_history_fields_projection(self, client: AsyncClient, db_session):
+        """fields= limits the returned columns and skips payload loading."""
+        create_response = await client.post(
+            "/api/v1/jobs", json={"method": "GET", "url": "https://httpbin.org/get"}
+        )
+        job_id = create_response.json()["job_id"]
+        await self._fail_job(db_session, job_id)
+        await client.post(f"/api/v1/jobs/{job_id}/retry")
+
+        response = await client.get(
+            f"/api/v1/jobs/{job_id}/result/history",
+            params={"fields": "response_status,duration_ms"},
+        )
+        assert response.status_code == 200
+        item = response.json()["items"][0]
+        assert set(item) == {
+            "id",
+            "job_id",
+            "attempt",
+            "response_status",
+            "duration_ms",
+        }
+        assert item["response_status"] == 500
+        assert item["duration_ms"] == 12
+
+    @pytest.mark.asyncio
+    async def test_history_unknown_field(self, client: AsyncClient):
+        """Unknown projection fields are rejected."""
+        create_response = await client.post(
+            "/api/v1/jobs", json={"method": "GET", "url": "https://httpbin.org/get"}
+        )
+        job_id = create_response.json()["job_id"]
+
+        response = await client.get(
+            f"/api/v1/jobs/{job_id}/result/history", params={"fields": "bogus"}
+        )
+        assert response.status_code == 400
+        assert "bogus" in response.json()["detail"]
+
+
+class TestJobBatchFromMasterAPI:
+    """Test batch job creation from master templates."""
+
+    async def _create_master(self, client: AsyncClient, name: str) -> str:
+        response = await client.post(
+            "/api/v1/job-masters",
+            json={
+                "name": name,
+                "method": "POST",
+                "url": "https://api.example.com/run",
+                "body": {"mode": "default", "limit": 10},
+            },
+        )
+        assert response.status_code == 201
+        return response.json()["master_id"]
+
+    @pytest.mark.asyncio
+    async def test_batch_creates_jobs_in_order(self, client: AsyncClient):
+        """Every valid item becomes a job and results keep request order."""
+        master_a = await self._create_master(client, "batch_a")
+        master_b = await self._create_master(client, "batch_b")
+
+        response = await client.post(
+            "/api/v1/jobs/from-master/batch",
+            json={
+                "jobs": [
+                    {"master_id": master_a, "body": {"mode": "override"}},
+                    {"master_id": master_b, "priority": 1, "tags": ["scheduled"]},
+                    {"master_id": master_a},
+                ]
+            },
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 3
+        assert [item["master_id"] for item in data["results"]] == [
+            master_a,
+            master_b,
+            master_a,
+        ]
+
+        first = await client.get(f"/api/v1/jobs/{data['results'][0]['job_id']}")
+        assert first.json()["body"] == {"mode": "override", "limit": 10}
+        second = await client.get(f"/api/v1/jobs/{data['results'][1]['job_id']}")
+        assert second.json()["priority"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_rejected_items(self, client: AsyncClient):
+        """An unknown or inactive master fails only its own item."""
+        master_id = await self._create_master(client, "batch_ok")
+        inactive_id = await self._create_master(client, "batch_inactive")
+        await client.delete(f"/api/v1/job-masters/{inactive_id}")
+
+        response = await client.post(
+            "/api/v1/jobs/from-master/batch",
+            json={
+                "jobs": [
+                    {"master_id": "jm_missing"},
+                    {"master_id": master_id},
+                    {"master_id": inactive_id},
+                ]
+            },
+        )
+        assert response.status_code == 201
+        results = response.json()["results"]
+        assert response.json()["created"] == 1
+        assert [item["status_code"] for item in results] == [404, 201, 400]
+        assert results[0]["job_id"] is None
+        assert results[1]["error"] is None
+
+        jobs = await client.get(f"/api/v1/job-masters/{master_id}/jobs")
+        assert jobs.json()["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_invalid_items(self, client: AsyncClient):
+        """An item failing schema validation fails only its own item."""
+        master_id = await self._create_master(client, "batch_valid")
+
+        response = await client.post(
+            "/api/v1/jobs/from-master/batch",
+            json={
+                "jobs": [
+                    {"master_id": master_id, "priority": 0},
+                    {"master_id": master_id, "priority": 3},
+                    {"priority": 3},
+                ]
+            },
+        )
+        assert response.status_code == 201
+        results = response.json()["results"]
+        assert response.json()["created"] == 1
+        assert [item["status_code"] for item in results] == [422, 201, 422]
+        assert results[0]["master_id"] == master_id
+        assert "priority" in results[0]["error"]
+        assert results[2]["master_id"] == ""
+        assert "master_id" in results[2]["error"]
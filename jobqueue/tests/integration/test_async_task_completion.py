@@ -0,0 +1,448 @@
+"""Integration tests for asynchronous task completion (202 Accepted)."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import get_settings
+from app.core.worker import JobExecutor
+from app.models.job import Job, JobStatus
+from app.models.task import Task, TaskStatus
+from app.models.task_master import TaskMaster
+from app.services.async_task_manager import AsyncTaskManager
+
+
+def make_settings(**overrides):
+    """Settings with asynchronous completion options overridden."""
+    return get_settings().model_copy(update=overrides)
+
+
+def make_response(status_code: int, url: str, **kwargs) -> httpx.Response:
+    """Build a real httpx response bound to a request."""
+    return httpx.Response(status_code, request=httpx.Request("POST", url), **kwargs)
+
+
+async def create_two_task_job(db_session) -> tuple[Job, Task, Task]:
+    """Create a RUNNING job whose second task uses the first task's output."""
+    job = Job(
+        id="job_async",
+        name="Async Test",
+        method="POST",
+        url="https://api.example.com/test",
+        status=JobStatus.RUNNING,
+        started_at=datetime.now(UTC),
+        priority=5,
+        timeout_sec=30,
+        max_attempts=1,
+        attempt=1,
+    )
+    tm1 = TaskMaster(
+        id="tm_slow",
+        name="Slow LLM workflow",
+        method="POST",
+        url="https://expert.example.com/workflow",
+        body_template={"prompt": "hello"},
+        timeout_sec=30,
+        current_version=1,
+    )
+    tm2 = TaskMaster(
+        id="tm_next",
+        name="Next step",
+        method="POST",
+        url="https://api.example.com/next",
+        body_template={"answer": "{{tasks[0].output_data.answer}}"},
+        timeout_sec=30,
+        current_version=1,
+    )
+    task1 = Task(
+        id="t_async1",
+        job_id=job.id,
+        master_id=tm1.id,
+        order=1,
+        status=TaskStatus.QUEUED,
+    )
+    task2 = Task(
+        id="t_async2",
+        job_id=job.id,
+        master_id=tm2.id,
+        order=2,
+        status=TaskStatus.QUEUED,
+    )
+    db_session.add_all([job, tm1, tm2, task1, task2])
+    await db_session.commit()
+    return job, task1, task2
+
+
+async def run_executor(db_session, job: Job, settings, responses) -> AsyncMock:
+    """Execute a job with mocked upstream responses; return the request mock."""
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client = mock_client_class.return_value.__aenter__.return_value
+        mock_client.request = AsyncMock(side_effect=responses)
+        await JobExecutor(db_session, settings).execute_job(job)
+    return mock_client.request
+
+
+class TestAsyncTaskCallback:
+    """Test the callback flow."""
+
+    @pytest.mark.asyncio
+    async def test_accepted_task_releases_worker_and_callback_resumes_job(
+        self, client: AsyncClient, db_session
+    ) -> None:
+        """202 parks the task; the callback re-queues the job for the next task."""
+        settings = make_settings(callback_base_url="http://jobqueue:8001")
+        job, task1, task2 = await create_two_task_job(db_session)
+
+        request = await run_executor(
+            db_session,
+            job,
+            settings,
+            [make_response(202, "https://expert.example.com/workflow")],
+        )
+
+        headers = request.call_args.kwargs["headers"]
+        assert headers[AsyncTaskManager.CALLBACK_URL_HEADER] == (
+            "http://jobqueue:8001/api/v1/tasks/t_async1/callback"
+        )
+        token = headers[AsyncTaskManager.CALLBACK_TOKEN_HEADER]
+
+        await db_session.refresh(task1)
+        await db_session.refresh(task2)
+        await db_session.refresh(job)
+        assert task1.status == TaskStatus.WAITING
+        assert task2.status == TaskStatus.QUEUED
+        assert job.status == JobStatus.WAITING
+
+        response = await client.post(
+            "/api/v1/tasks/t_async1/callback",
+            headers={AsyncTaskManager.CALLBACK_TOKEN_HEADER: token},
+            json={"status": "succeeded", "output_data": {"answer": "42"}},
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "task_id": "t_async1",
+            "status": TaskStatus.SUCCEEDED,
+            "job_status": JobStatus.QUEUED,
+        }
+
+        # A worker claims the resumed job and only runs the remaining task
+        await db_session.refresh(job)
+        await db_session.refresh(task1)
+        job.status = JobStatus.RUNNING
+        await db_session.commit()
+
+        request = await run_executor(
+            db_session,
+            job,
+            settings,
+            [make_response(200, "https://api.example.com/next", json={"ok": True})],
+        )
+
+        assert request.call_count == 1
+        assert request.call_args.kwargs["json"] == {"answer": "42"}
+        await db_session.refresh(task2)
+        await db_session.refresh(job)
+        assert task1.output_data == {"answer": "42"}
+        assert task1.callback_token is None
+        assert task2.status == TaskStatus.SUCCEEDED
+        assert job.status == JobStatus.SUCCEEDED
+
+    @pytest.mark.asyncio
+    async def test_failed_callback_fails_job(
+        self, client: AsyncClient, db_session
+    ) -> None:
+        """A failed callback fails the job and skips the remaining tasks."""
+        settings = make_settings(callback_base_url="http://jobqueue:8001")
+        job, task1, task2 = await create_two_task_job(db_session)
+        request = await run_executor(
+            db_session,
+            job,
+            settings,
+            [make_response(202, "https://expert.example.com/workflow")],
+        )
+        token = request.call_args.kwargs["headers"][
+            AsyncTaskManager.CALLBACK_TOKEN_HEADER
+        ]
+
+        response = await client.post(
+            "/api/v1/tasks/t_async1/callback",
+            headers={AsyncTaskManager.CALLBACK_TOKEN_HEADER: token},
+            json={"status": "failed", "error": "LLM quota exceeded"},
+        )
+        assert response.status_code == 200
+        assert response.json()["job_status"] == JobStatus.FAILED
+
+        await db_session.refresh(task1)
+        await db_session.refresh(task2)
+        assert task1.status == TaskStatus.FAILED
+        assert task1.error == "LLM quota exceeded"
+        assert task2.status == TaskStatus.SKIPPED
+
+    @pytest.mark.asyncio
+    async def test_callback_requires_valid_token(
+        self, client: AsyncClient, db_session
+    ) -> None:
+        """Callbacks with a missing or wrong token are rejected."""
+        settings = make_settings(callback_base_url="http://jobqueue:8001")
+        job, task1, _ = await create_two_task_job(db_session)
+        await run_executor(
+            db_session,
+            job,
+            settings,
+            [make_response(202, "https://expert.example.com/workflow")],
+        )
+
+        body = {"status": "succeeded"}
+        response = await client.post("/api/v1/tasks/t_async1/callback", json=body)
+        assert response.status_code == 403
+        response = await client.post(
+            "/api/v1/tasks/t_async1/callback",
+            headers={AsyncTaskManager.CALLBACK_TOKEN_HEADER: "wrong"},
+            json=body,
+        )
+        assert response.status_code == 403
+        response = await client.post("/api/v1/tasks/t_missing/callback", json=body)
+        assert response.status_code == 404
+
+        await db_session.refresh(task1)
+        assert task1.status == TaskStatus.WAITING
+
+    @pytest.mark.asyncio
+    async def test_callback_before_acknowledgement(
+        self, client: AsyncClient, db_session
+    ) -> None:
+        """A callback that beats the 202 is kept; the worker continues in place."""
+        settings = make_settings(callback_base_url="http://jobqueue:8001")
+        job, task1, task2 = await create_two_task_job(db_session)
+
+        async def fast_upstream(**kwargs):
+            if kwargs["url"].endswith("/next"):
+                return make_response(200, kwargs["url"], json={"ok": True})
+            token = kwargs["headers"][AsyncTaskManager.CALLBACK_TOKEN_HEADER]
+            response = await client.post(
+                "/api/v1/tasks/t_async1/callback",
+                headers={AsyncTaskManager.CALLBACK_TOKEN_HEADER: token},
+                json={"status": "succeeded", "output_data": {"answer": "fast"}},
+            )
+            assert response.json()["job_status"] == JobStatus.RUNNING
+            return make_response(202, kwargs["url"])
+
+        request = await run_executor(db_session, job, settings, fast_upstream)
+
+        assert request.call_count == 2
+        assert request.call_args.kwargs["json"] == {"answer": "fast"}
+        await db_session.refresh(task2)
+        await db_session.refresh(job)
+        assert task2.status == TaskStatus.SUCCEEDED
+        assert job.status == JobStatus.SUCCEEDED
+
+
+class TestAsyncTaskPolling:
+    """Test poll URL completion and expiry."""
+
+    @pytest.mark.asyncio
+    async def test_poll_url_completes_task(self, db_session) -> None:
+        """Polling keeps waiting on 202 and completes on a final response."""
+        settings = make_settings(callback_base_url=None, async_poll_interval=0)
+        job, task1, _ = await create_two_task_job(db_session)
+        await run_executor(
+            db_session,
+            job,
+            settings,
+            [
+                make_response(
+                    202,
+                    "https://expert.example.com/workflow",
+                    json={"poll_url": "/workflow/runs/1"},
+                )
+            ],
+        )
+
+        await db_session.refresh(task1)
+        assert task1.status == TaskStatus.WAITING
+        assert task1.poll_url == "https://expert.example.com/workflow/runs/1"
+
+        poll_client = MagicMock()
+        poll_client.get = AsyncMock(
+            return_value=make_response(202, "https://expert.example.com")
+        )
+        assert await AsyncTaskManager.poll_due(db_session, poll_client, settings) == 0
+        await db_session.refresh(task1)
+        assert task1.status == TaskStatus.WAITING
+
+        poll_client.get = AsyncMock(
+            return_value=make_response(
+                200, "https://expert.example.com", json={"answer": "42"}
+            )
+        )
+        assert await AsyncTaskManager.poll_due(db_session, poll_client, settings) == 1
+        poll_client.get.assert_awaited_once()
+        assert poll_client.get.call_args.args == (
+            "https://expert.example.com/workflow/runs/1",
+        )
+
+        await db_session.refresh(task1)
+        await db_session.refresh(job)
+        assert task1.status == TaskStatus.SUCCEEDED
+        assert task1.output_data == {"answer": "42"}
+        assert job.status == JobStatus.QUEUED
+
+    @pytest.mark.asyncio
+    async def test_callback_wins_race_during_poll(self, test_db, db_session) -> None:
+        """A task completed elsewhere mid-batch doesn't break the rest of it."""
+        settings = make_settings(async_poll_interval=0)
+        now = datetime.now(UTC)
+        db_session.add(
+            TaskMaster(
+                id="tm_poll",
+                name="Polled workflow",
+                method="POST",
+                url="https://expert.example.com/workflow",
+                timeout_sec=30,
+                current_version=1,
+            )
+        )
+        for i in range(2):
+            db_session.add(
+                Job(
+                    id=f"job_poll{i}",
+                    name="Polled",
+                    method="POST",
+                    url="https://api.example.com/test",
+                    status=JobStatus.WAITING,
+                    started_at=now,
+                    priority=5,
+                    timeout_sec=30,
+                    max_attempts=1,
+                    attempt=1,
+                )
+            )
+            db_session.add(
+                Task(
+                    id=f"t_poll{i}",
+                    job_id=f"job_poll{i}",
+                    master_id="tm_poll",
+                    order=1,
+                    status=TaskStatus.WAITING,
+                    poll_url=f"https://expert.example.com/runs/{i}",
+                    next_poll_at=now - timedelta(seconds=10 - i),
+                    wait_deadline=now + timedelta(hours=1),
+                )
+            )
+        await db_session.commit()
+
+        async def poll(url: str, **kwargs) -> httpx.Response:
+            if url.endswith("/runs/0"):
+                # The callback for the first task lands while polling
+                async for other in test_db():
+                    task = await other.get(Task, "t_poll0")
+                    await AsyncTaskManager.complete(other, task, succeeded=True)
+            return make_response(200, url, json={"answer": url[-1]})
+
+        poll_client = MagicMock()
+        poll_client.get = AsyncMock(side_effect=poll)
+        assert await AsyncTaskManager.poll_due(db_session, poll_client, settings) == 1
+
+        first = await db_session.get(Task, "t_poll0", populate_existing=True)
+        second = await db_session.get(Task, "t_poll1", populate_existing=True)
+        assert first.status == TaskStatus.SUCCEEDED
+        assert first.output_data is None  # Completed by the callback
+        assert second.status == TaskStatus.SUCCEEDED
+        assert second.output_data == {"answer": "1"}
+
+    @pytest.mark.asyncio
+    async def test_overdue_task_expires(self, db_session) -> None:
+        """Tasks past their completion deadline fail their job."""
+        settings = make_settings(callback_base_url="http://jobqueue:8001")
+        job, task1, task2 = await create_two_task_job(db_session)
+        await run_executor(
+            db_session,
+            job,
+            settings,
+            [make_response(202, "https://expert.example.com/workflow")],
+        )
+
+        await db_session.refresh(task1)
+        task1.wait_deadline = datetime.now(UTC) - timedelta(seconds=1)
+        await db_session.commit()
+
+        assert await AsyncTaskManager.expire_overdue(db_session) == 1
+
+        await db_session.refresh(task1)
+        await db_session.refresh(task2)
+        await db_session.refresh(job)
+        assert task1.status == TaskStatus.FAILED
+        assert task1.error == "Asynchronous completion timed out"
+        assert task2.status == TaskStatus.SKIPPED
+        assert job.status == JobStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_waiting_task(
+        self, client: AsyncClient, db_session
+    ) -> None:
+        """Canceling a WAITING job stops polling and rejects its callback."""
+        settings = make_settings(callback_base_url="http://jobqueue:8001")
+        job, task1, task2 = await create_two_task_job(db_session)
+        await run_executor(
+            db_session,
+            job,
+            settings,
+            [
+                make_response(
+                    202,
+                    "https://expert.example.com/workflow",
+                    json={"poll_url": "/runs/1"},
+                )
+            ],
+        )
+        await db_session.refresh(task1)
+        token = task1.callback_token
+
+        response = await client.post("/api/v1/jobs/job_async/cancel")
+        assert response.status_code == 200
+        assert response.json()["status"] == JobStatus.CANCELED
+
+        response = await client.post(
+            "/api/v1/tasks/t_async1/callback",
+            headers={AsyncTaskManager.CALLBACK_TOKEN_HEADER: token},
+            json={"status": "succeeded"},
+        )
+        assert response.status_code == 403
+
+        for entity in (task1, task2, job):
+            await db_session.refresh(entity)
+        assert task1.status == TaskStatus.FAILED
+        assert task1.poll_url is None
+        assert task1.wait_deadline is None
+        assert task2.status == TaskStatus.SKIPPED
+        assert job.status == JobStatus.CANCELED
+        client_mock = AsyncMock()
+        assert await AsyncTaskManager.poll_due(db_session, client_mock, settings) == 0
+        client_mock.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_plain_202_stays_synchronous(self, db_session) -> None:
+        """Without a callback URL or poll URL, 202 is a synchronous success."""
+        settings = make_settings(callback_base_url=None)
+        job, task1, task2 = await create_two_task_job(db_session)
+        request = await run_executor(
+            db_session,
+            job,
+            settings,
+            [
+                make_response(202, "https://expert.example.com/workflow"),
+                make_response(200, "https://api.example.com/next"),
+            ],
+        )
+
+        assert (
+            AsyncTaskManager.CALLBACK_URL_HEADER
+            not in (request.call_args_list[0].kwargs["headers"])
+        )
+        await db_session.refresh(task1)
+        await db_session.refresh(job)
+        assert task1.status == TaskStatus.SUCCEEDED
+        assert job.status == JobStatus.SUCCEEDED
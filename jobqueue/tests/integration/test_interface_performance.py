@@ -6,6 +6,7 @@
 - Validation latency measurement
 """
 
+import gc
 import time
 
 import pytest
@@ -20,6 +21,11 @@
 class TestInterfacePerformance:
     """Performance test suite for Interface Validation."""
 
+    @pytest.fixture(autouse=True)
+    def _collect_garbage(self) -> None:
+        """Collect garbage left by earlier tests so a GC pause is not measured."""
+        gc.collect()
+
     @pytest.mark.asyncio
     async def test_performance_complex_schema_validation(
         self, client: AsyncClient, db_session: AsyncSession
@@ -0,0 +1,75 @@
+"""Integration tests for concurrent job claiming.
+
+Runs against SQLite by default and against PostgreSQL (SKIP LOCKED path)
+when JOBQUEUE_TEST_DATABASE_URL is set.
+"""
+
+import asyncio
+from collections import Counter
+
+import pytest
+
+from app.core.worker import WorkerManager
+from app.models.job import Job, JobStatus
+
+
+class TestJobClaiming:
+    """Test that concurrent workers never claim the same job twice."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_workers_claim_each_job_once(
+        self, test_db, db_session
+    ) -> None:
+        """Each queued job is claimed by exactly one of many workers."""
+        job_count = 30
+        db_session.add_all(
+            [
+                Job(
+                    id=f"j_claim_{i:03d}",
+                    method="GET",
+                    url="https://example.com/",
+                    status=JobStatus.QUEUED,
+                    priority=i % 3,
+                )
+                for i in range(job_count)
+            ]
+        )
+        await db_session.commit()
+
+        manager = WorkerManager()
+        claimed: list[str] = []
+
+        async def worker() -> None:
+            misses = 0
+            while misses < 3:
+                async for session in test_db():
+                    job = await manager._get_next_job(session)
+                if job is None:
+                    misses += 1
+                    await asyncio.sleep(0.01)
+                else:
+                    claimed.append(job.id)
+
+        await asyncio.gather(*(worker() for _ in range(8)))
+
+        counts = Counter(claimed)
+        assert len(counts) == job_count
+        assert all(count == 1 for count in counts.values())
+
+    @pytest.mark.asyncio
+    async def test_claim_respects_priority(self, test_db, db_session) -> None:
+        """Lower priority number is claimed first."""
+        db_session.add_all(
+            [
+                Job(id="j_low", method="GET", url="https://example.com/", priority=9),
+                Job(id="j_high", method="GET", url="https://example.com/", priority=1),
+            ]
+        )
+        await db_session.commit()
+
+        async for session in test_db():
+            job = await WorkerManager()._get_next_job(session)
+
+        assert job is not None
+        assert job.id == "j_high"
+        assert job.status == JobStatus.RUNNING
@@ -0,0 +1,152 @@
+"""Integration tests for the master snapshot cache."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job import Job
+from app.services.task_version_manager import TaskVersionManager
+from app.services.version_manager import VersionManager
+
+
+async def create_job_master(client: AsyncClient, url: str) -> str:
+    """Create a job master via the API and return its ID."""
+    response = await client.post(
+        "/api/v1/job-masters",
+        json={"name": "cached_master", "method": "POST", "url": url},
+    )
+    assert response.status_code == 201
+    return response.json()["master_id"]
+
+
+class TestJobMasterSnapshotCache:
+    """Test job creation served from cached master snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_create_from_master_uses_cache(self, client: AsyncClient):
+        """Repeated submissions read the master once."""
+        master_id = await create_job_master(client, "https://api.example.com/a")
+
+        hits_before = VersionManager._masters.hits
+        for _ in range(3):
+            response = await client.post(
+                f"/api/v1/jobs/from-master/{master_id}", json={}
+            )
+            assert response.status_code == 201
+
+        assert VersionManager._masters.hits - hits_before == 2
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_snapshot(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        """Jobs created after an update use the new configuration."""
+        master_id = await create_job_master(client, "https://api.example.com/old")
+        await client.post(f"/api/v1/jobs/from-master/{master_id}", json={})
+
+        response = await client.put(
+            f"/api/v1/job-masters/{master_id}",
+            json={"url": "https://api.example.com/new", "change_reason": "move"},
+        )
+        assert response.status_code == 200
+        assert response.json()["auto_versioned"] is True
+
+        response = await client.post(f"/api/v1/jobs/from-master/{master_id}", json={})
+        job = await db_session.get(Job, response.json()["job_id"])
+        assert job.url == "https://api.example.com/new"
+        assert job.master_version == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_snapshot(self, client: AsyncClient):
+        """A deleted (inactive) master stops accepting jobs immediately."""
+        master_id = await create_job_master(client, "https://api.example.com/a")
+        await client.post(f"/api/v1/jobs/from-master/{master_id}", json={})
+
+        await client.delete(f"/api/v1/job-masters/{master_id}")
+
+        response = await client.post(f"/api/v1/jobs/from-master/{master_id}", json={})
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_unchanged_update_is_not_versioned(self, client: AsyncClient):
+        """Re-submitting identical critical fields does not bump the version."""
+        master_id = await create_job_master(client, "https://api.example.com/a")
+        await client.post(f"/api/v1/jobs/from-master/{master_id}", json={})
+
+        response = await client.put(
+            f"/api/v1/job-masters/{master_id}",
+            json={"url": "https://api.example.com/a", "backoff_seconds": 5},
+        )
+        assert response.json()["auto_versioned"] is False
+
+        jobs = await client.get(f"/api/v1/job-masters/{master_id}/jobs")
+        assert jobs.json()["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_version_history_compares_by_hash(self, client: AsyncClient):
+        """Version history reports changed fields between versions."""
+        master_id = await create_job_master(client, "https://api.example.com/a")
+        await client.post(f"/api/v1/jobs/from-master/{master_id}", json={})
+        await client.put(
+            f"/api/v1/job-masters/{master_id}",
+            json={"url": "https://api.example.com/b"},
+        )
+        await client.post(
+            f"/api/v1/job-masters/{master_id}/publish-version",
+        )
+
+        response = await client.get(f"/api/v1/job-masters/{master_id}/versions")
+        assert response.status_code == 200
+        versions = {v["version"]: v for v in response.json()["versions"]}
+        assert versions[2]["changed_fields"] == ["url"]
+        assert versions[1]["changed_fields"] == []
+
+
+class TestTaskMasterSnapshotCache:
+    """Test task validation served from cached task master snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_interface_association_invalidates_snapshot(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        """Associating a required interface applies to the next job."""
+        response = await client.post(
+            "/api/v1/task-masters",
+            json={"name": "task", "method": "GET", "url": "https://api.example.com"},
+        )
+        task_master_id = response.json()["master_id"]
+        job = {
+            "name": "job",
+            "method": "GET",
+            "url": "https://api.example.com",
+            "tasks": [{"master_id": task_master_id, "sequence": 0}],
+        }
+
+        response = await client.post("/api/v1/jobs", json=job)
+        assert response.status_code == 201
+        assert TaskVersionManager._masters.get(task_master_id) is not None
+
+        response = await client.post(
+            "/api/v1/interface-masters",
+            json={
+                "name": "needs_query",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {"query": {"type": "string"}},
+                    "required": ["query"],
+                },
+            },
+        )
+        interface_id = response.json()["interface_id"]
+        response = await client.post(
+            f"/api/v1/task-masters/{task_master_id}/interfaces",
+            json={"interface_id": interface_id, "required": True},
+        )
+        assert response.status_code == 201
+
+        response = await client.post("/api/v1/jobs", json=job)
+        assert response.status_code == 400
+
+        result = await db_session.scalars(select(Job))
+        assert len(result.all()) == 1
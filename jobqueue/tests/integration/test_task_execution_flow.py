@@ -407,7 +407,17 @@ async def test_task_with_invalid_interface_input(
     @pytest.mark.asyncio
     async def test_retry_failed_task(self, client: AsyncClient, db_session) -> None:
         """Test retrying a failed task."""
-        # Create job and task
+        # Create task master, job and task
+        task_master = TaskMaster(
+            id="tm_retry",
+            name="Retry Task",
+            method="POST",
+            url="https://api.example.com/test",
+            timeout_sec=30,
+            current_version=1,
+            created_by="test",
+            updated_by="test",
+        )
         job = Job(
             id="job_retry",
             name="Retry Job",
@@ -429,7 +439,9 @@ async def test_retry_failed_task(self, client: AsyncClient, db_session) -> None:
             error="HTTP 500: Internal Server Error",
             attempt=1,
         )
-        db_session.add_all([job, task])
+        db_session.add_all([task_master, job])
+        await db_session.flush()
+        db_session.add(task)
         await db_session.commit()
 
         # Retry the failed task
@@ -0,0 +1,65 @@
+"""Test benchmark result helpers."""
+
+import json
+
+from benchmarks.load_test import compare_with_baseline
+from benchmarks.stats import latency_summary, percentile
+
+
+class TestBenchmarkStats:
+    """Test percentile helpers."""
+
+    def test_percentile_nearest_rank(self):
+        """Nearest-rank percentiles over 1..100."""
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 99) == 0.0
+
+    def test_latency_summary_in_ms(self):
+        """Latencies are reported in milliseconds."""
+        summary = latency_summary([0.010, 0.020, 0.030])
+        assert summary["p50_ms"] == 20.0
+        assert summary["max_ms"] == 30.0
+
+
+class TestBaselineComparison:
+    """Test regression detection against a previous run."""
+
+    def _scenario(self, jobs_per_sec: float, p95_ms: float) -> dict:
+        return {
+            "backend": "sqlite+aiosqlite",
+            "concurrency": 4,
+            "tasks_per_job": 0,
+            "enqueue_per_sec": 100.0,
+            "jobs_per_sec": jobs_per_sec,
+            "end_to_end": {"p95_ms": p95_ms},
+            "dequeue": {"p95_ms": 10.0},
+            "cpu_ms_per_job": 5.0,
+        }
+
+    def test_detects_regressions(self, tmp_path):
+        """Lower throughput and higher latency beyond tolerance are flagged."""
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps({"scenarios": [self._scenario(100.0, 50.0)]}))
+
+        regressions = compare_with_baseline(
+            [self._scenario(80.0, 70.0)], str(baseline), tolerance=0.1
+        )
+
+        assert len(regressions) == 2
+        assert any("jobs_per_sec" in r for r in regressions)
+        assert any("end_to_end.p95_ms" in r for r in regressions)
+
+    def test_within_tolerance(self, tmp_path):
+        """Small changes and improvements are not regressions."""
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps({"scenarios": [self._scenario(100.0, 50.0)]}))
+
+        assert (
+            compare_with_baseline(
+                [self._scenario(120.0, 52.0)], str(baseline), tolerance=0.1
+            )
+            == []
+        )
@@ -0,0 +1,47 @@
+"""Test result blob storage encoding."""
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.result import ResultBlob
+from app.services.result_blob_store import ResultBlobStore
+
+
+class TestResultBlobStore:
+    """Test ResultBlobStore encode/decode and storage."""
+
+    def test_hash_is_independent_of_key_order(self):
+        """Equal payloads hash identically regardless of key order."""
+        hash_a, _, _ = ResultBlobStore.encode({"a": 1, "b": [1, 2]})
+        hash_b, _, _ = ResultBlobStore.encode({"b": [1, 2], "a": 1})
+        assert hash_a == hash_b
+
+    def test_roundtrip_and_compression(self):
+        """Large repetitive payloads compress and decode back unchanged."""
+        payload = {"text": "日本語" * 1000, "items": list(range(100))}
+        digest, data, size = ResultBlobStore.encode(payload)
+
+        assert len(digest) == 64
+        assert len(data) < size
+
+        blob = ResultBlob(
+            hash=digest, encoding=ResultBlobStore.ENCODING, data=data, size_bytes=size
+        )
+        assert ResultBlobStore.decode(blob) == payload
+
+    @pytest.mark.asyncio
+    async def test_store_is_idempotent_across_sessions(self, test_db):
+        """Storing an existing payload from another session is a no-op."""
+        payload = {"status": "ok"}
+        hashes = []
+        for _ in range(2):
+            async for session in test_db():
+                hashes.append(await ResultBlobStore.store(session, payload))
+                await session.commit()
+
+        async for session in test_db():
+            assert hashes[0] == hashes[1]
+            assert await ResultBlobStore.load_many(session, set(hashes)) == {
+                hashes[0]: payload
+            }
+            assert await session.scalar(select(func.count(ResultBlob.hash))) == 1
@@ -0,0 +1,155 @@
+"""Unit tests for master snapshots and the snapshot cache."""
+
+import time
+
+import pytest
+
+from app.models.job import BackoffStrategy
+from app.models.job_master_version import JobMasterVersion
+from app.services.snapshot_cache import Snapshot, SnapshotCache, structural_hash
+from app.services.version_manager import VersionManager
+
+
+def make_version(version: int = 1, **overrides) -> JobMasterVersion:
+    """Build an unsaved version row."""
+    values = {
+        "id": version,
+        "master_id": "jm_test",
+        "version": version,
+        "name": "master",
+        "method": "POST",
+        "url": "https://api.example.com",
+        "headers": {"X-Token": "a"},
+        "params": None,
+        "body": {"nested": {"key": [1, 2]}},
+        "timeout_sec": 30,
+        "max_attempts": 1,
+        "backoff_strategy": "exponential",
+        "backoff_seconds": 5,
+        "ttl_seconds": None,
+        "tags": ["a"],
+    }
+    values.update(overrides)
+    return JobMasterVersion(**values)
+
+
+class TestStructuralHash:
+    """Test structural hashing of configurations."""
+
+    def test_key_order_does_not_matter(self):
+        """Dict key order does not change the hash."""
+        fields = ["headers"]
+        assert structural_hash({"headers": {"a": 1, "b": 2}}, fields) == (
+            structural_hash({"headers": {"b": 2, "a": 1}}, fields)
+        )
+
+    def test_normalizes_enums_and_integral_floats(self):
+        """Enums hash as their value and 5.0 hashes like 5."""
+        fields = ["backoff_strategy", "backoff_seconds"]
+        assert structural_hash(
+            {"backoff_strategy": BackoffStrategy.FIXED, "backoff_seconds": 5.0}, fields
+        ) == structural_hash(
+            {"backoff_strategy": "fixed", "backoff_seconds": 5}, fields
+        )
+
+    def test_only_listed_fields_are_hashed(self):
+        """Non-critical fields do not affect the hash."""
+        fields = ["url"]
+        assert structural_hash({"url": "u", "name": "a"}, fields) == (
+            structural_hash({"url": "u", "name": "b"}, fields)
+        )
+        assert structural_hash({"url": "u"}, fields) != structural_hash(
+            {"url": "v"}, fields
+        )
+
+
+class TestSnapshot:
+    """Test immutable row snapshots."""
+
+    def test_attributes_mirror_columns(self):
+        """Column values are exposed as attributes."""
+        snapshot = Snapshot.from_row(
+            make_version(), VersionManager.VERSION_CRITICAL_FIELDS
+        )
+
+        assert snapshot.master_id == "jm_test"
+        assert snapshot.body == {"nested": {"key": [1, 2]}}
+        with pytest.raises(AttributeError):
+            snapshot.missing  # noqa: B018
+
+    def test_mutating_returned_values_does_not_change_snapshot(self):
+        """Dict/list values are copied on access."""
+        snapshot = Snapshot.from_row(
+            make_version(), VersionManager.VERSION_CRITICAL_FIELDS
+        )
+
+        snapshot.body["nested"]["key"].append(3)
+        snapshot.tags.append("b")
+
+        assert snapshot.body == {"nested": {"key": [1, 2]}}
+        assert snapshot.tags == ["a"]
+
+    def test_compare_versions_uses_hash(self):
+        """Identical versions compare equal; changed fields are listed."""
+        fields = VersionManager.VERSION_CRITICAL_FIELDS
+        v1 = Snapshot.from_row(make_version(1), fields)
+        v2 = Snapshot.from_row(make_version(2, name="renamed"), fields)
+        v3 = Snapshot.from_row(
+            make_version(3, url="https://other.example.com", timeout_sec=60), fields
+        )
+
+        assert v1.config_hash == v2.config_hash
+        assert VersionManager.compare_versions(v1, v2) == []
+        assert VersionManager.compare_versions(v2, v3) == ["timeout_sec", "url"]
+        assert VersionManager.compare_versions(None, v1) == []
+
+
+class TestSnapshotCache:
+    """Test the bounded snapshot cache."""
+
+    @staticmethod
+    def snapshot(name: str) -> Snapshot:
+        return Snapshot(values={"name": name}, config_hash=name)
+
+    def test_get_put_and_stats(self):
+        """Hits and misses are counted."""
+        cache = SnapshotCache(max_entries=10)
+        assert cache.get("a") is None
+        cache.put("a", self.snapshot("a"))
+
+        assert cache.get("a").name == "a"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self):
+        """The oldest unused entry is evicted when full."""
+        cache = SnapshotCache(max_entries=2)
+        cache.put("a", self.snapshot("a"))
+        cache.put("b", self.snapshot("b"))
+        cache.get("a")
+        cache.put("c", self.snapshot("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_ttl_expiry(self, monkeypatch):
+        """Entries expire after the TTL."""
+        cache = SnapshotCache(max_entries=10, ttl_seconds=30)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        cache.put("a", self.snapshot("a"))
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalidate_and_disabled(self):
+        """Entries can be dropped; size 0 disables caching."""
+        cache = SnapshotCache(max_entries=10)
+        cache.put("a", self.snapshot("a"))
+        cache.invalidate("a")
+        assert cache.get("a") is None
+
+        disabled = SnapshotCache(max_entries=0)
+        disabled.put("a", self.snapshot("a"))
+        assert disabled.get("a") is None
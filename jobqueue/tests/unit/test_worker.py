@@ -86,8 +86,8 @@ async def test_execute_job_success(self, mock_session, mock_settings, sample_job
                 timeout=30,
             )
 
-            # Verify result created
-            mock_session.add.assert_called_once()
+            # Verify result upserted
+            mock_session.execute.assert_called_once()
             mock_session.commit.assert_called()
 
     @pytest.mark.asyncio
@@ -0,0 +1,59 @@
+"""Audit log query API endpoints."""
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.auth import auth_service, get_current_service
+from app.core.database import get_db
+from app.models.audit_event import AuditEvent
+from app.schemas.audit import AuditEventResponse, AuditQueryResponse
+
+router = APIRouter(prefix="/api/audit", tags=["audit"])
+
+
+@router.get("", response_model=AuditQueryResponse)
+def query_audit_events(
+    since: datetime | None = Query(None, description="Events at or after (UTC)"),
+    until: datetime | None = Query(None, description="Events before (UTC)"),
+    project: str | None = Query(None, description="Filter by project"),
+    service: str | None = Query(None, description="Filter by service"),
+    action: str | None = Query(None, description="Filter by action"),
+    outcome: str | None = Query(None, description="Filter by outcome"),
+    after_id: int = Query(0, ge=0, description="Cursor from the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_service: str = Depends(get_current_service),
+) -> AuditQueryResponse:
+    """Query audit events in a time range (oldest first).
+
+    Events are written in batches, so the newest ones appear after at most
+    ``audit.flush_interval`` seconds. Only events of projects the service
+    may ``read`` as ``audit:{project}`` are returned.
+    """
+    query = db.query(AuditEvent).filter(AuditEvent.id > after_id)
+    if since:
+        query = query.filter(AuditEvent.occurred_at >= since)
+    if until:
+        query = query.filter(AuditEvent.occurred_at < until)
+    if project:
+        query = query.filter(AuditEvent.project == project)
+    if service:
+        query = query.filter(AuditEvent.service == service)
+    if action:
+        query = query.filter(AuditEvent.action == action)
+    if outcome:
+        query = query.filter(AuditEvent.outcome == outcome)
+
+    rows = query.order_by(AuditEvent.id).limit(limit).all()
+
+    can_read = auth_service.get_rbac_matcher(current_service, "read")
+    return AuditQueryResponse(
+        events=[
+            AuditEventResponse.model_validate(row)
+            for row in rows
+            if can_read(f"audit:{row.project}")
+        ],
+        cursor=rows[-1].id if rows else after_id,
+    )
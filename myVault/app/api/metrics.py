@@ -0,0 +1,27 @@
+"""Service metrics API endpoint."""
+
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from app.core.audit import audit_logger
+from app.core.auth import auth_service, get_current_service
+from app.core.key_rotation import key_rotation_job
+from app.core.loop_monitor import event_loop_monitor
+from app.core.secret_cache import secret_cache
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+
+@router.get("")
+async def get_metrics(
+    current_service: str = Depends(get_current_service),
+) -> dict[str, Any]:
+    """Get cache, event loop, audit pipeline and key rotation statistics."""
+    return {
+        "secret_cache": secret_cache.stats(),
+        "rbac_cache": auth_service.policy_engine.stats(),
+        "event_loop": event_loop_monitor.stats(),
+        "key_rotation": key_rotation_job.progress(),
+        "audit": audit_logger.stats(),
+    }
@@ -7,6 +7,7 @@
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_service
+from app.core.changes import change_notifier, record_change
 from app.core.crypto import crypto_service
 from app.core.database import get_db
 from app.models.project import Project
@@ -19,7 +20,7 @@
 
 
 @router.get("", response_model=list[ProjectResponse])
-async def list_projects(
+def list_projects(
     db: Session = Depends(get_db),
     current_service: str = Depends(get_current_service),
 ) -> list[Project]:
@@ -29,7 +30,7 @@ async def list_projects(
 
 
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
-async def create_project(
+def create_project(
     project: ProjectCreate,
     db: Session = Depends(get_db),
     current_service: str = Depends(get_current_service),
@@ -56,19 +57,17 @@ async def create_project(
     # Auto-generate Google credentials encryption key
     try:
         fernet_key = Fernet.generate_key().decode()
-        encrypted_value, iv, tag = crypto_service.encrypt(fernet_key)
-
         encryption_key_secret = Secret(
             project=project.name,
             path="GOOGLE_CREDS_ENCRYPTION_KEY",
-            encrypted_value=encrypted_value,
-            encryption_iv=iv,
-            encryption_tag=tag,
             version=1,
             updated_by="system",
         )
+        encryption_key_secret.set_envelope(crypto_service.encrypt_envelope(fernet_key))
         db.add(encryption_key_secret)
+        record_change(db, encryption_key_secret, "created", "system")
         db.commit()
+        change_notifier.notify()
 
         logger.info(
             f"✓ Auto-generated GOOGLE_CREDS_ENCRYPTION_KEY for project: {project.name}"
@@ -83,7 +82,7 @@ async def create_project(
 
 
 @router.get("/{project_name}", response_model=ProjectResponse)
-async def get_project(
+def get_project(
     project_name: str,
     db: Session = Depends(get_db),
     current_service: str = Depends(get_current_service),
@@ -100,7 +99,7 @@ async def get_project(
 
 
 @router.patch("/{project_name}", response_model=ProjectResponse)
-async def update_project(
+def update_project(
     project_name: str,
     project_update: ProjectUpdate,
     db: Session = Depends(get_db),
@@ -125,7 +124,7 @@ async def update_project(
 
 
 @router.delete("/{project_name}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_project(
+def delete_project(
     project_name: str,
     db: Session = Depends(get_db),
     current_service: str = Depends(get_current_service),
@@ -150,7 +149,7 @@ async def delete_project(
 
 
 @router.put("/{project_name}/set-default", response_model=ProjectResponse)
-async def set_default_project(
+def set_default_project(
     project_name: str,
     db: Session = Depends(get_db),
     current_service: str = Depends(get_current_service),
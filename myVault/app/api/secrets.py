@@ -1,13 +1,29 @@
 """Secret management API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import time
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy import ColumnElement, func, or_, tuple_
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.core.audit import audit_logger
 from app.core.auth import auth_service, get_current_service
+from app.core.bundle import SIGNATURE_ALGORITHM, bundle_etag, sign_bundle
+from app.core.changes import change_notifier, record_change
+from app.core.config import settings
 from app.core.crypto import crypto_service
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db
+from app.core.secret_cache import secret_cache
 from app.models.secret import Secret
+from app.models.secret_change import SecretChange
 from app.schemas.secret import (
+    SecretBulkItem,
+    SecretBulkRequest,
+    SecretBulkResponse,
+    SecretBundleResponse,
+    SecretChangeItem,
+    SecretChangesResponse,
     SecretCreate,
     SecretListItem,
     SecretResponse,
@@ -15,10 +31,48 @@
 )
 
 router = APIRouter(prefix="/api/secrets", tags=["secrets"])
+# Bundles live outside /api/secrets so they cannot shadow /{project}/{path}
+bundles_router = APIRouter(prefix="/api/bundles", tags=["secrets"])
+
+DEFAULT_CHANGES_MAX_WAIT = 30.0
+DEFAULT_CHANGES_POLL_INTERVAL = 1.0
+
+
+def _decrypt_secrets(secrets: list[Secret]) -> dict[int, str]:
+    """Decrypt secrets by id, using the hot cache and one batch for the misses."""
+    decrypted: dict[int, str] = {}
+    misses: list[Secret] = []
+    for secret in secrets:
+        value = secret_cache.get(secret.project, secret.path, secret.etag)
+        if value is None:
+            misses.append(secret)
+        else:
+            decrypted[secret.id] = value
+
+    try:
+        values = crypto_service.decrypt_many([secret.ciphertext for secret in misses])
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to decrypt secret: {e}",
+        ) from e
+
+    for secret, value in zip(misses, values, strict=True):
+        secret_cache.put(secret.project, secret.path, secret.etag, value)
+        decrypted[secret.id] = value
+    return decrypted
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against the current ETag."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
 
 @router.get("", response_model=list[SecretListItem])
-async def list_secrets(
+def list_secrets(
     project: str | None = Query(None, description="Filter by project"),
     db: Session = Depends(get_db),
     current_service: str = Depends(get_current_service),
@@ -31,19 +85,19 @@ async def list_secrets(
 
     secrets = query.all()
 
-    # Filter based on RBAC permissions
-    allowed_secrets = []
-    for secret in secrets:
-        resource = f"secret:{secret.project}:{secret.path}"
-        # Check list permission
-        if auth_service.check_rbac_permission(current_service, "list", resource):
-            allowed_secrets.append(secret)
-
-    return allowed_secrets
+    # Filter based on RBAC permissions (policies compiled once per service/action)
+    can_list = auth_service.get_rbac_matcher(current_service, "list")
+    visible = [
+        secret
+        for secret in secrets
+        if can_list(f"secret:{secret.project}:{secret.path}")
+    ]
+    audit_logger.record(current_service, "list", project or "*", None, "allowed")
+    return visible
 
 
 @router.post("", response_model=SecretResponse, status_code=status.HTTP_201_CREATED)
-async def create_secret(
+def create_secret(
     secret: SecretCreate,
     db: Session = Depends(get_db),
     current_service: str = Depends(get_current_service),
@@ -52,6 +106,9 @@ async def create_secret(
     # Check RBAC write permission
     resource = f"secret:{secret.project}:{secret.path}"
     if not auth_service.check_rbac_permission(current_service, "write", resource):
+        audit_logger.record(
+            current_service, "write", secret.project, secret.path, "denied"
+        )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Service '{current_service}' does not have 'write' permission for '{resource}'",
@@ -69,21 +126,21 @@ async def create_secret(
             detail=f"Secret '{resource}' already exists",
         )
 
-    # Encrypt value
-    encrypted_value, iv, tag = crypto_service.encrypt(secret.value)
-
-    # Create secret
+    # Create secret with the encrypted value
     db_secret = Secret(
         project=secret.project,
         path=secret.path,
-        encrypted_value=encrypted_value,
-        encryption_iv=iv,
-        encryption_tag=tag,
         version=1,
         updated_by=current_service,
     )
+    db_secret.set_envelope(crypto_service.encrypt_envelope(secret.value))
     db.add(db_secret)
+    record_change(db, db_secret, "created", current_service)
     db.commit()
+    change_notifier.notify()
+    audit_logger.record(
+        current_service, "write", secret.project, secret.path, "allowed"
+    )
     db.refresh(db_secret)
 
     # Return with decrypted value
@@ -98,17 +155,235 @@ async def create_secret(
     )
 
 
-@router.get("/{project}/{path:path}", response_model=SecretResponse)
-async def get_secret(
+@router.post("/bulk", response_model=SecretBulkResponse)
+def get_secrets_bulk(
+    request: SecretBulkRequest,
+    db: Session = Depends(get_db),
+    current_service: str = Depends(get_current_service),
+) -> SecretBulkResponse:
+    """Retrieve many secret values in one request.
+
+    Keys are authorized in one pass, loaded with a single query and decrypted
+    together. Secrets whose ETag matches ``if_none_match`` are returned
+    without a value.
+    """
+    can_read = auth_service.get_rbac_matcher(current_service, "read")
+
+    # Authorize explicit keys before touching the database
+    allowed: list[tuple[str, str]] = []
+    forbidden: list[str] = []
+    for key in request.keys:
+        project, _, path = key.partition("/")
+        if can_read(f"secret:{project}:{path}"):
+            allowed.append((project, path))
+        else:
+            forbidden.append(key)
+
+    conditions: list[ColumnElement[bool]] = []
+    if allowed:
+        conditions.append(tuple_(Secret.project, Secret.path).in_(allowed))
+    if request.prefix:
+        prefix_project, _, path_prefix = request.prefix.partition("/")
+        conditions.append(
+            (Secret.project == prefix_project)
+            & Secret.path.startswith(path_prefix, autoescape=True)
+        )
+
+    rows = db.query(Secret).filter(or_(*conditions)).all() if conditions else []
+    # Secrets matched only by the prefix are silently skipped if not readable
+    rows = [row for row in rows if can_read(f"secret:{row.project}:{row.path}")]
+    rows.sort(key=lambda row: (row.project, row.path))
+
+    found = {row.key for row in rows}
+    missing = [key for key in request.keys if key not in found and key not in forbidden]
+
+    # Decrypt only values the client doesn't already hold
+    decrypted = _decrypt_secrets(
+        [row for row in rows if request.if_none_match.get(row.key) != row.etag]
+    )
+
+    for row in rows:
+        outcome = "allowed" if row.id in decrypted else "not_modified"
+        audit_logger.record(current_service, "read", row.project, row.path, outcome)
+    for outcome, keys in (("denied", forbidden), ("not_found", missing)):
+        for key in keys:
+            project, _, path = key.partition("/")
+            audit_logger.record(current_service, "read", project, path, outcome)
+
+    return SecretBulkResponse(
+        secrets=[
+            SecretBulkItem(
+                key=row.key,
+                project=row.project,
+                path=row.path,
+                value=decrypted.get(row.id),
+                version=row.version,
+                etag=row.etag,
+                updated_at=row.updated_at,
+                updated_by=row.updated_by,
+                not_modified=row.id not in decrypted,
+            )
+            for row in rows
+        ],
+        missing=missing,
+        forbidden=forbidden,
+    )
+
+
+def _load_changes(
+    since: int, project: str | None, limit: int
+) -> tuple[int, list[SecretChangeItem]]:
+    """Load changes after the cursor and the new cursor position.
+
+    Each poll uses its own short session so a waiting request holds no
+    connection and every poll sees the latest commits.
+    """
+    with SessionLocal() as db:
+        query = db.query(SecretChange).filter(SecretChange.seq > since)
+        if project:
+            query = query.filter(SecretChange.project == project)
+        rows = query.order_by(SecretChange.seq).limit(limit).all()
+        return (rows[-1].seq if rows else since), [
+            SecretChangeItem(
+                seq=row.seq,
+                key=f"{row.project}/{row.path}",
+                project=row.project,
+                path=row.path,
+                action=row.action,
+                version=row.version,
+                changed_at=row.changed_at,
+                changed_by=row.changed_by,
+            )
+            for row in rows
+        ]
+
+
+def _head_cursor() -> int:
+    """Get the latest change sequence."""
+    with SessionLocal() as db:
+        return db.query(func.max(SecretChange.seq)).scalar() or 0
+
+
+@router.get("/changes", response_model=SecretChangesResponse)
+async def get_changes(
+    since: int | None = Query(
+        None, ge=0, description="Cursor from the previous response (omit to start)"
+    ),
+    wait: float = Query(0, ge=0, description="Seconds to wait for a change"),
+    project: str | None = Query(None, description="Filter by project"),
+    limit: int = Query(500, ge=1, le=1000),
+    current_service: str = Depends(get_current_service),
+) -> SecretChangesResponse:
+    """Get secrets changed since a cursor (long-poll with ``wait``).
+
+    Without ``since`` the current cursor is returned immediately, so a client
+    can load its secrets and then follow the feed. Only changes to secrets the
+    service may read are returned.
+    """
+    if since is None:
+        cursor = await run_in_threadpool(_head_cursor)
+        return SecretChangesResponse(cursor=cursor, changes=[])
+
+    changes_config = settings.get_changes_config()
+    wait = min(wait, changes_config.get("max_wait", DEFAULT_CHANGES_MAX_WAIT))
+    poll_interval = changes_config.get("poll_interval", DEFAULT_CHANGES_POLL_INTERVAL)
+    can_read = auth_service.get_rbac_matcher(current_service, "read")
+    deadline = time.monotonic() + wait
+
+    cursor = since
+    while True:
+        # Listen before reading so a commit in between still wakes us up
+        with change_notifier.listen() as listener:
+            cursor, rows = await run_in_threadpool(
+                _load_changes, cursor, project, limit
+            )
+            visible = [
+                row for row in rows if can_read(f"secret:{row.project}:{row.path}")
+            ]
+            remaining = deadline - time.monotonic()
+            if visible or remaining <= 0:
+                break
+            if not rows:
+                # Changes from other worker processes are found by re-checking
+                await listener.wait(min(remaining, poll_interval))
+
+    return SecretChangesResponse(cursor=cursor, changes=visible)
+
+
+@bundles_router.get(
+    "/{project}",
+    response_model=SecretBundleResponse,
+    responses={304: {"description": "Bundle unchanged (If-None-Match)"}},
+)
+def get_secret_bundle(
+    project: str,
+    response: Response,
+    if_none_match: str | None = Header(None),
+    db: Session = Depends(get_db),
+    current_service: str = Depends(get_current_service),
+) -> SecretBundleResponse | Response:
+    """Retrieve every secret of a project the service may read, in one response.
+
+    The bundle is versioned by an ETag computed from secret metadata, so an
+    unchanged bundle is answered with 304 without decrypting anything. The
+    bundle is signed with the service token, letting clients keep a local
+    snapshot and verify it on the next start.
+    """
+    can_read = auth_service.get_rbac_matcher(current_service, "read")
+    rows = [
+        row
+        for row in db.query(Secret)
+        .filter(Secret.project == project)
+        .order_by(Secret.path)
+        .all()
+        if can_read(f"secret:{row.project}:{row.path}")
+    ]
+
+    etag = bundle_etag(project, current_service, rows)
+    headers = {"ETag": etag, "Cache-Control": "no-store"}
+    if _etag_matches(if_none_match, etag):
+        audit_logger.record(current_service, "read", project, None, "not_modified")
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+    revision = (
+        db.query(func.max(SecretChange.seq))
+        .filter(SecretChange.project == project)
+        .scalar()
+    ) or 0
+    decrypted = _decrypt_secrets(rows)
+    for row in rows:
+        audit_logger.record(current_service, "read", project, row.path, "allowed")
+    payload = {
+        "project": project,
+        "service": current_service,
+        "revision": revision,
+        "etag": etag,
+        "secrets": {row.path: decrypted[row.id] for row in rows},
+        "signature_alg": SIGNATURE_ALGORITHM,
+    }
+    token = settings.get_service_token(current_service) or ""
+    return SecretBundleResponse(**payload, signature=sign_bundle(payload, token))
+
+
+@router.get(
+    "/{project}/{path:path}",
+    response_model=SecretResponse,
+    responses={304: {"description": "Secret unchanged (If-None-Match)"}},
+)
+def get_secret(
     project: str,
     path: str,
+    response: Response,
+    if_none_match: str | None = Header(None),
     db: Session = Depends(get_db),
     current_service: str = Depends(get_current_service),
-) -> SecretResponse:
-    """Retrieve a secret value."""
+) -> SecretResponse | Response:
+    """Retrieve a secret value (ETag / If-None-Match supported)."""
     # Check RBAC read permission
     resource = f"secret:{project}:{path}"
     if not auth_service.check_rbac_permission(current_service, "read", resource):
+        audit_logger.record(current_service, "read", project, path, "denied")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Service '{current_service}' does not have 'read' permission for '{resource}'",
@@ -116,28 +391,27 @@ async def get_secret(
 
     # Get secret
     db_secret = (
-        db.query(Secret)
-        .filter(Secret.project == project, Secret.path == path)
-        .first()
+        db.query(Secret).filter(Secret.project == project, Secret.path == path).first()
     )
     if not db_secret:
+        audit_logger.record(current_service, "read", project, path, "not_found")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Secret '{resource}' not found",
         )
 
-    # Decrypt value
-    try:
-        decrypted_value = crypto_service.decrypt(
-            db_secret.encrypted_value,
-            db_secret.encryption_iv,
-            db_secret.encryption_tag,
+    # Skip decryption when the client already holds the current version
+    if _etag_matches(if_none_match, db_secret.etag):
+        audit_logger.record(current_service, "read", project, path, "not_modified")
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": db_secret.etag},
         )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to decrypt secret: {e}",
-        ) from e
+    response.headers["ETag"] = db_secret.etag
+
+    # Decrypt value
+    decrypted_value = _decrypt_secrets([db_secret])[db_secret.id]
+    audit_logger.record(current_service, "read", project, path, "allowed")
 
     return SecretResponse(
         id=db_secret.id,
@@ -151,7 +425,7 @@ async def get_secret(
 
 
 @router.patch("/{project}/{path:path}", response_model=SecretResponse)
-async def update_secret(
+def update_secret(
     project: str,
     path: str,
     secret_update: SecretUpdate,
@@ -162,6 +436,7 @@ async def update_secret(
     # Check RBAC write permission
     resource = f"secret:{project}:{path}"
     if not auth_service.check_rbac_permission(current_service, "write", resource):
+        audit_logger.record(current_service, "write", project, path, "denied")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Service '{current_service}' does not have 'write' permission for '{resource}'",
@@ -169,27 +444,25 @@ async def update_secret(
 
     # Get secret
     db_secret = (
-        db.query(Secret)
-        .filter(Secret.project == project, Secret.path == path)
-        .first()
+        db.query(Secret).filter(Secret.project == project, Secret.path == path).first()
     )
     if not db_secret:
+        audit_logger.record(current_service, "write", project, path, "not_found")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Secret '{resource}' not found",
         )
 
-    # Encrypt new value
-    encrypted_value, iv, tag = crypto_service.encrypt(secret_update.value)
-
-    # Update secret
-    db_secret.encrypted_value = encrypted_value
-    db_secret.encryption_iv = iv
-    db_secret.encryption_tag = tag
+    # Update secret with the encrypted new value
+    db_secret.set_envelope(crypto_service.encrypt_envelope(secret_update.value))
     db_secret.version += 1
     db_secret.updated_by = current_service
+    record_change(db, db_secret, "updated", current_service)
 
     db.commit()
+    secret_cache.invalidate(project, path)
+    change_notifier.notify()
+    audit_logger.record(current_service, "write", project, path, "allowed")
     db.refresh(db_secret)
 
     return SecretResponse(
@@ -204,7 +477,7 @@ async def update_secret(
 
 
 @router.delete("/{project}/{path:path}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_secret(
+def delete_secret(
     project: str,
     path: str,
     db: Session = Depends(get_db),
@@ -214,6 +487,7 @@ async def delete_secret(
     # Check RBAC delete permission
     resource = f"secret:{project}:{path}"
     if not auth_service.check_rbac_permission(current_service, "delete", resource):
+        audit_logger.record(current_service, "delete", project, path, "denied")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Service '{current_service}' does not have 'delete' permission for '{resource}'",
@@ -221,19 +495,22 @@ async def delete_secret(
 
     # Get secret
     db_secret = (
-        db.query(Secret)
-        .filter(Secret.project == project, Secret.path == path)
-        .first()
+        db.query(Secret).filter(Secret.project == project, Secret.path == path).first()
     )
     if not db_secret:
+        audit_logger.record(current_service, "delete", project, path, "not_found")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Secret '{resource}' not found",
         )
 
     # Delete secret
+    record_change(db, db_secret, "deleted", current_service)
     db.delete(db_secret)
     db.commit()
+    secret_cache.invalidate(project, path)
+    change_notifier.notify()
+    audit_logger.record(current_service, "delete", project, path, "allowed")
 
 
 @router.post("/test", status_code=status.HTTP_200_OK)
@@ -0,0 +1,261 @@
+"""Asynchronous, batched audit logging of secret access."""
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.audit_event import AuditEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUFFER_SIZE = 10000
+DEFAULT_FLUSH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_OVERFLOW_WAIT = 0.1
+DEFAULT_RETENTION_DAYS = 90
+PURGE_INTERVAL = 3600.0
+
+# Actions that modify secrets (audit.log_modifications); the rest are accesses
+MODIFICATION_ACTIONS = {"write", "delete"}
+
+
+class AuditLogger:
+    """Audit log written off the request path.
+
+    Endpoints append events to a bounded in-memory buffer, which only takes
+    a lock. A background thread inserts them into the append-only
+    ``audit_events`` table in batches: when ``flush_size`` events are
+    buffered, or every ``flush_interval`` seconds. When the buffer is full,
+    the request waits at most ``overflow_wait`` seconds for the writer to
+    catch up (backpressure) before the event is dropped and counted.
+    Events older than ``retention_days`` are purged hourly.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        log_access: bool = True,
+        log_modifications: bool = True,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        overflow_wait: float = DEFAULT_OVERFLOW_WAIT,
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+    ) -> None:
+        """Initialize an empty audit buffer (the writer starts with start())."""
+        self.enabled = enabled
+        self.log_access = log_access
+        self.log_modifications = log_modifications
+        self.buffer_size = buffer_size
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.overflow_wait = overflow_wait
+        self.retention_days = retention_days
+        self._buffer: deque[dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        # Signalled when events are added (writer) or written (waiting requests)
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self._last_purge = 0.0
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.write_errors = 0
+        self.last_flush_ms: float | None = None
+
+    def record(
+        self,
+        service: str,
+        action: str,
+        project: str,
+        path: str | None,
+        outcome: str,
+    ) -> None:
+        """
+        Buffer an audit event (never touches the database).
+
+        Args:
+            service: Service performing the action
+            action: read, list, write or delete
+            project: Project of the secret
+            path: Secret path (None for project-wide actions)
+            outcome: allowed, denied, not_found or not_modified
+        """
+        if not self.enabled:
+            return
+        if action in MODIFICATION_ACTIONS:
+            if not self.log_modifications:
+                return
+        elif not self.log_access:
+            return
+
+        event = {
+            "occurred_at": datetime.utcnow(),
+            "service": service,
+            "action": action,
+            "project": project,
+            "path": path,
+            "outcome": outcome,
+        }
+        with self._lock:
+            if len(self._buffer) >= self.buffer_size:
+                # Backpressure: give the writer a moment before dropping
+                self._not_empty.notify()
+                self._not_full.wait_for(
+                    lambda: len(self._buffer) < self.buffer_size, self.overflow_wait
+                )
+                if len(self._buffer) >= self.buffer_size:
+                    self.dropped += 1
+                    return
+            self._buffer.append(event)
+            self.recorded += 1
+            if len(self._buffer) >= self.flush_size:
+                self._not_empty.notify()
+
+    def flush(self) -> int:
+        """
+        Write all buffered events in batches.
+
+        Returns:
+            Number of events written
+        """
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = [
+                        self._buffer.popleft()
+                        for _ in range(min(self.flush_size, len(self._buffer)))
+                    ]
+                if not batch:
+                    return written
+                if not self._write(batch):
+                    with self._lock:
+                        # Keep the events for the next attempt (oldest first)
+                        self._buffer.extendleft(reversed(batch))
+                    return written
+                written += len(batch)
+                with self._lock:
+                    self._not_full.notify_all()
+
+    def _write(self, batch: list[dict[str, Any]]) -> bool:
+        """Insert one batch in a single transaction."""
+        started = time.perf_counter()
+        db = SessionLocal()
+        try:
+            db.execute(insert(AuditEvent), batch)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            self.write_errors += 1
+            logger.error(f"Failed to write {len(batch)} audit events: {e}")
+            return False
+        finally:
+            db.close()
+        self.flushes += 1
+        self.written += len(batch)
+        self.last_flush_ms = round((time.perf_counter() - started) * 1000, 2)
+        return True
+
+    def purge(self) -> int:
+        """
+        Delete events older than the retention period.
+
+        Returns:
+            Number of events deleted
+        """
+        cutoff = datetime.utcnow() - timedelta(days=self.retention_days)
+        db = SessionLocal()
+        try:
+            deleted = (
+                db.query(AuditEvent)
+                .filter(AuditEvent.occurred_at < cutoff)
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+            return deleted
+        finally:
+            db.close()
+
+    def start(self) -> None:
+        """Start the background writer thread."""
+        if not self.enabled or (self._thread and self._thread.is_alive()):
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="audit-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the writer thread and write the remaining events."""
+        thread = self._thread
+        if thread is not None:
+            with self._lock:
+                self._stopping = True
+                self._not_empty.notify()
+            thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        """Writer loop: flush on size or interval, purge hourly."""
+        while True:
+            with self._lock:
+                self._not_empty.wait_for(
+                    lambda: self._stopping or len(self._buffer) >= self.flush_size,
+                    self.flush_interval,
+                )
+                if self._stopping:
+                    return
+            self.flush()
+            if time.monotonic() - self._last_purge >= PURGE_INTERVAL:
+                self._last_purge = time.monotonic()
+                try:
+                    self.purge()
+                except Exception as e:
+                    logger.error(f"Failed to purge audit events: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Get pipeline statistics."""
+        return {
+            "enabled": self.enabled,
+            "buffered": len(self._buffer),
+            "buffer_size": self.buffer_size,
+            "recorded": self.recorded,
+            "written": self.written,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "write_errors": self.write_errors,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+
+def _create_audit_logger() -> AuditLogger:
+    """Create the audit logger from the audit section of config.yaml."""
+    config = settings.get_audit_config()
+    return AuditLogger(
+        enabled=bool(config.get("enabled", False)),
+        log_access=bool(config.get("log_access", True)),
+        log_modifications=bool(config.get("log_modifications", True)),
+        buffer_size=int(config.get("buffer_size", DEFAULT_BUFFER_SIZE)),
+        flush_size=int(config.get("flush_size", DEFAULT_FLUSH_SIZE)),
+        flush_interval=float(config.get("flush_interval", DEFAULT_FLUSH_INTERVAL)),
+        overflow_wait=float(config.get("overflow_wait", DEFAULT_OVERFLOW_WAIT)),
+        retention_days=int(config.get("retention_days", DEFAULT_RETENTION_DAYS)),
+    )
+
+
+# Global audit logger instance
+audit_logger = _create_audit_logger()
@@ -1,15 +1,32 @@
 """Authentication and authorization middleware."""
 
 import fnmatch
+from collections.abc import Callable
 
 from fastapi import Header, HTTPException, status
 
 from app.core.config import settings
+from app.core.policy import DEFAULT_DECISION_CACHE_SIZE, PolicyEngine
 
 
 class AuthService:
     """Service for handling authentication and authorization."""
 
+    def __init__(self) -> None:
+        """Initialize auth service and compile RBAC policies."""
+        self.policy_engine = PolicyEngine(
+            cache_size=settings.get_security_config().get(
+                "rbac_cache_size", DEFAULT_DECISION_CACHE_SIZE
+            )
+        )
+        self.reload_policies()
+
+    def reload_policies(self) -> None:
+        """Recompile RBAC policies from the current configuration."""
+        self.policy_engine.load(
+            settings.get_service_role_map(), settings.get_policies()
+        )
+
     def verify_service_auth(
         self, x_service: str | None = None, x_token: str | None = None
     ) -> str:
@@ -73,62 +90,24 @@ def check_rbac_permission(self, service: str, action: str, resource: str) -> boo
         Example:
             check_rbac_permission("newsbot-api", "read", "secret:newsbot:prod/api-key")
             check_rbac_permission("newsbot-worker", "write", "secret:common:shared-config")
-        """
-        # Get roles assigned to the service
-        roles = settings.get_service_roles(service)
-        if not roles:
-            return False
-
-        # Get all policies
-        policies = settings.get_policies()
-        if not policies:
-            return False
-
-        # Build a policy lookup by name
-        policy_map = {p.get("name"): p for p in policies if isinstance(p, dict)}
-
-        # Check each role's permissions
-        for role_name in roles:
-            policy = policy_map.get(role_name)
-            if not policy:
-                continue
 
-            permissions = policy.get("permissions", [])
-            for perm in permissions:
-                if not isinstance(perm, dict):
-                    continue
-
-                # Check effect (only "allow" supported for now)
-                effect = perm.get("effect", "").lower()
-                if effect != "allow":
-                    continue
-
-                # Check if action is allowed
-                allowed_actions = perm.get("actions", [])
-                if action not in allowed_actions:
-                    continue
-
-                # Check if resource matches
-                allowed_resources = perm.get("resources", [])
-                for resource_pattern in allowed_resources:
-                    if self._match_resource(resource_pattern, resource):
-                        return True
-
-        return False
+        Policies are compiled once at load/reload and decisions are cached,
+        so repeated checks do not walk the policies again.
+        """
+        return self.policy_engine.is_allowed(service, action, resource)
 
-    def _match_resource(self, pattern: str, resource: str) -> bool:
+    def get_rbac_matcher(self, service: str, action: str) -> Callable[[str], bool]:
         """
-        Match resource against pattern with wildcard support.
+        Get a predicate checking one action of a service against many resources.
 
         Args:
-            pattern: Resource pattern (e.g., "secret:newsbot*:prod/*")
-            resource: Actual resource (e.g., "secret:newsbot_test:prod/api-key")
+            service: Service name
+            action: Action to perform (read, write, delete, list)
 
         Returns:
-            True if resource matches pattern
+            Function returning True if the resource is allowed
         """
-        # Use fnmatch for wildcard matching
-        return fnmatch.fnmatch(resource, pattern)
+        return self.policy_engine.matcher(service, action)
 
     def check_prefix_access(self, service: str, secret_path: str) -> bool:
         """
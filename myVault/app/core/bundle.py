@@ -0,0 +1,54 @@
+"""Per-project secret bundles: versioning and signing."""
+
+import hashlib
+import hmac
+import json
+from typing import Any
+
+from app.models.secret import Secret
+
+SIGNATURE_ALGORITHM = "HMAC-SHA256"
+
+
+def bundle_etag(project: str, service: str, secrets: list[Secret]) -> str:
+    """
+    Compute the ETag of a bundle from the metadata of its secrets.
+
+    The ETag changes whenever a secret visible to the service is created,
+    updated or deleted, and is computed without decrypting anything.
+    """
+    digest = hashlib.sha256(f"{project}\n{service}".encode())
+    for secret in sorted(secrets, key=lambda s: s.path):
+        digest.update(f"\n{secret.path}\t{secret.id}\t{secret.version}".encode())
+    return f'"b-{digest.hexdigest()[:32]}"'
+
+
+def canonical_bundle(payload: dict[str, Any]) -> bytes:
+    """Serialize bundle fields the way they are signed (sorted keys, compact)."""
+    return json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def sign_bundle(payload: dict[str, Any], token: str) -> str:
+    """
+    Sign a bundle with the requesting service's token.
+
+    Clients verify the signature with their own token before trusting a
+    locally stored snapshot.
+
+    Args:
+        payload: Bundle fields except the signature
+        token: Service authentication token (shared secret)
+
+    Returns:
+        Hex-encoded HMAC-SHA256 signature
+    """
+    return hmac.new(
+        token.encode("utf-8"), canonical_bundle(payload), hashlib.sha256
+    ).hexdigest()
+
+
+def verify_bundle(payload: dict[str, Any], signature: str, token: str) -> bool:
+    """Check a bundle signature (constant-time comparison)."""
+    return hmac.compare_digest(sign_bundle(payload, token), signature)
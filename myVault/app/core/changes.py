@@ -0,0 +1,89 @@
+"""Secret change feed: change recording and long-poll notification."""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy.orm import Session
+
+from app.models.secret import Secret
+from app.models.secret_change import SecretChange
+
+
+def record_change(db: Session, secret: Secret, action: str, changed_by: str) -> None:
+    """
+    Add a change log entry in the same transaction as the secret change.
+
+    Args:
+        db: Session holding the secret change (not committed yet)
+        secret: Created, updated or deleted secret
+        action: "created", "updated" or "deleted"
+        changed_by: Service making the change
+    """
+    db.add(
+        SecretChange(
+            project=secret.project,
+            path=secret.path,
+            action=action,
+            version=secret.version,
+            changed_by=changed_by,
+        )
+    )
+
+
+class ChangeListener:
+    """Wakes a waiting long-poll request when a change is committed."""
+
+    def __init__(self) -> None:
+        """Bind to the running event loop."""
+        self.loop = asyncio.get_running_loop()
+        self.event = asyncio.Event()
+
+    def notify(self) -> None:
+        """Wake the listener (safe to call from any thread)."""
+        self.loop.call_soon_threadsafe(self.event.set)
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for a change notification; False on timeout."""
+        try:
+            await asyncio.wait_for(self.event.wait(), timeout)
+            return True
+        except TimeoutError:
+            return False
+
+
+class ChangeNotifier:
+    """Fan-out of commit notifications to long-poll requests in this process.
+
+    Changes committed by other worker processes are picked up by the periodic
+    re-check of the long-poll loop instead.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no listeners."""
+        self._lock = threading.Lock()
+        self._listeners: set[ChangeListener] = set()
+
+    @contextmanager
+    def listen(self) -> Iterator[ChangeListener]:
+        """Register a listener (register before reading so no commit is missed)."""
+        listener = ChangeListener()
+        with self._lock:
+            self._listeners.add(listener)
+        try:
+            yield listener
+        finally:
+            with self._lock:
+                self._listeners.discard(listener)
+
+    def notify(self) -> None:
+        """Wake every listener after a change has been committed."""
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener.notify()
+
+
+# Global change notifier instance
+change_notifier = ChangeNotifier()
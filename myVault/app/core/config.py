@@ -41,6 +41,40 @@ def load_config_yaml() -> dict[str, Any]:
     return config
 
 
+def decode_master_key(value: str) -> bytes:
+    """Decode a "base64:..." master key.
+
+    Raises:
+        ValueError: If the key is not a base64-encoded 32-byte key
+    """
+    if not value.startswith("base64:"):
+        raise ValueError("Master key must start with 'base64:'")
+
+    try:
+        key_bytes = base64.b64decode(value[7:])
+        if len(key_bytes) != 32:
+            raise ValueError("Master key must be exactly 32 bytes when decoded")
+    except Exception as e:
+        raise ValueError(f"Invalid base64 encoding: {e}") from e
+
+    return key_bytes
+
+
+def parse_previous_master_keys(value: str) -> list[tuple[str | None, str]]:
+    """Split "[id=]base64:...,..." into (key id or None, key) pairs."""
+    keys: list[tuple[str | None, str]] = []
+    for entry in value.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        key_id, sep, key = entry.partition("=")
+        if sep and not key_id.startswith("base64:"):
+            keys.append((key_id.strip(), key.strip()))
+        else:
+            keys.append((None, entry))
+    return keys
+
+
 class Settings(BaseSettings):
     """Application settings loaded from YAML config and environment variables.
 
@@ -52,6 +86,7 @@ class Settings(BaseSettings):
 
     Environment variables contain sensitive data:
     - MSA_MASTER_KEY: Master encryption key (base64:...)
+    - MSA_PREVIOUS_MASTER_KEYS (optional): Retired keys kept for decryption
     - TOKEN_<service-name>: Service authentication tokens
     - DATABASE_URL (optional): Override database URL from config.yaml
     """
@@ -63,6 +98,18 @@ class Settings(BaseSettings):
         default="",
         description="Master key for AES-256-GCM encryption (base64:...)",
     )
+    msa_master_key_id: str = Field(
+        default="",
+        max_length=255,
+        description="Key id stored with each secret (default: key fingerprint)",
+    )
+    msa_previous_master_keys: str = Field(
+        default="",
+        description=(
+            "Retired master keys still accepted for decryption during rotation "
+            "(comma-separated, [id=]base64:...)"
+        ),
+    )
 
     # Database configuration (can be overridden by DATABASE_URL env var)
     database_url: str | None = Field(
@@ -96,16 +143,15 @@ def validate_master_key(cls, v: str) -> str:
                 "print('base64:' + base64.b64encode(secrets.token_bytes(32)).decode())\""
             )
 
-        if not v.startswith("base64:"):
-            raise ValueError("Master key must start with 'base64:'")
-
-        try:
-            key_bytes = base64.b64decode(v[7:])
-            if len(key_bytes) != 32:
-                raise ValueError("Master key must be exactly 32 bytes when decoded")
-        except Exception as e:
-            raise ValueError(f"Invalid base64 encoding: {e}") from e
+        decode_master_key(v)
+        return v
 
+    @field_validator("msa_previous_master_keys")
+    @classmethod
+    def validate_previous_master_keys(cls, v: str) -> str:
+        """Validate that every retired master key is properly formatted."""
+        for _, key in parse_previous_master_keys(v):
+            decode_master_key(key)
         return v
 
     def get_allowed_services(self) -> list[str]:
@@ -137,6 +183,15 @@ def get_service_prefixes(self, service: str) -> list[str]:
                 return svc.get("access_rules", [])
         return []
 
+    def get_service_role_map(self) -> dict[str, list[str]]:
+        """Get role names of every service defined in config.yaml."""
+        services = self._yaml_config.get("services", [])
+        return {
+            svc["name"]: svc.get("roles", [])
+            for svc in services
+            if isinstance(svc, dict) and "name" in svc
+        }
+
     def get_service_roles(self, service: str) -> list[str]:
         """Get list of role names assigned to a specific service."""
         services = self._yaml_config.get("services", [])
@@ -149,14 +204,54 @@ def get_policies(self) -> list[dict[str, Any]]:
         """Get all RBAC policies from config.yaml."""
         return self._yaml_config.get("policies", [])
 
+    def reload_config(self) -> None:
+        """Re-read config.yaml.
+
+        Sections read on each request (services, tokens, prefixes) apply
+        immediately; RBAC policies also need AuthService.reload_policies().
+        Other sections are only read at startup.
+        """
+        self._yaml_config = load_config_yaml()
+
     def get_master_key_bytes(self) -> bytes:
         """Get decoded master key bytes."""
         return base64.b64decode(self.msa_master_key[7:])
 
+    def get_previous_master_keys(self) -> list[tuple[str | None, bytes]]:
+        """Get retired master keys as (key id or None, key bytes) pairs."""
+        return [
+            (key_id, decode_master_key(key))
+            for key_id, key in parse_previous_master_keys(self.msa_previous_master_keys)
+        ]
+
     def get_app_config(self) -> dict[str, Any]:
         """Get application configuration section from YAML."""
         return self._yaml_config.get("application", {})
 
+    def get_database_config(self) -> dict[str, Any]:
+        """Get database configuration section from YAML."""
+        return self._yaml_config.get("database", {})
+
+    def get_changes_config(self) -> dict[str, Any]:
+        """Get change feed configuration section from YAML."""
+        return self._yaml_config.get("changes", {})
+
+    def get_secret_cache_config(self) -> dict[str, Any]:
+        """Get decrypted secret cache configuration section from YAML."""
+        return self._yaml_config.get("secret_cache", {})
+
+    def get_event_loop_config(self) -> dict[str, Any]:
+        """Get event loop monitor configuration section from YAML."""
+        return self._yaml_config.get("event_loop", {})
+
+    def get_key_rotation_config(self) -> dict[str, Any]:
+        """Get background key rotation configuration section from YAML."""
+        return self._yaml_config.get("key_rotation", {})
+
+    def get_security_config(self) -> dict[str, Any]:
+        """Get security configuration section from YAML."""
+        return self._yaml_config.get("security", {})
+
     def get_audit_config(self) -> dict[str, Any]:
         """Get audit configuration section from YAML."""
         return self._yaml_config.get("audit", {})
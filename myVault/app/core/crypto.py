@@ -1,20 +1,172 @@
 """Cryptographic services for secret encryption/decryption."""
 
+import hashlib
 import secrets
 
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from app.core.config import settings
 
+# Binary envelope layout (version 1):
+#   [0]          format version (0x01)
+#   [1]          key id length n
+#   [2:2+n]      key id (ASCII)
+#   [2+n:14+n]   nonce (12 bytes)
+#   [14+n:]      ciphertext || tag (16 bytes)
+ENVELOPE_VERSION = 1
+NONCE_SIZE = 12
+TAG_SIZE = 16
+
+# A secret is stored either as one envelope or as the legacy hex triple
+Ciphertext = bytes | tuple[str, str, str]
+
+
+def key_fingerprint(key: bytes) -> str:
+    """Derive a short, non-secret key id from a key."""
+    return hashlib.sha256(key).hexdigest()[:8]
+
+
+def parse_envelope(envelope: bytes) -> tuple[str, memoryview, memoryview]:
+    """
+    Split an envelope into key id, nonce and ciphertext (without copying).
+
+    Raises:
+        ValueError: If the envelope is malformed or of an unknown version
+    """
+    view = memoryview(envelope)
+    if len(view) < 2 or view[0] != ENVELOPE_VERSION:
+        raise ValueError("Unsupported envelope version")
+    key_id_end = 2 + view[1]
+    nonce_end = key_id_end + NONCE_SIZE
+    if len(view) < nonce_end + TAG_SIZE:
+        raise ValueError("Truncated envelope")
+    key_id = bytes(view[2:key_id_end]).decode("ascii")
+    return key_id, view[key_id_end:nonce_end], view[nonce_end:]
+
+
+def build_envelope(key_id: str, nonce: bytes, ciphertext_with_tag: bytes) -> bytes:
+    """Assemble a version 1 envelope."""
+    key_id_bytes = key_id.encode("ascii")
+    return (
+        bytes((ENVELOPE_VERSION, len(key_id_bytes)))
+        + key_id_bytes
+        + nonce
+        + ciphertext_with_tag
+    )
+
 
 class CryptoService:
-    """Service for encrypting and decrypting secrets using AES-256-GCM."""
+    """Service for encrypting and decrypting secrets using AES-256-GCM.
+
+    Values are always encrypted with the active master key. Retired keys
+    (MSA_PREVIOUS_MASTER_KEYS) are kept for decryption only, and the key id
+    in each envelope selects the key, so a master key can be rotated while
+    old ciphertexts are re-encrypted in the background.
+    """
 
-    def __init__(self) -> None:
-        """Initialize crypto service with master key."""
-        self.master_key = settings.get_master_key_bytes()
+    def __init__(
+        self,
+        master_key: bytes | None = None,
+        key_id: str | None = None,
+        previous_keys: list[tuple[str | None, bytes]] | None = None,
+    ) -> None:
+        """Initialize crypto service with master key (and retired keys)."""
+        self.master_key = master_key or settings.get_master_key_bytes()
+        if key_id is None:
+            key_id = settings.msa_master_key_id if master_key is None else ""
+        self.key_id = key_id or key_fingerprint(self.master_key)
         self.aesgcm = AESGCM(self.master_key)
 
+        if previous_keys is None:
+            previous_keys = settings.get_previous_master_keys()
+        self.keys: dict[str, AESGCM] = {
+            previous_id or key_fingerprint(key): AESGCM(key)
+            for previous_id, key in previous_keys
+        }
+        self.keys[self.key_id] = self.aesgcm
+
+    @property
+    def has_previous_keys(self) -> bool:
+        """Whether retired keys are configured (a rotation is in progress)."""
+        return len(self.keys) > 1
+
+    def encrypt_envelope(self, plaintext: str) -> bytes:
+        """
+        Encrypt plaintext into a binary envelope tagged with the key id.
+
+        Args:
+            plaintext: The secret value to encrypt
+
+        Returns:
+            Envelope bytes (see ENVELOPE_VERSION layout)
+        """
+        nonce = secrets.token_bytes(NONCE_SIZE)
+        ciphertext_with_tag = self.aesgcm.encrypt(
+            nonce, plaintext.encode("utf-8"), None
+        )
+        return build_envelope(self.key_id, nonce, ciphertext_with_tag)
+
+    def decrypt_envelope(self, envelope: bytes) -> str:
+        """
+        Decrypt a binary envelope with the key named by its key id.
+
+        Raises:
+            ValueError: If the envelope is malformed, the key id is unknown
+                or authentication fails
+        """
+        try:
+            key_id, nonce, ciphertext_with_tag = parse_envelope(envelope)
+            aesgcm = self.keys.get(key_id)
+            if aesgcm is None:
+                raise ValueError(f"Unknown key id '{key_id}'")
+            return aesgcm.decrypt(nonce, ciphertext_with_tag, None).decode("utf-8")
+        except Exception as e:
+            raise ValueError(f"Decryption failed: {e}") from e
+
+    def envelope_from_legacy(
+        self, ciphertext_hex: str, iv_hex: str, tag_hex: str
+    ) -> bytes:
+        """
+        Repack a legacy hex triple into an envelope (no re-encryption).
+
+        The envelope is tagged with the id of the key that decrypts the triple.
+
+        Raises:
+            ValueError: If no known key decrypts the triple
+        """
+        key_id, _ = self._decrypt_legacy(ciphertext_hex, iv_hex, tag_hex)
+        return build_envelope(
+            key_id,
+            bytes.fromhex(iv_hex),
+            bytes.fromhex(ciphertext_hex) + bytes.fromhex(tag_hex),
+        )
+
+    def is_current(self, ciphertext: Ciphertext) -> bool:
+        """Whether a stored value is an envelope under the active key."""
+        if not isinstance(ciphertext, bytes):
+            return False
+        try:
+            return parse_envelope(ciphertext)[0] == self.key_id
+        except ValueError:
+            return False
+
+    def to_current(self, ciphertext: Ciphertext) -> bytes:
+        """
+        Convert a stored value into an envelope under the active key.
+
+        Legacy triples under the active key are only repacked; anything else
+        is decrypted and encrypted again.
+
+        Raises:
+            ValueError: If the value can't be decrypted
+        """
+        if not isinstance(ciphertext, bytes):
+            ciphertext = self.envelope_from_legacy(*ciphertext)
+            if self.is_current(ciphertext):
+                return ciphertext
+        return self.encrypt_envelope(self.decrypt_envelope(ciphertext))
+
     def encrypt(self, plaintext: str) -> tuple[str, str, str]:
         """
         Encrypt plaintext using AES-256-GCM.
@@ -57,22 +209,58 @@ def decrypt(self, ciphertext_hex: str, iv_hex: str, tag_hex: str) -> str:
         Raises:
             ValueError: If decryption fails or authentication fails
         """
+        return self._decrypt_legacy(ciphertext_hex, iv_hex, tag_hex)[1]
+
+    def _decrypt_legacy(
+        self, ciphertext_hex: str, iv_hex: str, tag_hex: str
+    ) -> tuple[str, str]:
+        """Decrypt a legacy hex triple, trying the active key first.
+
+        Returns:
+            Tuple of (key id, plaintext)
+        """
         try:
             # Convert from hex
-            ciphertext = bytes.fromhex(ciphertext_hex)
             iv = bytes.fromhex(iv_hex)
-            tag = bytes.fromhex(tag_hex)
-
             # Reconstruct ciphertext with tag
-            ciphertext_with_tag = ciphertext + tag
-
-            # Decrypt and verify
-            plaintext_bytes = self.aesgcm.decrypt(iv, ciphertext_with_tag, None)
-            return plaintext_bytes.decode("utf-8")
-
+            ciphertext_with_tag = bytes.fromhex(ciphertext_hex) + bytes.fromhex(tag_hex)
         except Exception as e:
             raise ValueError(f"Decryption failed: {e}") from e
 
+        # Legacy values carry no key id
+        for key_id, aesgcm in sorted(
+            self.keys.items(), key=lambda item: item[0] != self.key_id
+        ):
+            try:
+                plaintext_bytes = aesgcm.decrypt(iv, ciphertext_with_tag, None)
+            except InvalidTag:
+                continue
+            except Exception as e:
+                raise ValueError(f"Decryption failed: {e}") from e
+            return key_id, plaintext_bytes.decode("utf-8")
+
+        raise ValueError("Decryption failed: no key matches the authentication tag")
+
+    def decrypt_many(self, items: list[Ciphertext]) -> list[str]:
+        """
+        Decrypt many values at once (e.g. for bulk fetches).
+
+        Args:
+            items: Envelopes or legacy (ciphertext_hex, iv_hex, tag_hex) tuples
+
+        Returns:
+            Decrypted plaintext strings in the same order
+
+        Raises:
+            ValueError: If any decryption fails
+        """
+        return [
+            self.decrypt_envelope(item)
+            if isinstance(item, bytes)
+            else self.decrypt(*item)
+            for item in items
+        ]
+
 
 # Global crypto service instance
 crypto_service = CryptoService()
@@ -1,17 +1,51 @@
 """Database configuration and session management."""
 
-from sqlalchemy import create_engine
+from typing import Any
+
+from sqlalchemy import LargeBinary, create_engine, event, inspect, text
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
 
+DEFAULT_WORKER_THREADS = 40
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+
+
+def _create_engine(database_url: str) -> Any:
+    """Create the engine (SQLite tuned for concurrent readers)."""
+    if "sqlite" not in database_url:
+        return create_engine(database_url, pool_pre_ping=True)
+
+    if ":memory:" in database_url:
+        # Endpoints run in worker threads: share one in-memory database across them
+        return create_engine(
+            database_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+    sqlite_engine = create_engine(
+        database_url, connect_args={"check_same_thread": False}
+    )
+    busy_timeout_ms = settings.get_database_config().get(
+        "busy_timeout_ms", DEFAULT_BUSY_TIMEOUT_MS
+    )
+
+    @event.listens_for(sqlite_engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        # WAL lets reads proceed while a write is in progress
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        cursor.close()
+
+    return sqlite_engine
+
+
 # Create database engine
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False}
-    if "sqlite" in settings.database_url
-    else {},
-)
+engine = _create_engine(settings.database_url)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -24,7 +58,12 @@ class Base(DeclarativeBase):
 
 
 def get_db():
-    """Dependency to get database session."""
+    """Dependency to get database session.
+
+    Endpoints using the session are plain ``def`` functions, so FastAPI runs
+    the blocking queries and decryption in its worker thread pool instead of
+    on the event loop.
+    """
     db = SessionLocal()
     try:
         yield db
@@ -32,6 +71,35 @@ def get_db():
         db.close()
 
 
+def get_worker_threads() -> int:
+    """Get the size of the thread pool running blocking endpoint work."""
+    return int(
+        settings.get_database_config().get("worker_threads", DEFAULT_WORKER_THREADS)
+    )
+
+
+def ensure_envelope_column(engine: Any) -> bool:
+    """
+    Add the encrypted_blob column to an existing secrets table.
+
+    create_all() only creates missing tables, so databases created before
+    the envelope format need the column added explicitly.
+
+    Returns:
+        True if the column was added, False if it already existed
+    """
+    columns = {column["name"] for column in inspect(engine).get_columns("secrets")}
+    if "encrypted_blob" in columns:
+        return False
+    column_type = LargeBinary().compile(dialect=engine.dialect)
+    with engine.begin() as conn:
+        conn.execute(
+            text(f"ALTER TABLE secrets ADD COLUMN encrypted_blob {column_type}")
+        )
+    return True
+
+
 def init_db() -> None:
-    """Initialize database tables."""
+    """Initialize database tables and add columns missing from older schemas."""
     Base.metadata.create_all(bind=engine)
+    ensure_envelope_column(engine)
@@ -0,0 +1,167 @@
+"""Background re-encryption of secrets after a master key rotation."""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.secret_migration import (
+    MigrationBatch,
+    count_secrets,
+    reencrypt_secret_batch,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_BATCH_INTERVAL = 0.5
+
+
+class KeyRotationJob:
+    """Throttled job re-encrypting every secret under the active master key.
+
+    The table is walked by id in small batches. Each batch runs in a worker
+    thread with its own session and commits on its own, and the job sleeps
+    between batches. The job therefore never holds long locks or competes
+    with request traffic for more than one worker thread at a time.
+    Progress is exposed through ``progress()`` (``GET /api/metrics``).
+    Only started on startup when ``key_rotation.auto_start`` is set, since an
+    instance that hasn't switched to the new key would rotate values back.
+    """
+
+    def __init__(
+        self,
+        auto_start: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_interval: float = DEFAULT_BATCH_INTERVAL,
+    ) -> None:
+        """Initialize an idle job."""
+        self.auto_start = auto_start
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._task: asyncio.Task[None] | None = None
+        self.state = "idle"
+        self.total = 0
+        self.scanned = 0
+        self.reencrypted = 0
+        self.failed = 0
+        self.last_id = 0
+        self.error: str | None = None
+        self.started_at: datetime | None = None
+        self.finished_at: datetime | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the job is currently running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> bool:
+        """
+        Start the job on the running event loop.
+
+        Returns:
+            False if the job was already running
+        """
+        if self.running:
+            return False
+        self._task = asyncio.get_running_loop().create_task(self.run())
+        return True
+
+    async def stop(self) -> None:
+        """Cancel the job (it can be started again later)."""
+        if self._task is None or self._task.done():
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self.state = "stopped"
+        self.finished_at = datetime.utcnow()
+
+    async def run(self) -> None:
+        """Re-encrypt all secrets batch by batch."""
+        self.state = "running"
+        self.total = self.scanned = self.reencrypted = self.failed = self.last_id = 0
+        self.error = None
+        self.started_at = datetime.utcnow()
+        self.finished_at = None
+        logger.info("Key rotation: re-encrypting secrets in the background")
+        try:
+            self.total = await run_in_threadpool(self._count)
+            while True:
+                batch = await run_in_threadpool(self._run_batch, self.last_id)
+                if batch.scanned == 0:
+                    break
+                self.last_id = batch.last_id
+                self.scanned += batch.scanned
+                self.reencrypted += batch.migrated
+                self.failed += batch.failed
+                await asyncio.sleep(self.batch_interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.state = "failed"
+            self.error = str(e)
+            self.finished_at = datetime.utcnow()
+            logger.error(f"Key rotation failed: {e}")
+            return
+
+        self.state = "completed"
+        self.finished_at = datetime.utcnow()
+        logger.info(
+            f"Key rotation completed: {self.reencrypted} re-encrypted, "
+            f"{self.failed} failed"
+        )
+
+    def _count(self) -> int:
+        """Count secrets to scan (worker thread)."""
+        db = SessionLocal()
+        try:
+            return count_secrets(db)
+        finally:
+            db.close()
+
+    def _run_batch(self, after_id: int) -> MigrationBatch:
+        """Re-encrypt one batch with its own session (worker thread)."""
+        db = SessionLocal()
+        try:
+            return reencrypt_secret_batch(db, after_id, self.batch_size)
+        finally:
+            db.close()
+
+    def progress(self) -> dict[str, Any]:
+        """Get job progress."""
+        return {
+            "state": self.state,
+            "total": self.total,
+            "scanned": self.scanned,
+            "reencrypted": self.reencrypted,
+            "failed": self.failed,
+            "percent": (
+                round(min(self.scanned / self.total, 1.0) * 100, 1)
+                if self.total
+                else None
+            ),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "error": self.error,
+        }
+
+
+def _create_job() -> KeyRotationJob:
+    """Create the job from the key_rotation section of config.yaml."""
+    config = settings.get_key_rotation_config()
+    return KeyRotationJob(
+        auto_start=bool(config.get("auto_start", False)),
+        batch_size=int(config.get("batch_size", DEFAULT_BATCH_SIZE)),
+        batch_interval=float(config.get("batch_interval", DEFAULT_BATCH_INTERVAL)),
+    )
+
+
+# Global key rotation job instance
+key_rotation_job = _create_job()
@@ -0,0 +1,102 @@
+"""Event loop lag monitor."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any
+
+from app.core.config import settings
+
+DEFAULT_INTERVAL = 0.05
+DEFAULT_SAMPLE_SIZE = 1200
+# Lag above this counts as the loop being blocked
+BLOCKED_THRESHOLD = 0.005
+
+
+class EventLoopMonitor:
+    """Measures how long the event loop is blocked.
+
+    A task sleeps for ``interval`` in a loop; any time it wakes up late is
+    time during which the loop couldn't run anything else (e.g. blocking
+    DB or crypto work on the loop). Recent lag samples are kept for
+    percentiles, and the total blocked time is accumulated.
+    """
+
+    def __init__(
+        self, interval: float = DEFAULT_INTERVAL, sample_size: int = DEFAULT_SAMPLE_SIZE
+    ) -> None:
+        """Initialize a stopped monitor."""
+        self.interval = interval
+        self._samples: deque[float] = deque(maxlen=sample_size)
+        self._task: asyncio.Task[None] | None = None
+        self.ticks = 0
+        self.blocked_count = 0
+        self.blocked_seconds = 0.0
+        self.max_lag = 0.0
+
+    def start(self) -> None:
+        """Start sampling on the running event loop."""
+        if self.interval <= 0 or (self._task and not self._task.done()):
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Sample the lag of one sleep per interval."""
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.record(time.perf_counter() - started - self.interval)
+
+    def record(self, lag: float) -> None:
+        """Record the lag (seconds) of one tick."""
+        lag = max(lag, 0.0)
+        self.ticks += 1
+        self._samples.append(lag)
+        self.max_lag = max(self.max_lag, lag)
+        if lag >= BLOCKED_THRESHOLD:
+            self.blocked_count += 1
+            self.blocked_seconds += lag
+
+    def stats(self) -> dict[str, Any]:
+        """Get lag statistics (percentiles over the recent samples)."""
+        samples = sorted(self._samples)
+
+        def lag_ms(pct: float) -> float | None:
+            if not samples:
+                return None
+            index = min(len(samples) - 1, int(len(samples) * pct / 100))
+            return round(samples[index] * 1000, 2)
+
+        return {
+            "interval_ms": round(self.interval * 1000, 2),
+            "ticks": self.ticks,
+            "lag_p50_ms": lag_ms(50),
+            "lag_p99_ms": lag_ms(99),
+            "max_lag_ms": round(self.max_lag * 1000, 2),
+            "blocked_count": self.blocked_count,
+            "blocked_ms": round(self.blocked_seconds * 1000, 2),
+        }
+
+
+def _create_monitor() -> EventLoopMonitor:
+    """Create the monitor from the event_loop section of config.yaml."""
+    config = settings.get_event_loop_config()
+    return EventLoopMonitor(
+        interval=float(config.get("monitor_interval", DEFAULT_INTERVAL)),
+        sample_size=int(config.get("sample_size", DEFAULT_SAMPLE_SIZE)),
+    )
+
+
+# Global event loop monitor instance
+event_loop_monitor = _create_monitor()
@@ -0,0 +1,130 @@
+"""Compiled RBAC policy engine."""
+
+import fnmatch
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+DEFAULT_DECISION_CACHE_SIZE = 10000
+
+
+def compile_patterns(patterns: list[str]) -> re.Pattern[str] | None:
+    """Compile resource patterns into one regex (None if nothing is allowed).
+
+    Args:
+        patterns: Resource patterns with fnmatch wildcards
+
+    Returns:
+        Regex matching a resource against any of the patterns
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in sorted(set(patterns))))
+
+
+class PolicyEngine:
+    """RBAC policies compiled into per-(service, action) matchers.
+
+    Policies from config.yaml are walked once when loaded: every allowed
+    resource pattern of a service's roles is grouped by action and compiled
+    into a single regex. Decisions are memoized in a bounded LRU cache, so
+    repeated checks of the same resource cost a dictionary lookup.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_DECISION_CACHE_SIZE) -> None:
+        """Initialize an empty engine (nothing is allowed until loaded)."""
+        self.cache_size = cache_size
+        self._matchers: dict[tuple[str, str], re.Pattern[str] | None] = {}
+        self._decisions: OrderedDict[tuple[str, str, str], bool] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(
+        self, service_roles: dict[str, list[str]], policies: list[dict[str, Any]]
+    ) -> None:
+        """
+        Compile policies and drop cached decisions.
+
+        Args:
+            service_roles: Role names assigned to each service
+            policies: RBAC policies (name, permissions)
+        """
+        policy_map = {p.get("name"): p for p in policies if isinstance(p, dict)}
+
+        patterns: dict[tuple[str, str], list[str]] = {}
+        for service, roles in service_roles.items():
+            for role_name in roles:
+                policy = policy_map.get(role_name)
+                if not policy:
+                    continue
+
+                for perm in policy.get("permissions", []):
+                    if not isinstance(perm, dict):
+                        continue
+
+                    # Check effect (only "allow" supported for now)
+                    if perm.get("effect", "").lower() != "allow":
+                        continue
+
+                    for action in perm.get("actions", []):
+                        patterns.setdefault((service, action), []).extend(
+                            perm.get("resources", [])
+                        )
+
+        matchers = {key: compile_patterns(value) for key, value in patterns.items()}
+        with self._lock:
+            self._matchers = matchers
+            self._decisions.clear()
+
+    def is_allowed(self, service: str, action: str, resource: str) -> bool:
+        """
+        Check whether service may perform action on resource.
+
+        Args:
+            service: Service name
+            action: Action to perform (read, write, delete, list)
+            resource: Resource identifier (format: secret:project:path)
+
+        Returns:
+            True if permission is granted, False otherwise
+        """
+        key = (service, action, resource)
+        with self._lock:
+            decision = self._decisions.get(key)
+            if decision is not None:
+                self._decisions.move_to_end(key)
+                self.hits += 1
+                return decision
+            self.misses += 1
+            matcher = self._matchers.get((service, action))
+
+        decision = matcher is not None and matcher.match(resource) is not None
+
+        with self._lock:
+            self._decisions[key] = decision
+            if len(self._decisions) > self.cache_size:
+                self._decisions.popitem(last=False)
+        return decision
+
+    def matcher(self, service: str, action: str) -> Callable[[str], bool]:
+        """
+        Get a predicate for many resources at once (bypasses the decision cache).
+
+        Used when filtering large listings so that they don't evict hot decisions.
+        """
+        compiled = self._matchers.get((service, action))
+        if compiled is None:
+            return lambda resource: False
+        return lambda resource: compiled.match(resource) is not None
+
+    def stats(self) -> dict[str, int]:
+        """Get decision cache statistics."""
+        return {
+            "size": len(self._decisions),
+            "max_size": self.cache_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
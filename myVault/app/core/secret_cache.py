@@ -0,0 +1,120 @@
+"""In-process cache of decrypted secret values."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.core.config import settings
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 30.0
+
+CacheKey = tuple[str, str, str]
+
+
+class DecryptedSecretCache:
+    """Bounded, short-TTL cache of decrypted values keyed by (project, path, etag).
+
+    Hot keys (e.g. LLM API keys) are read far more often than they change, so
+    caching the plaintext skips hex decoding and AES-GCM decryption on reads.
+    The etag (row id and version) in the key means a rotated secret is never
+    served stale, even when it was deleted and recreated (the version restarts
+    at 1 but the row id changes), and update/delete also drop the entry right
+    away. Values are held as bytearrays
+    and overwritten with zeros when evicted, expired or invalidated.
+    Disabled unless ``secret_cache.enabled`` is set in config.yaml.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """Initialize an empty cache."""
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[CacheKey, tuple[bytearray, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, project: str, path: str, etag: str) -> str | None:
+        """Get a cached value (None on miss, expiry or when disabled)."""
+        if not self.enabled:
+            return None
+        key = (project, path, etag)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0].decode("utf-8")
+
+    def put(self, project: str, path: str, etag: str, value: str) -> None:
+        """Cache a decrypted value, evicting the least recently used entry."""
+        if not self.enabled or self.max_entries <= 0:
+            return
+        key = (project, path, etag)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (
+                bytearray(value.encode("utf-8")),
+                time.monotonic() + self.ttl_seconds,
+            )
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, project: str, path: str) -> None:
+        """Drop every cached entry of a secret."""
+        with self._lock:
+            for key in [k for k in self._entries if k[:2] == (project, path)]:
+                self._drop(key)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+
+    def _drop(self, key: CacheKey) -> None:
+        """Remove an entry and zero its value (caller holds the lock)."""
+        value, _ = self._entries.pop(key)
+        value[:] = bytes(len(value))
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+def _create_cache() -> DecryptedSecretCache:
+    """Create the cache from the secret_cache section of config.yaml."""
+    config = settings.get_secret_cache_config()
+    return DecryptedSecretCache(
+        enabled=bool(config.get("enabled", False)),
+        max_entries=int(config.get("max_entries", DEFAULT_MAX_ENTRIES)),
+        ttl_seconds=float(config.get("ttl_seconds", DEFAULT_TTL_SECONDS)),
+    )
+
+
+# Global decrypted secret cache instance
+secret_cache = _create_cache()
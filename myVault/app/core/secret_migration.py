@@ -0,0 +1,156 @@
+"""Online migration of stored secrets (envelope format and key rotation)."""
+
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.crypto import crypto_service
+from app.models.secret import Secret
+
+DEFAULT_BATCH_SIZE = 500
+
+
+@dataclass
+class MigrationBatch:
+    """Result of migrating one batch of secrets."""
+
+    last_id: int
+    scanned: int = 0
+    migrated: int = 0
+    failed: int = 0
+
+
+def count_legacy_secrets(db: Session) -> int:
+    """Count secrets still stored in the legacy hex columns."""
+    return db.query(Secret).filter(Secret.encrypted_blob.is_(None)).count()
+
+
+def migrate_secret_batch(
+    db: Session, after_id: int = 0, batch_size: int = DEFAULT_BATCH_SIZE
+) -> MigrationBatch:
+    """
+    Repack the next batch of legacy secrets into envelopes and commit.
+
+    The ciphertext is not re-encrypted: the IV, ciphertext and tag are moved
+    into an envelope tagged with the id of the key that decrypts it. Each row
+    is only updated if it is still legacy and at the version that was read,
+    so concurrent writes always win.
+
+    Args:
+        db: Database session
+        after_id: Only consider secrets with a greater id (batch cursor)
+        batch_size: Maximum number of secrets to read
+
+    Returns:
+        Batch result (last_id is the cursor for the next batch)
+    """
+    rows = db.execute(
+        select(
+            Secret.id,
+            Secret.version,
+            Secret.encrypted_value,
+            Secret.encryption_iv,
+            Secret.encryption_tag,
+        )
+        .where(Secret.encrypted_blob.is_(None), Secret.id > after_id)
+        .order_by(Secret.id)
+        .limit(batch_size)
+    ).all()
+
+    batch = MigrationBatch(last_id=rows[-1].id if rows else after_id, scanned=len(rows))
+    for row in rows:
+        try:
+            envelope = crypto_service.envelope_from_legacy(
+                row.encrypted_value, row.encryption_iv, row.encryption_tag
+            )
+        except ValueError:
+            batch.failed += 1
+            continue
+
+        batch.migrated += (
+            db.query(Secret)
+            .filter(
+                Secret.id == row.id,
+                Secret.version == row.version,
+                Secret.encrypted_blob.is_(None),
+            )
+            .update(
+                {
+                    Secret.encrypted_blob: envelope,
+                    Secret.encrypted_value: "",
+                    Secret.encryption_iv: "",
+                    Secret.encryption_tag: "",
+                },
+                synchronize_session=False,
+            )
+        )
+    db.commit()
+    return batch
+
+
+def count_secrets(db: Session) -> int:
+    """Count all stored secrets."""
+    return db.query(Secret).count()
+
+
+def reencrypt_secret_batch(
+    db: Session, after_id: int = 0, batch_size: int = DEFAULT_BATCH_SIZE
+) -> MigrationBatch:
+    """
+    Re-encrypt the next batch of secrets under the active master key and commit.
+
+    Secrets already stored as envelopes under the active key are skipped.
+    As with migrate_secret_batch, a row is only rewritten if its stored
+    ciphertext and version are unchanged since it was read; the value and
+    version stay the same, so ETags and cached values remain valid.
+
+    Args:
+        db: Database session
+        after_id: Only consider secrets with a greater id (batch cursor)
+        batch_size: Maximum number of secrets to read
+
+    Returns:
+        Batch result (last_id is the cursor for the next batch)
+    """
+    secrets = (
+        db.query(Secret)
+        .filter(Secret.id > after_id)
+        .order_by(Secret.id)
+        .limit(batch_size)
+        .all()
+    )
+
+    batch = MigrationBatch(
+        last_id=secrets[-1].id if secrets else after_id, scanned=len(secrets)
+    )
+    for secret in secrets:
+        ciphertext = secret.ciphertext
+        if crypto_service.is_current(ciphertext):
+            continue
+        try:
+            envelope = crypto_service.to_current(ciphertext)
+        except ValueError:
+            batch.failed += 1
+            continue
+
+        unchanged = (
+            Secret.encrypted_blob == ciphertext
+            if isinstance(ciphertext, bytes)
+            else Secret.encrypted_blob.is_(None)
+        )
+        batch.migrated += (
+            db.query(Secret)
+            .filter(Secret.id == secret.id, Secret.version == secret.version, unchanged)
+            .update(
+                {
+                    Secret.encrypted_blob: envelope,
+                    Secret.encrypted_value: "",
+                    Secret.encryption_iv: "",
+                    Secret.encryption_tag: "",
+                },
+                synchronize_session=False,
+            )
+        )
+    db.commit()
+    return batch
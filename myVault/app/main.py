@@ -1,19 +1,27 @@
 """myVault - Secure personal data vault and secret management service."""
 
+import asyncio
 import logging
 import logging.handlers
 import os
+import signal
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+from anyio import to_thread
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api import projects, secrets
+from app.api import audit, metrics, projects, secrets
+from app.core.audit import audit_logger
+from app.core.auth import auth_service
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.crypto import crypto_service
+from app.core.database import get_worker_threads, init_db
+from app.core.key_rotation import key_rotation_job
+from app.core.loop_monitor import event_loop_monitor
 
 # Load .env file from project root
 env_path = Path(__file__).parent.parent / ".env"
@@ -64,13 +72,55 @@
 )
 
 
+def reload_config() -> None:
+    """Re-read config.yaml and recompile RBAC policies (on SIGHUP).
+
+    Services, tokens, prefixes and policies take effect for the next request.
+    An invalid file is logged and the previous configuration is kept.
+    """
+    try:
+        settings.reload_config()
+    except Exception as e:
+        logger.error(f"Failed to reload config.yaml, keeping the previous one: {e}")
+        return
+    auth_service.reload_policies()
+    logger.info("Reloaded config.yaml")
+
+
+def _install_reload_handler() -> bool:
+    """Reload config.yaml on SIGHUP (only possible on the main thread, POSIX)."""
+    if not hasattr(signal, "SIGHUP"):
+        return False
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, reload_config)
+    except (NotImplementedError, RuntimeError, ValueError):
+        return False
+    return True
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup: Initialize database
     init_db()
+    # Bound the thread pool running blocking DB/crypto work of the endpoints
+    to_thread.current_default_thread_limiter().total_tokens = get_worker_threads()
+    # Write buffered audit events in the background
+    audit_logger.start()
+    # Measure how long the event loop is blocked (GET /api/metrics)
+    event_loop_monitor.start()
+    # Re-encrypt values under retired master keys in the background (opt-in)
+    if crypto_service.has_previous_keys and key_rotation_job.auto_start:
+        key_rotation_job.start()
+    # Apply config.yaml edits without a restart: kill -HUP <pid>
+    reload_handler = _install_reload_handler()
     yield
     # Shutdown: cleanup if needed
+    if reload_handler:
+        asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+    await event_loop_monitor.stop()
+    await key_rotation_job.stop()
+    await to_thread.run_sync(audit_logger.stop)
 
 
 app = FastAPI(
@@ -92,6 +142,9 @@ async def lifespan(app: FastAPI):
 # Include routers
 app.include_router(projects.router)
 app.include_router(secrets.router)
+app.include_router(secrets.bundles_router)
+app.include_router(metrics.router)
+app.include_router(audit.router)
 
 
 @app.get("/health")
@@ -1,6 +1,8 @@
 """Database models for myVault."""
 
+from app.models.audit_event import AuditEvent
 from app.models.project import Project
 from app.models.secret import Secret
+from app.models.secret_change import SecretChange
 
-__all__ = ["Project", "Secret"]
+__all__ = ["AuditEvent", "Project", "Secret", "SecretChange"]
@@ -0,0 +1,35 @@
+"""Audit event model (append-only access log)."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class AuditEvent(Base):
+    """One access to a secret (read, list, write or delete), allowed or not.
+
+    Rows are only ever inserted (in batches by the audit logger) and removed
+    by the retention purge.
+    """
+
+    __tablename__ = "audit_events"
+    __table_args__ = (
+        # Time-range queries, optionally narrowed to a project or service
+        Index("ix_audit_events_project_time", "project", "occurred_at"),
+        Index("ix_audit_events_service_time", "service", "occurred_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime, index=True, nullable=False)
+    service: Mapped[str] = mapped_column(String(100), nullable=False)
+    action: Mapped[str] = mapped_column(String(20), nullable=False)
+    project: Mapped[str] = mapped_column(String(255), nullable=False)
+    path: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    outcome: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<AuditEvent(id={self.id}, service={self.service}, action={self.action}, project={self.project}, path={self.path}, outcome={self.outcome})>"
@@ -0,0 +1,80 @@
+"""Secret model for encrypted values."""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base
+
+
+class Secret(Base):
+    """Secret model storing an AES-256-GCM encrypted value.
+
+    New values are stored as a binary envelope in ``encrypted_blob``. Rows
+    written before envelopes existed keep the hex columns until they are
+    migrated (``scripts/migrate_secret_envelope.py``).
+    """
+
+    __tablename__ = "secrets"
+    __table_args__ = (UniqueConstraint("project", "path", name="uq_secret_path"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    project: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
+    project_id: Mapped[int | None] = mapped_column(
+        ForeignKey("projects.id"), nullable=True
+    )
+    path: Mapped[str] = mapped_column(String(500), nullable=False)
+    encrypted_value: Mapped[str] = mapped_column(Text, nullable=False)
+    encryption_iv: Mapped[str] = mapped_column(String(24), nullable=False)
+    encryption_tag: Mapped[str] = mapped_column(String(32), nullable=False)
+    encrypted_blob: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+    updated_by: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    # Relationship to project
+    project_rel: Mapped["Project"] = relationship(  # noqa: F821
+        "Project", back_populates="secrets"
+    )
+
+    @property
+    def ciphertext(self) -> bytes | tuple[str, str, str]:
+        """Stored ciphertext: the envelope, or the legacy hex triple."""
+        if self.encrypted_blob is not None:
+            return self.encrypted_blob
+        return (self.encrypted_value, self.encryption_iv, self.encryption_tag)
+
+    def set_envelope(self, envelope: bytes) -> None:
+        """Store an envelope and clear the legacy hex columns."""
+        self.encrypted_blob = envelope
+        self.encrypted_value = ""
+        self.encryption_iv = ""
+        self.encryption_tag = ""
+
+    @property
+    def key(self) -> str:
+        """Secret key in "project/path" form."""
+        return f"{self.project}/{self.path}"
+
+    @property
+    def etag(self) -> str:
+        """Entity tag of the current value (changes on every update)."""
+        return f'"{self.id}.{self.version}"'
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<Secret(id={self.id}, project={self.project}, path={self.path})>"
@@ -0,0 +1,29 @@
+"""Secret change log model (change feed)."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class SecretChange(Base):
+    """One create/update/delete of a secret, ordered by a monotonic sequence."""
+
+    __tablename__ = "secret_changes"
+
+    # Monotonically increasing change sequence (used as the feed cursor)
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    project: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
+    path: Mapped[str] = mapped_column(String(500), nullable=False)
+    action: Mapped[str] = mapped_column(String(20), nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    changed_by: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<SecretChange(seq={self.seq}, project={self.project}, path={self.path}, action={self.action})>"
@@ -2,6 +2,11 @@
 
 from app.schemas.project import ProjectCreate, ProjectResponse
 from app.schemas.secret import (
+    SecretBulkItem,
+    SecretBulkRequest,
+    SecretBulkResponse,
+    SecretChangeItem,
+    SecretChangesResponse,
     SecretCreate,
     SecretListItem,
     SecretResponse,
@@ -15,4 +20,9 @@
     "SecretUpdate",
     "SecretResponse",
     "SecretListItem",
+    "SecretBulkRequest",
+    "SecretBulkItem",
+    "SecretBulkResponse",
+    "SecretChangeItem",
+    "SecretChangesResponse",
 ]
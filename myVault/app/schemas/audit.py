@@ -0,0 +1,26 @@
+"""Pydantic schemas for audit events."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class AuditEventResponse(BaseModel):
+    """Schema for one audit event."""
+
+    id: int
+    occurred_at: datetime
+    service: str
+    action: str = Field(..., description="read, list, write or delete")
+    project: str
+    path: str | None
+    outcome: str = Field(..., description="allowed, denied, not_found or not_modified")
+
+    model_config = {"from_attributes": True}
+
+
+class AuditQueryResponse(BaseModel):
+    """Schema for audit query response."""
+
+    events: list[AuditEventResponse]
+    cursor: int = Field(..., description="Pass as 'after_id' to get the next page")
@@ -0,0 +1,145 @@
+"""Pydantic schemas for Secret model."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+MAX_BULK_KEYS = 1000
+
+
+class SecretCreate(BaseModel):
+    """Schema for creating a new secret."""
+
+    project: str = Field(..., min_length=1, max_length=255, description="Project name")
+    path: str = Field(..., min_length=1, max_length=500, description="Secret path")
+    value: str = Field(..., description="Secret value (stored encrypted)")
+
+
+class SecretUpdate(BaseModel):
+    """Schema for rotating a secret value."""
+
+    value: str = Field(..., description="New secret value")
+
+
+class SecretResponse(BaseModel):
+    """Schema for secret response with decrypted value."""
+
+    id: int
+    project: str
+    path: str
+    value: str
+    version: int
+    updated_at: datetime
+    updated_by: str
+
+
+class SecretListItem(BaseModel):
+    """Schema for secret list item (value redacted)."""
+
+    id: int
+    project: str
+    path: str
+    version: int
+    updated_at: datetime
+    updated_by: str
+
+    model_config = {"from_attributes": True}
+
+
+class SecretBulkRequest(BaseModel):
+    """Schema for fetching many secrets in one request."""
+
+    keys: list[str] = Field(
+        default_factory=list,
+        max_length=MAX_BULK_KEYS,
+        description='Secret keys in "project/path" form',
+    )
+    prefix: str | None = Field(
+        None,
+        description='Fetch every readable secret under "project/" or "project/path-prefix"',
+    )
+    if_none_match: dict[str, str] = Field(
+        default_factory=dict,
+        description="ETags already held by the client, by key (unchanged values are omitted)",
+    )
+
+    @field_validator("keys")
+    @classmethod
+    def validate_keys(cls, keys: list[str]) -> list[str]:
+        """Validate key format and drop duplicates."""
+        for key in keys:
+            project, _, path = key.partition("/")
+            if not project or not path:
+                raise ValueError(f"Key '{key}' must be in 'project/path' form")
+        return list(dict.fromkeys(keys))
+
+    @model_validator(mode="after")
+    def require_keys_or_prefix(self) -> "SecretBulkRequest":
+        """Require at least one of keys or prefix."""
+        if not self.keys and not self.prefix:
+            raise ValueError("Either keys or prefix is required")
+        return self
+
+
+class SecretBulkItem(BaseModel):
+    """Schema for one secret of a bulk response."""
+
+    key: str
+    project: str
+    path: str
+    value: str | None = Field(None, description="Omitted when not_modified is true")
+    version: int
+    etag: str
+    updated_at: datetime
+    updated_by: str
+    not_modified: bool = False
+
+
+class SecretBulkResponse(BaseModel):
+    """Schema for bulk secret response."""
+
+    secrets: list[SecretBulkItem]
+    missing: list[str] = Field(default_factory=list, description="Keys not found")
+    forbidden: list[str] = Field(
+        default_factory=list, description="Keys the service may not read"
+    )
+
+
+class SecretBundleResponse(BaseModel):
+    """Schema for a per-project secret bundle."""
+
+    project: str
+    service: str = Field(..., description="Service the bundle was issued to")
+    revision: int = Field(
+        ..., description="Change feed cursor of the project when the bundle was built"
+    )
+    etag: str = Field(..., description="Bundle version (send as If-None-Match)")
+    secrets: dict[str, str] = Field(..., description="Secret values by path")
+    signature_alg: str = "HMAC-SHA256"
+    signature: str = Field(
+        ...,
+        description=(
+            "HMAC-SHA256 with the service token over the other fields "
+            "(JSON, sorted keys, compact separators)"
+        ),
+    )
+
+
+class SecretChangeItem(BaseModel):
+    """Schema for one entry of the change feed."""
+
+    seq: int
+    key: str
+    project: str
+    path: str
+    action: str = Field(..., description="created, updated or deleted")
+    version: int
+    changed_at: datetime
+    changed_by: str
+
+
+class SecretChangesResponse(BaseModel):
+    """Schema for change feed response."""
+
+    cursor: int = Field(..., description="Pass as 'since' in the next request")
+    changes: list[SecretChangeItem]
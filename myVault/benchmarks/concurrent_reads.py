@@ -0,0 +1,163 @@
+"""
+Concurrent secret read benchmark.
+
+Starts myVault (uvicorn subprocess) on a temporary SQLite database, seeds
+secrets and, for every client count, reads random secrets for a fixed
+duration while `--writers` clients keep rotating other secrets. Reports read
+throughput and latency, showing whether reads scale with clients and stay
+unaffected by concurrent writes.
+
+The service identity must have read/write on `secret:<project>:*` in
+myVault/config.yaml (the default `commonui` role does).
+
+Run:
+    uv run python -m benchmarks.concurrent_reads --clients 1,4,16,64 \\
+        --secrets 200 --writers 2 --duration 5 --output reads.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import secrets
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.server import (
+    free_port,
+    seed_secrets,
+    start_myvault,
+    stop_process,
+    wait_until_healthy,
+)
+from benchmarks.stats import latency_summary
+
+PROJECT = "bench"
+
+
+async def run_clients(
+    client: httpx.AsyncClient,
+    keys: list[tuple[str, str]],
+    clients: int,
+    writers: int,
+    duration: float,
+) -> dict[str, Any]:
+    """Read with `clients` concurrent clients while `writers` rotate secrets."""
+    read_latencies: list[float] = []
+    write_latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def reader() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            project, path = random.choice(keys)
+            start = time.perf_counter()
+            response = await client.get(f"/api/secrets/{project}/{path}")
+            read_latencies.append(time.perf_counter() - start)
+            errors += response.status_code != 200
+
+    async def writer() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            project, path = random.choice(keys)
+            start = time.perf_counter()
+            response = await client.patch(
+                f"/api/secrets/{project}/{path}", json={"value": secrets.token_hex(32)}
+            )
+            write_latencies.append(time.perf_counter() - start)
+            errors += response.status_code != 200
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(reader() for _ in range(clients)), *(writer() for _ in range(writers))
+    )
+    elapsed = time.perf_counter() - started
+
+    return {
+        "clients": clients,
+        "writers": writers,
+        "reads": len(read_latencies),
+        "reads_per_sec": round(len(read_latencies) / elapsed, 1),
+        "read_latency": latency_summary(read_latencies),
+        "writes": len(write_latencies),
+        "writes_per_sec": round(len(write_latencies) / elapsed, 1),
+        "write_latency": latency_summary(write_latencies),
+        "errors": errors,
+    }
+
+
+async def main() -> int:
+    """Parse arguments and run the client-count matrix."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", default="1,4,16,64")
+    parser.add_argument("--secrets", type=int, default=200)
+    parser.add_argument("--value-bytes", type=int, default=64)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--service", default="commonui")
+    parser.add_argument("--database-url", help="Default: a fresh SQLite file")
+    parser.add_argument("--workdir", default=None)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    args.workdir = args.workdir or tempfile.mkdtemp(prefix="myvault-bench-")
+    database_url = args.database_url or f"sqlite:///{args.workdir}/bench.db"
+    token = secrets.token_urlsafe(32)
+    port = free_port()
+    proc = start_myvault(port, database_url, args.workdir, args.service, token)
+
+    results = []
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}",
+            headers={"X-Service": args.service, "X-Token": token},
+            timeout=60,
+            limits=httpx.Limits(max_connections=None),
+        ) as client:
+            await wait_until_healthy(client)
+            keys = await seed_secrets(client, [PROJECT], args.secrets, args.value_bytes)
+
+            for clients in (int(c) for c in args.clients.split(",")):
+                result = await run_clients(
+                    client, keys, clients, args.writers, args.duration
+                )
+                results.append(result)
+                print(
+                    f"clients={clients:<4} writers={args.writers:<2} "
+                    f"reads={result['reads_per_sec']:>8}/s "
+                    f"read p50/p99={result['read_latency']['p50_ms']}/"
+                    f"{result['read_latency']['p99_ms']}ms "
+                    f"writes={result['writes_per_sec']:>6}/s "
+                    f"errors={result['errors']}"
+                )
+    finally:
+        stop_process(proc)
+
+    report = {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "secrets": args.secrets,
+            "value_bytes": args.value_bytes,
+            "writers": args.writers,
+            "duration": args.duration,
+            "database_url": database_url,
+        },
+        "scenarios": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,271 @@
+"""
+Mixed read/list/write load benchmark.
+
+Starts myVault (uvicorn subprocess) on a temporary SQLite database, seeds
+`--projects` x `--secrets` secrets and, for every client count, drives a
+weighted mix of operations for a fixed duration:
+
+    read    GET   /api/secrets/{project}/{path}
+    list    GET   /api/secrets?project={project}
+    write   PATCH /api/secrets/{project}/{path}
+    bulk    POST  /api/secrets/bulk (10 random keys of one project)
+    bundle  GET   /api/bundles/{project}
+
+Reports throughput and p50/p99 latency per operation, plus event loop
+blocking time. The blocking time comes from two sources: the server-side
+loop lag monitor (`event_loop` in GET /api/metrics, diffed per scenario)
+and a probe that times GET /health (served on the loop) throughout the
+run. RBAC decision and decrypted-secret cache counters are diffed per
+scenario too, so the effect of caching and of running DB work off the
+loop can be compared between runs.
+
+The service identity must have read/write/list on `secret:*:*` in
+myVault/config.yaml (the default `commonui` role does).
+
+Run:
+    uv run python -m benchmarks.mixed_load --projects 10 --secrets 100 \\
+        --clients 1,16,64 --mix read=80,list=5,write=10,bulk=3,bundle=2 \\
+        --duration 10 --output mixed.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import secrets
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.server import (
+    free_port,
+    seed_secrets,
+    start_myvault,
+    stop_process,
+    wait_until_healthy,
+)
+from benchmarks.stats import latency_summary
+
+OPERATIONS = ("read", "list", "write", "bulk", "bundle")
+BULK_KEYS = 10
+HEALTH_PROBE_INTERVAL = 0.05
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    """Parse "read=80,write=20" into operation weights."""
+    weights: dict[str, int] = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation '{name}' (use {OPERATIONS})")
+        weights[name] = int(weight or 1)
+    return weights
+
+
+async def perform(
+    client: httpx.AsyncClient,
+    operation: str,
+    projects: list[str],
+    keys_by_project: dict[str, list[str]],
+) -> bool:
+    """Perform one operation on a random project; True if it succeeded."""
+    project = random.choice(projects)
+    if operation == "read":
+        path = random.choice(keys_by_project[project])
+        response = await client.get(f"/api/secrets/{project}/{path}")
+    elif operation == "list":
+        response = await client.get("/api/secrets", params={"project": project})
+    elif operation == "write":
+        path = random.choice(keys_by_project[project])
+        response = await client.patch(
+            f"/api/secrets/{project}/{path}", json={"value": secrets.token_hex(32)}
+        )
+    elif operation == "bulk":
+        paths = random.sample(
+            keys_by_project[project], min(BULK_KEYS, len(keys_by_project[project]))
+        )
+        response = await client.post(
+            "/api/secrets/bulk", json={"keys": [f"{project}/{p}" for p in paths]}
+        )
+    else:
+        response = await client.get(f"/api/bundles/{project}")
+    return response.status_code == 200
+
+
+def diff_metrics(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    """Summarize server-side counters accumulated during one scenario."""
+    loop_before, loop_after = before["event_loop"], after["event_loop"]
+    rbac_before, rbac_after = before["rbac_cache"], after["rbac_cache"]
+    cache_before, cache_after = before["secret_cache"], after["secret_cache"]
+
+    def hit_rate(hits: int, misses: int) -> float | None:
+        return round(hits / (hits + misses), 4) if hits + misses else None
+
+    rbac_hits = rbac_after["hits"] - rbac_before["hits"]
+    rbac_misses = rbac_after["misses"] - rbac_before["misses"]
+    cache_hits = cache_after["hits"] - cache_before["hits"]
+    cache_misses = cache_after["misses"] - cache_before["misses"]
+    return {
+        "event_loop": {
+            "blocked_ms": round(
+                loop_after["blocked_ms"] - loop_before["blocked_ms"], 2
+            ),
+            "blocked_count": loop_after["blocked_count"] - loop_before["blocked_count"],
+            "lag_p99_ms": loop_after["lag_p99_ms"],
+            "max_lag_ms": loop_after["max_lag_ms"],
+        },
+        "rbac_cache_hit_rate": hit_rate(rbac_hits, rbac_misses),
+        "secret_cache_hit_rate": hit_rate(cache_hits, cache_misses),
+    }
+
+
+async def run_clients(
+    client: httpx.AsyncClient,
+    projects: list[str],
+    keys_by_project: dict[str, list[str]],
+    mix: dict[str, int],
+    clients: int,
+    duration: float,
+) -> dict[str, Any]:
+    """Run the operation mix with `clients` concurrent clients."""
+    latencies: dict[str, list[float]] = {operation: [] for operation in mix}
+    errors: dict[str, int] = dict.fromkeys(mix, 0)
+    health_latencies: list[float] = []
+    operations, weights = list(mix), list(mix.values())
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            operation = random.choices(operations, weights)[0]
+            start = time.perf_counter()
+            ok = await perform(client, operation, projects, keys_by_project)
+            latencies[operation].append(time.perf_counter() - start)
+            errors[operation] += not ok
+
+    async def health_probe() -> None:
+        # /health runs on the event loop: its latency rises when the loop is blocked
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await client.get("/health")
+            health_latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(HEALTH_PROBE_INTERVAL)
+
+    before = (await client.get("/api/metrics")).json()
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(clients)), health_probe())
+    elapsed = time.perf_counter() - started
+    after = (await client.get("/api/metrics")).json()
+
+    total = sum(len(values) for values in latencies.values())
+    return {
+        "clients": clients,
+        "requests": total,
+        "requests_per_sec": round(total / elapsed, 1),
+        "errors": sum(errors.values()),
+        "operations": {
+            operation: {
+                "count": len(values),
+                "per_sec": round(len(values) / elapsed, 1),
+                "latency": latency_summary(values),
+                "errors": errors[operation],
+            }
+            for operation, values in latencies.items()
+        },
+        "health_probe_latency": latency_summary(health_latencies),
+        "server": diff_metrics(before, after),
+    }
+
+
+async def main() -> int:
+    """Parse arguments and run the client-count matrix."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--secrets", type=int, default=100, help="Per project")
+    parser.add_argument("--value-bytes", type=int, default=64)
+    parser.add_argument("--clients", default="1,16,64")
+    parser.add_argument("--mix", default="read=80,list=5,write=10,bulk=3,bundle=2")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument("--service", default="commonui")
+    parser.add_argument("--database-url", help="Default: a fresh SQLite file")
+    parser.add_argument("--workdir", default=None)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    random.seed(args.seed)
+    args.workdir = args.workdir or tempfile.mkdtemp(prefix="myvault-bench-")
+    database_url = args.database_url or f"sqlite:///{args.workdir}/bench.db"
+    token = secrets.token_urlsafe(32)
+    port = free_port()
+    proc = start_myvault(port, database_url, args.workdir, args.service, token)
+
+    results = []
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}",
+            headers={"X-Service": args.service, "X-Token": token},
+            timeout=60,
+            limits=httpx.Limits(max_connections=None),
+        ) as client:
+            await wait_until_healthy(client)
+            projects = [f"bench-{i}" for i in range(args.projects)]
+            keys_by_project: dict[str, list[str]] = {
+                project: [] for project in projects
+            }
+            for project, path in await seed_secrets(
+                client, projects, args.secrets, args.value_bytes
+            ):
+                keys_by_project[project].append(path)
+
+            for clients in (int(c) for c in args.clients.split(",")):
+                result = await run_clients(
+                    client, projects, keys_by_project, mix, clients, args.duration
+                )
+                results.append(result)
+                loop = result["server"]["event_loop"]
+                print(
+                    f"clients={clients:<4} "
+                    f"requests={result['requests_per_sec']:>8}/s "
+                    f"errors={result['errors']:<4} "
+                    f"loop blocked={loop['blocked_ms']}ms "
+                    f"health p99={result['health_probe_latency']['p99_ms']}ms"
+                )
+                for operation, summary in result["operations"].items():
+                    print(
+                        f"  {operation:<7} {summary['per_sec']:>8}/s "
+                        f"p50/p99={summary['latency']['p50_ms']}/"
+                        f"{summary['latency']['p99_ms']}ms "
+                        f"errors={summary['errors']}"
+                    )
+    finally:
+        stop_process(proc)
+
+    report = {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "projects": args.projects,
+            "secrets_per_project": args.secrets,
+            "value_bytes": args.value_bytes,
+            "mix": mix,
+            "duration": args.duration,
+            "database_url": database_url,
+        },
+        "scenarios": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
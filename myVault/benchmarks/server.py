@@ -0,0 +1,118 @@
+"""Helpers for running myVault in a subprocess during benchmarks."""
+
+import asyncio
+import base64
+import os
+import secrets
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+MYVAULT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def free_port() -> int:
+    """Return an unused local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def generate_master_key() -> str:
+    """Return a fresh MSA_MASTER_KEY value."""
+    return "base64:" + base64.b64encode(secrets.token_bytes(32)).decode()
+
+
+def start_myvault(
+    port: int,
+    database_url: str,
+    workdir: str,
+    service: str,
+    token: str,
+    extra_env: dict[str, str] | None = None,
+) -> subprocess.Popen[bytes]:
+    """Start myVault in a uvicorn subprocess (uses myVault/config.yaml)."""
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "MSA_MASTER_KEY": generate_master_key(),
+        f"TOKEN_{service}": token,
+        "LOG_LEVEL": "WARNING",
+        "LOG_DIR": workdir,
+        **(extra_env or {}),
+    }
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=MYVAULT_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def stop_process(proc: subprocess.Popen[bytes]) -> None:
+    """Terminate a subprocess and reap it."""
+    if proc.poll() is None:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+async def wait_until_healthy(client: httpx.AsyncClient, timeout: float = 30) -> None:
+    """Wait for myVault's /health endpoint."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("myVault did not become healthy")
+
+
+async def seed_secrets(
+    client: httpx.AsyncClient,
+    projects: list[str],
+    secrets_per_project: int,
+    value_bytes: int,
+    concurrency: int = 16,
+) -> list[tuple[str, str]]:
+    """Create `secrets_per_project` secrets in every project via the API."""
+    keys = [
+        (project, f"bench/key-{i}")
+        for project in projects
+        for i in range(secrets_per_project)
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create(project: str, path: str) -> None:
+        async with semaphore:
+            response = await client.post(
+                "/api/secrets",
+                json={"project": project, "path": path, "value": "x" * value_bytes},
+            )
+            response.raise_for_status()
+
+    await asyncio.gather(*(create(project, path) for project, path in keys))
+    return keys
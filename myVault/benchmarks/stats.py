@@ -0,0 +1,20 @@
+"""Statistics helpers shared by the benchmarks."""
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of `values` (0.0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def latency_summary(seconds: list[float]) -> dict[str, float]:
+    """Summarize latencies (in seconds) as p50/p95/p99/max milliseconds."""
+    return {
+        "p50_ms": round(percentile(seconds, 50) * 1000, 2),
+        "p95_ms": round(percentile(seconds, 95) * 1000, 2),
+        "p99_ms": round(percentile(seconds, 99) * 1000, 2),
+        "max_ms": round(max(seconds, default=0.0) * 1000, 2),
+    }
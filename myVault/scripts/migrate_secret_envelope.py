@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Migration script to move secrets to the binary envelope format.
+
+This script adds the encrypted_blob column to the secrets table (if missing)
+and repacks legacy hex-encoded secrets into envelopes in small batches.
+It is safe to run while myVault is serving requests and can be re-run at
+any time; already migrated secrets are skipped.
+
+Usage:
+    python scripts/migrate_secret_envelope.py [--batch-size 500] [--sleep 0.1]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import (  # noqa: E402
+    SessionLocal,
+    engine,
+    ensure_envelope_column,
+)
+from app.core.secret_migration import (  # noqa: E402
+    DEFAULT_BATCH_SIZE,
+    count_legacy_secrets,
+    migrate_secret_batch,
+)
+
+
+def main():
+    """Run migration."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--sleep",
+        type=float,
+        default=0.1,
+        help="Pause between batches (seconds) to leave room for live traffic",
+    )
+    args = parser.parse_args()
+
+    print(f"📂 Database: {engine.url.render_as_string(hide_password=True)}")
+
+    if ensure_envelope_column(engine):
+        print("✅ Added 'encrypted_blob' column to secrets table.")
+
+    db = SessionLocal()
+    try:
+        remaining = count_legacy_secrets(db)
+        if remaining == 0:
+            print("✅ All secrets already use the envelope format.")
+            return
+
+        print(f"🔄 Migrating {remaining} secrets...")
+        after_id = 0
+        migrated = failed = 0
+        while True:
+            batch = migrate_secret_batch(db, after_id, args.batch_size)
+            if batch.last_id == after_id:
+                break
+            after_id = batch.last_id
+            migrated += batch.migrated
+            failed += batch.failed
+            print(f"  … {migrated}/{remaining} migrated (up to id={after_id})")
+            time.sleep(args.sleep)
+
+        print(f"✅ Migration completed: {migrated} secrets migrated.")
+        if failed:
+            print(
+                f"⚠ {failed} secrets could not be decrypted with the current "
+                "master key and were left unchanged."
+            )
+            sys.exit(1)
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Migration failed: {str(e)}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -160,3 +160,34 @@ def test_access_control(client: TestClient) -> None:
         headers=headers_test,
     )
     assert response.status_code == 403
+
+
+def test_secret_io_runs_off_event_loop(
+    client: TestClient, auth_headers: dict[str, str], monkeypatch
+) -> None:
+    """Test that decryption (and the DB session) run in a worker thread."""
+    import asyncio
+
+    from app.core.crypto import crypto_service
+
+    client.post(
+        "/api/secrets",
+        json={"project": "test", "path": "dev/threaded", "value": "v"},
+        headers=auth_headers,
+    )
+
+    loops = []
+    decrypt_many = crypto_service.decrypt_many
+
+    def spy(*args):
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return decrypt_many(*args)
+
+    monkeypatch.setattr(crypto_service, "decrypt_many", spy)
+    response = client.get("/api/secrets/test/dev/threaded", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert loops == [None]
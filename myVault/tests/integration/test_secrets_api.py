@@ -0,0 +1,346 @@
+"""Integration tests for bulk and conditional secret reads."""
+
+from fastapi.testclient import TestClient
+
+from app.core.audit import audit_logger
+from app.core.bundle import verify_bundle
+
+
+def create_secrets(
+    client: TestClient, auth_headers: dict[str, str], secrets: dict[str, str]
+) -> None:
+    """Create secrets given as {"project/path": value}."""
+    for key, value in secrets.items():
+        project, _, path = key.partition("/")
+        response = client.post(
+            "/api/secrets",
+            json={"project": project, "path": path, "value": value},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+
+
+def test_bulk_fetch_by_keys(client: TestClient, auth_headers: dict[str, str]) -> None:
+    """Test fetching several keys, reporting missing and forbidden ones."""
+    create_secrets(
+        client,
+        auth_headers,
+        {"test/OPENAI_API_KEY": "sk-1", "common/GOOGLE_API_KEY": "g-1"},
+    )
+
+    response = client.post(
+        "/api/secrets/bulk",
+        json={
+            "keys": [
+                "test/OPENAI_API_KEY",
+                "common/GOOGLE_API_KEY",
+                "test/MISSING",
+                "other/SECRET",
+                "test/OPENAI_API_KEY",
+            ]
+        },
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert {s["key"]: s["value"] for s in data["secrets"]} == {
+        "test/OPENAI_API_KEY": "sk-1",
+        "common/GOOGLE_API_KEY": "g-1",
+    }
+    assert all(s["etag"] and s["version"] == 1 for s in data["secrets"])
+    assert data["missing"] == ["test/MISSING"]
+    assert data["forbidden"] == ["other/SECRET"]
+
+
+def test_bulk_fetch_by_prefix(client: TestClient, auth_headers: dict[str, str]) -> None:
+    """Test fetching every readable secret under a prefix."""
+    create_secrets(
+        client,
+        auth_headers,
+        {"test/llm/a": "1", "test/llm/b": "2", "test/llm_x": "3", "test/db/c": "4"},
+    )
+
+    response = client.post(
+        "/api/secrets/bulk", json={"prefix": "test/llm/"}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert [s["key"] for s in response.json()["secrets"]] == [
+        "test/llm/a",
+        "test/llm/b",
+    ]
+
+
+def test_bulk_fetch_if_none_match(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test that secrets with a matching ETag come back without a value."""
+    create_secrets(client, auth_headers, {"test/a": "1", "test/b": "2"})
+    first = client.post(
+        "/api/secrets/bulk", json={"prefix": "test"}, headers=auth_headers
+    ).json()
+    etags = {s["key"]: s["etag"] for s in first["secrets"]}
+
+    client.patch("/api/secrets/test/b", json={"value": "3"}, headers=auth_headers)
+    response = client.post(
+        "/api/secrets/bulk",
+        json={"prefix": "test", "if_none_match": etags},
+        headers=auth_headers,
+    )
+
+    items = {s["key"]: s for s in response.json()["secrets"]}
+    assert items["test/a"]["not_modified"] is True
+    assert items["test/a"]["value"] is None
+    assert items["test/b"]["not_modified"] is False
+    assert items["test/b"]["value"] == "3"
+    assert items["test/b"]["etag"] != etags["test/b"]
+
+
+def test_bulk_fetch_validation(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test that keys must be project/path and something must be requested."""
+    response = client.post("/api/secrets/bulk", json={}, headers=auth_headers)
+    assert response.status_code == 422
+
+    response = client.post(
+        "/api/secrets/bulk", json={"keys": ["no-path"]}, headers=auth_headers
+    )
+    assert response.status_code == 422
+
+
+def test_get_secret_etag(client: TestClient, auth_headers: dict[str, str]) -> None:
+    """Test conditional GET with If-None-Match."""
+    create_secrets(client, auth_headers, {"test/dev/etag": "v1"})
+
+    response = client.get("/api/secrets/test/dev/etag", headers=auth_headers)
+    etag = response.headers["ETag"]
+
+    response = client.get(
+        "/api/secrets/test/dev/etag", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    client.patch(
+        "/api/secrets/test/dev/etag", json={"value": "v2"}, headers=auth_headers
+    )
+    response = client.get(
+        "/api/secrets/test/dev/etag", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["value"] == "v2"
+
+
+def test_secret_bundle(client: TestClient, auth_headers: dict[str, str]) -> None:
+    """Test that a bundle holds every readable secret and is signed."""
+    create_secrets(
+        client,
+        auth_headers,
+        {"test/api-key": "k1", "test/db/password": "p1", "common/shared": "s1"},
+    )
+
+    response = client.get("/api/bundles/test", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "no-store"
+    bundle = response.json()
+    assert bundle["secrets"] == {"api-key": "k1", "db/password": "p1"}
+    assert bundle["etag"] == response.headers["ETag"]
+    assert bundle["revision"] > 0
+
+    signature = bundle.pop("signature")
+    assert verify_bundle(bundle, signature, "test-token-123")
+    assert not verify_bundle(bundle, signature, "other-token-456")
+    bundle["secrets"]["api-key"] = "tampered"
+    assert not verify_bundle(bundle, signature, "test-token-123")
+
+
+def test_secret_bundle_if_none_match(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test that the bundle version changes on create, update and delete."""
+    create_secrets(client, auth_headers, {"test/a": "1", "test/b": "2"})
+    etag = client.get("/api/bundles/test", headers=auth_headers).headers["ETag"]
+
+    def fetch(etag: str) -> int:
+        return client.get(
+            "/api/bundles/test",
+            headers={**auth_headers, "If-None-Match": etag},
+        ).status_code
+
+    assert fetch(etag) == 304
+
+    client.patch("/api/secrets/test/a", json={"value": "1b"}, headers=auth_headers)
+    assert fetch(etag) == 200
+    etag = client.get("/api/bundles/test", headers=auth_headers).headers["ETag"]
+
+    client.delete("/api/secrets/test/b", headers=auth_headers)
+    assert fetch(etag) == 200
+
+
+def test_secret_bundle_hides_unreadable_secrets(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test that a service only receives secrets it may read."""
+    create_secrets(client, auth_headers, {"test/api-key": "k1"})
+
+    response = client.get(
+        "/api/bundles/test",
+        headers={"X-Service": "other-service", "X-Token": "other-token-456"},
+    )
+    assert response.status_code == 200
+    assert response.json()["secrets"] == {}
+
+
+def test_project_named_bundles_is_readable(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test that bundles do not shadow secrets of a project named "bundles"."""
+    create_secrets(client, auth_headers, {"bundles/api-key": "k1"})
+
+    response = client.get("/api/secrets/bundles/api-key", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["value"] == "k1"
+
+
+def test_change_feed(client: TestClient, auth_headers: dict[str, str]) -> None:
+    """Test that creates, updates and deletes appear after the cursor."""
+    cursor = client.get("/api/secrets/changes", headers=auth_headers).json()["cursor"]
+
+    create_secrets(client, auth_headers, {"test/feed/a": "1"})
+    client.patch("/api/secrets/test/feed/a", json={"value": "2"}, headers=auth_headers)
+    client.delete("/api/secrets/test/feed/a", headers=auth_headers)
+
+    response = client.get(
+        "/api/secrets/changes", params={"since": cursor}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [(c["key"], c["action"], c["version"]) for c in data["changes"]] == [
+        ("test/feed/a", "created", 1),
+        ("test/feed/a", "updated", 2),
+        ("test/feed/a", "deleted", 2),
+    ]
+    assert data["cursor"] == data["changes"][-1]["seq"] > cursor
+
+    # Nothing new after the returned cursor
+    response = client.get(
+        "/api/secrets/changes", params={"since": data["cursor"]}, headers=auth_headers
+    )
+    assert response.json() == {"cursor": data["cursor"], "changes": []}
+
+
+def test_change_feed_hides_unreadable_secrets(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test that services only see changes of secrets they may read."""
+    create_secrets(client, auth_headers, {"test/hidden": "1"})
+    other_headers = {"X-Service": "other-service", "X-Token": "other-token-456"}
+
+    response = client.get(
+        "/api/secrets/changes", params={"since": 0}, headers=other_headers
+    )
+
+    data = response.json()
+    assert data["changes"] == []
+    assert data["cursor"] > 0
+
+
+def test_change_feed_long_poll(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test that a waiting request returns as soon as a change is committed."""
+    import threading
+    import time
+
+    cursor = client.get("/api/secrets/changes", headers=auth_headers).json()["cursor"]
+    result = {}
+
+    def poll() -> None:
+        started = time.monotonic()
+        response = client.get(
+            "/api/secrets/changes",
+            params={"since": cursor, "wait": 10},
+            headers=auth_headers,
+        )
+        result["elapsed"] = time.monotonic() - started
+        result["changes"] = response.json()["changes"]
+
+    poller = threading.Thread(target=poll)
+    poller.start()
+    time.sleep(0.3)
+    create_secrets(client, auth_headers, {"test/long-poll": "1"})
+    poller.join(timeout=10)
+
+    assert [c["key"] for c in result["changes"]] == ["test/long-poll"]
+    assert result["elapsed"] < 5
+
+
+def test_hot_cache_serves_repeated_reads(
+    client: TestClient, auth_headers: dict[str, str], monkeypatch
+) -> None:
+    """Test that repeated reads skip decryption and updates invalidate."""
+    from app.core.secret_cache import secret_cache
+
+    monkeypatch.setattr(secret_cache, "enabled", True)
+    secret_cache.clear()
+    create_secrets(client, auth_headers, {"test/OPENAI_API_KEY": "sk-1"})
+
+    for _ in range(3):
+        response = client.get("/api/secrets/test/OPENAI_API_KEY", headers=auth_headers)
+        assert response.json()["value"] == "sk-1"
+    client.patch(
+        "/api/secrets/test/OPENAI_API_KEY", json={"value": "sk-2"}, headers=auth_headers
+    )
+    response = client.get("/api/secrets/test/OPENAI_API_KEY", headers=auth_headers)
+
+    assert response.json()["value"] == "sk-2"
+    stats = client.get("/api/metrics", headers=auth_headers).json()["secret_cache"]
+    assert stats["hits"] >= 2
+
+    # Recreated under the same path: version restarts at 1, row id differs
+    client.delete("/api/secrets/test/OPENAI_API_KEY", headers=auth_headers)
+    create_secrets(client, auth_headers, {"test/OPENAI_API_KEY": "sk-3"})
+    response = client.get("/api/secrets/test/OPENAI_API_KEY", headers=auth_headers)
+    assert response.json()["value"] == "sk-3"
+    secret_cache.clear()
+
+
+def test_secret_access_is_audited(
+    client: TestClient, auth_headers: dict[str, str], monkeypatch
+) -> None:
+    """Test that reads, denials and writes show up in the audit query API."""
+    for option in ("enabled", "log_access", "log_modifications"):
+        monkeypatch.setattr(audit_logger, option, True)
+    create_secrets(client, auth_headers, {"test/audited": "v1"})
+    client.get("/api/secrets/test/audited", headers=auth_headers)
+    client.get("/api/secrets/test/missing", headers=auth_headers)
+    other_headers = {"X-Service": "other-service", "X-Token": "other-token-456"}
+    client.get("/api/secrets/test/audited", headers=other_headers)
+    audit_logger.flush()
+
+    response = client.get("/api/audit?project=test", headers=auth_headers)
+    assert response.status_code == 200
+    events = [
+        (event["service"], event["action"], event["path"], event["outcome"])
+        for event in response.json()["events"]
+    ]
+    assert events == [
+        ("test-service", "write", "audited", "allowed"),
+        ("test-service", "read", "audited", "allowed"),
+        ("test-service", "read", "missing", "not_found"),
+        ("other-service", "read", "audited", "denied"),
+    ]
+
+    response = client.get(
+        "/api/audit?project=test&outcome=denied&since=2000-01-01T00:00:00",
+        headers=auth_headers,
+    )
+    assert [event["service"] for event in response.json()["events"]] == [
+        "other-service"
+    ]
+
+    # Audit events of a project are only visible with read on audit:{project}
+    response = client.get("/api/audit?project=test", headers=other_headers)
+    assert response.json()["events"] == []
@@ -0,0 +1,85 @@
+"""Unit tests for the batched audit pipeline."""
+
+import time
+from datetime import datetime, timedelta
+
+from app.core.audit import AuditLogger
+from app.models.audit_event import AuditEvent
+
+
+def test_events_are_buffered_and_written_in_batches(db_session) -> None:
+    """Test that record() only buffers and flush() writes in batches."""
+    audit = AuditLogger(enabled=True, flush_size=2)
+    for i in range(5):
+        audit.record("test-service", "read", "test", f"key-{i}", "allowed")
+
+    assert db_session.query(AuditEvent).count() == 0
+    assert audit.flush() == 5
+
+    stats = audit.stats()
+    assert (stats["recorded"], stats["written"], stats["flushes"]) == (5, 5, 3)
+    assert stats["buffered"] == 0
+    paths = [event.path for event in db_session.query(AuditEvent).order_by("id")]
+    assert paths == [f"key-{i}" for i in range(5)]
+
+
+def test_record_respects_config() -> None:
+    """Test that disabled audit and disabled categories record nothing."""
+    disabled = AuditLogger(enabled=False)
+    disabled.record("test-service", "read", "test", "key", "allowed")
+    assert disabled.stats()["recorded"] == 0
+
+    modifications_only = AuditLogger(enabled=True, log_access=False)
+    modifications_only.record("test-service", "read", "test", "key", "allowed")
+    modifications_only.record("test-service", "delete", "test", "key", "allowed")
+    assert modifications_only.stats()["recorded"] == 1
+
+
+def test_full_buffer_drops_after_waiting() -> None:
+    """Test backpressure: a full buffer waits briefly, then drops the event."""
+    audit = AuditLogger(enabled=True, buffer_size=2, overflow_wait=0.01)
+    for i in range(3):
+        audit.record("test-service", "read", "test", f"key-{i}", "allowed")
+
+    stats = audit.stats()
+    assert (stats["recorded"], stats["dropped"], stats["buffered"]) == (2, 1, 2)
+
+
+def test_writer_thread_flushes_in_background(db_session) -> None:
+    """Test that the writer thread flushes full batches and the rest on stop."""
+    audit = AuditLogger(enabled=True, flush_size=3, flush_interval=60)
+    audit.start()
+    try:
+        for i in range(4):
+            audit.record("test-service", "read", "test", f"key-{i}", "allowed")
+        deadline = time.monotonic() + 5
+        while audit.stats()["written"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert audit.stats()["written"] >= 3
+    finally:
+        audit.stop()
+
+    assert audit.stats()["written"] == 4
+    assert db_session.query(AuditEvent).count() == 4
+
+
+def test_purge_removes_expired_events(db_session) -> None:
+    """Test that events older than the retention period are purged."""
+    audit = AuditLogger(enabled=True, retention_days=1)
+    db_session.add_all(
+        [
+            AuditEvent(
+                occurred_at=datetime.utcnow() - timedelta(days=age),
+                service="test-service",
+                action="read",
+                project="test",
+                path="key",
+                outcome="allowed",
+            )
+            for age in (0, 2)
+        ]
+    )
+    db_session.commit()
+
+    assert audit.purge() == 1
+    assert db_session.query(AuditEvent).count() == 1
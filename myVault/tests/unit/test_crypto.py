@@ -1,6 +1,8 @@
 """Unit tests for cryptographic services."""
 
-from app.core.crypto import CryptoService
+import pytest
+
+from app.core.crypto import CryptoService, parse_envelope
 
 
 def test_encrypt_decrypt() -> None:
@@ -69,3 +71,81 @@ def test_decrypt_invalid_ciphertext_fails() -> None:
         raise AssertionError("Should have raised ValueError")
     except ValueError:
         pass
+
+
+def test_envelope_roundtrip() -> None:
+    """Test envelope encryption and its binary layout."""
+    crypto = CryptoService()
+    plaintext = "my-secret-password-123"
+
+    envelope = crypto.encrypt_envelope(plaintext)
+
+    key_id, nonce, ciphertext_with_tag = parse_envelope(envelope)
+    assert envelope[0] == 1
+    assert key_id == crypto.key_id
+    assert len(nonce) == 12
+    assert len(ciphertext_with_tag) == len(plaintext) + 16
+    # Smaller than the legacy hex columns
+    assert len(envelope) < sum(len(part) for part in crypto.encrypt(plaintext))
+    assert crypto.decrypt_envelope(envelope) == plaintext
+
+
+def test_envelope_from_legacy() -> None:
+    """Test repacking a legacy hex triple without re-encrypting."""
+    crypto = CryptoService()
+    ciphertext, iv, tag = crypto.encrypt("legacy-secret")
+
+    envelope = crypto.envelope_from_legacy(ciphertext, iv, tag)
+
+    assert crypto.decrypt_envelope(envelope) == "legacy-secret"
+    assert crypto.decrypt_many([envelope, (ciphertext, iv, tag)]) == [
+        "legacy-secret",
+        "legacy-secret",
+    ]
+
+
+@pytest.mark.parametrize(
+    "tamper",
+    [
+        lambda envelope: b"\x02" + envelope[1:],  # unknown version
+        lambda envelope: envelope[:-1],  # truncated tag
+        lambda envelope: envelope[:-1] + bytes([envelope[-1] ^ 1]),  # bad tag
+    ],
+)
+def test_decrypt_invalid_envelope_fails(tamper) -> None:
+    """Test that malformed or tampered envelopes are rejected."""
+    crypto = CryptoService()
+    envelope = crypto.encrypt_envelope("my-secret")
+
+    with pytest.raises(ValueError):
+        crypto.decrypt_envelope(tamper(envelope))
+
+
+def test_decrypt_envelope_unknown_key_id_fails() -> None:
+    """Test that envelopes from another key are rejected."""
+    envelope = CryptoService().encrypt_envelope("my-secret")
+    other = CryptoService(master_key=b"x" * 32, previous_keys=[])
+
+    with pytest.raises(ValueError, match="Unknown key id"):
+        other.decrypt_envelope(envelope)
+
+
+def test_decrypt_with_previous_key() -> None:
+    """Test that values under a retired key stay readable after rotation."""
+    old = CryptoService(master_key=b"o" * 32)
+    envelope = old.encrypt_envelope("old-secret")
+    legacy = old.encrypt("legacy-secret")
+
+    crypto = CryptoService(master_key=b"n" * 32, previous_keys=[(None, b"o" * 32)])
+
+    assert crypto.has_previous_keys
+    assert crypto.decrypt_envelope(envelope) == "old-secret"
+    assert crypto.decrypt(*legacy) == "legacy-secret"
+    assert not crypto.is_current(envelope)
+
+    rotated = crypto.to_current(envelope)
+    assert crypto.is_current(rotated)
+    assert crypto.decrypt_envelope(rotated) == "old-secret"
+    assert crypto.decrypt_envelope(crypto.to_current(legacy)) == "legacy-secret"
+    with pytest.raises(ValueError, match="Unknown key id"):
+        CryptoService(master_key=b"o" * 32).decrypt_envelope(rotated)
@@ -0,0 +1,75 @@
+"""Unit tests for background re-encryption after a master key rotation."""
+
+import asyncio
+
+import pytest
+
+from app.core import secret_migration
+from app.core.crypto import CryptoService
+from app.core.key_rotation import KeyRotationJob
+from app.core.secret_migration import reencrypt_secret_batch
+from app.models.secret import Secret
+
+OLD_KEY = b"o" * 32
+NEW_KEY = b"n" * 32
+
+
+@pytest.fixture
+def rotated_crypto(monkeypatch) -> CryptoService:
+    """Use a new active key with the old key kept as a retired key."""
+    crypto = CryptoService(master_key=NEW_KEY, previous_keys=[("old", OLD_KEY)])
+    monkeypatch.setattr(secret_migration, "crypto_service", crypto)
+    return crypto
+
+
+def _add_old_secrets(db_session, count: int) -> None:
+    """Store secrets encrypted with the old key (half legacy, half envelopes)."""
+    old = CryptoService(master_key=OLD_KEY, key_id="old")
+    for i in range(count):
+        secret = Secret(project="test", path=f"key-{i}", updated_by="test-service")
+        if i % 2:
+            secret.set_envelope(old.encrypt_envelope(f"value-{i}"))
+        else:
+            secret.encrypted_value, secret.encryption_iv, secret.encryption_tag = (
+                old.encrypt(f"value-{i}")
+            )
+        db_session.add(secret)
+    db_session.commit()
+
+
+def test_reencrypt_batch_skips_current_and_changed_rows(db_session, rotated_crypto):
+    """Test that only rows under a retired key are rewritten."""
+    _add_old_secrets(db_session, 3)
+    current = Secret(project="test", path="current", updated_by="test-service")
+    current.set_envelope(rotated_crypto.encrypt_envelope("current-value"))
+    db_session.add(current)
+    db_session.commit()
+
+    batch = reencrypt_secret_batch(db_session, batch_size=10)
+
+    assert (batch.scanned, batch.migrated, batch.failed) == (4, 3, 0)
+    db_session.expire_all()
+    for secret in db_session.query(Secret).all():
+        assert rotated_crypto.is_current(secret.ciphertext)
+        assert secret.version == 1
+    assert reencrypt_secret_batch(db_session, batch_size=10).migrated == 0
+
+
+def test_key_rotation_job_reports_progress(db_session, rotated_crypto):
+    """Test that the job walks the table batch by batch."""
+    _add_old_secrets(db_session, 7)
+    job = KeyRotationJob(batch_size=3, batch_interval=0)
+
+    asyncio.run(job.run())
+
+    progress = job.progress()
+    assert progress["state"] == "completed"
+    assert (progress["total"], progress["scanned"]) == (7, 7)
+    assert (progress["reencrypted"], progress["failed"]) == (7, 0)
+    assert progress["percent"] == 100.0
+    db_session.expire_all()
+    values = sorted(
+        rotated_crypto.decrypt_envelope(secret.encrypted_blob)
+        for secret in db_session.query(Secret).all()
+    )
+    assert values == sorted(f"value-{i}" for i in range(7))
@@ -0,0 +1,38 @@
+"""Unit tests for the event loop lag monitor."""
+
+import asyncio
+import time
+
+from app.core.loop_monitor import EventLoopMonitor
+
+
+def test_record_accumulates_blocked_time() -> None:
+    """Test that only lag above the threshold counts as blocked."""
+    monitor = EventLoopMonitor(interval=0.01)
+    for lag in (0.0, 0.001, 0.02, 0.05):
+        monitor.record(lag)
+
+    stats = monitor.stats()
+    assert stats["ticks"] == 4
+    assert stats["blocked_count"] == 2
+    assert stats["blocked_ms"] == 70.0
+    assert stats["max_lag_ms"] == 50.0
+    assert stats["lag_p50_ms"] == 20.0
+
+
+def test_monitor_detects_blocking_call() -> None:
+    """Test that a blocking call on the loop shows up as lag."""
+    monitor = EventLoopMonitor(interval=0.01)
+
+    async def scenario() -> None:
+        monitor.start()
+        await asyncio.sleep(0.03)
+        time.sleep(0.1)  # Blocks the event loop
+        await asyncio.sleep(0.03)
+        await monitor.stop()
+
+    asyncio.run(scenario())
+
+    stats = monitor.stats()
+    assert stats["max_lag_ms"] >= 80
+    assert stats["blocked_ms"] >= 80
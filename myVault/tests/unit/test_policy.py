@@ -0,0 +1,137 @@
+"""Unit tests for the compiled RBAC policy engine."""
+
+import fnmatch
+
+from app.core import config
+from app.core.auth import auth_service
+from app.core.policy import PolicyEngine
+from app.main import reload_config
+
+POLICIES = [
+    {
+        "name": "api",
+        "permissions": [
+            {
+                "effect": "allow",
+                "actions": ["read", "list"],
+                "resources": ["secret:newsbot*:prod/*", "secret:common:*"],
+            },
+            {"effect": "deny", "actions": ["write"], "resources": ["secret:*"]},
+        ],
+    },
+    {
+        "name": "writer",
+        "permissions": [
+            {
+                "effect": "allow",
+                "actions": ["write"],
+                "resources": ["secret:newsbot:prod/[ab]*"],
+            }
+        ],
+    },
+]
+
+
+def make_engine(cache_size: int = 100) -> PolicyEngine:
+    """Create an engine with one service holding both roles."""
+    engine = PolicyEngine(cache_size=cache_size)
+    engine.load({"newsbot-api": ["api", "writer"], "idle": ["missing"]}, POLICIES)
+    return engine
+
+
+def test_matches_like_fnmatch() -> None:
+    """Test that compiled matchers give the same decisions as fnmatch."""
+    engine = make_engine()
+    patterns = ["secret:newsbot*:prod/*", "secret:common:*"]
+    resources = [
+        "secret:newsbot:prod/api-key",
+        "secret:newsbot_test:prod/nested/key",
+        "secret:newsbot:dev/api-key",
+        "secret:common:shared",
+        "secret:other:prod/key",
+    ]
+
+    for resource in resources:
+        expected = any(fnmatch.fnmatch(resource, p) for p in patterns)
+        assert engine.is_allowed("newsbot-api", "read", resource) is expected
+
+    assert engine.is_allowed("newsbot-api", "write", "secret:newsbot:prod/alpha")
+    assert not engine.is_allowed("newsbot-api", "write", "secret:newsbot:prod/zeta")
+    assert not engine.is_allowed("newsbot-api", "delete", "secret:common:shared")
+    assert not engine.is_allowed("idle", "read", "secret:common:shared")
+    assert not engine.is_allowed("unknown", "read", "secret:common:shared")
+
+
+def test_decisions_are_cached_and_bounded() -> None:
+    """Test that repeated checks hit the bounded decision cache."""
+    engine = make_engine(cache_size=2)
+
+    for _ in range(3):
+        engine.is_allowed("newsbot-api", "read", "secret:common:a")
+    engine.is_allowed("newsbot-api", "read", "secret:common:b")
+    engine.is_allowed("newsbot-api", "read", "secret:common:c")
+
+    stats = engine.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 3
+    assert stats["size"] == 2
+
+
+def test_load_replaces_policies() -> None:
+    """Test that reloading recompiles policies and drops cached decisions."""
+    engine = make_engine()
+    assert engine.is_allowed("newsbot-api", "read", "secret:common:a")
+
+    engine.load({"newsbot-api": ["writer"]}, POLICIES)
+
+    assert not engine.is_allowed("newsbot-api", "read", "secret:common:a")
+    assert engine.stats()["size"] == 1
+
+
+def test_auth_service_uses_config_policies() -> None:
+    """Test that the auth service compiles policies from config.yaml."""
+    assert auth_service.check_rbac_permission(
+        "test-service", "write", "secret:test:dev/key"
+    )
+    assert auth_service.check_rbac_permission(
+        "other-service", "list", "secret:other:dev/key"
+    )
+    assert not auth_service.check_rbac_permission(
+        "other-service", "write", "secret:other:dev/key"
+    )
+
+
+def test_matcher_skips_decision_cache() -> None:
+    """Test that listing predicates don't fill the decision cache."""
+    engine = make_engine()
+    can_list = engine.matcher("newsbot-api", "list")
+
+    allowed = [r for r in ("secret:common:a", "secret:other:b") if can_list(r)]
+
+    assert allowed == ["secret:common:a"]
+    assert not engine.matcher("unknown", "list")("secret:common:a")
+    assert engine.stats()["size"] == 0
+
+
+def test_reload_config_recompiles_policies(monkeypatch) -> None:
+    """Test that a config reload (SIGHUP) applies edited policies."""
+    original = config.load_config_yaml()
+    edited = {**original, "policies": []}
+    try:
+        monkeypatch.setattr(config, "load_config_yaml", lambda: edited)
+        reload_config()
+        assert not auth_service.check_rbac_permission(
+            "test-service", "write", "secret:test:dev/key"
+        )
+
+        # An unreadable file keeps the current configuration
+        monkeypatch.setattr(config, "load_config_yaml", lambda: 1 / 0)
+        reload_config()
+        assert config.settings.get_policies() == []
+    finally:
+        monkeypatch.setattr(config, "load_config_yaml", lambda: original)
+        reload_config()
+
+    assert auth_service.check_rbac_permission(
+        "test-service", "write", "secret:test:dev/key"
+    )
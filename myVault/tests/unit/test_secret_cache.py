@@ -0,0 +1,57 @@
+"""Unit tests for the decrypted secret cache."""
+
+import time
+
+from app.core.secret_cache import DecryptedSecretCache
+
+
+def test_disabled_cache_stores_nothing() -> None:
+    """Test that the cache is opt-in."""
+    cache = DecryptedSecretCache()
+    cache.put("p", "k", '"1.1"', "value")
+
+    assert cache.get("p", "k", '"1.1"') is None
+    assert cache.stats()["size"] == 0
+
+
+def test_hit_requires_same_etag() -> None:
+    """Test that a rotated or recreated secret (new etag) misses the cache."""
+    cache = DecryptedSecretCache(enabled=True)
+    cache.put("p", "k", '"1.1"', "old")
+
+    assert cache.get("p", "k", '"1.1"') == "old"
+    assert cache.get("p", "k", '"1.2"') is None
+    # Deleted and recreated: the version restarts at 1 under a new row id
+    assert cache.get("p", "k", '"2.1"') is None
+    assert cache.stats()["hit_rate"] == 0.3333
+
+
+def test_eviction_zeroes_values() -> None:
+    """Test LRU eviction, TTL expiry and zeroing of dropped values."""
+    cache = DecryptedSecretCache(enabled=True, max_entries=2, ttl_seconds=60)
+    cache.put("p", "a", '"1.1"', "aaaa")
+    buffer = cache._entries[("p", "a", '"1.1"')][0]
+    cache.put("p", "b", '"1.1"', "bbbb")
+    cache.put("p", "c", '"1.1"', "cccc")
+
+    assert cache.get("p", "a", '"1.1"') is None
+    assert buffer == bytearray(4)
+    assert cache.stats()["evictions"] == 1
+
+    cache.ttl_seconds = 0.01
+    cache.put("p", "d", '"1.1"', "dddd")
+    time.sleep(0.02)
+    assert cache.get("p", "d", '"1.1"') is None
+
+
+def test_invalidate_drops_all_versions() -> None:
+    """Test that invalidation removes every version of one secret only."""
+    cache = DecryptedSecretCache(enabled=True)
+    cache.put("p", "k", '"1.1"', "v1")
+    cache.put("p", "k", '"1.2"', "v2")
+    cache.put("p", "other", '"1.1"', "x")
+
+    cache.invalidate("p", "k")
+
+    assert cache.get("p", "k", '"1.2"') is None
+    assert cache.get("p", "other", '"1.1"') == "x"
@@ -0,0 +1,94 @@
+"""Unit tests for the envelope migration of legacy secrets."""
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.core.crypto import crypto_service
+from app.core.database import engine, ensure_envelope_column
+from app.core.secret_migration import count_legacy_secrets, migrate_secret_batch
+from app.models.secret import Secret
+
+
+def _legacy_secret(path: str, value: str) -> Secret:
+    """Build a secret stored in the legacy hex columns."""
+    encrypted_value, iv, tag = crypto_service.encrypt(value)
+    return Secret(
+        project="test",
+        path=path,
+        encrypted_value=encrypted_value,
+        encryption_iv=iv,
+        encryption_tag=tag,
+        updated_by="test-service",
+    )
+
+
+def test_migrate_legacy_secrets_in_batches(db_session) -> None:
+    """Test that legacy secrets are repacked batch by batch."""
+    db_session.add_all([_legacy_secret(f"key-{i}", f"value-{i}") for i in range(5)])
+    db_session.commit()
+    assert count_legacy_secrets(db_session) == 5
+
+    first = migrate_secret_batch(db_session, batch_size=3)
+    assert first.migrated == 3
+    second = migrate_secret_batch(db_session, first.last_id, batch_size=3)
+    assert second.migrated == 2
+    assert migrate_secret_batch(db_session, second.last_id).last_id == second.last_id
+
+    assert count_legacy_secrets(db_session) == 0
+    db_session.expire_all()
+    for i, secret in enumerate(db_session.query(Secret).order_by(Secret.id)):
+        assert secret.encrypted_value == ""
+        assert secret.version == 1
+        assert crypto_service.decrypt_envelope(secret.encrypted_blob) == f"value-{i}"
+
+
+def test_migrate_skips_undecryptable_secrets(db_session) -> None:
+    """Test that secrets the current key can't decrypt are left unchanged."""
+    broken = _legacy_secret("broken", "value")
+    broken.encryption_tag = "0" * 32
+    db_session.add(broken)
+    db_session.commit()
+
+    batch = migrate_secret_batch(db_session)
+
+    assert (batch.migrated, batch.failed) == (0, 1)
+    assert count_legacy_secrets(db_session) == 1
+
+
+def test_ensure_envelope_column_is_idempotent(db_session) -> None:
+    """Test that the column is not added twice."""
+    assert ensure_envelope_column(engine) is False
+
+
+def test_ensure_envelope_column_upgrades_old_schema() -> None:
+    """Test that a secrets table created before envelopes gets the column."""
+    old_engine = create_engine("sqlite://")
+    with old_engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE secrets (id INTEGER PRIMARY KEY, "
+                "encrypted_value TEXT, encryption_iv TEXT, encryption_tag TEXT)"
+            )
+        )
+
+    assert ensure_envelope_column(old_engine) is True
+    columns = {c["name"] for c in inspect(old_engine).get_columns("secrets")}
+    assert "encrypted_blob" in columns
+    assert ensure_envelope_column(old_engine) is False
+
+
+def test_api_reads_legacy_and_writes_envelope(client, auth_headers, db_session):
+    """Test that legacy rows stay readable and updates switch to envelopes."""
+    db_session.add(_legacy_secret("legacy", "old-value"))
+    db_session.commit()
+
+    response = client.get("/api/secrets/test/legacy", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["value"] == "old-value"
+
+    response = client.patch(
+        "/api/secrets/test/legacy", json={"value": "new-value"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert count_legacy_secrets(db_session) == 0
+    response = client.get("/api/secrets/test/legacy", headers=auth_headers)
+    assert response.json()["value"] == "new-value"
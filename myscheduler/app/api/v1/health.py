@@ -2,15 +2,24 @@
 
 from ...core.config import settings
 from ...schemas.job import HealthResponse
+from ...services.leader_election import leader_elector
 
 router = APIRouter(tags=["health"])
 
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
-    """ヘルスチェック"""
+    """ヘルスチェック（リーダー選出が有効な場合はノードの役割も返す）"""
+    node_id = None
+    role = "standalone"
+    if settings.leader_election_enabled:
+        node_id = leader_elector.node_id
+        role = "leader" if leader_elector.is_leader else "follower"
+
     return HealthResponse(
         message="MyScheduler API is running",
         timezone=str(settings.tz),
         version=settings.app_version,
+        node_id=node_id,
+        role=role,
     )
@@ -1,11 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException
 
+from ...core.config import settings
 from ...repositories.execution_repository import execution_repository
 from ...schemas.job import (
+    JobBulkRequest,
+    JobBulkResponse,
     JobCreateRequest,
     JobDetail,
+    JobExport,
     JobListResponse,
     JobResponse,
+    JobStatsResponse,
 )
 from ...services.job_service import JobService
 from ..deps import get_job_service
@@ -39,6 +44,73 @@ async def list_jobs(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.post("/bulk", response_model=JobBulkResponse)
+async def create_jobs(
+    bulk_request: JobBulkRequest,
+    job_service: JobService = Depends(get_job_service),
+) -> JobBulkResponse:
+    """複数のジョブを1トランザクションで作成・置換"""
+    try:
+        jobs = await job_service.create_jobs(
+            bulk_request.jobs, bulk_request.replace_existing
+        )
+        return JobBulkResponse(jobs=jobs, count=len(jobs))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+# 未指定の項目は出力せず、インポート時も未指定のまま（全体設定に従う）にする
+@router.get("/export", response_model=JobExport, response_model_exclude_none=True)
+async def export_jobs(
+    job_service: JobService = Depends(get_job_service),
+) -> JobExport:
+    """全ジョブをJSONでエクスポート"""
+    try:
+        return JobExport(jobs=await job_service.export_jobs())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.post("/import", response_model=JobBulkResponse)
+async def import_jobs(
+    export: JobExport,
+    replace_existing: bool = True,
+    job_service: JobService = Depends(get_job_service),
+) -> JobBulkResponse:
+    """エクスポートしたJSONからジョブを一括登録（既定では同じIDのジョブを置き換える）"""
+    try:
+        jobs = await job_service.create_jobs(export.jobs, replace_existing)
+        return JobBulkResponse(jobs=jobs, count=len(jobs))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@router.post("/pause", response_model=JobBulkResponse)
+async def pause_jobs_by_tag(
+    tag: str,
+    job_service: JobService = Depends(get_job_service),
+) -> JobBulkResponse:
+    """タグの付いたジョブをまとめて一時停止"""
+    try:
+        jobs = await job_service.set_paused_by_tag(tag, paused=True)
+        return JobBulkResponse(jobs=jobs, count=len(jobs))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.post("/resume", response_model=JobBulkResponse)
+async def resume_jobs_by_tag(
+    tag: str,
+    job_service: JobService = Depends(get_job_service),
+) -> JobBulkResponse:
+    """タグの付いたジョブをまとめて再開"""
+    try:
+        jobs = await job_service.set_paused_by_tag(tag, paused=False)
+        return JobBulkResponse(jobs=jobs, count=len(jobs))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @router.get("/{job_id}", response_model=JobDetail)
 async def get_job(
     job_id: str,
@@ -116,6 +188,28 @@ async def get_job_executions(
         ) from e
 
 
+@router.get("/{job_id}/stats", response_model=JobStatsResponse)
+async def get_job_stats(
+    job_id: str,
+    job_service: JobService = Depends(get_job_service),
+) -> JobStatsResponse:
+    """ジョブの実行統計（件数と直近の所要時間のパーセンタイル）を取得
+
+    削除済みのジョブも実行の記録があれば返す。
+    """
+    try:
+        stats = execution_repository.get_job_stats(
+            job_id, settings.execution_stats_sample_size
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get stats for job {job_id}"
+        ) from e
+    if not stats.get("total_count") and not job_service.job_exists(job_id):
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return JobStatsResponse(**stats)
+
+
 @router.get("/executions/recent")
 async def get_recent_executions(limit: int = 100):
     """最近の実行履歴を取得"""
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException
+
+from ...core.config import settings
+from ...services.fire_limiter import fire_limiter
+from ...services.jobqueue_submitter import jobqueue_submitter
+from ...services.schedule_metrics import schedule_metrics
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("")
+async def get_metrics():
+    """スケジューラーのメトリクスを取得
+
+    発火の同時実行数・スキュー、スケジューリングの遅れ・ミスファイア、jobqueue への一括投入
+    """
+    return {
+        "fires": {
+            **fire_limiter.snapshot(),
+            "default_jitter_sec": settings.job_fire_jitter,
+            "default_spread_sec": settings.job_fire_spread,
+        },
+        "schedule": schedule_metrics.snapshot(),
+        "jobqueue": jobqueue_submitter.snapshot(),
+    }
+
+
+@router.get("/jobs/{job_id}")
+async def get_job_metrics(job_id: str):
+    """ジョブごとのスケジューリングの遅れとミスファイアを取得"""
+    summary = schedule_metrics.job_summary(job_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="No metrics recorded for this job")
+    return {"job_id": job_id, **summary}
@@ -34,10 +34,52 @@ class Settings(BaseSettings):
     job_coalesce: bool = True
     job_misfire_grace_time: int = 30
 
+    # 発火の分散と同時実行数の制限（ジョブごとの指定がない場合の既定値）
+    job_fire_jitter: float = 0.0  # 発火時刻にランダムに加える最大秒数（±）
+    job_fire_spread: float = 0.0  # ジョブIDから決まる固定オフセットの分散幅（秒）
+    max_concurrent_fires: int = 0  # 全ジョブの同時実行数の上限（0 で無制限）
+    max_concurrent_fires_per_host: int = 0  # 送信先ホストごとの上限（0 で無制限）
+    host_concurrency_limits: dict[
+        str, int
+    ] = {}  # ホスト個別の上限（例: {"localhost": 4}）
+    fire_metrics_sample_size: int = (
+        1000  # スキューのパーセンタイル計算に使う直近の発火数
+    )
+    schedule_metrics_sample_size: int = 200  # ジョブごとに保持する直近の発火遅延の件数
+
+    # リーダー選出（複数ノードで同じデータベースを共有する場合に有効化）
+    leader_election_enabled: bool = False
+    leader_lease_ttl: float = 15.0  # リースの有効期間（秒）
+    leader_renew_interval: float = 5.0  # リース更新間隔（秒、TTLより十分短く）
+    node_id: str | None = None  # 未指定時は "ホスト名:PID:ランダム値"
+
+    # 実行履歴の書き込み（バックグラウンドでまとめて書き込む）
+    execution_queue_size: int = 10000  # 上限に達するとジョブ側が待たされる
+    execution_batch_size: int = 500
+    execution_flush_interval: float = 0.2  # バッチを溜める最大秒数
+    execution_retry_interval: float = 1.0  # 書き込みに失敗した実行履歴を再試行する間隔
+    execution_write_attempts: int = 5  # 1件ずつの書き込みがこの回数失敗したら破棄
+
+    # 実行履歴の保存内容と保持期間
+    execution_response_preview_chars: int = 1024  # 保存するレスポンスの先頭文字数
+    execution_capture_response: bool = False  # 全ジョブでレスポンス全体を保存
+    execution_retention_days: int = 30  # 0 で削除しない
+    execution_retention_interval_minutes: int = 60
+    execution_retention_batch_size: int = 1000  # 1トランザクションで削除する件数
+    execution_stats_sample_size: int = 1000  # パーセンタイル計算に使う直近の件数
+
     # HTTP
     http_timeout: float = 30.0
     max_retries: int = 3
     retry_backoff: float = 1.0
+    http_max_connections: int = 100  # 全ジョブで共有するコネクションプール
+    http_max_keepalive_connections: int = 20
+
+    # jobqueue へのジョブ投入（job_type="jobqueue" のジョブ）
+    jobqueue_api_url: str = "http://localhost:8101"
+    jobqueue_batch_window: float = 0.05  # 同時に発火した投入をまとめる待ち時間（秒）
+    jobqueue_batch_size: int = 100  # 1回の一括リクエストの最大件数
+    jobqueue_timeout: float = 30.0
 
     # サーバー
     host: str = "0.0.0.0"
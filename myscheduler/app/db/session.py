@@ -1,14 +1,28 @@
+import pickle
+from datetime import datetime
 from pathlib import Path
+from typing import Any
 
+from apscheduler.job import Job
+from apscheduler.jobstores.base import ConflictingIdError
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.util import datetime_to_utc_timestamp
 from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
 
 from ..core.config import settings
 from ..core.logging import get_logger
+from ..services.run_context import RunContextExecutor
+from ..services.schedule_metrics import SCHEDULE_METRICS_EVENTS, schedule_metrics
 
 logger = get_logger(__name__)
 
+# ユーザーのジョブ（永続化）と、起動時に登録する内部ジョブのジョブストア
+USER_JOBSTORE = "default"
+INTERNAL_JOBSTORE = "internal"
+
 
 def _ensure_sqlite_directory(database_url: str) -> None:
     """Ensure the directory for a SQLite database exists."""
@@ -40,16 +54,124 @@ def __init__(self) -> None:
         _ensure_sqlite_directory(settings.database_url)
         self.jobstore = SQLAlchemyJobStore(url=settings.database_url)
         self.scheduler = AsyncIOScheduler(
-            jobstores={"default": self.jobstore},
+            jobstores={
+                USER_JOBSTORE: self.jobstore,
+                INTERNAL_JOBSTORE: MemoryJobStore(),
+            },
+            executors={"default": RunContextExecutor()},
             timezone=settings.tz,
             job_defaults=settings.scheduler_config,
         )
+        # ミスファイア・max_instances による見送り・ジョブ削除をメトリクスに反映
+        self.scheduler.add_listener(
+            schedule_metrics.on_scheduler_event, SCHEDULE_METRICS_EVENTS
+        )
+
+    def start(self, paused: bool = False) -> None:
+        """スケジューラーを開始（paused=True ならリーダーになるまで実行しない）"""
+        if not self.scheduler.running:
+            self.scheduler.start(paused=paused)
+            logger.info("Scheduler started" + (" (paused)" if paused else ""))
+
+    def pause(self) -> None:
+        """ジョブの実行を停止（ジョブストアへの登録・変更は引き続き可能）"""
+        if self.scheduler.running:
+            self.scheduler.pause()
+            logger.info("Scheduler paused")
 
-    def start(self) -> None:
-        """スケジューラーを開始"""
+    def resume(self) -> None:
+        """ジョブの実行を再開"""
+        if self.scheduler.running:
+            self.scheduler.resume()
+            logger.info("Scheduler resumed")
+
+    def wakeup(self) -> None:
+        """ジョブストアを再確認させる（他ノードで追加・変更されたジョブの反映）"""
+        if self.scheduler.running:
+            self.scheduler.wakeup()
+
+    def add_jobs(self, jobs: list[dict[str, Any]], replace_ids: set[str]) -> None:
+        """複数のジョブをユーザージョブストアに1トランザクションで登録
+
+        jobs は add_job のキーワード引数（id 必須）。replace_ids のジョブは既存を置き換え、
+        それ以外のIDが既に存在する場合は全体をロールバックして ConflictingIdError を送出する。
+        スケジューラーは全件の登録後に1回だけ起こす。
+        """
+        if not self.scheduler.running:
+            # 開始前はジョブストアが未接続のため、開始時に登録される保留ジョブとして追加
+            for job_kwargs in jobs:
+                self.scheduler.add_job(
+                    jobstore=USER_JOBSTORE,
+                    replace_existing=job_kwargs["id"] in replace_ids,
+                    **job_kwargs,
+                )
+            return
+
+        now = datetime.now(self.scheduler.timezone)
+        rows = []
+        for job_kwargs in jobs:
+            if "next_run_time" not in job_kwargs:
+                job_kwargs = {
+                    **job_kwargs,
+                    "next_run_time": job_kwargs["trigger"].get_next_fire_time(
+                        None, now
+                    ),
+                }
+            job = Job(
+                self.scheduler,
+                executor="default",
+                **{**settings.scheduler_config, **job_kwargs},
+            )
+            rows.append(self._job_row(job))
+
+        jobs_t = self.jobstore.jobs_t
+        with self.jobstore.engine.begin() as connection:
+            if replace_ids:
+                connection.execute(jobs_t.delete().where(jobs_t.c.id.in_(replace_ids)))
+            try:
+                connection.execute(jobs_t.insert(), rows)
+            except IntegrityError as e:
+                raise ConflictingIdError(
+                    ", ".join(row["id"] for row in rows if row["id"] not in replace_ids)
+                ) from e
+
+        logger.info(f"Added {len(rows)} jobs in one transaction")
+        self.scheduler.wakeup()
+
+    def reschedule_jobs(self, changes: list[tuple[Job, datetime | None]]) -> None:
+        """複数のユーザージョブの次回実行時刻を1トランザクションで更新（None は一時停止）"""
         if not self.scheduler.running:
-            self.scheduler.start()
-            logger.info("Scheduler started")
+            for job, next_run_time in changes:
+                self.scheduler.modify_job(
+                    job.id, jobstore=USER_JOBSTORE, next_run_time=next_run_time
+                )
+            return
+
+        jobs_t = self.jobstore.jobs_t
+        with self.jobstore.engine.begin() as connection:
+            for job, next_run_time in changes:
+                job._modify(next_run_time=next_run_time)
+                row = self._job_row(job)
+                connection.execute(
+                    jobs_t.update()
+                    .values(
+                        next_run_time=row["next_run_time"], job_state=row["job_state"]
+                    )
+                    .where(jobs_t.c.id == job.id)
+                )
+
+        logger.info(f"Rescheduled {len(changes)} jobs in one transaction")
+        self.scheduler.wakeup()
+
+    def _job_row(self, job: Job) -> dict[str, Any]:
+        """SQLAlchemyJobStore と同じ形式のジョブ行を作成"""
+        return {
+            "id": job.id,
+            "next_run_time": datetime_to_utc_timestamp(job.next_run_time),
+            "job_state": pickle.dumps(
+                job.__getstate__(), self.jobstore.pickle_protocol
+            ),
+        }
 
     def shutdown(self) -> None:
         """スケジューラーを停止"""
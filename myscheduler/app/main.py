@@ -3,11 +3,17 @@
 
 from fastapi import FastAPI
 
-from .api.v1 import health, jobs
+from .api.v1 import health, jobs, metrics
 from .core.config import settings
 from .core.logging import setup_logging
 from .db.session import scheduler_manager
+from .repositories.execution_repository import async_execution_repository
+from .repositories.lease_repository import lease_repository
+from .services.execution_retention import schedule_retention
+from .services.execution_writer import execution_writer
 from .services.http_service import http_service
+from .services.jobqueue_submitter import jobqueue_submitter
+from .services.leader_election import leader_elector
 
 
 @asynccontextmanager
@@ -15,11 +21,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """アプリケーションのライフサイクル管理"""
     # 起動時
     setup_logging()
-    scheduler_manager.start()
+    execution_writer.start()
+    # リーダー選出が有効な場合はリースを取得するまで実行しない
+    scheduler_manager.start(paused=settings.leader_election_enabled)
+    schedule_retention(scheduler_manager)
+    if settings.leader_election_enabled:
+        await leader_elector.start()
     yield
     # 終了時
+    if settings.leader_election_enabled:
+        await leader_elector.stop()
     scheduler_manager.shutdown()
+    await execution_writer.stop()  # キューに残った実行履歴を書き込む
     await http_service.close()
+    await jobqueue_submitter.close()
+    await async_execution_repository.close()
+    await lease_repository.close()
 
 
 def create_app() -> FastAPI:
@@ -37,6 +54,7 @@ def create_app() -> FastAPI:
     app.include_router(health.router)
     app.include_router(health.router, prefix="/health")
     app.include_router(jobs.router, prefix="/api/v1")
+    app.include_router(metrics.router, prefix="/api/v1")
 
     return app
 
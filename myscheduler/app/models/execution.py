@@ -1,18 +1,51 @@
+import hashlib
+import json
 from typing import Any
 
-from sqlalchemy import JSON, Column, DateTime, Integer, String, Text
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
 
+def compact_result(
+    result: dict[str, Any], preview_chars: int, capture_response: bool = False
+) -> dict[str, Any]:
+    """実行結果のレスポンスボディをプレビューとハッシュに置き換える
+
+    capture_response=True の場合はレスポンスボディ全体も残す。
+    ハッシュはボディのテキスト表現（JSONはキー順を揃えて直列化）の SHA-256。
+    """
+    body = result.get("response_body")
+    if body is None:
+        return result
+
+    text = (
+        body
+        if isinstance(body, str)
+        else json.dumps(body, ensure_ascii=False, sort_keys=True)
+    )
+    compacted = {k: v for k, v in result.items() if k != "response_body"}
+    compacted["response_preview"] = text[:preview_chars]
+    compacted["response_truncated"] = len(text) > preview_chars
+    compacted["response_sha256"] = hashlib.sha256(text.encode()).hexdigest()
+    if capture_response:
+        compacted["response_body"] = body
+    return compacted
+
+
 class JobExecutionORM(Base):  # type: ignore
     """ジョブ実行履歴テーブル"""
 
     __tablename__ = "job_executions"
+    __table_args__ = (
+        # ジョブごとの実行履歴（新しい順）と保持期間による削除に使う
+        Index("ix_job_executions_job_id_started_at", "job_id", "started_at"),
+    )
 
     execution_id = Column(String(36), primary_key=True)
-    job_id = Column(String(255), nullable=False, index=True)
+    job_id = Column(String(255), nullable=False)
+    scheduled_at = Column(DateTime, nullable=True)  # スケジュール上の発火予定時刻
     started_at = Column(DateTime, nullable=False, index=True)
     completed_at = Column(DateTime, nullable=True)
     status = Column(
@@ -23,12 +56,16 @@ class JobExecutionORM(Base):  # type: ignore
     execution_time_ms = Column(Integer, nullable=True)
     http_status_code = Column(Integer, nullable=True)
     response_size = Column(Integer, nullable=True)
+    misfire_delay_ms = Column(Integer, nullable=True)  # 発火予定から開始までの遅延
 
     def to_dict(self) -> dict[str, Any]:
         """辞書形式に変換"""
         return {
             "execution_id": self.execution_id,
             "job_id": self.job_id,
+            "scheduled_at": self.scheduled_at.isoformat()
+            if self.scheduled_at
+            else None,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat()
             if self.completed_at
@@ -39,4 +76,31 @@ def to_dict(self) -> dict[str, Any]:
             "execution_time_ms": self.execution_time_ms,
             "http_status_code": self.http_status_code,
             "response_size": self.response_size,
+            "misfire_delay_ms": self.misfire_delay_ms,
+        }
+
+
+class JobExecutionStatsORM(Base):  # type: ignore
+    """ジョブごとの実行集計テーブル（実行履歴の書き込み時に更新）"""
+
+    __tablename__ = "job_execution_stats"
+
+    job_id = Column(String(255), primary_key=True)
+    total_count = Column(Integer, nullable=False, default=0)
+    success_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+    last_run_at = Column(DateTime, nullable=True)  # 最後の実行開始時刻
+    last_status = Column(String(50), nullable=True)  # 最後に終了した実行の状態
+    last_duration_ms = Column(Integer, nullable=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        """辞書形式に変換"""
+        return {
+            "job_id": self.job_id,
+            "total_count": self.total_count,
+            "success_count": self.success_count,
+            "failed_count": self.failed_count,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_status": self.last_status,
+            "last_duration_ms": self.last_duration_ms,
         }
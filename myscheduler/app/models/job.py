@@ -36,6 +36,7 @@ class JobExecution(BaseModel):
 
     execution_id: str
     job_id: str
+    scheduled_at: datetime | None = None
     started_at: datetime
     completed_at: datetime | None = None
     status: str  # "running", "completed", "failed"
@@ -44,3 +45,4 @@ class JobExecution(BaseModel):
     execution_time_ms: int | None = None
     http_status_code: int | None = None
     response_size: int | None = None
+    misfire_delay_ms: int | None = None
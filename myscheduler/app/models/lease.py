@@ -0,0 +1,14 @@
+from sqlalchemy import Column, DateTime, String
+
+from .execution import Base
+
+
+class SchedulerLeaseORM(Base):
+    """スケジューラーのリーダーリーステーブル"""
+
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(64), primary_key=True)
+    holder_id = Column(String(255), nullable=False)  # リースを保持するノードID
+    expires_at = Column(DateTime, nullable=False)  # UTC（naive）
+    renewed_at = Column(DateTime, nullable=False)  # UTC（naive）
@@ -1,12 +1,27 @@
+import asyncio
 import uuid
 from datetime import datetime, timedelta
+from typing import Any
 
-from sqlalchemy import create_engine, desc
+from sqlalchemy import (
+    bindparam,
+    create_engine,
+    delete,
+    desc,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from ..core.config import settings
 from ..core.logging import get_logger
-from ..models.execution import Base, JobExecutionORM
+from ..models.execution import Base, JobExecutionORM, JobExecutionStatsORM
 
 logger = get_logger(__name__)
 
@@ -14,11 +29,12 @@
 class ExecutionRepository:
     """実行履歴リポジトリ"""
 
-    def __init__(self):
+    def __init__(self, database_url: str | None = None):
         from ..db.session import _ensure_sqlite_directory
 
-        _ensure_sqlite_directory(settings.database_url)
-        self.engine = create_engine(settings.database_url)
+        database_url = database_url or settings.database_url
+        _ensure_sqlite_directory(database_url)
+        self.engine = create_engine(database_url)
         Base.metadata.create_all(self.engine)
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
@@ -124,6 +140,44 @@ def get_execution_count_by_job_id(self, job_id: str) -> int:
             logger.error(f"Failed to get execution count for job {job_id}: {e}")
             return 0
 
+    def get_execution_stats(self, job_ids: list[str]) -> dict[str, dict]:
+        """複数ジョブの実行集計を1クエリで取得（集計のないジョブは含まない）"""
+        if not job_ids:
+            return {}
+        with self.SessionLocal() as db:
+            stats = (
+                db.query(JobExecutionStatsORM)
+                .filter(JobExecutionStatsORM.job_id.in_(job_ids))
+                .all()
+            )
+            return {row.job_id: row.to_dict() for row in stats}
+
+    def get_job_stats(self, job_id: str, sample_size: int) -> dict[str, Any]:
+        """ジョブの実行集計と直近の所要時間のパーセンタイルを取得"""
+        with self.SessionLocal() as db:
+            stats = db.get(JobExecutionStatsORM, job_id)
+            # (job_id, started_at) インデックスで直近の完了分だけを読む
+            durations: list[int] = sorted(
+                db.scalars(
+                    select(JobExecutionORM.execution_time_ms)
+                    .where(
+                        JobExecutionORM.job_id == job_id,
+                        JobExecutionORM.execution_time_ms.is_not(None),
+                    )
+                    .order_by(desc(JobExecutionORM.started_at))
+                    .limit(sample_size)
+                )
+            )
+
+        result: dict[str, Any] = stats.to_dict() if stats else {"job_id": job_id}
+        result["sample_size"] = len(durations)
+        if durations:
+            result["avg_ms"] = sum(durations) / len(durations)
+            result["max_ms"] = durations[-1]
+            for p in (50, 90, 95, 99):
+                result[f"p{p}_ms"] = percentile(durations, p)
+        return result
+
     def cleanup_old_executions(self, days: int = 30) -> int:
         """古い実行履歴を削除"""
         cutoff_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -140,5 +194,133 @@ def cleanup_old_executions(self, days: int = 30) -> int:
             return deleted_count
 
 
+def percentile(sorted_values: list[int], percent: float) -> float:
+    """ソート済みの値のパーセンタイル（線形補間）"""
+    rank = (len(sorted_values) - 1) * percent / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (
+        rank - lower
+    )
+
+
+# 同期ドライバ名 -> 非同期ドライバ名
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def _to_async_url(database_url: str) -> str:
+    """同期ドライバのURLを非同期ドライバのURLに変換"""
+    url = make_url(database_url)
+    drivername = ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def _stats_upsert(dialect_name: str):
+    """実行集計に増分を加算する UPSERT 文（SQLite / PostgreSQL）"""
+    table = JobExecutionStatsORM.__table__
+    stmt = (
+        postgresql_insert(table)
+        if dialect_name == "postgresql"
+        else sqlite_insert(table)
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.job_id],
+        set_={
+            "total_count": table.c.total_count + stmt.excluded.total_count,
+            "success_count": table.c.success_count + stmt.excluded.success_count,
+            "failed_count": table.c.failed_count + stmt.excluded.failed_count,
+            "last_run_at": func.coalesce(
+                stmt.excluded.last_run_at, table.c.last_run_at
+            ),
+            "last_status": func.coalesce(
+                stmt.excluded.last_status, table.c.last_status
+            ),
+            "last_duration_ms": func.coalesce(
+                stmt.excluded.last_duration_ms, table.c.last_duration_ms
+            ),
+        },
+    )
+
+
+class AsyncExecutionRepository:
+    """実行履歴リポジトリ（スケジューラーのイベントループ上で書き込む非同期版）
+
+    テーブル作成は同期版の ExecutionRepository が起動時に行う。
+    """
+
+    def __init__(self, database_url: str | None = None):
+        self.engine = create_async_engine(
+            _to_async_url(database_url or settings.database_url)
+        )
+        self.SessionLocal = async_sessionmaker(
+            bind=self.engine, autoflush=False, expire_on_commit=False
+        )
+
+    async def write_executions(
+        self,
+        inserts: list[dict[str, Any]],
+        updates: list[dict[str, Any]],
+        stats: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """実行履歴と実行集計をまとめて書き込む（1トランザクション）
+
+        inserts は全カラムを持つ行、updates は execution_id をキーに
+        更新するカラムを持つ行。いずれも同じキー構成で executemany する。
+        stats はジョブごとの件数の増分と最終実行の情報で、集計テーブルに
+        加算する。
+        """
+        table = JobExecutionORM.__table__
+        async with self.engine.begin() as conn:
+            if inserts:
+                await conn.execute(insert(table), inserts)
+            if updates:
+                await conn.execute(
+                    update(table).where(
+                        table.c.execution_id == bindparam("b_execution_id")
+                    ),
+                    [
+                        {
+                            "b_execution_id": row["execution_id"],
+                            **{k: v for k, v in row.items() if k != "execution_id"},
+                        }
+                        for row in updates
+                    ],
+                )
+            if stats:
+                await conn.execute(_stats_upsert(conn.dialect.name), stats)
+
+    async def delete_executions_before(self, cutoff: datetime, batch_size: int) -> int:
+        """cutoff より前に開始した実行履歴を古い順に少しずつ削除
+
+        1回の DELETE を batch_size 件に抑え、チャンクごとにコミットして
+        スケジューラーの書き込みを長時間ブロックしないようにする。
+        """
+        table = JobExecutionORM.__table__
+        deleted = 0
+        while True:
+            async with self.engine.begin() as conn:
+                oldest = (
+                    select(table.c.execution_id)
+                    .where(table.c.started_at < cutoff)
+                    .order_by(table.c.started_at)
+                    .limit(batch_size)
+                )
+                result = await conn.execute(
+                    delete(table).where(table.c.execution_id.in_(oldest))
+                )
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                return deleted
+            await asyncio.sleep(0)  # チャンクの合間に他のジョブを実行させる
+
+    async def close(self) -> None:
+        """コネクションプールを解放"""
+        await self.engine.dispose()
+
+
 # グローバル実行履歴リポジトリ
 execution_repository = ExecutionRepository()
+async_execution_repository = AsyncExecutionRepository()
@@ -0,0 +1,99 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import insert, inspect, or_, select, update
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from ..core.config import settings
+from ..models.lease import SchedulerLeaseORM
+from .execution_repository import _to_async_url
+
+
+class AsyncLeaseRepository:
+    """リーダーリースのリポジトリ（全ノードが同じデータベースを共有する）"""
+
+    def __init__(self, database_url: str | None = None):
+        self.engine = create_async_engine(
+            _to_async_url(database_url or settings.database_url)
+        )
+
+    async def create_table(self) -> None:
+        """リーステーブルを作成（存在する場合は何もしない）"""
+        table = SchedulerLeaseORM.__table__
+        try:
+            async with self.engine.begin() as conn:
+                await conn.run_sync(table.create, checkfirst=True)
+        except DBAPIError:
+            # 同時に起動した他ノードが先に作成した場合は成功とみなす
+            async with self.engine.connect() as conn:
+                exists = await conn.run_sync(
+                    lambda sync_conn: inspect(sync_conn).has_table(table.name)
+                )
+            if not exists:
+                raise
+
+    async def try_acquire(self, name: str, holder_id: str, ttl_seconds: float) -> bool:
+        """リースを取得または更新（期限切れか自分が保持している場合のみ成功）"""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        table = SchedulerLeaseORM.__table__
+
+        # 条件付き UPDATE で奪取・更新をアトミックに行う
+        async with self.engine.begin() as conn:
+            result = await conn.execute(
+                update(table)
+                .where(
+                    table.c.name == name,
+                    or_(table.c.holder_id == holder_id, table.c.expires_at < now),
+                )
+                .values(holder_id=holder_id, expires_at=expires_at, renewed_at=now)
+            )
+            if result.rowcount:
+                return True
+            exists = await conn.scalar(select(table.c.name).where(table.c.name == name))
+            if exists:
+                return False
+
+        # まだ誰もリースを作っていない場合は INSERT（競合したら負け）
+        try:
+            async with self.engine.begin() as conn:
+                await conn.execute(
+                    insert(table).values(
+                        name=name,
+                        holder_id=holder_id,
+                        expires_at=expires_at,
+                        renewed_at=now,
+                    )
+                )
+            return True
+        except IntegrityError:
+            return False
+
+    async def release(self, name: str, holder_id: str) -> None:
+        """保持しているリースを即座に期限切れにする（フェイルオーバーを早める）"""
+        table = SchedulerLeaseORM.__table__
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                update(table)
+                .where(table.c.name == name, table.c.holder_id == holder_id)
+                .values(expires_at=datetime(1970, 1, 1))
+            )
+
+    async def get_holder(self, name: str) -> str | None:
+        """現在有効なリースの保持ノードIDを取得"""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        table = SchedulerLeaseORM.__table__
+        async with self.engine.connect() as conn:
+            return await conn.scalar(
+                select(table.c.holder_id).where(
+                    table.c.name == name, table.c.expires_at >= now
+                )
+            )
+
+    async def close(self) -> None:
+        """コネクションプールを解放"""
+        await self.engine.dispose()
+
+
+# グローバルリースリポジトリ
+lease_repository = AsyncLeaseRepository()
@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CronSchedule(BaseModel):
@@ -26,19 +27,69 @@ class IntervalSchedule(BaseModel):
     seconds: int | None = None
 
 
+class JobqueueTask(BaseModel):
+    """jobqueue のジョブと一緒に作成するタスク"""
+
+    master_id: str  # タスクマスターID
+    sequence: int = Field(..., ge=0)
+    input_data: dict[str, Any] | None = None
+
+
+class JobqueueOverrides(BaseModel):
+    """ジョブマスターの設定の上書き
+
+    jobqueue の JobCreateFromMaster と同じ項目と制約で、不正な値はジョブの
+    作成・インポート時に拒否する（一括投入で他のジョブを巻き込まないため）。
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    name: str | None = Field(None, max_length=255)
+    headers: dict[str, str] | None = None
+    params: dict[str, Any] | None = None
+    body: dict[str, Any] | None = None
+    timeout_sec: int | None = Field(None, ge=1, le=3600)
+    priority: int | None = Field(None, ge=1, le=10)  # 1 が最優先
+    scheduled_at: datetime | None = None
+    max_attempts: int | None = Field(None, ge=1, le=10)
+    backoff_strategy: str | None = Field(None, pattern=r"^(fixed|linear|exponential)$")
+    backoff_seconds: float | None = Field(None, ge=0.1)
+    tags: list[str] | None = None
+    tasks: list[JobqueueTask] | None = None
+    validate_interfaces: bool | None = None
+
+
+class JobqueueTarget(BaseModel):
+    """jobqueue へのジョブ投入設定（job_type="jobqueue"）"""
+
+    master_id: str  # jobqueue のジョブマスターID
+    overrides: JobqueueOverrides | None = None
+
+
 class JobCreateRequest(BaseModel):
     """ジョブ作成リクエスト"""
 
     job_id: str | None = None
     name: str | None = None  # ジョブ名
     schedule_type: str = Field(..., pattern=r"^(cron|interval|date)$")
-    target_url: str
+    # "http": target_url へリクエスト、"jobqueue": jobqueue へジョブを投入
+    job_type: str = Field(default="http", pattern=r"^(http|jobqueue)$")
+    target_url: str | None = None  # http タイプでは必須
+    jobqueue: JobqueueTarget | None = None  # jobqueue タイプでは必須
     method: str = Field(default="GET", pattern=r"^(GET|POST|PUT|PATCH|DELETE)$")
     headers: dict[str, str] | None = None
     body: dict[str, Any] | None = None
     timeout_sec: float = 30.0
     max_retries: int = 0
     retry_backoff_sec: float = 1.0
+    capture_response: bool = (
+        False  # レスポンス全体を実行履歴に保存（既定はプレビューのみ）
+    )
+    tags: list[str] = Field(default_factory=list)  # 一括の一時停止・再開に使うタグ
+    # 発火の分散（未指定時は全体の既定値、date タイプには適用しない）
+    jitter_sec: float | None = None  # 発火時刻にランダムに加える最大秒数（±）
+    spread_sec: float | None = None  # ジョブIDから決まる固定オフセットの分散幅（秒）
+    paused: bool = False  # 一時停止状態で登録
 
     # スケジュール設定
     cron: CronSchedule | None = None
@@ -64,9 +115,16 @@ class JobInfo(BaseModel):
     next_run_time: str | None
     trigger: str
     status: str | None = None
+    job_type: str = "http"
     target_url: str | None = None
     method: str | None = None
     execution_count: int = 0
+    success_count: int = 0
+    failed_count: int = 0
+    last_run_at: str | None = None
+    last_status: str | None = None
+    last_duration_ms: int | None = None
+    tags: list[str] = Field(default_factory=list)
 
 
 class JobDetail(BaseModel):
@@ -80,6 +138,8 @@ class JobDetail(BaseModel):
     next_run_time: str | None
     execution_count: int = 0
     trigger_info: dict[str, Any] | None = None
+    job_type: str = "http"
+    jobqueue: JobqueueTarget | None = None
     target_url: str | None = None
     method: str | None = None
     headers: dict[str, str] | None = None
@@ -87,9 +147,51 @@ class JobDetail(BaseModel):
     timeout_sec: float | None = None
     max_retries: int | None = None
     retry_backoff_sec: float | None = None
+    capture_response: bool = False
+    tags: list[str] = Field(default_factory=list)
     executions: list[dict[str, Any]] | None = None  # 実行履歴
 
 
+class JobBulkRequest(BaseModel):
+    """ジョブ一括登録リクエスト（1トランザクションで登録）"""
+
+    jobs: list[JobCreateRequest]
+    replace_existing: bool = False  # 全ジョブについて既存のジョブを置き換える
+
+
+class JobBulkResponse(BaseModel):
+    """ジョブ一括操作レスポンス"""
+
+    jobs: list[JobResponse]
+    count: int
+
+
+class JobExport(BaseModel):
+    """ジョブのエクスポート（そのままインポートに使える形式）"""
+
+    jobs: list[JobCreateRequest]
+
+
+class JobStatsResponse(BaseModel):
+    """ジョブの実行統計"""
+
+    job_id: str
+    total_count: int = 0
+    success_count: int = 0
+    failed_count: int = 0
+    last_run_at: str | None = None
+    last_status: str | None = None
+    last_duration_ms: int | None = None
+    # 直近の完了した実行の所要時間（ミリ秒）
+    sample_size: int = 0
+    avg_ms: float | None = None
+    p50_ms: float | None = None
+    p90_ms: float | None = None
+    p95_ms: float | None = None
+    p99_ms: float | None = None
+    max_ms: int | None = None
+
+
 class JobListResponse(BaseModel):
     """ジョブリストレスポンス"""
 
@@ -102,3 +204,5 @@ class HealthResponse(BaseModel):
     message: str
     timezone: str
     version: str
+    node_id: str | None = None  # リーダー選出が有効な場合のみ
+    role: str = "standalone"  # "standalone", "leader", "follower"
@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+from ..core.config import settings
+from ..core.logging import get_logger
+from ..db.session import INTERNAL_JOBSTORE, SchedulerManager
+from ..repositories.execution_repository import async_execution_repository
+
+logger = get_logger(__name__)
+
+RETENTION_JOB_ID = "execution-retention"
+
+
+async def purge_expired_executions() -> int:
+    """保持期間を過ぎた実行履歴を削除（ジョブごとの集計は残る）"""
+    # started_at と同じくローカル時刻（naive）で比較する
+    cutoff = datetime.now() - timedelta(days=settings.execution_retention_days)
+    deleted = await async_execution_repository.delete_executions_before(
+        cutoff, settings.execution_retention_batch_size
+    )
+    if deleted:
+        logger.info(f"Purged {deleted} executions started before {cutoff}")
+    return deleted
+
+
+def schedule_retention(manager: SchedulerManager) -> None:
+    """実行履歴の定期削除を内部ジョブとして登録（リーダーのみが実行する）"""
+    if settings.execution_retention_days <= 0:
+        return
+    manager.get_scheduler().add_job(
+        purge_expired_executions,
+        "interval",
+        minutes=settings.execution_retention_interval_minutes,
+        id=RETENTION_JOB_ID,
+        name="実行履歴の定期削除",
+        jobstore=INTERNAL_JOBSTORE,
+        replace_existing=True,
+    )
@@ -0,0 +1,333 @@
+import asyncio
+import uuid
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any
+
+from ..core.config import settings
+from ..core.logging import get_logger
+from ..repositories.execution_repository import (
+    AsyncExecutionRepository,
+    async_execution_repository,
+)
+from .run_context import JobRunContext
+
+logger = get_logger(__name__)
+
+
+def _to_local_naive(value: datetime) -> datetime:
+    """既存の実行履歴と同じくローカル時刻（naive）に変換"""
+    return value.astimezone().replace(tzinfo=None)
+
+
+@dataclass
+class ExecutionStarted:
+    """実行開始イベント（INSERTされる行）"""
+
+    execution_id: str
+    job_id: str
+    started_at: datetime
+    scheduled_at: datetime | None = None
+    misfire_delay_ms: int | None = None
+    status: str = "running"
+    completed_at: datetime | None = None
+    result: dict[str, Any] | None = None
+    error_message: str | None = None
+    execution_time_ms: int | None = None
+    http_status_code: int | None = None
+    response_size: int | None = None
+
+
+@dataclass
+class ExecutionFinished:
+    """実行終了イベント（execution_id で UPDATE される行）"""
+
+    execution_id: str
+    job_id: str
+    status: str
+    completed_at: datetime
+    execution_time_ms: int
+    result: dict[str, Any] | None = None
+    error_message: str | None = None
+    http_status_code: int | None = None
+    response_size: int | None = None
+
+
+class ExecutionWriter:
+    """実行履歴をキューに溜めてバックグラウンドでまとめて書き込むライター
+
+    キューは上限付きで、満杯の間はジョブ側の put が待たされる（バックプレッシャー）。
+    同じバッチ内で開始・終了が揃った実行は1回の INSERT にまとめる。
+    書き込みに失敗したイベントは保持し、retry_interval ごとにまとめて、失敗すれば
+    1件ずつ再試行する。1件での書き込みが write_attempts 回失敗したイベントは破棄し、
+    書き込めないイベントが後続の履歴を止め続けないようにする。保持中に届いた
+    イベントは順序を保つため保持分の後ろに並ぶ（保持するのは最大 max_queue_size 件）。
+    stop() 後の記録は破棄する。
+    """
+
+    def __init__(
+        self,
+        repository: AsyncExecutionRepository,
+        max_queue_size: int | None = None,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        retry_interval: float | None = None,
+        write_attempts: int | None = None,
+    ) -> None:
+        self.repository = repository
+        self.max_queue_size = max_queue_size or settings.execution_queue_size
+        self.batch_size = batch_size or settings.execution_batch_size
+        self.flush_interval = (
+            settings.execution_flush_interval
+            if flush_interval is None
+            else flush_interval
+        )
+        self.retry_interval = (
+            settings.execution_retry_interval
+            if retry_interval is None
+            else retry_interval
+        )
+        self.write_attempts = write_attempts or settings.execution_write_attempts
+        self._queue: asyncio.Queue[ExecutionStarted | ExecutionFinished] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # 書き込めていないイベントと、1件での書き込みに失敗した回数
+        self._failed: list[tuple[ExecutionStarted | ExecutionFinished, int]] = []
+        self._retry_at = 0.0
+        self._stopped = False
+
+    def start(self) -> None:
+        """バックグラウンドライターを開始（実行中のイベントループ上）"""
+        loop = asyncio.get_running_loop()
+        if self._task and not self._task.done() and self._loop is loop:
+            return
+        self._loop = loop
+        self._stopped = False
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = loop.create_task(self._run())
+        logger.info("Execution history writer started")
+
+    async def flush(self) -> None:
+        """キューに溜まった実行履歴がすべて書き込まれるまで待つ"""
+        if self._queue is not None and self._task and not self._task.done():
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """残りを書き込んでからライターを停止"""
+        self._stopped = True
+        if self._task is None:
+            return
+        await self.flush()
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        if self._failed and await self._write([event for event, _ in self._failed]):
+            self._failed = []
+        if self._failed:
+            logger.error(
+                f"Discarding {len(self._failed)} execution events "
+                "that could not be written"
+            )
+            self._failed = []
+        logger.info("Execution history writer stopped")
+
+    async def start_execution(
+        self, job_id: str, run_context: JobRunContext | None = None
+    ) -> ExecutionStarted:
+        """実行開始を記録（run_context があれば発火予定時刻と遅延も記録）
+
+        started_at は記録した時刻で、実行時間の起点になる。misfire_delay_ms は
+        スケジューラーの遅れのみのため、発火予定時刻から started_at までとの
+        差がそれ以外の待ち時間（同時実行数の上限など）になる。
+        """
+        if run_context:
+            event = ExecutionStarted(
+                execution_id=str(uuid.uuid4()),
+                job_id=job_id,
+                started_at=datetime.now(),
+                scheduled_at=_to_local_naive(run_context.scheduled_run_time),
+                misfire_delay_ms=run_context.misfire_delay_ms,
+            )
+        else:
+            event = ExecutionStarted(
+                execution_id=str(uuid.uuid4()),
+                job_id=job_id,
+                started_at=datetime.now(),
+            )
+        await self._put(event)
+        return event
+
+    async def finish_execution(
+        self,
+        execution: ExecutionStarted,
+        status: str,
+        result: dict[str, Any] | None = None,
+        error_message: str | None = None,
+        http_status_code: int | None = None,
+        response_size: int | None = None,
+    ) -> None:
+        """実行終了を記録（実行時間は開始イベントから計算するため SELECT 不要）"""
+        completed_at = datetime.now()
+        delta = completed_at - execution.started_at
+        await self._put(
+            ExecutionFinished(
+                execution_id=execution.execution_id,
+                job_id=execution.job_id,
+                status=status,
+                completed_at=completed_at,
+                execution_time_ms=int(delta.total_seconds() * 1000),
+                result=result,
+                error_message=error_message,
+                http_status_code=http_status_code,
+                response_size=response_size,
+            )
+        )
+
+    async def _put(self, event: ExecutionStarted | ExecutionFinished) -> None:
+        """キューに追加（満杯ならライターが空けるまで待つ）"""
+        if self._stopped:
+            # 終了処理後にライターを再開しない
+            logger.warning(
+                f"Execution history writer is stopped; dropping event for job "
+                f"{event.job_id}"
+            )
+            return
+        self.start()
+        assert self._queue is not None
+        if self._queue.full():
+            logger.warning(
+                "Execution history queue is full "
+                f"({self.max_queue_size}); waiting for the writer"
+            )
+        await self._queue.put(event)
+
+    async def _run(self) -> None:
+        """キューからバッチを取り出して書き込むループ"""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            events = await self._next_events()
+            if self._failed:
+                self._failed.extend((event, 0) for event in events)
+            elif events and not await self._write(events):
+                self._failed = [(event, 0) for event in events]
+
+            if self._failed and loop.time() >= self._retry_at:
+                await self._retry_failed()
+                self._retry_at = loop.time() + self.retry_interval
+            self._failed = self._keep(self._failed)
+            for _ in events:
+                self._queue.task_done()
+
+    async def _retry_failed(self) -> None:
+        """保持中のイベントをまとめて、失敗すれば1件ずつ書き込む"""
+        if await self._write([event for event, _ in self._failed]):
+            self._failed = []
+            return
+
+        remaining = []
+        for event, failures in self._failed:
+            if await self._write([event]):
+                continue
+            failures += 1
+            if failures >= self.write_attempts:
+                logger.error(
+                    f"Discarding execution event {event.execution_id} of job "
+                    f"{event.job_id} after {failures} failed writes"
+                )
+            else:
+                remaining.append((event, failures))
+        self._failed = remaining
+
+    async def _next_events(self) -> list[ExecutionStarted | ExecutionFinished]:
+        """キューから最大 batch_size 件を取り出す
+
+        失敗したイベントを保持している間は次の再試行時刻まで待っても
+        イベントが来なければ空のまま返し、保持分だけで再試行させる。
+        """
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        first_timeout = max(self._retry_at - loop.time(), 0) if self._failed else None
+        try:
+            events = [await asyncio.wait_for(self._queue.get(), first_timeout)]
+        except TimeoutError:
+            return []
+        deadline = loop.time() + self.flush_interval
+        while len(events) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                events.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except TimeoutError:
+                break
+        return events
+
+    def _keep(
+        self, failed: list[tuple[ExecutionStarted | ExecutionFinished, int]]
+    ) -> list[tuple[ExecutionStarted | ExecutionFinished, int]]:
+        """保持するイベントを上限までに抑える（超えた古い分は破棄）"""
+        overflow = len(failed) - self.max_queue_size
+        if overflow > 0:
+            logger.error(
+                f"Discarding {overflow} oldest execution events after repeated "
+                "write failures"
+            )
+            return failed[overflow:]
+        return failed
+
+    async def _write(self, batch: list[ExecutionStarted | ExecutionFinished]) -> bool:
+        """バッチをまとめて INSERT / UPDATE し、ジョブごとの実行集計を加算
+
+        書き込めた場合は True を返す。
+        """
+        inserts: dict[str, dict[str, Any]] = {}
+        updates: list[dict[str, Any]] = []
+        stats: dict[str, dict[str, Any]] = {}
+        for event in batch:
+            job_stats = stats.setdefault(
+                event.job_id,
+                {
+                    "job_id": event.job_id,
+                    "total_count": 0,
+                    "success_count": 0,
+                    "failed_count": 0,
+                    "last_run_at": None,
+                    "last_status": None,
+                    "last_duration_ms": None,
+                },
+            )
+            row = asdict(event)
+            if isinstance(event, ExecutionStarted):
+                inserts[event.execution_id] = row
+                job_stats["total_count"] += 1
+                job_stats["last_run_at"] = event.started_at
+            else:
+                if event.status == "completed":
+                    job_stats["success_count"] += 1
+                else:
+                    job_stats["failed_count"] += 1
+                job_stats["last_status"] = event.status
+                job_stats["last_duration_ms"] = event.execution_time_ms
+
+                if event.execution_id in inserts:
+                    # 開始と終了が同じバッチにある場合は1行の INSERT にまとめる
+                    inserts[event.execution_id].update(row)
+                else:
+                    del row["job_id"]
+                    updates.append(row)
+
+        try:
+            await self.repository.write_executions(
+                list(inserts.values()), updates, list(stats.values())
+            )
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} execution events: {e}")
+            return False
+        return True
+
+
+# グローバル実行履歴ライター
+execution_writer = ExecutionWriter(async_execution_repository)
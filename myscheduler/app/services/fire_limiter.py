@@ -0,0 +1,141 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+from ..core.config import settings
+from ..core.logging import get_logger
+from ..repositories.execution_repository import percentile
+
+logger = get_logger(__name__)
+
+
+class FireLimiter:
+    """ジョブ発火の同時実行数の制限と、発火時刻のずれ（スキュー）の計測
+
+    全ジョブ共通の上限と送信先ホストごとの上限を超えた発火は、空きが出るまで待たされる。
+    スキューは発火予定時刻から実際にリクエストを開始するまでの遅延で、
+    スケジューラーの遅れと上限による待ち時間の両方を含む。
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int | None = None,
+        max_per_host: int | None = None,
+        host_limits: dict[str, int] | None = None,
+        sample_size: int | None = None,
+    ) -> None:
+        self.max_concurrent = (
+            settings.max_concurrent_fires if max_concurrent is None else max_concurrent
+        )
+        self.max_per_host = (
+            settings.max_concurrent_fires_per_host
+            if max_per_host is None
+            else max_per_host
+        )
+        self.host_limits = (
+            settings.host_concurrency_limits if host_limits is None else host_limits
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._global: asyncio.Semaphore | None = None
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+        self._skews: deque[int] = deque(
+            maxlen=sample_size or settings.fire_metrics_sample_size
+        )
+        self.fires = 0
+        self.waited = 0  # 上限により待たされた発火数
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._host_in_flight: dict[str, int] = {}
+
+    def _host_limit(self, host: str) -> int:
+        """ホストの同時実行数の上限（0 で無制限）"""
+        return self.host_limits.get(host, self.max_per_host)
+
+    def _semaphores(self, host: str) -> list[asyncio.Semaphore]:
+        """ホスト・全体の順に取得するセマフォ（イベントループごとに作り直す）"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._global = (
+                asyncio.Semaphore(self.max_concurrent)
+                if self.max_concurrent > 0
+                else None
+            )
+            self._hosts = {}
+
+        semaphores = []
+        # ホストの空きを待つ間に全体の枠を占有しないよう、ホストを先に取得する
+        limit = self._host_limit(host)
+        if limit > 0:
+            if host not in self._hosts:
+                self._hosts[host] = asyncio.Semaphore(limit)
+            semaphores.append(self._hosts[host])
+        if self._global is not None:
+            semaphores.append(self._global)
+        return semaphores
+
+    @asynccontextmanager
+    async def acquire(
+        self, url: str, scheduled_at: datetime | None = None
+    ) -> AsyncIterator[None]:
+        """上限の空きを待ってから発火し、終了時に枠を返す"""
+        host = urlsplit(url).hostname or ""
+        acquired: list[asyncio.Semaphore] = []
+        try:
+            waited = False
+            for semaphore in self._semaphores(host):
+                waited = waited or semaphore.locked()
+                await semaphore.acquire()
+                acquired.append(semaphore)
+
+            self.fires += 1
+            if waited:
+                self.waited += 1
+            if scheduled_at is not None:
+                skew = datetime.now(UTC) - scheduled_at
+                self._skews.append(max(int(skew.total_seconds() * 1000), 0))
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self._host_in_flight[host] = self._host_in_flight.get(host, 0) + 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+                self._host_in_flight[host] -= 1
+                if not self._host_in_flight[host]:
+                    del self._host_in_flight[host]
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+
+    def snapshot(self) -> dict[str, Any]:
+        """同時実行数とスキューの統計"""
+        skews = sorted(self._skews)
+        result: dict[str, Any] = {
+            "max_concurrent": self.max_concurrent,
+            "max_per_host": self.max_per_host,
+            "host_limits": self.host_limits,
+            "fires": self.fires,
+            "waited": self.waited,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "in_flight_by_host": dict(self._host_in_flight),
+            "skew_sample_size": len(skews),
+            "skew_p50_ms": None,
+            "skew_p95_ms": None,
+            "skew_p99_ms": None,
+            "skew_max_ms": None,
+        }
+        if skews:
+            result["skew_max_ms"] = skews[-1]
+            for p in (50, 95, 99):
+                result[f"skew_p{p}_ms"] = percentile(skews, p)
+        return result
+
+
+# グローバル発火リミッター
+fire_limiter = FireLimiter()
@@ -10,10 +10,26 @@
 
 
 class HTTPService:
-    """HTTP実行サービス"""
+    """HTTP実行サービス（プール済みクライアントを全ジョブで共有）"""
 
     def __init__(self) -> None:
-        self.client = httpx.AsyncClient()
+        self.client = self._create_client()
+
+    @staticmethod
+    def _create_client() -> httpx.AsyncClient:
+        """コネクションプール付きのHTTPクライアントを作成"""
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+            )
+        )
+
+    def get_client(self) -> httpx.AsyncClient:
+        """共有HTTPクライアントを取得（クローズ済みの場合は再作成）"""
+        if self.client.is_closed:
+            self.client = self._create_client()
+        return self.client
 
     async def close(self) -> None:
         """HTTPクライアントを閉じる"""
@@ -28,18 +44,32 @@ async def execute_request(
         timeout_sec: float | None = None,
         max_retries: int | None = None,
         retry_backoff_sec: float | None = None,
-    ) -> None:
-        """外部APIへのHTTPリクエストを実行"""
-
-        # デフォルト値の設定
-        timeout_sec = timeout_sec or settings.http_timeout
-        max_retries = max_retries or settings.max_retries
-        retry_backoff_sec = retry_backoff_sec or settings.retry_backoff
+    ) -> dict[str, Any]:
+        """外部APIへのHTTPリクエストを実行し、実行結果を返す"""
+
+        # デフォルト値の設定（0 は明示的な指定として扱う）
+        if timeout_sec is None:
+            timeout_sec = settings.http_timeout
+        if max_retries is None:
+            max_retries = settings.max_retries
+        if retry_backoff_sec is None:
+            retry_backoff_sec = settings.retry_backoff
+
+        result: dict[str, Any] = {
+            "success": False,
+            "status_code": None,
+            "response_size": None,
+            "response_body": None,
+            "error_message": None,
+            "attempts": 0,
+        }
+        client = self.get_client()
 
         for attempt in range(max_retries + 1):
+            result["attempts"] = attempt + 1
             try:
                 if body and method.upper() in ["POST", "PUT", "PATCH"]:
-                    response = await self.client.request(
+                    response = await client.request(
                         method.upper(),
                         url,
                         json=body,
@@ -47,12 +77,25 @@ async def execute_request(
                         headers=headers or {},
                     )
                 else:
-                    response = await self.client.request(
+                    response = await client.request(
                         method.upper(), url, timeout=timeout_sec, headers=headers or {}
                     )
 
+                result["status_code"] = response.status_code
+                result["response_size"] = (
+                    len(response.content) if response.content else 0
+                )
+
+                # レスポンスボディを保存
+                try:
+                    result["response_body"] = response.json()
+                except Exception:
+                    # JSONでない場合はテキストとして保存
+                    result["response_body"] = response.text
+
                 # 4xxエラーはリトライしない
                 if 400 <= response.status_code < 500:
+                    result["error_message"] = f"Client error {response.status_code}"
                     logger.error(
                         f"Client error {response.status_code} for {method} {url}"
                     )
@@ -64,16 +107,21 @@ async def execute_request(
                         await asyncio.sleep(retry_backoff_sec * (attempt + 1))
                         continue
                     else:
+                        result["error_message"] = (
+                            f"Max retries exceeded, last status: {response.status_code}"
+                        )
                         logger.error(f"Max retries exceeded for {method} {url}")
                         break
 
                 # 成功
+                result["success"] = True
                 logger.info(
                     f"Successfully executed {method} {url} - Status: {response.status_code}"
                 )
-                return
+                return result
 
             except Exception as e:
+                result["error_message"] = str(e)
                 logger.error(f"Error executing {method} {url}: {str(e)}")
                 if attempt < max_retries:
                     await asyncio.sleep(retry_backoff_sec * (attempt + 1))
@@ -81,6 +129,8 @@ async def execute_request(
                     logger.error(f"Max retries exceeded for {method} {url}")
                     break
 
+        return result
+
 
 # グローバルHTTPサービス
 http_service = HTTPService()
@@ -1,16 +1,27 @@
 import uuid
 from datetime import datetime
+from typing import Any
 
+from apscheduler.job import Job
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from ..core.config import settings
 from ..core.logging import get_logger
-from ..db.session import scheduler_manager
+from ..db.session import USER_JOBSTORE, SchedulerManager, scheduler_manager
 from ..repositories.execution_repository import execution_repository
-from ..schemas.job import JobCreateRequest, JobDetail, JobInfo, JobResponse
-from .job_executor import execute_http_job
+from ..schemas.job import (
+    CronSchedule,
+    IntervalSchedule,
+    JobCreateRequest,
+    JobDetail,
+    JobInfo,
+    JobqueueTarget,
+    JobResponse,
+)
+from .job_executor import execute_http_job, execute_jobqueue_job
+from .triggers import SpreadCronTrigger, SpreadIntervalTrigger, spread_offset
 
 logger = get_logger(__name__)
 
@@ -18,11 +29,34 @@
 class JobService:
     """ジョブサービス"""
 
-    def __init__(self) -> None:
-        self.scheduler = scheduler_manager.get_scheduler()
-
-    def _create_trigger(self, job_request: JobCreateRequest):
-        """スケジュール設定からAPSchedulerトリガーを作成"""
+    def __init__(self, manager: SchedulerManager | None = None) -> None:
+        self.manager = manager or scheduler_manager
+        self.scheduler = self.manager.get_scheduler()
+
+    def _create_trigger(self, job_request: JobCreateRequest, job_id: str | None = None):
+        """スケジュール設定からAPSchedulerトリガーを作成
+
+        cron / interval には発火の分散を適用する。ユーザーのスケジュール設定は変えず、
+        ジッター（ランダム）と分散幅内の固定オフセット（ジョブIDから決まる）で発火をずらす。
+        """
+        jitter = (
+            settings.job_fire_jitter
+            if job_request.jitter_sec is None
+            else job_request.jitter_sec
+        )
+        spread = (
+            settings.job_fire_spread
+            if job_request.spread_sec is None
+            else job_request.spread_sec
+        )
+        spread_kwargs = {}
+        if spread > 0:
+            spread_kwargs = {
+                "spread_window": spread,
+                "spread_offset": spread_offset(
+                    job_id or job_request.job_id or "", spread
+                ),
+            }
 
         if job_request.schedule_type == "cron":
             if not job_request.cron:
@@ -31,7 +65,16 @@ def _create_trigger(self, job_request: JobCreateRequest):
             cron_kwargs = {
                 k: v for k, v in job_request.cron.model_dump().items() if v is not None
             }
-            return CronTrigger(timezone=settings.tz, **cron_kwargs)
+            if spread_kwargs:
+                return SpreadCronTrigger(
+                    timezone=settings.tz,
+                    jitter=jitter or None,
+                    **spread_kwargs,
+                    **cron_kwargs,
+                )
+            return CronTrigger(
+                timezone=settings.tz, jitter=jitter or None, **cron_kwargs
+            )
 
         elif job_request.schedule_type == "interval":
             if not job_request.interval:
@@ -42,7 +85,16 @@ def _create_trigger(self, job_request: JobCreateRequest):
                 for k, v in job_request.interval.model_dump().items()
                 if v is not None
             }
-            return IntervalTrigger(timezone=settings.tz, **interval_kwargs)
+            if spread_kwargs:
+                return SpreadIntervalTrigger(
+                    timezone=settings.tz,
+                    jitter=jitter or None,
+                    **spread_kwargs,
+                    **interval_kwargs,
+                )
+            return IntervalTrigger(
+                timezone=settings.tz, jitter=jitter or None, **interval_kwargs
+            )
 
         elif job_request.schedule_type == "date":
             if not job_request.run_at:
@@ -59,37 +111,80 @@ def _create_trigger(self, job_request: JobCreateRequest):
         else:
             raise ValueError(f"Unknown schedule type: {job_request.schedule_type}")
 
+    def _build_job_kwargs(
+        self, job_request: JobCreateRequest, job_id: str
+    ) -> dict[str, Any]:
+        """ジョブ作成リクエストから add_job のキーワード引数を作成"""
+        job_kwargs: dict[str, Any] = {
+            "trigger": self._create_trigger(job_request, job_id),
+            "id": job_id,
+            # ジョブ名の設定（指定されていない場合はジョブIDを使用）
+            "name": job_request.name or job_id,  # APSchedulerのname属性を使用
+        }
+
+        # 発火の分散はジョブで指定された項目だけを保存（未指定は全体設定に従う）
+        fire_spread = job_request.model_dump(
+            include={"jitter_sec", "spread_sec"}, exclude_none=True
+        )
+
+        if job_request.job_type == "jobqueue":
+            if not job_request.jobqueue:
+                raise ValueError("jobqueue settings are required for jobqueue type")
+
+            job_kwargs["func"] = execute_jobqueue_job
+            job_kwargs["args"] = [
+                job_request.jobqueue.master_id,
+                # ジョブストアには指定された項目だけを辞書で保存
+                job_request.jobqueue.overrides.model_dump(
+                    mode="json", exclude_none=True
+                )
+                if job_request.jobqueue.overrides
+                else None,
+                job_id,  # 実行履歴記録用のjob_id
+            ]
+            job_kwargs["kwargs"] = {
+                "tags": job_request.tags,
+                "fire_spread": fire_spread,
+            }
+        else:
+            if not job_request.target_url:
+                raise ValueError("target_url is required for http type")
+
+            job_kwargs["func"] = execute_http_job
+            job_kwargs["args"] = [
+                job_request.target_url,
+                job_request.method,
+                job_request.headers,
+                job_request.body,
+                job_request.timeout_sec,
+                job_request.max_retries,
+                job_request.retry_backoff_sec,
+                job_id,  # 実行履歴記録用のjob_id
+            ]
+            job_kwargs["kwargs"] = {
+                "capture_response": job_request.capture_response,
+                "tags": job_request.tags,
+                "fire_spread": fire_spread,
+            }
+
+        if job_request.paused:
+            # 次回実行時刻なしで登録すると一時停止状態になる
+            job_kwargs["next_run_time"] = None
+        return job_kwargs
+
     async def create_job(self, job_request: JobCreateRequest) -> JobResponse:
         """ジョブを作成"""
         try:
             # ジョブIDの生成
             job_id = job_request.job_id or str(uuid.uuid4())
 
-            # ジョブ名の設定（指定されていない場合はジョブIDを使用）
-            job_name = job_request.name or job_id
-
-            # トリガーの作成
-            trigger = self._create_trigger(job_request)
-
-            # ジョブの追加（job_idを最後の引数として追加）
             self.scheduler.add_job(
-                func=execute_http_job,
-                trigger=trigger,
-                id=job_id,
-                name=job_name,  # APSchedulerのname属性を使用
-                args=[
-                    job_request.target_url,
-                    job_request.method,
-                    job_request.headers,
-                    job_request.body,
-                    job_request.timeout_sec,
-                    job_request.max_retries,
-                    job_request.retry_backoff_sec,
-                    job_id,  # 実行履歴記録用のjob_id
-                ],
+                jobstore=USER_JOBSTORE,
                 replace_existing=job_request.replace_existing,
+                **self._build_job_kwargs(job_request, job_id),
             )
 
+            job_name = job_request.name or job_id
             logger.info(f"Job {job_id} (name: {job_name}) created successfully")
             return JobResponse(job_id=job_id, status="scheduled")
 
@@ -97,11 +192,178 @@ async def create_job(self, job_request: JobCreateRequest) -> JobResponse:
             logger.error(f"Failed to create job: {str(e)}")
             raise
 
+    async def create_jobs(
+        self, job_requests: list[JobCreateRequest], replace_existing: bool = False
+    ) -> list[JobResponse]:
+        """複数のジョブを1トランザクションで作成・置換（1件でも失敗すれば全件登録しない）"""
+        try:
+            jobs: list[dict[str, Any]] = []
+            replace_ids = set()
+            for job_request in job_requests:
+                job_id = job_request.job_id or str(uuid.uuid4())
+                if any(job["id"] == job_id for job in jobs):
+                    raise ValueError(f"Duplicate job_id in request: {job_id}")
+                if replace_existing or job_request.replace_existing:
+                    replace_ids.add(job_id)
+                # トリガーの検証も含め、書き込み前に全件のジョブを組み立てる
+                jobs.append(self._build_job_kwargs(job_request, job_id))
+
+            self.manager.add_jobs(jobs, replace_ids)
+
+            logger.info(f"{len(jobs)} jobs created successfully")
+            return [JobResponse(job_id=job["id"], status="scheduled") for job in jobs]
+
+        except Exception as e:
+            logger.error(f"Failed to create jobs: {str(e)}")
+            raise
+
+    async def set_paused_by_tag(self, tag: str, paused: bool) -> list[JobResponse]:
+        """タグの付いたジョブをまとめて一時停止・再開"""
+        try:
+            now = datetime.now(settings.tz)
+            changes: list[tuple[Job, datetime | None]] = []
+            for job in self.scheduler.get_jobs(jobstore=USER_JOBSTORE):
+                if tag not in (job.kwargs or {}).get("tags", []):
+                    continue
+                if paused:
+                    changes.append((job, None))
+                else:
+                    changes.append((job, job.trigger.get_next_fire_time(None, now)))
+
+            if changes:
+                self.manager.reschedule_jobs(changes)
+
+            status = "paused" if paused else "resumed"
+            logger.info(f"{len(changes)} jobs tagged '{tag}' {status}")
+            return [JobResponse(job_id=job.id, status=status) for job, _ in changes]
+
+        except Exception as e:
+            logger.error(f"Failed to update jobs tagged '{tag}': {str(e)}")
+            raise
+
+    @staticmethod
+    def _fire_spread(job) -> dict[str, float]:
+        """ジョブで指定された発火の分散設定（未指定の項目は含めない）"""
+        fire_spread = (job.kwargs or {}).get("fire_spread")
+        if fire_spread is not None:
+            return fire_spread
+        # 指定の有無を保存する前に登録されたジョブはトリガーの値から復元する
+        trigger = job.trigger
+        return {
+            key: value
+            for key, value in (
+                ("jitter_sec", getattr(trigger, "jitter", None)),
+                ("spread_sec", getattr(trigger, "spread_window", None)),
+            )
+            if value
+        }
+
+    def _schedule_from_trigger(self, trigger) -> dict[str, Any]:
+        """APSchedulerトリガーをジョブ作成リクエストのスケジュール設定に戻す"""
+        if isinstance(trigger, CronTrigger):
+            return {
+                "schedule_type": "cron",
+                "cron": CronSchedule(
+                    **{
+                        field.name: str(field)
+                        for field in trigger.fields
+                        if field.name in CronSchedule.model_fields
+                        and not field.is_default
+                    }
+                ),
+            }
+        elif isinstance(trigger, IntervalTrigger):
+            return {
+                "schedule_type": "interval",
+                "interval": IntervalSchedule(
+                    seconds=int(trigger.interval.total_seconds())
+                ),
+            }
+        elif isinstance(trigger, DateTrigger):
+            return {"schedule_type": "date", "run_at": trigger.run_date.isoformat()}
+        else:
+            raise ValueError(f"Unsupported trigger: {trigger}")
+
+    @staticmethod
+    def _jobqueue_target(job) -> JobqueueTarget | None:
+        """jobqueue タイプのジョブの投入設定（http タイプでは None）"""
+        if getattr(job, "func", None) is not execute_jobqueue_job:
+            return None
+        return JobqueueTarget(master_id=job.args[0], overrides=job.args[1])
+
+    @staticmethod
+    def _jobqueue_url(target: JobqueueTarget) -> str:
+        """jobqueue タイプのジョブの投入先（一覧・詳細の表示用、実際は一括APIで投入）"""
+        return (
+            f"{settings.jobqueue_api_url.rstrip('/')}"
+            f"/api/v1/jobs/from-master/{target.master_id}"
+        )
+
+    async def export_jobs(self) -> list[JobCreateRequest]:
+        """全ジョブをジョブ作成リクエストの形式で取得（インポートでそのまま再登録できる）"""
+        try:
+            exported = []
+            for job in self.scheduler.get_jobs(jobstore=USER_JOBSTORE):
+                job_kwargs = job.kwargs or {}
+                common = {
+                    "job_id": job.id,
+                    "name": job.name,
+                    "tags": job_kwargs.get("tags") or [],
+                    # 開始前の保留ジョブは次回実行時刻が未計算
+                    "paused": getattr(job, "next_run_time", False) is None,
+                    **self._schedule_from_trigger(job.trigger),
+                    **self._fire_spread(job),
+                }
+
+                jobqueue = self._jobqueue_target(job)
+                if jobqueue:
+                    exported.append(
+                        JobCreateRequest(
+                            job_type="jobqueue", jobqueue=jobqueue, **common
+                        )
+                    )
+                    continue
+
+                (
+                    target_url,
+                    method,
+                    headers,
+                    body,
+                    timeout_sec,
+                    max_retries,
+                    retry_backoff_sec,
+                ) = job.args[:7]
+                exported.append(
+                    JobCreateRequest(
+                        target_url=target_url,
+                        method=method,
+                        headers=headers,
+                        body=body,
+                        timeout_sec=timeout_sec,
+                        max_retries=max_retries,
+                        retry_backoff_sec=retry_backoff_sec,
+                        capture_response=job_kwargs.get("capture_response", False),
+                        **common,
+                    )
+                )
+            return exported
+
+        except Exception as e:
+            logger.error(f"Failed to export jobs: {str(e)}")
+            raise
+
     async def list_jobs(self) -> list[JobInfo]:
         """ジョブ一覧を取得"""
         try:
+            scheduled_jobs = self.scheduler.get_jobs(jobstore=USER_JOBSTORE)
+
+            # 全ジョブの実行集計を1クエリで取得
+            stats_by_job = execution_repository.get_execution_stats(
+                [job.id for job in scheduled_jobs]
+            )
+
             jobs = []
-            for job in self.scheduler.get_jobs():
+            for job in scheduled_jobs:
                 next_run_time = None
                 if hasattr(job, "next_run_time") and job.next_run_time:
                     next_run_time = job.next_run_time.isoformat()
@@ -114,17 +376,18 @@ async def list_jobs(self) -> list[JobInfo]:
                 # ジョブの引数からHTTP設定を取得 (execute_http_job用)
                 target_url = None
                 method = None
-                if job.args and len(job.args) >= 2:
+                jobqueue = self._jobqueue_target(job)
+                if jobqueue:
+                    target_url = self._jobqueue_url(jobqueue)
+                    method = "POST"
+                elif job.args and len(job.args) >= 2:
                     target_url = job.args[0]
                     method = job.args[1]
 
                 # ジョブ名を取得（APSchedulerのname属性またはjob_idをフォールバック）
                 job_name = getattr(job, "name", job.id)
 
-                # データベースから実際の実行回数を取得
-                execution_count = execution_repository.get_execution_count_by_job_id(
-                    job.id
-                )
+                stats = stats_by_job.get(job.id, {})
 
                 jobs.append(
                     JobInfo(
@@ -134,9 +397,16 @@ async def list_jobs(self) -> list[JobInfo]:
                         next_run_time=next_run_time,
                         trigger=str(job.trigger),
                         status=status,
+                        job_type="jobqueue" if jobqueue else "http",
                         target_url=target_url,
                         method=method,
-                        execution_count=execution_count,  # データベースから取得した実行回数
+                        execution_count=stats.get("total_count", 0),
+                        success_count=stats.get("success_count", 0),
+                        failed_count=stats.get("failed_count", 0),
+                        last_run_at=stats.get("last_run_at"),
+                        last_status=stats.get("last_status"),
+                        last_duration_ms=stats.get("last_duration_ms"),
+                        tags=(job.kwargs or {}).get("tags") or [],
                     )
                 )
 
@@ -149,7 +419,7 @@ async def list_jobs(self) -> list[JobInfo]:
     async def delete_job(self, job_id: str) -> JobResponse:
         """ジョブを削除"""
         try:
-            self.scheduler.remove_job(job_id)
+            self.scheduler.remove_job(job_id, jobstore=USER_JOBSTORE)
             logger.info(f"Job {job_id} deleted successfully")
             return JobResponse(job_id=job_id, status="deleted")
 
@@ -160,7 +430,7 @@ async def delete_job(self, job_id: str) -> JobResponse:
     async def pause_job(self, job_id: str) -> JobResponse:
         """ジョブを一時停止"""
         try:
-            self.scheduler.pause_job(job_id)
+            self.scheduler.pause_job(job_id, jobstore=USER_JOBSTORE)
             logger.info(f"Job {job_id} paused successfully")
             return JobResponse(job_id=job_id, status="paused")
 
@@ -171,7 +441,7 @@ async def pause_job(self, job_id: str) -> JobResponse:
     async def resume_job(self, job_id: str) -> JobResponse:
         """ジョブを再開"""
         try:
-            self.scheduler.resume_job(job_id)
+            self.scheduler.resume_job(job_id, jobstore=USER_JOBSTORE)
             logger.info(f"Job {job_id} resumed successfully")
             return JobResponse(job_id=job_id, status="resumed")
 
@@ -183,14 +453,16 @@ async def trigger_job(self, job_id: str) -> JobResponse:
         """ジョブを即座に実行"""
         try:
             # ジョブが存在するかチェック
-            job = self.scheduler.get_job(job_id)
+            job = self.scheduler.get_job(job_id, jobstore=USER_JOBSTORE)
             if not job:
                 raise ValueError(f"Job {job_id} not found")
 
             # ジョブを即座に実行（既存のスケジュールを維持）
             from datetime import datetime
 
-            self.scheduler.modify_job(job_id, next_run_time=datetime.now())
+            self.scheduler.modify_job(
+                job_id, jobstore=USER_JOBSTORE, next_run_time=datetime.now()
+            )
             logger.info(f"Job {job_id} triggered successfully")
             return JobResponse(job_id=job_id, status="triggered")
 
@@ -198,10 +470,14 @@ async def trigger_job(self, job_id: str) -> JobResponse:
             logger.error(f"Failed to trigger job {job_id}: {str(e)}")
             raise
 
+    def job_exists(self, job_id: str) -> bool:
+        """ジョブが登録されているか"""
+        return self.scheduler.get_job(job_id, jobstore=USER_JOBSTORE) is not None
+
     async def get_job(self, job_id: str) -> JobDetail:
         """ジョブ詳細を取得"""
         try:
-            job = self.scheduler.get_job(job_id)
+            job = self.scheduler.get_job(job_id, jobstore=USER_JOBSTORE)
             if not job:
                 raise ValueError(f"Job {job_id} not found")
 
@@ -253,6 +529,13 @@ async def get_job(self, job_id: str) -> JobDetail:
                 if hasattr(job.trigger, "run_date"):
                     trigger_info["run_date"] = job.trigger.run_date.isoformat()
 
+            # 発火の分散設定
+            if getattr(job.trigger, "jitter", None):
+                trigger_info["jitter_sec"] = job.trigger.jitter
+            if getattr(job.trigger, "spread_window", 0):
+                trigger_info["spread_sec"] = job.trigger.spread_window
+                trigger_info["spread_offset_sec"] = job.trigger.spread_offset
+
             # ジョブの引数からHTTP設定を取得 (execute_http_job用)
             target_url = None
             method = None
@@ -262,7 +545,11 @@ async def get_job(self, job_id: str) -> JobDetail:
             max_retries = None
             retry_backoff_sec = None
 
-            if job.args and len(job.args) >= 2:
+            jobqueue = self._jobqueue_target(job)
+            if jobqueue:
+                target_url = self._jobqueue_url(jobqueue)
+                method = "POST"
+            elif job.args and len(job.args) >= 2:
                 target_url = job.args[0]
                 method = job.args[1]
                 if len(job.args) > 2:
@@ -277,6 +564,10 @@ async def get_job(self, job_id: str) -> JobDetail:
                     retry_backoff_sec = job.args[6]
                 # job.args[7] is job_id for execution history tracking
 
+            # レスポンス全体の保存設定（キーワード引数で渡している）
+            capture_response = bool((job.kwargs or {}).get("capture_response"))
+            tags = (job.kwargs or {}).get("tags") or []
+
             # 実行履歴を取得
             executions = []
             try:
@@ -289,8 +580,8 @@ async def get_job(self, job_id: str) -> JobDetail:
             # ジョブ名を取得（APSchedulerのname属性またはjob_idをフォールバック）
             job_name = getattr(job, "name", job.id)
 
-            # データベースから実際の実行回数を取得
-            execution_count = execution_repository.get_execution_count_by_job_id(job.id)
+            # 実行集計テーブルから実行回数を取得
+            stats = execution_repository.get_execution_stats([job.id]).get(job.id, {})
 
             return JobDetail(
                 job_id=job.id,
@@ -303,8 +594,10 @@ async def get_job(self, job_id: str) -> JobDetail:
                 status=status,
                 trigger=str(job.trigger),
                 next_run_time=next_run_time,
-                execution_count=execution_count,  # データベースから取得した実行回数
+                execution_count=stats.get("total_count", 0),
                 trigger_info=trigger_info,
+                job_type="jobqueue" if jobqueue else "http",
+                jobqueue=jobqueue,
                 target_url=target_url,
                 method=method,
                 headers=headers,
@@ -312,6 +605,8 @@ async def get_job(self, job_id: str) -> JobDetail:
                 timeout_sec=timeout_sec,
                 max_retries=max_retries,
                 retry_backoff_sec=retry_backoff_sec,
+                capture_response=capture_response,
+                tags=tags,
                 executions=executions,  # 実行履歴を追加
             )
 
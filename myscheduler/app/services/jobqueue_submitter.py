@@ -0,0 +1,210 @@
+import asyncio
+from typing import Any
+
+import httpx
+
+from ..core.config import settings
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+BATCH_PATH = "/api/v1/jobs/from-master/batch"
+
+
+class JobqueueSubmitter:
+    """jobqueue へのジョブ投入
+
+    同じタイミングで発火した投入を短い待ち時間（batch_window）の間に集め、
+    jobqueue の一括作成APIへ1回のリクエストで送信する。クライアントは全ジョブで共有する。
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        batch_window: float | None = None,
+        batch_size: int | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        self.base_url = (base_url or settings.jobqueue_api_url).rstrip("/")
+        self.batch_window = (
+            settings.jobqueue_batch_window if batch_window is None else batch_window
+        )
+        self.batch_size = batch_size or settings.jobqueue_batch_size
+        self.timeout = timeout or settings.jobqueue_timeout
+        self.client = self._create_client()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: list[tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.batches = 0
+        self.submitted = 0
+        self.failed = 0
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """jobqueue 用のコネクションプール付きクライアントを作成"""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+            ),
+        )
+
+    def get_client(self) -> httpx.AsyncClient:
+        """共有クライアントを取得（クローズ済みの場合は再作成）"""
+        if self.client.is_closed:
+            self.client = self._create_client()
+        return self.client
+
+    async def close(self) -> None:
+        """送信中の一括リクエストを待ってからクライアントを閉じる"""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.client.aclose()
+
+    async def submit(
+        self, master_id: str, overrides: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """ジョブマスターからの投入を次の一括リクエストに加え、その1件の結果を返す"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 別のイベントループで溜まった投入は送信できないため失敗として返す
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+            self._fail(self._pending, "event loop changed before submission", None)
+            self._loop = loop
+            self._pending = []
+            self._flush_handle = None
+
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        self._pending.append(({**(overrides or {}), "master_id": master_id}, future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """溜まった投入を一括リクエストとして送信開始"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _post(self, items: list[dict[str, Any]]) -> httpx.Response:
+        """一括作成APIを呼び出す（接続できなかった場合のみリトライ）"""
+        for attempt in range(settings.max_retries + 1):
+            try:
+                return await self.get_client().post(BATCH_PATH, json={"jobs": items})
+            except httpx.ConnectError:
+                # 送信前の失敗のため再送しても二重投入にならない
+                if attempt >= settings.max_retries:
+                    raise
+                await asyncio.sleep(settings.retry_backoff * (attempt + 1))
+        raise AssertionError("unreachable")
+
+    def _fail(
+        self,
+        batch: list[tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]],
+        error_message: str,
+        status_code: int | None,
+    ) -> None:
+        """未解決の投入をすべて失敗として返す（各 Future のイベントループ上で）"""
+        for item, future in batch:
+            if future.done():
+                continue
+            self.failed += 1
+            result = {
+                "success": False,
+                "master_id": item["master_id"],
+                "jobqueue_job_id": None,
+                "status_code": status_code,
+                "error_message": error_message,
+                "batch_size": len(batch),
+            }
+            future_loop = future.get_loop()
+            if future_loop is _running_loop():
+                future.set_result(result)
+            elif not future_loop.is_closed():
+                future_loop.call_soon_threadsafe(_set_result_if_pending, future, result)
+
+    async def _send(
+        self, batch: list[tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]]
+    ) -> None:
+        """一括リクエストを送信し、結果を投入ごとに返す"""
+        self.batches += 1
+        self.submitted += len(batch)
+        try:
+            try:
+                response = await self._post([item for item, _ in batch])
+                response.raise_for_status()
+                results = response.json()["results"]
+                if len(results) != len(batch):
+                    raise ValueError(
+                        f"jobqueue returned {len(results)} results for "
+                        f"{len(batch)} jobs"
+                    )
+                outcomes = [
+                    {
+                        "success": result["status_code"] == 201,
+                        "master_id": item["master_id"],
+                        "jobqueue_job_id": result.get("job_id"),
+                        "status_code": result["status_code"],
+                        "error_message": result.get("error"),
+                        "batch_size": len(batch),
+                    }
+                    for (item, _), result in zip(batch, results, strict=True)
+                ]
+            except Exception as e:
+                status_code = (
+                    e.response.status_code
+                    if isinstance(e, httpx.HTTPStatusError)
+                    else None
+                )
+                logger.error(f"Failed to submit {len(batch)} jobs to jobqueue: {e}")
+                self._fail(batch, str(e), status_code)
+                return
+
+            logger.info(f"Submitted {len(batch)} jobs to jobqueue in one request")
+            for (_, future), outcome in zip(batch, outcomes, strict=True):
+                if not outcome["success"]:
+                    self.failed += 1
+                if not future.done():
+                    future.set_result(outcome)
+        finally:
+            # キャンセル等で結果を返せなかった投入を待たせ続けない
+            self._fail(batch, "submission was interrupted", None)
+
+    def snapshot(self) -> dict[str, Any]:
+        """一括投入の統計"""
+        return {
+            "batches": self.batches,
+            "submitted": self.submitted,
+            "failed": self.failed,
+            "avg_batch_size": self.submitted / self.batches if self.batches else None,
+        }
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _set_result_if_pending(
+    future: asyncio.Future[dict[str, Any]], result: dict[str, Any]
+) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+# グローバル jobqueue 投入クライアント
+jobqueue_submitter = JobqueueSubmitter()
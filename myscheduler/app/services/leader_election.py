@@ -0,0 +1,103 @@
+import asyncio
+import os
+import socket
+import uuid
+from contextlib import suppress
+
+from ..core.config import settings
+from ..core.logging import get_logger
+from ..db.session import SchedulerManager, scheduler_manager
+from ..repositories.lease_repository import AsyncLeaseRepository, lease_repository
+
+logger = get_logger(__name__)
+
+
+def default_node_id() -> str:
+    """ノードIDを生成（同一ホストの複数プロセスも区別する）"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderElector:
+    """データベースのリースによるリーダー選出
+
+    全ノードがジョブストアを共有し、リースを保持するリーダーだけが
+    スケジューラーを実行する。他のノードは一時停止状態のまま API を提供し、
+    リーダーのリースが切れると次の更新周期でいずれかが引き継ぐ。
+    """
+
+    LEASE_NAME = "scheduler"
+
+    def __init__(
+        self,
+        manager: SchedulerManager,
+        repository: AsyncLeaseRepository,
+        node_id: str | None = None,
+        lease_ttl: float | None = None,
+        renew_interval: float | None = None,
+    ) -> None:
+        self.manager = manager
+        self.repository = repository
+        self.node_id = node_id or settings.node_id or default_node_id()
+        self.lease_ttl = lease_ttl or settings.leader_lease_ttl
+        self.renew_interval = renew_interval or settings.leader_renew_interval
+        self.is_leader = False
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """リース取得を試み、以降は定期的に更新する"""
+        await self.repository.create_table()
+        await self.tick()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Leader election started (node_id={self.node_id})")
+
+    async def stop(self) -> None:
+        """更新を止め、リーダーならリースを解放する"""
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self.is_leader:
+            self._step_down()
+            try:
+                await self.repository.release(self.LEASE_NAME, self.node_id)
+            except Exception as e:
+                logger.error(f"Failed to release scheduler lease: {e}")
+
+    async def tick(self) -> None:
+        """リースを取得・更新し、結果に応じてスケジューラーを再開・停止"""
+        try:
+            acquired = await self.repository.try_acquire(
+                self.LEASE_NAME, self.node_id, self.lease_ttl
+            )
+        except Exception as e:
+            # 更新できない間に他ノードが引き継ぐ可能性があるため実行を止める
+            logger.error(f"Failed to renew scheduler lease: {e}")
+            acquired = False
+
+        if acquired and not self.is_leader:
+            self.is_leader = True
+            self.manager.resume()
+            logger.info(f"Node {self.node_id} became scheduler leader")
+        elif not acquired and self.is_leader:
+            self._step_down()
+
+        if self.is_leader:
+            # 他ノードの API で追加・変更されたジョブを拾う
+            self.manager.wakeup()
+
+    def _step_down(self) -> None:
+        """リーダーを降りてジョブの実行を止める"""
+        self.is_leader = False
+        self.manager.pause()
+        logger.warning(f"Node {self.node_id} lost scheduler leadership")
+
+    async def _run(self) -> None:
+        """リース更新ループ"""
+        while True:
+            await asyncio.sleep(self.renew_interval)
+            await self.tick()
+
+
+# グローバルリーダー選出
+leader_elector = LeaderElector(scheduler_manager, lease_repository)
@@ -0,0 +1,104 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from apscheduler.events import EVENT_JOB_MISSED
+from apscheduler.executors.asyncio import AsyncIOExecutor
+from apscheduler.executors.base import run_coroutine_job
+from apscheduler.util import iscoroutinefunction_partial
+
+from .schedule_metrics import schedule_metrics
+
+
+@dataclass(frozen=True)
+class JobRunContext:
+    """1回のジョブ実行のコンテキスト（スケジューラーから明示的に渡される）"""
+
+    job_id: str
+    scheduled_run_time: datetime  # 本来の発火予定時刻（タイムゾーン付き）
+    started_at: datetime  # 実際に実行を開始した時刻（タイムゾーン付き）
+    submitted_at: datetime | None = None  # エグゼキューターに投入された時刻
+
+    @property
+    def misfire_delay_ms(self) -> int:
+        """予定時刻から実際の開始までの遅延（ミリ秒）"""
+        delta = self.started_at - self.scheduled_run_time
+        return max(int(delta.total_seconds() * 1000), 0)
+
+
+_current_run: ContextVar[JobRunContext | None] = ContextVar(
+    "current_job_run", default=None
+)
+
+
+def get_run_context() -> JobRunContext | None:
+    """実行中のジョブのコンテキストを取得（スケジューラー外では None）"""
+    return _current_run.get()
+
+
+async def _run_coroutine_job_with_context(
+    job,
+    jobstore_alias: str,
+    run_times: list[datetime],
+    logger_name: str,
+    submitted_at: datetime | None = None,
+) -> list:
+    """発火予定時刻ごとにコンテキストを設定してコルーチンジョブを実行"""
+    events = []
+    for run_time in run_times:
+        context = JobRunContext(
+            job_id=job.id,
+            scheduled_run_time=run_time,
+            started_at=datetime.now(UTC),
+            submitted_at=submitted_at,
+        )
+        token = _current_run.set(context)
+        try:
+            # 猶予時間を超えた発火の判定はAPSchedulerに任せる
+            run_events = await run_coroutine_job(
+                job, jobstore_alias, [run_time], logger_name
+            )
+        finally:
+            _current_run.reset(token)
+        events.extend(run_events)
+
+        # ミスファイアはスケジューラーイベント経由で数える
+        if submitted_at and not any(e.code == EVENT_JOB_MISSED for e in run_events):
+            schedule_metrics.record_start(
+                job.id, run_time, submitted_at, context.started_at
+            )
+    return events
+
+
+class RunContextExecutor(AsyncIOExecutor):
+    """コルーチンジョブに JobRunContext を渡す AsyncIOExecutor
+
+    投入時刻と、coalesce により省かれた発火の数もスケジューリングメトリクスに記録する。
+    """
+
+    def _do_submit_job(self, job, run_times):
+        submitted_at = datetime.now(UTC)
+        # 投入時点の next_run_time は最初の未実行の予定時刻のため、
+        # 最後の予定時刻までを数えれば coalesce 前の発火数になる
+        due_count = len(job._get_run_times(run_times[-1])) if run_times else 0
+        schedule_metrics.record_submission(job.id, due_count, len(run_times))
+
+        if not iscoroutinefunction_partial(job.func):
+            return super()._do_submit_job(job, run_times)
+
+        def callback(f):
+            self._pending_futures.discard(f)
+            try:
+                events = f.result()
+            except BaseException as e:
+                self._run_job_error(job.id, e, e.__traceback__)
+            else:
+                self._run_job_success(job.id, events)
+
+        f = self._eventloop.create_task(
+            _run_coroutine_job_with_context(
+                job, job._jobstore_alias, run_times, self._logger.name, submitted_at
+            )
+        )
+        f.add_done_callback(callback)
+        self._pending_futures.add(f)
@@ -0,0 +1,144 @@
+from collections import deque
+from datetime import datetime
+from typing import Any
+
+from apscheduler.events import (
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_REMOVED,
+    JobEvent,
+)
+
+from ..core.config import settings
+
+# ScheduleMetrics が購読するスケジューラーイベント
+SCHEDULE_METRICS_EVENTS = EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES | EVENT_JOB_REMOVED
+
+
+def _ms(start: datetime, end: datetime) -> int:
+    return max(int((end - start).total_seconds() * 1000), 0)
+
+
+def _summary(samples: deque[int]) -> dict[str, Any]:
+    """遅延サンプルのパーセンタイル"""
+    # db.session → run_context → 本モジュールの順に読み込まれるため遅延インポート
+    from ..repositories.execution_repository import percentile
+
+    values = sorted(samples)
+    if not values:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    return {
+        "p50_ms": percentile(values, 50),
+        "p95_ms": percentile(values, 95),
+        "p99_ms": percentile(values, 99),
+        "max_ms": values[-1],
+    }
+
+
+class _LagSamples:
+    """発火ごとの遅延と、実行されなかった発火の件数"""
+
+    def __init__(self, sample_size: int) -> None:
+        self.fires = 0  # 実行された発火
+        self.misfires = 0  # 猶予時間を超えて実行されなかった発火
+        self.coalesced = 0  # まとめて1回にされた発火
+        self.skipped = 0  # 同時実行数の上限（max_instances）で見送られた発火
+        self.last_scheduled_at: datetime | None = None
+        self.last_start_delay_ms: int | None = None
+        self.scheduler_lag: deque[int] = deque(maxlen=sample_size)
+        self.queue_delay: deque[int] = deque(maxlen=sample_size)
+        self.start_delay: deque[int] = deque(maxlen=sample_size)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fires": self.fires,
+            "misfires": self.misfires,
+            "coalesced": self.coalesced,
+            "skipped": self.skipped,
+            "last_scheduled_at": (
+                self.last_scheduled_at.isoformat() if self.last_scheduled_at else None
+            ),
+            "last_start_delay_ms": self.last_start_delay_ms,
+            "sample_size": len(self.start_delay),
+            # 予定時刻からエグゼキューターへの投入まで（スケジューラーの遅れ）
+            "scheduler_lag": _summary(self.scheduler_lag),
+            # 投入から実際の開始まで（エグゼキューターでの待ち）
+            "queue_delay": _summary(self.queue_delay),
+            # 予定時刻から実際の開始まで
+            "start_delay": _summary(self.start_delay),
+        }
+
+
+class ScheduleMetrics:
+    """スケジューリングの遅れとミスファイアの計測
+
+    発火ごとに予定時刻・エグゼキューターへの投入時刻・開始時刻を記録し、
+    猶予時間切れ（ミスファイア）、coalesce でまとめられた発火、
+    max_instances で見送られた発火を数える。値はノードのメモリ上に保持する。
+    """
+
+    def __init__(self, sample_size: int | None = None) -> None:
+        self.sample_size = sample_size or settings.schedule_metrics_sample_size
+        self.total = _LagSamples(settings.fire_metrics_sample_size)
+        self._jobs: dict[str, _LagSamples] = {}
+
+    def _job(self, job_id: str) -> _LagSamples:
+        if job_id not in self._jobs:
+            self._jobs[job_id] = _LagSamples(self.sample_size)
+        return self._jobs[job_id]
+
+    def record_submission(self, job_id: str, due_count: int, run_count: int) -> None:
+        """エグゼキューターへの投入を記録（coalesce で省かれた発火を数える）"""
+        coalesced = due_count - run_count
+        if coalesced > 0:
+            self.total.coalesced += coalesced
+            self._job(job_id).coalesced += coalesced
+
+    def record_start(
+        self,
+        job_id: str,
+        scheduled_at: datetime,
+        submitted_at: datetime,
+        started_at: datetime,
+    ) -> None:
+        """実行された発火の遅延を記録"""
+        scheduler_lag = _ms(scheduled_at, submitted_at)
+        queue_delay = _ms(submitted_at, started_at)
+        start_delay = _ms(scheduled_at, started_at)
+        for samples in (self.total, self._job(job_id)):
+            samples.fires += 1
+            samples.last_scheduled_at = scheduled_at
+            samples.last_start_delay_ms = start_delay
+            samples.scheduler_lag.append(scheduler_lag)
+            samples.queue_delay.append(queue_delay)
+            samples.start_delay.append(start_delay)
+
+    def on_scheduler_event(self, event: JobEvent) -> None:
+        """スケジューラーイベントのリスナー（ミスファイア・見送り・ジョブ削除）"""
+        if event.code == EVENT_JOB_REMOVED:
+            self._jobs.pop(event.job_id, None)
+        elif event.code == EVENT_JOB_MISSED:
+            self.total.misfires += 1
+            self._job(event.job_id).misfires += 1
+        elif event.code == EVENT_JOB_MAX_INSTANCES:
+            skipped = len(getattr(event, "scheduled_run_times", None) or [None])
+            self.total.skipped += skipped
+            self._job(event.job_id).skipped += skipped
+
+    def job_summary(self, job_id: str) -> dict[str, Any] | None:
+        """ジョブごとの集計（記録がなければ None）"""
+        samples = self._jobs.get(job_id)
+        return samples.to_dict() if samples else None
+
+    def snapshot(self) -> dict[str, Any]:
+        """全体とジョブごとの集計"""
+        return {
+            **self.total.to_dict(),
+            "jobs": {
+                job_id: samples.to_dict() for job_id, samples in self._jobs.items()
+            },
+        }
+
+
+# グローバルスケジューリングメトリクス
+schedule_metrics = ScheduleMetrics()
@@ -0,0 +1,74 @@
+import hashlib
+from datetime import timedelta
+
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+
+def spread_offset(job_id: str, window: float) -> float:
+    """ジョブIDから決まる 0 以上 window 未満のオフセット秒（同じジョブは常に同じ値）"""
+    if window <= 0:
+        return 0.0
+    digest = hashlib.sha256(job_id.encode()).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64 * window
+
+
+def _shifted_fire_time(get_next_fire_time, offset: float, previous_fire_time, now):
+    """時間軸をオフセット分ずらして次回発火時刻を計算"""
+    delta = timedelta(seconds=offset)
+    if previous_fire_time is not None:
+        previous_fire_time -= delta
+    next_fire_time = get_next_fire_time(previous_fire_time, now - delta)
+    return next_fire_time + delta if next_fire_time else None
+
+
+class _SpreadMixin:
+    """ユーザーが設定したスケジュールを変えずに、発火をジョブごとの固定オフセット分ずらす
+
+    同じ時刻に設定された多数のジョブ（毎時0分など）が同じ秒に集中しないよう、
+    分散幅 spread_window の中でジョブIDから決まる位置に発火を割り当てる。
+    """
+
+    spread_window: float = 0.0
+    spread_offset: float = 0.0
+
+    def get_next_fire_time(self, previous_fire_time, now):
+        return _shifted_fire_time(
+            super().get_next_fire_time,  # type: ignore[misc]
+            self.spread_offset,
+            previous_fire_time,
+            now,
+        )
+
+    def __getstate__(self) -> dict:
+        state: dict = super().__getstate__()  # type: ignore[assignment]
+        state["spread_window"] = self.spread_window
+        state["spread_offset"] = self.spread_offset
+        return state
+
+    def __setstate__(self, state) -> None:
+        super().__setstate__(state)  # type: ignore[misc]
+        self.spread_window = state.get("spread_window", 0.0)
+        self.spread_offset = state.get("spread_offset", 0.0)
+
+
+class SpreadCronTrigger(_SpreadMixin, CronTrigger):
+    """発火を固定オフセット分ずらす CronTrigger"""
+
+    def __init__(
+        self, spread_window: float = 0.0, spread_offset: float = 0.0, **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+        self.spread_window = spread_window
+        self.spread_offset = spread_offset
+
+
+class SpreadIntervalTrigger(_SpreadMixin, IntervalTrigger):
+    """発火を固定オフセット分ずらす IntervalTrigger"""
+
+    def __init__(
+        self, spread_window: float = 0.0, spread_offset: float = 0.0, **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+        self.spread_window = spread_window
+        self.spread_offset = spread_offset
@@ -0,0 +1,106 @@
+"""
+Migration script to record per-run scheduling context on job executions.
+
+Changes:
+1. Add scheduled_at and misfire_delay_ms columns to the job_executions table
+
+Run: uv run python -m scripts.migrate_execution_context
+"""
+
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+# Database paths
+BASE_DIR = Path(__file__).parent.parent
+DB_PATH = BASE_DIR / "data" / "jobs.db"
+BACKUP_DIR = BASE_DIR / "data" / "backups"
+
+NEW_COLUMNS = {
+    "scheduled_at": "DATETIME",
+    "misfire_delay_ms": "INTEGER",
+}
+
+
+def create_backup() -> Path:
+    """Create database backup."""
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = BACKUP_DIR / f"jobs.db.backup.{timestamp}"
+    shutil.copy(DB_PATH, backup_path)
+    return backup_path
+
+
+def migrate() -> None:
+    """Execute database migration."""
+    print("=" * 80)
+    print("🚀 Execution Context Migration")
+    print("=" * 80)
+    print(f"⏰ Timestamp: {datetime.now().isoformat()}\n")
+
+    # Check if database exists
+    if not DB_PATH.exists():
+        print(f"❌ Database not found: {DB_PATH}")
+        print("   Please ensure MyScheduler is initialized first.")
+        return
+
+    # Create backup
+    print("📦 Step 1: Creating database backup...")
+    try:
+        backup_path = create_backup()
+        print(f"   ✅ Backup created: {backup_path}\n")
+    except Exception as e:
+        print(f"   ❌ Backup failed: {e}")
+        return
+
+    # Connect to database
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        # Step 2: Add columns to job_executions
+        print("📝 Step 2: Adding columns to job_executions table...")
+        cursor.execute("PRAGMA table_info(job_executions)")
+        columns = {col[1] for col in cursor.fetchall()}
+
+        for column, column_type in NEW_COLUMNS.items():
+            if column not in columns:
+                cursor.execute(
+                    f"ALTER TABLE job_executions ADD COLUMN {column} {column_type};"
+                )
+                print(f"   ✅ Added column: {column}")
+            else:
+                print(f"   ⏭️  Column already exists: {column}")
+        print()
+
+        # Commit changes
+        conn.commit()
+
+        # Summary
+        print("=" * 80)
+        print("✅ Migration completed successfully!")
+        print("=" * 80)
+        print("\n📊 Summary:")
+        for column in NEW_COLUMNS:
+            print(f"   - job_executions.{column}: Added")
+        print(f"\n📦 Backup: {backup_path}")
+        print()
+
+    except Exception as e:
+        conn.rollback()
+        print("\n" + "=" * 80)
+        print("❌ Migration failed!")
+        print("=" * 80)
+        print(f"\nError: {e}")
+        print("\n🔄 Database has been rolled back.")
+        print(f"📦 You can restore from backup: {backup_path}")
+        print()
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
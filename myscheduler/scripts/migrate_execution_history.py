@@ -0,0 +1,143 @@
+"""
+Migration script to compact and index the execution history.
+
+Changes:
+1. Create a composite index on job_executions(job_id, started_at)
+2. Drop the single-column job_id index it replaces
+3. Replace stored response bodies with a preview and a SHA-256 hash
+
+Run: uv run python -m scripts.migrate_execution_history
+Optionally reclaim disk space afterwards: sqlite3 data/jobs.db "VACUUM;"
+"""
+
+import json
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from app.core.config import settings
+from app.models.execution import compact_result
+
+# Database paths
+BASE_DIR = Path(__file__).parent.parent
+DB_PATH = BASE_DIR / "data" / "jobs.db"
+BACKUP_DIR = BASE_DIR / "data" / "backups"
+
+# Rows rewritten per transaction in step 4
+BATCH_SIZE = 1000
+
+
+def create_backup() -> Path:
+    """Create database backup."""
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = BACKUP_DIR / f"jobs.db.backup.{timestamp}"
+    shutil.copy(DB_PATH, backup_path)
+    return backup_path
+
+
+def compact_results(conn: sqlite3.Connection) -> int:
+    """Compact stored results in batches; return the number of rows changed."""
+    compacted = 0
+    last_id = ""
+    while True:
+        rows = conn.execute(
+            """
+            SELECT execution_id, result FROM job_executions
+            WHERE execution_id > ? AND result LIKE '%"response_body"%'
+            ORDER BY execution_id LIMIT ?
+            """,
+            (last_id, BATCH_SIZE),
+        ).fetchall()
+        if not rows:
+            return compacted
+
+        updates = []
+        for execution_id, result in rows:
+            data = json.loads(result)
+            if isinstance(data, dict) and "response_body" in data:
+                data = compact_result(data, settings.execution_response_preview_chars)
+                updates.append((json.dumps(data, ensure_ascii=False), execution_id))
+        conn.executemany(
+            "UPDATE job_executions SET result = ? WHERE execution_id = ?", updates
+        )
+        conn.commit()
+        compacted += len(updates)
+        last_id = rows[-1][0]
+
+
+def migrate() -> None:
+    """Execute database migration."""
+    print("=" * 80)
+    print("🚀 Execution History Compaction Migration")
+    print("=" * 80)
+    print(f"⏰ Timestamp: {datetime.now().isoformat()}\n")
+
+    # Check if database exists
+    if not DB_PATH.exists():
+        print(f"❌ Database not found: {DB_PATH}")
+        print("   Please ensure MyScheduler is initialized first.")
+        return
+
+    # Create backup
+    print("📦 Step 1: Creating database backup...")
+    try:
+        backup_path = create_backup()
+        print(f"   ✅ Backup created: {backup_path}\n")
+    except Exception as e:
+        print(f"   ❌ Backup failed: {e}")
+        return
+
+    # Connect to database
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        # Step 2: Create composite index
+        print("📝 Step 2: Creating index...")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS ix_job_executions_job_id_started_at
+            ON job_executions(job_id, started_at);
+        """)
+        print("   ✅ Index 'ix_job_executions_job_id_started_at' created\n")
+
+        # Step 3: Drop the index made redundant by the composite index
+        print("📝 Step 3: Dropping redundant index...")
+        cursor.execute("DROP INDEX IF EXISTS ix_job_executions_job_id;")
+        print("   ✅ Index 'ix_job_executions_job_id' dropped\n")
+        conn.commit()
+
+        # Step 4: Compact stored response bodies
+        print("📝 Step 4: Compacting stored response bodies...")
+        compacted = compact_results(conn)
+        print(f"   ✅ Compacted {compacted} executions\n")
+
+        # Summary
+        print("=" * 80)
+        print("✅ Migration completed successfully!")
+        print("=" * 80)
+        print("\n📊 Summary:")
+        print("   - ix_job_executions_job_id_started_at: Created")
+        print("   - ix_job_executions_job_id: Dropped")
+        print(f"   - Executions compacted: {compacted}")
+        print(f"\n📦 Backup: {backup_path}")
+        print()
+
+    except Exception as e:
+        conn.rollback()
+        print("\n" + "=" * 80)
+        print("❌ Migration failed!")
+        print("=" * 80)
+        print(f"\nError: {e}")
+        print("\n🔄 Uncommitted changes have been rolled back.")
+        print(f"📦 You can restore from backup: {backup_path}")
+        print()
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,133 @@
+"""
+Migration script to add precomputed per-job execution statistics.
+
+Changes:
+1. Create the job_execution_stats table
+2. Backfill it from the existing job_executions rows
+
+Run: uv run python -m scripts.migrate_execution_stats
+"""
+
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+# Database paths
+BASE_DIR = Path(__file__).parent.parent
+DB_PATH = BASE_DIR / "data" / "jobs.db"
+BACKUP_DIR = BASE_DIR / "data" / "backups"
+
+
+def create_backup() -> Path:
+    """Create database backup."""
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = BACKUP_DIR / f"jobs.db.backup.{timestamp}"
+    shutil.copy(DB_PATH, backup_path)
+    return backup_path
+
+
+def migrate() -> None:
+    """Execute database migration."""
+    print("=" * 80)
+    print("🚀 Execution Stats Migration")
+    print("=" * 80)
+    print(f"⏰ Timestamp: {datetime.now().isoformat()}\n")
+
+    # Check if database exists
+    if not DB_PATH.exists():
+        print(f"❌ Database not found: {DB_PATH}")
+        print("   Please ensure MyScheduler is initialized first.")
+        return
+
+    # Create backup
+    print("📦 Step 1: Creating database backup...")
+    try:
+        backup_path = create_backup()
+        print(f"   ✅ Backup created: {backup_path}\n")
+    except Exception as e:
+        print(f"   ❌ Backup failed: {e}")
+        return
+
+    # Connect to database
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        # Step 2: Create stats table
+        print("📝 Step 2: Creating job_execution_stats table...")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_execution_stats (
+                job_id VARCHAR(255) NOT NULL PRIMARY KEY,
+                total_count INTEGER NOT NULL,
+                success_count INTEGER NOT NULL,
+                failed_count INTEGER NOT NULL,
+                last_run_at DATETIME,
+                last_status VARCHAR(50),
+                last_duration_ms INTEGER
+            );
+        """)
+        print("   ✅ Table 'job_execution_stats' ready\n")
+
+        # Step 3: Backfill from execution history (recomputed from scratch)
+        print("📝 Step 3: Backfilling stats from job_executions...")
+        cursor.execute("DELETE FROM job_execution_stats;")
+        cursor.execute("""
+            INSERT INTO job_execution_stats (
+                job_id, total_count, success_count, failed_count,
+                last_run_at, last_status, last_duration_ms
+            )
+            SELECT
+                e.job_id,
+                COUNT(*),
+                SUM(CASE WHEN e.status = 'completed' THEN 1 ELSE 0 END),
+                SUM(CASE WHEN e.status = 'failed' THEN 1 ELSE 0 END),
+                MAX(e.started_at),
+                (
+                    SELECT l.status FROM job_executions l
+                    WHERE l.job_id = e.job_id AND l.completed_at IS NOT NULL
+                    ORDER BY l.completed_at DESC LIMIT 1
+                ),
+                (
+                    SELECT l.execution_time_ms FROM job_executions l
+                    WHERE l.job_id = e.job_id AND l.completed_at IS NOT NULL
+                    ORDER BY l.completed_at DESC LIMIT 1
+                )
+            FROM job_executions e
+            GROUP BY e.job_id;
+        """)
+        cursor.execute("SELECT COUNT(*) FROM job_execution_stats;")
+        job_count = cursor.fetchone()[0]
+        print(f"   ✅ Backfilled stats for {job_count} jobs\n")
+
+        # Commit changes
+        conn.commit()
+
+        # Summary
+        print("=" * 80)
+        print("✅ Migration completed successfully!")
+        print("=" * 80)
+        print("\n📊 Summary:")
+        print("   - job_execution_stats: Created")
+        print(f"   - Jobs backfilled: {job_count}")
+        print(f"\n📦 Backup: {backup_path}")
+        print()
+
+    except Exception as e:
+        conn.rollback()
+        print("\n" + "=" * 80)
+        print("❌ Migration failed!")
+        print("=" * 80)
+        print(f"\nError: {e}")
+        print("\n🔄 Database has been rolled back.")
+        print(f"📦 You can restore from backup: {backup_path}")
+        print()
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -21,6 +21,26 @@ def test_health_check(self, client: TestClient):
         assert data["timezone"] == str(settings.tz)
 
 
+class TestMetricsAPI:
+    def test_get_metrics(self, client: TestClient):
+        """メトリクスAPIのテスト"""
+        response = client.get("/api/v1/metrics")
+        assert response.status_code == 200
+
+        fires = response.json()["fires"]
+        assert "peak_in_flight" in fires
+        assert "skew_p95_ms" in fires
+
+        schedule = response.json()["schedule"]
+        assert {"misfires", "coalesced", "skipped", "jobs"} <= schedule.keys()
+        assert "p99_ms" in schedule["start_delay"]
+
+    def test_get_job_metrics_not_recorded(self, client: TestClient):
+        """記録のないジョブのメトリクスは404になることのテスト"""
+        response = client.get("/api/v1/metrics/jobs/non-existent")
+        assert response.status_code == 404
+
+
 class TestJobsAPI:
     @pytest.mark.production
     def test_create_cron_job(self, client: TestClient):
@@ -164,6 +184,39 @@ def test_pause_and_resume_job(self, client: TestClient):
         assert data["job_id"] == job_id
         assert data["status"] == "resumed"
 
+    def test_bulk_create_export_and_pause_by_tag(self, client: TestClient):
+        """ジョブの一括作成・エクスポート・タグによる一時停止のテスト"""
+        jobs = [
+            {
+                "job_id": f"bulk-{i}",
+                "schedule_type": "interval",
+                "interval": {"minutes": 1},
+                "target_url": "https://example.com/test",
+                "tags": ["bulk"] if i < 2 else [],
+            }
+            for i in range(3)
+        ]
+
+        response = client.post("/api/v1/jobs/bulk", json={"jobs": jobs})
+        assert response.status_code == 200
+        assert response.json()["count"] == 3
+
+        response = client.post("/api/v1/jobs/pause", params={"tag": "bulk"})
+        assert response.status_code == 200
+        assert response.json()["count"] == 2
+
+        response = client.get("/api/v1/jobs/export")
+        assert response.status_code == 200
+        exported = {job["job_id"]: job for job in response.json()["jobs"]}
+        assert exported["bulk-0"]["paused"] is True
+        assert exported["bulk-0"]["tags"] == ["bulk"]
+        assert exported["bulk-2"]["paused"] is False
+        assert "spread_sec" not in exported["bulk-2"]
+
+        response = client.post("/api/v1/jobs/import", json=response.json())
+        assert response.status_code == 200
+        assert response.json()["count"] == 3
+
     def test_get_job_detail(self, client: TestClient):
         """ジョブ詳細取得のテスト"""
         # まずジョブを作成
@@ -200,6 +253,29 @@ def test_get_job_detail(self, client: TestClient):
         assert "trigger_info" in detail_data
         assert "next_run_time" in detail_data
 
+    def test_get_job_stats(self, client: TestClient):
+        """ジョブ実行統計APIのテスト"""
+        job_data = {
+            "schedule_type": "cron",
+            "cron": {"hour": "9", "minute": "0"},
+            "target_url": "https://api.example.com/webhook",
+        }
+        job_id = client.post("/api/v1/jobs/", json=job_data).json()["job_id"]
+
+        response = client.get(f"/api/v1/jobs/{job_id}/stats")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["job_id"] == job_id
+        assert data["total_count"] == 0
+        assert data["sample_size"] == 0
+        assert data["p95_ms"] is None
+
+    def test_get_nonexistent_job_stats(self, client: TestClient):
+        """存在しないジョブの実行統計は404になることのテスト"""
+        response = client.get("/api/v1/jobs/nonexistent-id/stats")
+        assert response.status_code == 404
+
     def test_get_nonexistent_job(self, client: TestClient):
         """存在しないジョブの詳細取得テスト"""
         response = client.get("/api/v1/jobs/nonexistent-id")
@@ -0,0 +1,130 @@
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.repositories.lease_repository import AsyncLeaseRepository
+from app.services.leader_election import LeaderElector
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# 別プロセスから同じデータベースのリースを奪い合うスクリプト
+ACQUIRE_SCRIPT = """
+import asyncio, sys
+from app.repositories.lease_repository import AsyncLeaseRepository
+
+async def main():
+    repository = AsyncLeaseRepository(sys.argv[1])
+    await repository.create_table()
+    acquired = await repository.try_acquire("scheduler", sys.argv[2], 30)
+    await repository.close()
+    print("acquired" if acquired else "rejected")
+
+asyncio.run(main())
+"""
+
+
+@pytest.fixture
+def database_url(tmp_path) -> str:
+    return f"sqlite:///{tmp_path / 'jobs.db'}"
+
+
+@pytest.fixture
+async def repository(database_url):
+    repository = AsyncLeaseRepository(database_url)
+    await repository.create_table()
+    yield repository
+    await repository.close()
+
+
+def make_elector(repository, node_id: str, lease_ttl: float = 30.0) -> LeaderElector:
+    """スケジューラーをモックにしたリーダー選出"""
+    return LeaderElector(MagicMock(), repository, node_id=node_id, lease_ttl=lease_ttl)
+
+
+class TestLeaderElector:
+    @pytest.mark.asyncio
+    async def test_only_one_node_leads(self, repository):
+        """リースを取得したノードだけがスケジューラーを再開することのテスト"""
+        node_a = make_elector(repository, "node-a")
+        node_b = make_elector(repository, "node-b")
+
+        await node_a.start()
+        await node_b.start()
+
+        assert node_a.is_leader
+        assert not node_b.is_leader
+        node_a.manager.resume.assert_called_once()
+        node_b.manager.resume.assert_not_called()
+        assert await repository.get_holder("scheduler") == "node-a"
+
+        await node_a.stop()
+        await node_b.stop()
+
+    @pytest.mark.asyncio
+    async def test_release_hands_over_leadership(self, repository):
+        """リーダーの停止後、次の更新で他ノードが引き継ぐことのテスト"""
+        node_a = make_elector(repository, "node-a")
+        node_b = make_elector(repository, "node-b")
+        await node_a.start()
+        await node_b.start()
+
+        await node_a.stop()
+        node_a.manager.pause.assert_called_once()
+        await node_b.tick()
+
+        assert node_b.is_leader
+        assert await repository.get_holder("scheduler") == "node-b"
+
+        await node_b.stop()
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_fails_over(self, repository):
+        """更新が止まったリーダーのリースが切れると引き継がれ、旧リーダーは停止することのテスト"""
+        node_a = make_elector(repository, "node-a", lease_ttl=0.1)
+        node_b = make_elector(repository, "node-b", lease_ttl=0.1)
+        await node_a.tick()
+        await node_b.tick()
+        assert node_a.is_leader and not node_b.is_leader
+
+        await asyncio.sleep(0.2)  # node-a が更新できないままリースが切れる
+        await node_b.tick()
+        await node_a.tick()
+
+        assert node_b.is_leader
+        assert not node_a.is_leader
+        node_a.manager.pause.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_renewal_error_steps_down(self, repository):
+        """リースを更新できない場合はリーダーを降りることのテスト"""
+        node_a = make_elector(repository, "node-a")
+        await node_a.tick()
+        assert node_a.is_leader
+
+        async def broken(*args):
+            raise RuntimeError("database is locked")
+
+        node_a.repository = MagicMock(try_acquire=broken)
+        await node_a.tick()
+
+        assert not node_a.is_leader
+        node_a.manager.pause.assert_called_once()
+
+    def test_processes_compete_for_one_lease(self, database_url):
+        """複数プロセスが同じデータベースで競合しても1つだけが取得することのテスト"""
+        processes = [
+            subprocess.Popen(
+                [sys.executable, "-c", ACQUIRE_SCRIPT, database_url, f"node-{i}"],
+                cwd=PROJECT_ROOT,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            for i in range(4)
+        ]
+        results = [process.communicate(timeout=60)[0].strip() for process in processes]
+
+        assert sorted(results) == ["acquired", "rejected", "rejected", "rejected"]
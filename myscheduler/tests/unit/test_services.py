@@ -1,12 +1,48 @@
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import inspect
+import json
+import pickle
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
 
 import pytest
 import respx
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, JobSubmissionEvent
+from apscheduler.jobstores.base import ConflictingIdError
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import create_engine, insert, select
 
 from app.core.config import settings
-from app.schemas.job import CronSchedule, IntervalSchedule, JobCreateRequest
+from app.db.session import SchedulerManager, scheduler_manager
+from app.models.execution import Base, JobExecutionORM, compact_result
+from app.repositories.execution_repository import (
+    AsyncExecutionRepository,
+    ExecutionRepository,
+)
+from app.schemas.job import (
+    CronSchedule,
+    IntervalSchedule,
+    JobCreateRequest,
+    JobqueueTarget,
+)
+from app.services import job_executor
+from app.services import job_service as job_service_module
+from app.services import run_context as run_context_module
+from app.services.execution_retention import RETENTION_JOB_ID, schedule_retention
+from app.services.execution_writer import ExecutionWriter
+from app.services.fire_limiter import FireLimiter
 from app.services.http_service import HTTPService
+from app.services.job_executor import execute_http_job, execute_jobqueue_job
 from app.services.job_service import JobService
+from app.services.jobqueue_submitter import BATCH_PATH, JobqueueSubmitter
+from app.services.run_context import (
+    JobRunContext,
+    RunContextExecutor,
+    get_run_context,
+)
+from app.services.schedule_metrics import SCHEDULE_METRICS_EVENTS, ScheduleMetrics
+from app.services.triggers import SpreadCronTrigger, spread_offset
 
 
 class TestHTTPService:
@@ -71,6 +107,402 @@ async def test_execute_request_4xx_no_retry(self):
 
         await http_service.close()
 
+    @pytest.mark.asyncio
+    async def test_execute_request_returns_result(self):
+        """実行結果が返り、max_retries=0 が既定値で上書きされないことのテスト"""
+        http_service = HTTPService()
+
+        with respx.mock:
+            route = respx.get("https://example.com/test").mock(
+                return_value=respx.MockResponse(503)
+            )
+
+            result = await http_service.execute_request(
+                url="https://example.com/test", method="GET", max_retries=0
+            )
+
+        assert route.call_count == 1
+        assert result["success"] is False
+        assert result["status_code"] == 503
+        assert result["attempts"] == 1
+
+        await http_service.close()
+
+
+@pytest.fixture
+async def async_repository(tmp_path):
+    """一時データベースを使う非同期実行履歴リポジトリ"""
+    database_url = f"sqlite:///{tmp_path / 'executions.db'}"
+    Base.metadata.create_all(create_engine(database_url))
+    repository = AsyncExecutionRepository(database_url)
+    yield repository
+    await repository.close()
+
+
+@pytest.fixture
+async def writer(async_repository, monkeypatch):
+    """一時データベースに書き込む実行履歴ライター"""
+    writer = ExecutionWriter(async_repository, flush_interval=0.01)
+    monkeypatch.setattr(job_executor, "execution_writer", writer)
+    yield writer
+    await writer.stop()
+
+
+async def fetch_executions(repository) -> list[JobExecutionORM]:
+    """記録された実行履歴を取得"""
+    async with repository.SessionLocal() as db:
+        return list(await db.scalars(select(JobExecutionORM)))
+
+
+class TestJobExecutor:
+    def test_execute_http_job_is_coroutine(self):
+        """スレッドプールではなくイベントループ上で実行されることのテスト"""
+        assert inspect.iscoroutinefunction(execute_http_job)
+
+    @pytest.mark.asyncio
+    async def test_execute_http_job_records_execution(self, writer, async_repository):
+        """実行履歴がライター経由で記録されることのテスト"""
+        with respx.mock:
+            respx.post("https://example.com/hook").mock(
+                return_value=respx.MockResponse(200, json={"result": "ok"})
+            )
+
+            await execute_http_job(
+                "https://example.com/hook",
+                "POST",
+                body={"key": "value"},
+                job_id="job-1",
+            )
+
+        await writer.flush()
+        [row] = await fetch_executions(async_repository)
+
+        assert row.job_id == "job-1"
+        assert row.status == "completed"
+        assert row.http_status_code == 200
+        assert "response_body" not in row.result
+        assert row.result["response_preview"] == '{"result": "ok"}'
+        assert len(row.result["response_sha256"]) == 64
+        assert row.execution_time_ms is not None
+
+    @pytest.mark.asyncio
+    async def test_limiter_wait_is_not_execution_time(
+        self, writer, async_repository, monkeypatch
+    ):
+        """同時実行数の上限による待ち時間が実行時間に含まれないことのテスト"""
+        limiter = FireLimiter(max_concurrent=1, max_per_host=0, host_limits={})
+        monkeypatch.setattr(job_executor, "fire_limiter", limiter)
+
+        with respx.mock:
+            respx.get("https://example.com/hook").mock(
+                return_value=respx.MockResponse(200)
+            )
+            async with limiter.acquire("https://example.com/other"):
+                job = asyncio.create_task(
+                    execute_http_job("https://example.com/hook", "GET", job_id="job-1")
+                )
+                await asyncio.sleep(0.3)
+                await writer.flush()
+                assert await fetch_executions(async_repository) == []
+            await job
+
+        await writer.flush()
+        [row] = await fetch_executions(async_repository)
+        assert row.status == "completed"
+        assert row.execution_time_ms < 300
+
+    @pytest.mark.asyncio
+    async def test_scheduler_passes_run_context(self, writer, async_repository):
+        """job_id を引数に持たないジョブでも実行コンテキストから記録されることのテスト"""
+        scheduler = AsyncIOScheduler(executors={"default": RunContextExecutor()})
+        scheduled_at = datetime.now(UTC) - timedelta(seconds=2)
+        scheduler.start()
+        try:
+            with respx.mock:
+                respx.get("https://example.com/tick").mock(
+                    return_value=respx.MockResponse(200)
+                )
+                scheduler.add_job(
+                    execute_http_job,
+                    "date",
+                    run_date=scheduled_at,
+                    id="ctx-job",
+                    args=["https://example.com/tick", "GET"],
+                    misfire_grace_time=30,
+                )
+                for _ in range(100):
+                    await writer.flush()
+                    rows = await fetch_executions(async_repository)
+                    if rows and rows[0].status == "completed":
+                        break
+                    await asyncio.sleep(0.05)
+        finally:
+            scheduler.shutdown(wait=False)
+
+        [row] = rows
+        assert row.job_id == "ctx-job"
+        assert row.scheduled_at == scheduled_at.astimezone().replace(tzinfo=None)
+        assert row.misfire_delay_ms >= 2000
+        assert get_run_context() is None
+
+    def test_misfire_delay(self):
+        """予定時刻からの遅延計算のテスト"""
+        scheduled = datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+        context = JobRunContext(
+            job_id="job-1",
+            scheduled_run_time=scheduled,
+            started_at=scheduled + timedelta(milliseconds=1500),
+        )
+        assert context.misfire_delay_ms == 1500
+
+
+class TestExecutionWriter:
+    @pytest.mark.asyncio
+    async def test_batches_start_and_finish_into_one_insert(self, async_repository):
+        """同じバッチ内の開始・終了が1回の書き込みにまとまることのテスト"""
+        calls = []
+        write_executions = async_repository.write_executions
+
+        async def spy(inserts, updates, stats):
+            calls.append((len(inserts), len(updates), len(stats)))
+            await write_executions(inserts, updates, stats)
+
+        async_repository.write_executions = spy
+        writer = ExecutionWriter(async_repository, flush_interval=0.5)
+
+        for i in range(3):
+            execution = await writer.start_execution(f"job-{i}")
+            await writer.finish_execution(execution, "completed", http_status_code=200)
+        await writer.stop()
+
+        assert calls == [(3, 0, 3)]
+        rows = await fetch_executions(async_repository)
+        assert {row.status for row in rows} == {"completed"}
+        assert all(row.execution_time_ms is not None for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_finish_updates_row_written_earlier(self, async_repository):
+        """別バッチの終了イベントは execution_id で UPDATE されることのテスト"""
+        writer = ExecutionWriter(async_repository, flush_interval=0)
+
+        execution = await writer.start_execution("job-1")
+        await writer.flush()
+        [row] = await fetch_executions(async_repository)
+        assert row.status == "running"
+
+        await writer.finish_execution(
+            execution, "failed", error_message="boom", http_status_code=500
+        )
+        await writer.stop()
+
+        [row] = await fetch_executions(async_repository)
+        assert row.status == "failed"
+        assert row.error_message == "boom"
+        assert row.http_status_code == 500
+
+    @pytest.mark.asyncio
+    async def test_full_queue_applies_backpressure(self, async_repository):
+        """キューが満杯の間は記録側が待たされることのテスト"""
+        release = asyncio.Event()
+        write_executions = async_repository.write_executions
+
+        async def slow_write(inserts, updates, stats):
+            await release.wait()
+            await write_executions(inserts, updates, stats)
+
+        async_repository.write_executions = slow_write
+        writer = ExecutionWriter(
+            async_repository, max_queue_size=1, batch_size=1, flush_interval=0
+        )
+
+        await writer.start_execution("job-1")  # ライターが取り出して書き込み待ち
+        await asyncio.sleep(0)
+        await writer.start_execution("job-2")  # キューを埋める
+        blocked = asyncio.create_task(writer.start_execution("job-3"))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        release.set()
+        await blocked
+        await writer.stop()
+
+        assert len(await fetch_executions(async_repository)) == 3
+
+    @pytest.mark.asyncio
+    async def test_maintains_job_stats(self, tmp_path, async_repository):
+        """実行集計が複数バッチにわたって加算されることのテスト"""
+        writer = ExecutionWriter(async_repository, flush_interval=0)
+
+        for status in ["completed", "failed", "completed"]:
+            execution = await writer.start_execution("job-1")
+            await writer.flush()
+            await writer.finish_execution(execution, status)
+            await writer.flush()
+        await writer.start_execution("job-2")
+        await writer.stop()
+
+        repository = ExecutionRepository(f"sqlite:///{tmp_path / 'executions.db'}")
+        stats = repository.get_execution_stats(["job-1", "job-2", "job-3"])
+
+        assert set(stats) == {"job-1", "job-2"}
+        assert stats["job-1"]["total_count"] == 3
+        assert stats["job-1"]["success_count"] == 2
+        assert stats["job-1"]["failed_count"] == 1
+        assert stats["job-1"]["last_status"] == "completed"
+        assert stats["job-1"]["last_duration_ms"] is not None
+        assert stats["job-2"]["total_count"] == 1
+        assert stats["job-2"]["last_status"] is None
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried(self, async_repository):
+        """書き込みに失敗したバッチが保持されて再試行されることのテスト"""
+        write_executions = async_repository.write_executions
+        failures = [RuntimeError("database is locked")]
+
+        async def flaky_write(inserts, updates, stats):
+            if failures:
+                raise failures.pop()
+            await write_executions(inserts, updates, stats)
+
+        async_repository.write_executions = flaky_write
+        writer = ExecutionWriter(async_repository, flush_interval=0, retry_interval=0)
+
+        execution = await writer.start_execution("job-1")
+        await writer.flush()
+        await writer.finish_execution(execution, "completed")
+        await writer.stop()
+
+        [row] = await fetch_executions(async_repository)
+        assert row.status == "completed"
+
+    @pytest.mark.asyncio
+    async def test_unwritable_event_does_not_block_others(self, async_repository):
+        """書き込めないイベントが破棄され、後続の実行履歴が書き込まれることのテスト"""
+        write_executions = async_repository.write_executions
+        attempts = []
+
+        async def reject_poison(inserts, updates, stats):
+            if any(row["job_id"] == "poison" for row in inserts):
+                attempts.append(len(inserts))
+                raise RuntimeError("value too long")
+            await write_executions(inserts, updates, stats)
+
+        async_repository.write_executions = reject_poison
+        writer = ExecutionWriter(
+            async_repository, flush_interval=0, retry_interval=0, write_attempts=2
+        )
+
+        await writer.start_execution("poison")
+        await writer.start_execution("job-1")
+        await writer.flush()
+        for i in range(2, 4):
+            await writer.start_execution(f"job-{i}")
+            await writer.flush()
+        await writer.stop()
+
+        rows = await fetch_executions(async_repository)
+        assert sorted(row.job_id for row in rows) == ["job-1", "job-2", "job-3"]
+        assert 1 in attempts  # 1件ずつの再試行で切り分けられた
+
+    @pytest.mark.asyncio
+    async def test_stopped_writer_is_not_restarted(self, async_repository):
+        """停止後の記録でライターが再開されないことのテスト"""
+        writer = ExecutionWriter(async_repository, flush_interval=0)
+        await writer.start_execution("job-1")
+        await writer.stop()
+
+        await writer.start_execution("job-2")
+
+        assert writer._task is None
+        assert len(await fetch_executions(async_repository)) == 1
+
+
+class TestExecutionHistory:
+    def test_compact_result_keeps_preview_and_hash(self):
+        """レスポンスボディがプレビューとハッシュに置き換わることのテスト"""
+        result = {"success": True, "response_body": "x" * 100}
+
+        compacted = compact_result(result, preview_chars=10)
+
+        assert "response_body" not in compacted
+        assert compacted["response_preview"] == "x" * 10
+        assert compacted["response_truncated"] is True
+        assert compacted["response_sha256"] == hashlib.sha256(b"x" * 100).hexdigest()
+        assert compacted["success"] is True
+
+    def test_compact_result_full_capture(self):
+        """capture_response でレスポンス全体も保存されることのテスト"""
+        body = {"b": 2, "a": 1}
+
+        compacted = compact_result({"response_body": body}, 1024, True)
+
+        assert compacted["response_body"] == body
+        assert compacted["response_preview"] == '{"a": 1, "b": 2}'
+        assert compacted["response_truncated"] is False
+
+    @pytest.mark.asyncio
+    async def test_retention_deletes_in_chunks(self, async_repository):
+        """保持期間を過ぎた実行履歴だけがチャンク単位で削除されることのテスト"""
+        now = datetime.now()
+        rows = [
+            {
+                "execution_id": f"old-{i}",
+                "job_id": "job-1",
+                "started_at": now - timedelta(days=40, minutes=i),
+                "status": "completed",
+            }
+            for i in range(25)
+        ] + [
+            {
+                "execution_id": f"new-{i}",
+                "job_id": "job-1",
+                "started_at": now - timedelta(days=1),
+                "status": "completed",
+            }
+            for i in range(5)
+        ]
+        async with async_repository.engine.begin() as conn:
+            await conn.execute(insert(JobExecutionORM.__table__), rows)
+
+        deleted = await async_repository.delete_executions_before(
+            now - timedelta(days=30), batch_size=10
+        )
+
+        assert deleted == 25
+        remaining = await fetch_executions(async_repository)
+        assert {row.execution_id for row in remaining} == {f"new-{i}" for i in range(5)}
+
+    @pytest.mark.asyncio
+    async def test_job_stats_percentiles(self, tmp_path, async_repository):
+        """直近の所要時間からパーセンタイルが計算されることのテスト"""
+        now = datetime.now()
+        rows = [
+            {
+                "execution_id": f"exec-{i}",
+                "job_id": "job-1",
+                "started_at": now - timedelta(seconds=i),
+                "status": "completed",
+                "execution_time_ms": (i + 1) * 10,
+            }
+            for i in range(100)
+        ]
+        async with async_repository.engine.begin() as conn:
+            await conn.execute(insert(JobExecutionORM.__table__), rows)
+
+        repository = ExecutionRepository(f"sqlite:///{tmp_path / 'executions.db'}")
+        stats = repository.get_job_stats("job-1", sample_size=1000)
+        recent = repository.get_job_stats("job-1", sample_size=10)
+
+        assert stats["sample_size"] == 100
+        assert stats["p50_ms"] == pytest.approx(505.0)
+        assert stats["p99_ms"] == pytest.approx(990.1)
+        assert stats["max_ms"] == 1000
+        assert stats["avg_ms"] == pytest.approx(505.0)
+        # 直近10件（所要時間 10〜100ms）だけが対象になる
+        assert recent["sample_size"] == 10
+        assert recent["max_ms"] == 100
+        assert repository.get_job_stats("missing", 1000)["sample_size"] == 0
+
 
 class TestJobService:
     def test_create_cron_trigger(self):
@@ -86,6 +518,43 @@ def test_create_cron_trigger(self):
         trigger = job_service._create_trigger(job_request)
         assert trigger.timezone == settings.tz
 
+    @pytest.mark.asyncio
+    async def test_list_jobs_fetches_stats_once(self, monkeypatch):
+        """ジョブ数によらず実行集計の取得が1回であることのテスト"""
+        repository = MagicMock()
+        repository.get_execution_stats.return_value = {
+            "job-a": {"total_count": 5, "success_count": 4, "failed_count": 1}
+        }
+        monkeypatch.setattr(job_service_module, "execution_repository", repository)
+        job_service = JobService()
+
+        for job_id in ["job-a", "job-b", "job-c"]:
+            await job_service.create_job(
+                JobCreateRequest(
+                    job_id=job_id,
+                    schedule_type="interval",
+                    target_url="https://example.com/test",
+                    interval=IntervalSchedule(minutes=5),
+                )
+            )
+
+        jobs = {job.job_id: job for job in await job_service.list_jobs()}
+
+        repository.get_execution_stats.assert_called_once()
+        assert jobs["job-a"].execution_count == 5
+        assert jobs["job-a"].failed_count == 1
+        assert jobs["job-b"].execution_count == 0
+
+    @pytest.mark.asyncio
+    async def test_internal_jobs_are_not_listed(self):
+        """内部ジョブ（実行履歴の定期削除）が一覧に含まれないことのテスト"""
+        schedule_retention(scheduler_manager)
+
+        jobs = await JobService().list_jobs()
+
+        assert RETENTION_JOB_ID not in [job.job_id for job in jobs]
+        assert scheduler_manager.get_scheduler().get_job(RETENTION_JOB_ID)
+
     def test_create_interval_trigger(self):
         """intervalトリガー作成のテスト"""
         job_service = JobService()
@@ -124,3 +593,559 @@ def test_create_trigger_invalid_type(self):
             JobCreateRequest(
                 schedule_type="invalid", target_url="https://example.com/test"
             )
+
+
+@pytest.fixture
+async def running_manager(tmp_path, monkeypatch):
+    """一時データベースのジョブストアで開始したスケジューラー"""
+    monkeypatch.setattr(settings, "database_url", f"sqlite:///{tmp_path / 'jobs.db'}")
+    manager = SchedulerManager()
+    manager.start()
+    manager.scheduler.wakeup = MagicMock(wraps=manager.scheduler.wakeup)
+    yield manager
+    manager.scheduler.shutdown(wait=False)
+
+
+def interval_request(job_id: str, **kwargs) -> JobCreateRequest:
+    return JobCreateRequest(
+        job_id=job_id,
+        schedule_type="interval",
+        target_url=f"https://example.com/{job_id}",
+        interval=IntervalSchedule(minutes=5),
+        **kwargs,
+    )
+
+
+class TestBulkJobs:
+    @pytest.mark.asyncio
+    async def test_create_jobs_wakes_scheduler_once(self, running_manager):
+        """一括作成で全ジョブが登録され、スケジューラーを1回だけ起こすことのテスト"""
+        job_service = JobService(running_manager)
+
+        responses = await job_service.create_jobs(
+            [interval_request(f"job-{i}", tags=["batch"]) for i in range(20)]
+        )
+
+        assert len(responses) == 20
+        running_manager.scheduler.wakeup.assert_called_once()
+        job = running_manager.scheduler.get_job("job-3")
+        assert job.args[0] == "https://example.com/job-3"
+        assert job.kwargs["tags"] == ["batch"]
+        assert job.next_run_time is not None
+
+    @pytest.mark.asyncio
+    async def test_conflict_rolls_back_whole_batch(self, running_manager):
+        """既存のIDと重複した場合は1件も登録されないことのテスト"""
+        job_service = JobService(running_manager)
+        await job_service.create_jobs([interval_request("job-a")])
+
+        with pytest.raises(ConflictingIdError):
+            await job_service.create_jobs(
+                [interval_request("job-b"), interval_request("job-a")]
+            )
+
+        assert running_manager.scheduler.get_job("job-b") is None
+
+        # replace_existing では既存のジョブを置き換える
+        replaced = interval_request("job-a", name="replaced")
+        await job_service.create_jobs(
+            [interval_request("job-b"), replaced], replace_existing=True
+        )
+        assert running_manager.scheduler.get_job("job-a").name == "replaced"
+        assert running_manager.scheduler.get_job("job-b") is not None
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_in_request(self, running_manager):
+        """リクエスト内のID重複はエラーになることのテスト"""
+        with pytest.raises(ValueError, match="Duplicate job_id"):
+            await JobService(running_manager).create_jobs(
+                [interval_request("job-a"), interval_request("job-a")]
+            )
+
+    @pytest.mark.asyncio
+    async def test_pause_and_resume_by_tag(self, running_manager):
+        """タグの付いたジョブだけをまとめて一時停止・再開できることのテスト"""
+        job_service = JobService(running_manager)
+        await job_service.create_jobs(
+            [
+                interval_request("job-a", tags=["nightly"]),
+                interval_request("job-b", tags=["nightly", "reports"]),
+                interval_request("job-c", tags=["reports"]),
+            ]
+        )
+        running_manager.scheduler.wakeup.reset_mock()
+
+        paused = await job_service.set_paused_by_tag("nightly", paused=True)
+
+        assert sorted(job.job_id for job in paused) == ["job-a", "job-b"]
+        running_manager.scheduler.wakeup.assert_called_once()
+        scheduler = running_manager.scheduler
+        assert scheduler.get_job("job-a").next_run_time is None
+        assert scheduler.get_job("job-b").next_run_time is None
+        assert scheduler.get_job("job-c").next_run_time is not None
+
+        resumed = await job_service.set_paused_by_tag("nightly", paused=False)
+
+        assert len(resumed) == 2
+        assert scheduler.get_job("job-a").next_run_time is not None
+
+    @pytest.mark.asyncio
+    async def test_export_and_import_round_trip(self, running_manager):
+        """エクスポートしたジョブをインポートすると同じ設定で復元されることのテスト"""
+        job_service = JobService(running_manager)
+        await job_service.create_jobs(
+            [
+                interval_request(
+                    "job-a", tags=["nightly"], max_retries=2, spread_sec=60
+                ),
+                JobCreateRequest(
+                    job_id="job-b",
+                    schedule_type="cron",
+                    target_url="https://example.com/job-b",
+                    method="POST",
+                    body={"report": "daily"},
+                    cron=CronSchedule(hour="10", minute="30"),
+                    paused=True,
+                ),
+            ]
+        )
+        exported = await job_service.export_jobs()
+
+        running_manager.scheduler.remove_all_jobs()
+        await job_service.create_jobs(exported)
+
+        assert await job_service.export_jobs() == exported
+        job_b = running_manager.scheduler.get_job("job-b")
+        assert job_b.next_run_time is None
+        assert str(job_b.trigger.fields[5]) == "10"
+
+    @pytest.mark.asyncio
+    async def test_export_keeps_fire_spread_unset(self, running_manager, monkeypatch):
+        """未指定の発火分散がエクスポートで0に固定されず、全体設定に従い続けることのテスト"""
+        job_service = JobService(running_manager)
+        await job_service.create_jobs(
+            [
+                interval_request("job-a", spread_sec=0),
+                interval_request("job-b"),
+            ]
+        )
+        exported = {job.job_id: job for job in await job_service.export_jobs()}
+
+        assert exported["job-a"].model_dump(exclude_unset=True)["spread_sec"] == 0
+        assert "jitter_sec" not in exported["job-a"].model_dump(exclude_unset=True)
+        assert exported["job-b"].jitter_sec is None
+        assert exported["job-b"].spread_sec is None
+
+        monkeypatch.setattr(settings, "job_fire_spread", 300.0)
+        running_manager.scheduler.remove_all_jobs()
+        await job_service.create_jobs(list(exported.values()))
+
+        scheduler = running_manager.scheduler
+        assert getattr(scheduler.get_job("job-a").trigger, "spread_window", 0) == 0
+        assert scheduler.get_job("job-b").trigger.spread_window == 300
+
+
+class TestFireSpread:
+    def test_spread_offset_is_stable_and_spread(self):
+        """オフセットがジョブごとに固定で、分散幅内に散らばることのテスト"""
+        offsets = [spread_offset(f"job-{i}", 60) for i in range(100)]
+
+        assert offsets == [spread_offset(f"job-{i}", 60) for i in range(100)]
+        assert all(0 <= offset < 60 for offset in offsets)
+        assert len({int(offset) for offset in offsets}) > 40
+        assert spread_offset("job-0", 0) == 0
+
+    def test_spread_cron_trigger_shifts_every_fire(self):
+        """設定した cron の各発火が固定オフセット分ずれることのテスト"""
+        trigger = SpreadCronTrigger(
+            spread_window=300,
+            spread_offset=90,
+            minute="0",
+            second="0",
+            timezone=settings.tz,
+        )
+        now = datetime(2025, 1, 1, 10, 0, 30, tzinfo=settings.tz)
+
+        first = trigger.get_next_fire_time(None, now)
+        second = trigger.get_next_fire_time(first, first)
+
+        # 10:00:00 の発火は 10:01:30 にずれ、まだ過ぎていないため次回になる
+        assert first == datetime(2025, 1, 1, 10, 1, 30, tzinfo=settings.tz)
+        assert second == datetime(2025, 1, 1, 11, 1, 30, tzinfo=settings.tz)
+
+        restored = pickle.loads(pickle.dumps(trigger))
+        assert restored.spread_offset == 90
+        assert restored.get_next_fire_time(None, now) == first
+
+    def test_global_spread_applies_without_changing_schedule(self, monkeypatch):
+        """全体の分散幅が既定値として適用され、ジョブごとに無効化できることのテスト"""
+        monkeypatch.setattr(settings, "job_fire_spread", 300.0)
+        job_service = JobService()
+        request = JobCreateRequest(
+            schedule_type="cron",
+            target_url="https://example.com/test",
+            cron=CronSchedule(minute="0"),
+        )
+
+        trigger = job_service._create_trigger(request, "job-a")
+        assert isinstance(trigger, SpreadCronTrigger)
+        assert trigger.spread_offset == spread_offset("job-a", 300)
+        assert str(trigger.fields[6]) == "0"  # 設定した分は変わらない
+
+        request.spread_sec = 0
+        assert not isinstance(
+            job_service._create_trigger(request, "job-a"), SpreadCronTrigger
+        )
+
+
+class TestFireLimiter:
+    async def _fire(self, limiter: FireLimiter, url: str) -> None:
+        async with limiter.acquire(url):
+            await asyncio.sleep(0.05)
+
+    @pytest.mark.asyncio
+    async def test_global_limit(self):
+        """全体の同時実行数が上限を超えないことのテスト"""
+        limiter = FireLimiter(max_concurrent=2, max_per_host=0, host_limits={})
+
+        await asyncio.gather(
+            *(self._fire(limiter, f"https://host-{i}.example/") for i in range(5))
+        )
+
+        assert limiter.fires == 5
+        assert limiter.peak_in_flight == 2
+        assert limiter.waited == 3
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_host_limit(self):
+        """送信先ホストごとの上限が他のホストを待たせないことのテスト"""
+        limiter = FireLimiter(
+            max_concurrent=0, max_per_host=0, host_limits={"jobqueue.local": 1}
+        )
+
+        await asyncio.gather(
+            self._fire(limiter, "http://jobqueue.local/api/v1/jobs"),
+            self._fire(limiter, "http://jobqueue.local/api/v1/jobs"),
+            self._fire(limiter, "http://agent.local/run"),
+        )
+
+        assert limiter.peak_in_flight == 2
+        assert limiter.waited == 1
+        assert limiter.snapshot()["in_flight_by_host"] == {}
+
+    @pytest.mark.asyncio
+    async def test_skew_is_measured_from_scheduled_time(self):
+        """発火予定時刻から実際の開始までのスキューが記録されることのテスト"""
+        limiter = FireLimiter(max_concurrent=0, max_per_host=0, host_limits={})
+        scheduled_at = datetime.now(UTC) - timedelta(seconds=2)
+
+        async with limiter.acquire("https://example.com/", scheduled_at):
+            pass
+
+        snapshot = limiter.snapshot()
+        assert snapshot["skew_sample_size"] == 1
+        assert snapshot["skew_p50_ms"] >= 2000
+
+
+JOBQUEUE_URL = "http://jobqueue.test"
+
+
+def batch_response(request):
+    """一括作成APIのモック（"jm_missing" だけ404）"""
+    items = json.loads(request.content)["jobs"]
+    results = []
+    for i, item in enumerate(items):
+        if item["master_id"] == "jm_missing":
+            results.append(
+                {
+                    "master_id": item["master_id"],
+                    "status_code": 404,
+                    "job_id": None,
+                    "error": "Job master not found",
+                }
+            )
+        else:
+            results.append(
+                {"master_id": item["master_id"], "status_code": 201, "job_id": f"j_{i}"}
+            )
+    return respx.MockResponse(201, json={"results": results, "created": 0})
+
+
+@pytest.fixture
+async def submitter(monkeypatch):
+    submitter = JobqueueSubmitter(base_url=JOBQUEUE_URL, batch_window=0.05)
+    monkeypatch.setattr(job_executor, "jobqueue_submitter", submitter)
+    yield submitter
+    await submitter.close()
+
+
+class TestJobqueueSubmitter:
+    @pytest.mark.asyncio
+    async def test_same_tick_submissions_share_one_request(self, submitter):
+        """同じタイミングの投入が1回の一括リクエストにまとまることのテスト"""
+        with respx.mock:
+            route = respx.post(f"{JOBQUEUE_URL}{BATCH_PATH}").mock(
+                side_effect=batch_response
+            )
+
+            results = await asyncio.gather(
+                *(submitter.submit(f"jm_{i}", {"priority": 1}) for i in range(5)),
+                submitter.submit("jm_missing"),
+            )
+
+        assert route.call_count == 1
+        sent = json.loads(route.calls[0].request.content)["jobs"]
+        assert sent[0] == {"priority": 1, "master_id": "jm_0"}
+        assert [r["jobqueue_job_id"] for r in results[:5]] == [
+            f"j_{i}" for i in range(5)
+        ]
+        assert results[5]["success"] is False
+        assert results[5]["status_code"] == 404
+        assert submitter.snapshot()["avg_batch_size"] == 6
+
+    @pytest.mark.asyncio
+    async def test_batch_size_limit(self, submitter):
+        """上限件数に達したら待たずに送信することのテスト"""
+        submitter.batch_size = 2
+        with respx.mock:
+            route = respx.post(f"{JOBQUEUE_URL}{BATCH_PATH}").mock(
+                side_effect=batch_response
+            )
+            await asyncio.gather(*(submitter.submit(f"jm_{i}") for i in range(5)))
+
+        assert route.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_server_error_fails_every_item(self, submitter):
+        """一括リクエスト自体の失敗は全件の失敗として返すことのテスト"""
+        with respx.mock:
+            respx.post(f"{JOBQUEUE_URL}{BATCH_PATH}").mock(
+                return_value=respx.MockResponse(500)
+            )
+            results = await asyncio.gather(
+                submitter.submit("jm_a"), submitter.submit("jm_b")
+            )
+
+        assert [r["success"] for r in results] == [False, False]
+        assert results[0]["status_code"] == 500
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {"results": []},
+            {"results": [{"job_id": "j_0"}, {"job_id": "j_1"}]},
+            {"created": 0},
+        ],
+    )
+    async def test_malformed_response_fails_every_item(self, submitter, body):
+        """件数不足・キー欠落のレスポンスでも全件が失敗として返ることのテスト"""
+        with respx.mock:
+            respx.post(f"{JOBQUEUE_URL}{BATCH_PATH}").mock(
+                return_value=respx.MockResponse(201, json=body)
+            )
+            results = await asyncio.wait_for(
+                asyncio.gather(submitter.submit("jm_a"), submitter.submit("jm_b")),
+                timeout=5,
+            )
+
+        assert [r["success"] for r in results] == [False, False]
+        assert submitter.snapshot()["failed"] == 2
+
+    def test_pending_from_previous_loop_is_failed(self):
+        """別のイベントループで溜まった投入が失敗として返ることのテスト"""
+        submitter = JobqueueSubmitter(base_url=JOBQUEUE_URL, batch_window=60)
+        old_loop = asyncio.new_event_loop()
+        try:
+            pending = old_loop.create_task(submitter.submit("jm_old"))
+            old_loop.run_until_complete(asyncio.sleep(0))
+
+            async def submit_on_new_loop() -> None:
+                submitter.batch_window = 0.01
+                with respx.mock:
+                    respx.post(f"{JOBQUEUE_URL}{BATCH_PATH}").mock(
+                        side_effect=batch_response
+                    )
+                    await submitter.submit("jm_new")
+                await submitter.close()
+
+            asyncio.run(submit_on_new_loop())
+            result = old_loop.run_until_complete(asyncio.wait_for(pending, 5))
+        finally:
+            old_loop.close()
+
+        assert result["success"] is False
+        assert "event loop changed" in result["error_message"]
+
+    @pytest.mark.asyncio
+    async def test_execution_records_jobqueue_job_id(
+        self, submitter, writer, async_repository
+    ):
+        """実行履歴にレスポンスではなく jobqueue のジョブIDが記録されることのテスト"""
+        with respx.mock:
+            respx.post(f"{JOBQUEUE_URL}{BATCH_PATH}").mock(side_effect=batch_response)
+            await execute_jobqueue_job("jm_report", {"body": {"a": 1}}, "job-1")
+
+        await writer.flush()
+        [row] = await fetch_executions(async_repository)
+
+        assert row.status == "completed"
+        assert row.http_status_code == 201
+        assert row.result["jobqueue_job_id"] == "j_0"
+        assert "response_preview" not in row.result
+
+    @pytest.mark.asyncio
+    async def test_jobqueue_job_listed_and_exported(self):
+        """jobqueue タイプのジョブが一覧・詳細・エクスポートに反映されることのテスト"""
+        job_service = JobService()
+        request = JobCreateRequest(
+            job_id="enqueue-report",
+            schedule_type="cron",
+            cron=CronSchedule(minute="0"),
+            job_type="jobqueue",
+            jobqueue=JobqueueTarget(master_id="jm_report", overrides={"priority": 2}),
+        )
+        await job_service.create_job(request)
+
+        [info] = await job_service.list_jobs()
+        detail = await job_service.get_job("enqueue-report")
+        [exported] = await job_service.export_jobs()
+
+        assert info.job_type == "jobqueue"
+        assert info.target_url.endswith("/api/v1/jobs/from-master/jm_report")
+        assert detail.jobqueue.overrides.model_dump(exclude_unset=True) == {
+            "priority": 2
+        }
+        assert exported.job_type == "jobqueue"
+        assert exported.jobqueue == request.jobqueue
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [{"priority": 0}, {"timeout_sec": 7200}, {"backoff_seconds": 0}, {"bad": 1}],
+    )
+    def test_jobqueue_overrides_are_validated(self, overrides):
+        """jobqueue で拒否される上書きはジョブ作成時に拒否されることのテスト"""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            JobqueueTarget(master_id="jm_report", overrides=overrides)
+
+    @pytest.mark.asyncio
+    async def test_job_type_requires_its_settings(self):
+        """ジョブタイプごとの必須設定がない場合はエラーになることのテスト"""
+        job_service = JobService()
+        with pytest.raises(ValueError, match="jobqueue settings"):
+            await job_service.create_job(
+                JobCreateRequest(
+                    schedule_type="interval",
+                    interval=IntervalSchedule(minutes=5),
+                    job_type="jobqueue",
+                )
+            )
+        with pytest.raises(ValueError, match="target_url"):
+            await job_service.create_job(
+                JobCreateRequest(
+                    schedule_type="interval", interval=IntervalSchedule(minutes=5)
+                )
+            )
+
+
+@pytest.fixture
+async def metrics_scheduler(monkeypatch):
+    """RunContextExecutor で動かし、新しい ScheduleMetrics に記録するスケジューラー"""
+    metrics = ScheduleMetrics(sample_size=50)
+    monkeypatch.setattr(run_context_module, "schedule_metrics", metrics)
+    scheduler = AsyncIOScheduler(executors={"default": RunContextExecutor()})
+    scheduler.add_listener(metrics.on_scheduler_event, SCHEDULE_METRICS_EVENTS)
+    scheduler.start()
+    yield scheduler, metrics
+    scheduler.shutdown(wait=False)
+
+
+async def noop() -> None:
+    pass
+
+
+async def wait_for_summary(metrics: ScheduleMetrics, job_id: str, key: str) -> dict:
+    """ジョブの集計で key が数えられるまで待つ"""
+    for _ in range(100):
+        summary = metrics.job_summary(job_id)
+        if summary and summary[key]:
+            return summary
+        await asyncio.sleep(0.05)
+    raise AssertionError(f"{key} was not recorded for {job_id}")
+
+
+class TestScheduleMetrics:
+    @pytest.mark.asyncio
+    async def test_records_start_delay(self, metrics_scheduler):
+        """予定時刻・投入・開始の遅延が発火ごとに記録されることのテスト"""
+        scheduler, metrics = metrics_scheduler
+        scheduled_at = datetime.now(UTC) - timedelta(seconds=2)
+        scheduler.add_job(
+            noop, "date", run_date=scheduled_at, id="late", misfire_grace_time=30
+        )
+
+        summary = await wait_for_summary(metrics, "late", "fires")
+
+        assert summary["fires"] == 1
+        assert summary["misfires"] == 0
+        assert summary["start_delay"]["p50_ms"] >= 2000
+        assert summary["scheduler_lag"]["p50_ms"] >= 2000
+        assert summary["queue_delay"]["max_ms"] < 2000
+        assert metrics.snapshot()["fires"] == 1
+
+    @pytest.mark.asyncio
+    async def test_counts_misfire(self, metrics_scheduler):
+        """猶予時間を超えた発火が実行されずミスファイアとして数えられることのテスト"""
+        scheduler, metrics = metrics_scheduler
+        scheduler.add_job(
+            noop,
+            "date",
+            run_date=datetime.now(UTC) - timedelta(minutes=1),
+            id="missed",
+            misfire_grace_time=1,
+        )
+
+        summary = await wait_for_summary(metrics, "missed", "misfires")
+
+        assert summary["fires"] == 0
+        assert summary["start_delay"]["p50_ms"] is None
+        assert metrics.snapshot()["misfires"] == 1
+
+    @pytest.mark.asyncio
+    async def test_counts_coalesced_fires(self, metrics_scheduler):
+        """coalesce で1回にまとめられた発火の数を記録することのテスト"""
+        scheduler, metrics = metrics_scheduler
+        scheduler.add_job(
+            noop,
+            "interval",
+            seconds=1,
+            id="behind",
+            next_run_time=datetime.now(UTC) - timedelta(seconds=5.5),
+            coalesce=True,
+            misfire_grace_time=60,
+        )
+
+        summary = await wait_for_summary(metrics, "behind", "fires")
+
+        assert summary["fires"] == 1
+        assert summary["coalesced"] == 5
+
+    def test_skipped_and_removed_jobs(self):
+        """max_instances による見送りを数え、削除されたジョブの集計は破棄することのテスト"""
+        metrics = ScheduleMetrics(sample_size=10)
+        run_times = [datetime.now(UTC)] * 2
+        metrics.on_scheduler_event(
+            JobSubmissionEvent(EVENT_JOB_MAX_INSTANCES, "busy", None, run_times)
+        )
+        assert metrics.job_summary("busy")["skipped"] == 2
+
+        scheduler = AsyncIOScheduler()
+        scheduler.add_listener(metrics.on_scheduler_event, SCHEDULE_METRICS_EVENTS)
+        scheduler.add_job(noop, "interval", minutes=5, id="busy")
+        scheduler.remove_job("busy")
+
+        assert metrics.job_summary("busy") is None
+        assert metrics.snapshot()["skipped"] == 2